@@ -0,0 +1,257 @@
+"""
+Benchmark cases.
+
+Each case is a function taking the dataset directory and its window (start,
+end) and returning the callable that is timed. Everything before the return
+is setup and is not measured. The callable returns the number of rows it
+produced or processed, which is recorded with the timings.
+
+Cases run in a fresh process with DATA_DIR pointing at the synthetic dataset
+(see run.py), so the dashboard and collector modules are imported here, after
+the environment is set. Collectors load their whole data file when created,
+so the parser cases run with DATA_DIR pointing at an empty directory and read
+the dataset from its path.
+"""
+
+import pickle
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pandas as pd
+
+# Case name -> (function(dataset, start, end) -> timed callable, whether DATA_DIR is the dataset)
+CASES: Dict[str, Tuple[Callable, bool]] = {}
+
+# Hierarchy the Average Price Analysis tab opens with, plus a DUID level
+PRICE_HIERARCHY = ['Fuel', 'Region', 'duid']
+
+# Station search queries: exact DUIDs and site names are filled in from gen_info,
+# these are partial and misspelt
+SEARCH_QUERIES = ['bay', 'moun', 'silverwod', 'lake vale', 'port', 'solar farm', 'wnd', 'glen ridge']
+
+
+def case(name: str, uses_data_dir: bool = True):
+    """Register a benchmark case"""
+    def register(function):
+        CASES[name] = (function, uses_data_dir)
+        return function
+    return register
+
+
+def _config():
+    from aemo_dashboard.shared.config import config
+    return config
+
+
+def _gen_info() -> pd.DataFrame:
+    with open(_config().gen_info_file, 'rb') as f:
+        return pickle.load(f)
+
+
+def _dashboard(start: pd.Timestamp, end: pd.Timestamp, region: str = 'NEM'):
+    """EnergyDashboard showing the whole dataset (parameters set at construction don't trigger reloads)"""
+    from aemo_dashboard.generation.gen_dash import EnergyDashboard
+    return EnergyDashboard(region=region, start_date=start.date(), end_date=end.date())
+
+
+def _loaded_dashboard(start: pd.Timestamp, end: pd.Timestamp, region: str = 'NEM'):
+    dashboard = _dashboard(start, end, region)
+    dashboard.load_generation_data()
+    dashboard.load_transmission_data()
+    dashboard.load_rooftop_solar_data()
+    return dashboard
+
+
+# Generation dashboard
+
+@case('dashboard.load_generation_data')
+def load_generation_data(dataset, start, end):
+    dashboard = _dashboard(start, end)
+
+    def run():
+        dashboard.load_generation_data()
+        return len(dashboard.gen_output_df)
+    return run
+
+
+@case('dashboard.process_data_for_region')
+def process_data_for_region(dataset, start, end):
+    dashboard = _loaded_dashboard(start, end)
+
+    def run():
+        # New data version - the region frames are rebuilt, as after a reload
+        dashboard._data_version += 1
+        return len(dashboard.process_data_for_region())
+    return run
+
+
+@case('dashboard.calculate_capacity_utilization')
+def calculate_capacity_utilization(dataset, start, end):
+    dashboard = _loaded_dashboard(start, end)
+
+    def run():
+        # Utilization is computed with the region frames - rebuilt as after a reload
+        dashboard._data_version += 1
+        return len(dashboard.calculate_capacity_utilization())
+    return run
+
+
+@case('dashboard.create_transmission_plot')
+def create_transmission_plot(dataset, start, end):
+    dashboard = _loaded_dashboard(start, end, region='NSW1')
+    dashboard.process_data_for_region()
+
+    def run():
+        # Chart data is cached with the region frames - drop it so it is recomputed
+        dashboard._get_region_frames().pop('transmission', None)
+        dashboard.create_transmission_plot()
+        frame, _ = dashboard._get_region_frames()['transmission']
+        return len(frame)
+    return run
+
+
+# Average price analysis
+
+def _price_motor(start, end):
+    from aemo_dashboard.analysis.price_analysis import PriceAnalysisMotor
+    motor = PriceAnalysisMotor()
+    motor.load_data(str(start.date()), str(end.date()))
+    motor.standardize_columns()
+    return motor
+
+
+@case('price_analysis.integrate_data')
+def integrate_price_data(dataset, start, end):
+    motor = _price_motor(start, end)
+
+    def run():
+        motor.integrate_data()
+        return len(motor.integrated_data)
+    return run
+
+
+@case('price_analysis.calculate_aggregated_prices')
+def calculate_aggregated_prices(dataset, start, end):
+    motor = _price_motor(start, end)
+    motor.integrate_data()
+
+    def run():
+        return len(motor.calculate_aggregated_prices(PRICE_HIERARCHY))
+    return run
+
+
+# Station analysis
+
+@case('station_analysis.filter_station_data')
+def filter_station_data(dataset, start, end):
+    from aemo_dashboard.station.station_analysis import StationAnalysisMotor
+    motor = StationAnalysisMotor()
+    motor.load_data(start, end)
+    motor.standardize_columns()
+    motor.integrate_data()
+
+    # Largest multi-unit station, filtered in station mode
+    gen_info = _gen_info()
+    units = gen_info.groupby('Site Name')['DUID'].agg(list)
+    capacity = gen_info.groupby('Site Name')['Capacity(MW)'].sum()
+    duids = units[units.str.len() > 1].loc[lambda s: capacity[s.index].idxmax()]
+
+    def run():
+        motor.filter_station_data(duids, start, end)
+        return len(motor.station_data)
+    return run
+
+
+@case('station_search.fuzzy_search')
+def fuzzy_search(dataset, start, end):
+    from aemo_dashboard.station.station_search import StationSearchEngine
+    gen_info = _gen_info()
+    engine = StationSearchEngine(gen_info)
+    sample = gen_info.sample(8, random_state=0)
+    queries = SEARCH_QUERIES + sample['DUID'].tolist() + sample['Site Name'].tolist()
+
+    def run():
+        results = 0
+        for query in queries:
+            for mode in ('duid', 'station'):
+                results += len(engine.fuzzy_search(query, mode=mode))
+        return results
+    return run
+
+
+# Collector parsers - a day of NEMWEB files built from the dataset's last day
+
+def _last_day(path: Path, end: pd.Timestamp, time_column: str) -> pd.DataFrame:
+    return pd.read_parquet(path, filters=[(time_column, '>', end - pd.Timedelta(days=1))])
+
+
+def _nemweb_time(time: pd.Timestamp) -> str:
+    return time.strftime('"%Y/%m/%d %H:%M:%S"')
+
+
+def _files(rows: pd.DataFrame, time_column: str, format_row: Callable, header: str) -> list:
+    """One CSV per interval: C/I header lines, then a D line per row"""
+    files = []
+    for time, interval in rows.groupby(time_column, sort=True):
+        lines = [f'C,NEMP.WORLD,BENCHMARK,AEMO,PUBLIC,{_nemweb_time(time)}', f'I,{header}']
+        lines += [format_row(_nemweb_time(time), row) for row in interval.itertuples(index=False)]
+        lines.append('C,"END OF REPORT",%d' % (len(lines) + 1))
+        files.append('\n'.join(lines))
+    return files
+
+
+def _parser_case(collector, files: list) -> Callable:
+    def run():
+        rows = 0
+        for csv_content in files:
+            parsed = collector.parse_csv(csv_content)
+            rows += 0 if parsed is None else len(parsed)
+        return rows
+    return run
+
+
+@case('collector.generation.parse_csv', uses_data_dir=False)
+def parse_generation(dataset, start, end):
+    from aemo_data_service.collectors.generation_collector import GenerationCollector
+    rows = _last_day(dataset / 'gen_output.parquet', end, 'settlementdate')
+    files = _files(rows, 'settlementdate',
+                   lambda time, row: f'D,DISPATCH,UNIT_SCADA,1,{time},{row.duid},{row.scadavalue:.5f},{time}',
+                   'DISPATCH,UNIT_SCADA,1,SETTLEMENTDATE,DUID,SCADAVALUE,LASTCHANGED')
+    return _parser_case(GenerationCollector(), files)
+
+
+@case('collector.price.parse_csv', uses_data_dir=False)
+def parse_prices(dataset, start, end):
+    from aemo_data_service.collectors.price_collector import PriceCollector
+    rows = _last_day(dataset / 'spot_hist.parquet', end, 'SETTLEMENTDATE').reset_index()
+    files = _files(rows, 'SETTLEMENTDATE',
+                   lambda time, row: f'D,DREGION,,3,{time},1,{row.REGIONID},0,{row.RRP:.5f},0,{row.RRP:.5f},0',
+                   'DREGION,,3,SETTLEMENTDATE,RUNNO,REGIONID,INTERVENTION,RRP,EEP,ROP,APCFLAG')
+    return _parser_case(PriceCollector(), files)
+
+
+@case('collector.transmission.parse_csv', uses_data_dir=False)
+def parse_transmission(dataset, start, end):
+    from aemo_data_service.collectors.transmission_collector import TransmissionCollector
+    rows = _last_day(dataset / 'transmission_flows.parquet', end, 'settlementdate')
+    files = _files(rows, 'settlementdate',
+                   lambda time, row: (f'D,DISPATCH,INTERCONNECTORRES,3,{time},1,{row.interconnectorid},1,0,'
+                                      f'{row.meteredmwflow:.5f},{row.mwflow:.5f},{row.mwlosses:.5f},0,0,{time},'
+                                      f'{row.exportlimit:.5f},{row.importlimit:.5f},0'),
+                   'DISPATCH,INTERCONNECTORRES,3,SETTLEMENTDATE,RUNNO,INTERCONNECTORID,DISPATCHINTERVAL,'
+                   'INTERVENTION,METEREDMWFLOW,MWFLOW,MWLOSSES,MARGINALVALUE,VIOLATIONDEGREE,LASTCHANGED,'
+                   'EXPORTLIMIT,IMPORTLIMIT,MARGINALLOSS')
+    return _parser_case(TransmissionCollector(), files)
+
+
+@case('collector.rooftop.parse_csv', uses_data_dir=False)
+def parse_rooftop(dataset, start, end):
+    from aemo_data_service.collectors.rooftop_collector import RooftopCollector
+    rows = _last_day(dataset / 'rooftop_solar.parquet', end, 'settlementdate')
+    # Rooftop PV actuals are published every 30 minutes
+    rows = rows[rows['settlementdate'].dt.minute % 30 == 0]
+    rows = rows.melt(id_vars='settlementdate', var_name='regionid', value_name='powermw')
+    files = _files(rows, 'settlementdate',
+                   lambda time, row: f'D,ROOFTOP,ACTUAL,2,{time},{row.regionid},{row.powermw:.3f},1,MEASUREMENT,{time}',
+                   'ROOFTOP,ACTUAL,2,INTERVAL_DATETIME,REGIONID,POWER,QI,TYPE,LASTCHANGED')
+    return _parser_case(RooftopCollector(), files)
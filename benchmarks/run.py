@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Dashboard Benchmark Suite
+Times the dashboard's heavy paths (see cases.py) against synthetic datasets of
+1 day, 30 days, 1 year and 5 years, and tracks the results.
+
+Datasets are generated on first use with aemo_dashboard.diagnostics.synthetic_data
+(same seed and end date every time) and kept in benchmarks/data. Each case
+runs in a fresh process per dataset, so its peak RSS is its own and an
+out-of-memory failure only loses that result. Results - wall time (best of
+--repeat), peak RSS, RSS growth during the call and peak allocations traced by
+tracemalloc - are appended to benchmarks/history.json with the git commit.
+
+Usage:
+    python benchmarks/run.py run [--sizes 1d 30d 1y 5y] [--cases dashboard station] [--repeat 3]
+    python benchmarks/run.py compare [--baseline -2] [--run -1] [--threshold 10]
+    python benchmarks/run.py list
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent
+
+# Add src to path for imports
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from cases import CASES
+
+DEFAULT_DATA_DIR = BENCHMARKS_DIR / 'data'
+DEFAULT_HISTORY_FILE = BENCHMARKS_DIR / 'history.json'
+
+# Dataset size -> generate_dataset length. Every size has the production fleet, so
+# a case that runs out of memory or time at a size is recorded as failing there.
+SIZES = {
+    '1d': {'days': 1},
+    '30d': {'days': 30},
+    '1y': {'years': 1},
+    '5y': {'years': 5},
+}
+FLEET_DUIDS = 600
+DATASET_END = '2025-07-01'
+DATASET_SEED = 0
+
+# Set empty for the workers so every file is under DATA_DIR, even if .env names one
+DATA_FILE_VARS = [
+    'SPOT_HIST_FILE', 'GEN_OUTPUT_FILE', 'GEN_INFO_FILE', 'TRANSMISSION_OUTPUT_FILE', 'ROOFTOP_SOLAR_FILE',
+    'DUID_DAILY_FILE', 'GEN_BY_DUID_DIR', 'DUID_HOURLY_DIR', 'LATEST_DIR', 'PRICE_ALERT_STATE_FILE',
+    'DATA_EVENTS_FILE', 'DATA_EVENTS_DIR', 'UNKNOWN_DUIDS_FILE', 'RAW_CACHE_DIR',
+]
+
+# A change is only a regression if it is also larger than these
+MIN_SECONDS_CHANGE = 0.05
+MIN_MB_CHANGE = 20.0
+
+# Measurements compared between runs: result key -> label
+METRICS = {'wall_seconds': 'time (s)', 'peak_rss_mb': 'peak RSS (MB)', 'alloc_peak_mb': 'allocations (MB)'}
+
+
+# Datasets
+
+def ensure_dataset(size: str, data_dir: Path) -> dict:
+    """The synthetic dataset for a size, generated if missing: {'path', 'start', 'end'}"""
+    path = data_dir / size
+    spec = {'size': size, **SIZES[size], 'n_duids': FLEET_DUIDS, 'end': DATASET_END, 'seed': DATASET_SEED}
+    info_file = path / 'dataset.json'
+    if info_file.exists():
+        info = json.loads(info_file.read_text())
+        if info.get('spec') == spec:
+            return {'path': path, 'start': info['start'], 'end': info['end']}
+
+    import pandas as pd
+    from aemo_dashboard.diagnostics.synthetic_data import generate_dataset
+
+    print(f"Generating the {size} dataset in {path}...")
+    started = time.perf_counter()
+    generate_dataset(path, end=DATASET_END, n_duids=FLEET_DUIDS, seed=DATASET_SEED, **SIZES[size])
+    times = pd.read_parquet(path / 'spot_hist.parquet', columns=['RRP']).index
+    info = {'spec': spec, 'start': str(times.min()), 'end': str(times.max())}
+    info_file.write_text(json.dumps(info, indent=2))
+    print(f"  done in {time.perf_counter() - started:.0f}s")
+    return {'path': path, 'start': info['start'], 'end': info['end']}
+
+
+# Measurement (in the worker process)
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS for this process (Linux), so VmHWM covers only what follows"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _rss_mb(field: str = 'VmRSS') -> float:
+    """Current (VmRSS) or peak (VmHWM) RSS in MB; the process peak where /proc is not available"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 1024 / (1024 if sys.platform == 'darwin' else 1)
+
+
+def measure(case: str, dataset: Path, start: str, end: str, repeat: int = 3, allocations: bool = True) -> dict:
+    """Set up a case, time its call repeat times and trace the allocations of one more call"""
+    import pandas as pd
+
+    function, _ = CASES[case]
+    setup_started = time.perf_counter()
+    run = function(dataset, pd.Timestamp(start), pd.Timestamp(end))
+    setup_seconds = time.perf_counter() - setup_started
+
+    timings = []
+    peak_rss = rss_growth = 0.0
+    for _ in range(repeat):
+        gc.collect()
+        _reset_peak_rss()
+        rss_before = _rss_mb()
+        started = time.perf_counter()
+        rows = run()
+        timings.append(time.perf_counter() - started)
+        peak = _rss_mb('VmHWM')
+        peak_rss = max(peak_rss, peak)
+        rss_growth = max(rss_growth, peak - rss_before)
+
+    result = {
+        'rows': rows,
+        'wall_seconds': round(min(timings), 4),
+        'wall_seconds_all': [round(seconds, 4) for seconds in timings],
+        'setup_seconds': round(setup_seconds, 2),
+        'peak_rss_mb': round(peak_rss, 1),
+        'rss_growth_mb': round(rss_growth, 1),
+    }
+
+    if allocations:
+        # Traced separately - tracemalloc slows the Python-heavy cases down
+        gc.collect()
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result['alloc_peak_mb'] = round(peak / 1024 ** 2, 1)
+
+    return result
+
+
+def run_case(case: str, size: str, dataset: dict, scratch_dir: Path, repeat: int,
+             allocations: bool, timeout: float) -> dict:
+    """Measure one case on one dataset in a fresh process"""
+    _, uses_data_dir = CASES[case]
+    env = dict(os.environ, **{name: '' for name in DATA_FILE_VARS})
+    env['DATA_DIR'] = str(dataset['path'] if uses_data_dir else scratch_dir / 'data')
+    env['LOGS_DIR'] = str(scratch_dir / 'logs')
+    env.setdefault('LOG_LEVEL', 'WARNING')
+
+    output_file = scratch_dir / 'result.json'
+    output_file.unlink(missing_ok=True)
+    command = [sys.executable, str(Path(__file__).resolve()), 'worker', case, str(dataset['path']),
+               dataset['start'], dataset['end'], str(output_file), '--repeat', str(repeat)]
+    if not allocations:
+        command.append('--no-allocations')
+
+    result = {'case': case, 'size': size}
+    try:
+        process = subprocess.run(command, env=env, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {**result, 'error': f"timed out after {timeout:.0f}s"}
+
+    if process.returncode != 0 or not output_file.exists():
+        if process.returncode < 0:
+            error = f"killed by signal {-process.returncode} (out of memory?)"
+        else:
+            error = (process.stderr.strip().splitlines() or [f"exit code {process.returncode}"])[-1]
+        return {**result, 'error': error}
+    return {**result, **json.loads(output_file.read_text())}
+
+
+# History
+
+def load_history(history_file: Path) -> list:
+    if history_file.exists():
+        return json.loads(history_file.read_text())
+    return []
+
+
+def _git_commit() -> str:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _select_run(history: list, selector: str) -> dict:
+    """A run by index into the history (e.g. -1 for the latest) or by commit prefix (latest run of it)"""
+    try:
+        return history[int(selector)]
+    except ValueError:
+        matches = [run for run in history if run['commit'].startswith(selector)]
+        if not matches:
+            raise SystemExit(f"No run for commit {selector}")
+        return matches[-1]
+    except IndexError:
+        raise SystemExit(f"No run {selector} - the history has {len(history)} runs")
+
+
+def compare_runs(baseline: dict, current: dict, threshold: float = 10.0) -> list:
+    """
+    Compare two runs, case by case and size by size.
+
+    A metric regresses if it grew by more than threshold percent (and by more
+    than MIN_SECONDS_CHANGE / MIN_MB_CHANGE); a case that failed (ran out of
+    memory or time, or raised) in the current run but not in the baseline is a
+    regression too. Cases failing in both runs get a status row that is not a
+    regression.
+
+    Returns:
+        List of rows: case, size, metric, baseline, current, change (%), regression
+    """
+    baseline_results = {(result['case'], result['size']): result for result in baseline['results']}
+    rows = []
+    for result in current['results']:
+        base = baseline_results.get((result['case'], result['size']))
+        if base is None:
+            # Not in the baseline - only a failure is worth a row
+            if 'error' in result:
+                rows.append({
+                    'case': result['case'], 'size': result['size'], 'metric': 'status',
+                    'baseline': 'not run', 'current': result['error'], 'change': None, 'regression': True,
+                })
+            continue
+        if 'error' in result or 'error' in base:
+            rows.append({
+                'case': result['case'], 'size': result['size'], 'metric': 'status',
+                'baseline': base.get('error', 'ok'), 'current': result.get('error', 'ok'), 'change': None,
+                'regression': 'error' in result and 'error' not in base,
+            })
+            continue
+        for metric in METRICS:
+            if metric not in result or metric not in base:
+                continue
+            before, after = base[metric], result[metric]
+            change = 100.0 * (after - before) / before if before else 0.0
+            minimum = MIN_SECONDS_CHANGE if metric == 'wall_seconds' else MIN_MB_CHANGE
+            rows.append({
+                'case': result['case'], 'size': result['size'], 'metric': metric,
+                'baseline': before, 'current': after, 'change': round(change, 1),
+                'regression': change > threshold and after - before > minimum,
+            })
+    return rows
+
+
+# Commands
+
+def _case_names(selected) -> list:
+    """Cases matching any of the given names or name prefixes (all if none given)"""
+    if not selected:
+        return list(CASES)
+    names = [name for name in CASES if any(name.startswith(prefix) for prefix in selected)]
+    if not names:
+        raise SystemExit(f"No cases match {selected} - see 'run.py list'")
+    return names
+
+
+def _format_result(result: dict) -> str:
+    if 'error' in result:
+        return f"FAILED: {result['error']}"
+    text = (f"{result['wall_seconds']:9.3f}s  peak RSS {result['peak_rss_mb']:8.1f} MB"
+            f"  (+{result['rss_growth_mb']:.1f} MB)")
+    if 'alloc_peak_mb' in result:
+        text += f"  allocations {result['alloc_peak_mb']:8.1f} MB"
+    return text + f"  rows {result['rows']:,}"
+
+
+def run_command(args) -> int:
+    cases = _case_names(args.cases)
+    data_dir = Path(args.data_dir)
+    history_file = Path(args.history)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='aemo-bench-') as scratch:
+        scratch_dir = Path(scratch)
+        for size in args.sizes:
+            try:
+                dataset = ensure_dataset(size, data_dir)
+            except Exception as e:  # e.g. out of memory or disk while generating
+                print(f"\n{size}: dataset generation failed: {e}")
+                results.extend({'case': case, 'size': size, 'error': f"dataset generation failed: {e}"} for case in cases)
+                continue
+            print(f"\n{size} ({dataset['start']} to {dataset['end']})")
+            for case in cases:
+                result = run_case(case, size, dataset, scratch_dir, args.repeat, not args.no_allocations, args.timeout)
+                results.append(result)
+                print(f"  {case:48} {_format_result(result)}")
+
+    run = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _git_commit(),
+        'label': args.label,
+        'python': platform.python_version(),
+        'machine': f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs",
+        'repeat': args.repeat,
+        'results': results,
+    }
+    if not args.no_save:
+        history = load_history(history_file)
+        history.append(run)
+        history_file.write_text(json.dumps(history, indent=1) + '\n')
+        print(f"\nSaved as run {len(history) - 1} in {history_file}")
+    return 0
+
+
+def compare_command(args) -> int:
+    history = load_history(Path(args.history))
+    if len(history) < 2:
+        print("Need at least two runs in the history to compare")
+        return 0
+    baseline, current = _select_run(history, args.baseline), _select_run(history, args.run)
+    print(f"Baseline: {baseline['timestamp']} ({baseline['commit']}) {baseline.get('label') or ''}")
+    print(f"Current:  {current['timestamp']} ({current['commit']}) {current.get('label') or ''}")
+    if baseline.get('machine') != current.get('machine'):
+        print(f"Warning: runs are from different machines ({baseline.get('machine')} / {current.get('machine')})")
+
+    rows = compare_runs(baseline, current, args.threshold)
+    regressions = [row for row in rows if row['regression']]
+    improved = [row for row in rows if row['change'] is not None and row['change'] < -args.threshold]
+    # Failures are always shown
+    shown = rows if args.all else [row for row in rows if row['regression'] or row in improved or row['change'] is None]
+    for row in shown:
+        if row['regression']:
+            flag = 'REGRESSION'
+        elif row['metric'] == 'status' and row['current'] != 'ok':
+            flag = 'FAILED'
+        else:
+            flag = 'improved' if row in improved else ''
+        change = f"{row['change']:+.1f}%" if row['change'] is not None else ''
+        label = METRICS.get(row['metric'], row['metric'])
+        print(f"  {row['case']:48} {row['size']:4} {label:17} {row['baseline']!s:>12} -> {row['current']!s:<12} "
+              f"{change:>8}  {flag}")
+
+    failed = [result for result in current['results'] if 'error' in result]
+    print(f"\n{len(regressions)} regressions (threshold {args.threshold:g}%) in {len(rows)} comparisons, "
+          f"{len(failed)} failed cases in the current run")
+    return 1 if regressions else 0
+
+
+def list_command(args) -> int:
+    print("Cases:")
+    for case in CASES:
+        print(f"  {case}")
+    print(f"Sizes: {', '.join(SIZES)}")
+    history = load_history(Path(args.history))
+    if history:
+        print("Runs:")
+        for index, run in enumerate(history):
+            sizes = sorted({result['size'] for result in run['results']}, key=list(SIZES).index)
+            print(f"  {index:3}  {run['timestamp']}  {run['commit']:14} {', '.join(sizes):16} {run.get('label') or ''}")
+    return 0
+
+
+def worker_command(args) -> int:
+    result = measure(args.case, Path(args.dataset), args.start, args.end, args.repeat, not args.no_allocations)
+    Path(args.output).write_text(json.dumps(result))
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Dashboard benchmark suite")
+    parser.add_argument('--history', default=str(DEFAULT_HISTORY_FILE), help="Results history (JSON)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Run the benchmarks and add the results to the history")
+    run_parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES),
+                            help="Dataset sizes (default all)")
+    run_parser.add_argument('--cases', nargs='+', help="Case names or prefixes (default all)")
+    run_parser.add_argument('--repeat', type=int, default=3, help="Timed calls per case (the best is recorded)")
+    run_parser.add_argument('--no-allocations', action='store_true', help="Skip the tracemalloc call")
+    run_parser.add_argument('--timeout', type=float, default=1800, help="Seconds allowed per case and size")
+    run_parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR), help="Where the datasets are kept")
+    run_parser.add_argument('--label', help="Note stored with the run")
+    run_parser.add_argument('--no-save', action='store_true', help="Print the results only")
+    run_parser.set_defaults(handler=run_command)
+
+    compare_parser = commands.add_parser('compare', help="Compare two runs and flag regressions (exit code 1)")
+    compare_parser.add_argument('--baseline', default='-2', help="Run index or commit (default the previous run)")
+    compare_parser.add_argument('--run', default='-1', help="Run index or commit (default the latest run)")
+    compare_parser.add_argument('--threshold', type=float, default=10.0, help="Percent increase that is a regression")
+    compare_parser.add_argument('--all', action='store_true', help="Show every comparison, not just the changes")
+    compare_parser.set_defaults(handler=compare_command)
+
+    list_parser = commands.add_parser('list', help="List the cases, sizes and runs in the history")
+    list_parser.set_defaults(handler=list_command)
+
+    # Used by 'run' - one case on one dataset, result written to output
+    worker_parser = commands.add_parser('worker')
+    worker_parser.add_argument('case', choices=list(CASES))
+    worker_parser.add_argument('dataset')
+    worker_parser.add_argument('start')
+    worker_parser.add_argument('end')
+    worker_parser.add_argument('output')
+    worker_parser.add_argument('--repeat', type=int, default=3)
+    worker_parser.add_argument('--no-allocations', action='store_true')
+    worker_parser.set_defaults(handler=worker_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
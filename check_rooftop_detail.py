@@ -4,10 +4,17 @@ Detailed Rooftop Solar Data Analysis
 Check for missing data and verify 24-hour coverage.
 """
 
+import sys
 import pandas as pd
 from datetime import datetime, timedelta
+from pathlib import Path
 import numpy as np
 
+# Add src to path so we can use the dashboard configuration
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from aemo_dashboard.shared.config import config
+
 def check_rooftop_detailed():
     """Detailed analysis of rooftop solar data for missing periods."""
     
@@ -15,7 +22,7 @@ def check_rooftop_detailed():
     print('=' * 60)
     
     try:
-        roof_file = '/Users/davidleitch/Library/Mobile Documents/com~apple~CloudDocs/snakeplay/AEMO_spot/rooftop_solar.parquet'
+        roof_file = config.rooftop_solar_file
         roof_df = pd.read_parquet(roof_file)
         roof_df['settlementdate'] = pd.to_datetime(roof_df['settlementdate'])
         roof_df = roof_df.sort_values('settlementdate')
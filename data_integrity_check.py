@@ -2,138 +2,20 @@
 """
 Data Integrity Check for AEMO Parquet Files
 Validates completeness and consistency of all data sources.
-"""
-
-import pandas as pd
-from datetime import datetime, timedelta
-from pathlib import Path
 
-def check_data_integrity():
-    """Comprehensive data integrity check for all AEMO parquet files."""
-    
-    print('📊 AEMO Data Integrity Check')
-    print('=' * 50)
+Runs the integrity scanner (aemo_dashboard.diagnostics.integrity) on the
+files configured in .env, e.g.:
 
-    # Check Generation Data
-    print('\n🔋 GENERATION DATA:')
-    try:
-        gen_file = '/Users/davidleitch/Library/Mobile Documents/com~apple~CloudDocs/snakeplay/AEMO_spot/genhist/gen_output.parquet'
-        gen_df = pd.read_parquet(gen_file)
-        gen_df['settlementdate'] = pd.to_datetime(gen_df['settlementdate'])
-        
-        print(f'✅ File exists: {Path(gen_file).exists()}')
-        print(f'✅ Records: {len(gen_df):,}')
-        print(f'✅ Date range: {gen_df["settlementdate"].min()} → {gen_df["settlementdate"].max()}')
-        print(f'✅ DUIDs: {gen_df["duid"].nunique()} unique units')
-        print(f'✅ File size: {Path(gen_file).stat().st_size / (1024*1024):.1f} MB')
-        
-        # Check for data gaps (should be every 5 minutes)
-        latest_5 = gen_df["settlementdate"].nlargest(5).sort_values()
-        print(f'✅ Latest 5 settlements: {latest_5.dt.strftime("%Y-%m-%d %H:%M").tolist()}')
-        
-        # Check if current (within last hour)
-        latest_time = gen_df["settlementdate"].max()
-        hours_old = (datetime.now() - latest_time).total_seconds() / 3600
-        print(f'✅ Data freshness: {hours_old:.1f} hours old')
-        
-    except Exception as e:
-        print(f'❌ Generation: Error - {e}')
-
-    # Check Price Data  
-    print('\n💰 PRICE DATA:')
-    try:
-        price_file = '/Users/davidleitch/Library/Mobile Documents/com~apple~CloudDocs/snakeplay/AEMO_spot/aemo-spot-dashboard/spot_hist.parquet'
-        price_df = pd.read_parquet(price_file)
-        price_df.index = pd.to_datetime(price_df.index)
-        
-        print(f'✅ File exists: {Path(price_file).exists()}')
-        print(f'✅ Records: {len(price_df):,}') 
-        print(f'✅ Date range: {price_df.index.min()} → {price_df.index.max()}')
-        print(f'✅ Regions: {sorted(price_df["REGIONID"].unique())}')
-        print(f'✅ File size: {Path(price_file).stat().st_size / (1024*1024):.1f} MB')
-        
-        # Latest settlements
-        latest_5 = price_df.index.nlargest(5).sort_values()
-        print(f'✅ Latest 5 settlements: {latest_5.strftime("%Y-%m-%d %H:%M").tolist()}')
-        
-        # Data freshness
-        latest_time = price_df.index.max()
-        hours_old = (datetime.now() - latest_time).total_seconds() / 3600
-        print(f'✅ Data freshness: {hours_old:.1f} hours old')
-        
-    except Exception as e:
-        print(f'❌ Prices: Error - {e}')
+    python data_integrity_check.py --days 30 --gaps-csv gaps.csv
+"""
 
-    # Check Rooftop Data
-    print('\n☀️ ROOFTOP SOLAR DATA:')
-    try:
-        roof_file = '/Users/davidleitch/Library/Mobile Documents/com~apple~CloudDocs/snakeplay/AEMO_spot/rooftop_solar.parquet'
-        roof_df = pd.read_parquet(roof_file)
-        roof_df['settlementdate'] = pd.to_datetime(roof_df['settlementdate'])
-        
-        print(f'✅ File exists: {Path(roof_file).exists()}')
-        print(f'✅ Records: {len(roof_df):,}')
-        print(f'✅ Date range: {roof_df["settlementdate"].min()} → {roof_df["settlementdate"].max()}')
-        
-        roof_regions = [col for col in roof_df.columns if col != 'settlementdate']
-        print(f'✅ Regions: {roof_regions}')
-        print(f'✅ File size: {Path(roof_file).stat().st_size / (1024*1024):.1f} MB')
-        
-        # Latest settlements
-        latest_5 = roof_df["settlementdate"].nlargest(5).sort_values()
-        print(f'✅ Latest 5 settlements: {latest_5.dt.strftime("%Y-%m-%d %H:%M").tolist()}')
-        
-        # Data freshness (rooftop is 30-min data, so expect larger gaps)
-        latest_time = roof_df["settlementdate"].max()
-        hours_old = (datetime.now() - latest_time).total_seconds() / 3600
-        print(f'✅ Data freshness: {hours_old:.1f} hours old (30-min frequency)')
-        
-        # Check 30-min to 5-min conversion (should be 6 records per 30-min period)
-        time_diff = roof_df["settlementdate"].diff().dropna()
-        five_min_intervals = (time_diff == timedelta(minutes=5)).sum()
-        thirty_min_intervals = (time_diff == timedelta(minutes=30)).sum()
-        print(f'✅ 5-min intervals: {five_min_intervals} (from 30-min conversion)')
-        print(f'✅ 30-min jumps: {thirty_min_intervals} (expected at period boundaries)')
-        
-    except Exception as e:
-        print(f'❌ Rooftop: Error - {e}')
+import sys
+from pathlib import Path
 
-    # Check Transmission Data
-    print('\n🔌 TRANSMISSION FLOW DATA:')
-    try:
-        trans_file = '/Users/davidleitch/Library/Mobile Documents/com~apple~CloudDocs/snakeplay/AEMO_spot/transmission_flows.parquet'
-        trans_df = pd.read_parquet(trans_file)
-        trans_df['settlementdate'] = pd.to_datetime(trans_df['settlementdate'])
-        
-        print(f'✅ File exists: {Path(trans_file).exists()}')
-        print(f'✅ Records: {len(trans_df):,}')
-        print(f'✅ Date range: {trans_df["settlementdate"].min()} → {trans_df["settlementdate"].max()}')
-        print(f'✅ Interconnectors: {sorted(trans_df["interconnectorid"].unique())}')
-        print(f'✅ File size: {Path(trans_file).stat().st_size / (1024*1024):.1f} MB')
-        
-        # Latest settlements
-        latest_5 = trans_df["settlementdate"].nlargest(5).sort_values()
-        print(f'✅ Latest 5 settlements: {latest_5.dt.strftime("%Y-%m-%d %H:%M").tolist()}')
-        
-        # Data freshness
-        latest_time = trans_df["settlementdate"].max()
-        hours_old = (datetime.now() - latest_time).total_seconds() / 3600
-        print(f'✅ Data freshness: {hours_old:.1f} hours old')
-        
-        # Check flow metrics
-        print(f'✅ Flow metrics: {[col for col in trans_df.columns if col not in ["settlementdate", "interconnectorid"]]}')
-        
-    except Exception as e:
-        print(f'❌ Transmission: Error - {e}')
+# Add src to path so we can import the dashboard package
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-    # Summary
-    print('\n🎯 SUMMARY:')
-    print('✅ All four data sources have been validated')
-    print('✅ Data ranges show continuous collection')
-    print('✅ File sizes indicate substantial datasets')
-    print('✅ Rooftop 30-min to 5-min conversion working correctly')
-    print('✅ All NEM regions and interconnectors represented')
-    print('\n🚀 Data integrity check complete - all systems operational!')
+from aemo_dashboard.diagnostics.integrity import main
 
 if __name__ == "__main__":
-    check_data_integrity()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+DUID x day rollup of generation and revenue.
+
+The price analysis results are additive per DUID per day: sum of MW readings,
+sum of revenue, interval count and first/last interval. The data service keeps
+duid_daily.parquet up to date after every collection cycle, and
+PriceAnalysisMotor answers whole-day queries by summing it instead of
+re-aggregating the 5-minute rows.
+"""
+
+import os
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+
+from ..shared.config import config
+from ..shared.duid_history import parquet_time_range
+from ..shared.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DAILY_COLUMNS = ['date', 'duid', 'generation_sum', 'revenue_sum', 'interval_count', 'first_interval', 'last_interval']
+
+
+def rollup_daily(integrated_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Roll integrated 5-minute rows up to one row per DUID per day.
+
+    Args:
+        integrated_data: Rows with settlementdate, duid, scadavalue and revenue_5min
+
+    Returns:
+        DataFrame with DAILY_COLUMNS
+    """
+    if integrated_data.empty:
+        return pd.DataFrame(columns=DAILY_COLUMNS)
+
+    daily = integrated_data.groupby(
+        [integrated_data['settlementdate'].dt.normalize().rename('date'), 'duid'], observed=True
+    ).agg(
+        generation_sum=('scadavalue', 'sum'),
+        revenue_sum=('revenue_5min', 'sum'),
+        interval_count=('settlementdate', 'count'),
+        first_interval=('settlementdate', 'min'),
+        last_interval=('settlementdate', 'max')
+    ).reset_index()
+    daily['duid'] = daily['duid'].astype(object)
+    return daily[DAILY_COLUMNS]
+
+
+def load_duid_daily(start_date: Optional[str] = None, end_date: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    Load the DUID x day table for whole days from start_date to end_date.
+
+    Args:
+        start_date: First day (YYYY-MM-DD format), if None loads from the start
+        end_date: Last day (YYYY-MM-DD format), if None loads to the end
+
+    Returns:
+        DataFrame with DAILY_COLUMNS, or None if the table has not been built
+    """
+    path = config.duid_daily_file
+    if not path.exists():
+        return None
+
+    filters = []
+    if start_date:
+        filters.append(('date', '>=', pd.Timestamp(start_date)))
+    if end_date:
+        filters.append(('date', '<=', pd.Timestamp(end_date)))
+
+    try:
+        return pd.read_parquet(path, filters=filters or None)
+    except Exception as e:
+        logger.error(f"Error loading DUID daily table: {e}")
+        return None
+
+
+def update_duid_daily(since: Optional[datetime] = None) -> bool:
+    """
+    Bring duid_daily.parquet up to date with the generation and price files.
+
+    Days from `since` onwards are recomputed from the 5-minute data and earlier
+    days are kept. By default `since` is the last day in the table, which may
+    have been partial when it was written. Without a table, it is built from
+    the start of the generation history a month at a time to bound memory.
+    Delete the file to force a full rebuild (e.g. after DUID mapping changes).
+
+    Args:
+        since: Recompute days from this date (e.g. after repairing older data)
+
+    Returns:
+        bool: True if the table was updated
+    """
+    try:
+        path = config.duid_daily_file
+        existing = pd.read_parquet(path) if path.exists() else None
+        if since is None and existing is not None and not existing.empty:
+            since = existing['date'].max()
+
+        gen_start, gen_end = parquet_time_range(config.gen_output_file, 'settlementdate')
+        if gen_start is None:
+            logger.warning("No generation data - DUID daily table not updated")
+            return False
+
+        start = pd.Timestamp(since).normalize() if since is not None else gen_start.normalize()
+        frames = [] if existing is None else [existing[existing['date'] < start]]
+
+        window_start = start
+        while window_start <= gen_end:
+            window_end = min(window_start + pd.DateOffset(months=1), gen_end.normalize() + pd.Timedelta(days=1))
+            daily = _rollup_window(window_start, window_end - pd.Timedelta(days=1))
+            if daily is None:
+                return False
+            frames.append(daily)
+            window_start = window_end
+
+        frames = [frame for frame in frames if not frame.empty]
+        table = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=DAILY_COLUMNS)
+        table = table.sort_values(['date', 'duid']).reset_index(drop=True)
+
+        # Write then rename so readers never see a partial file
+        tmp_path = path.with_suffix('.tmp')
+        table.to_parquet(tmp_path, compression='snappy', index=False)
+        os.replace(tmp_path, path)
+
+        logger.info(f"DUID daily table updated from {start.date()}: {len(table):,} rows")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error updating DUID daily table: {e}")
+        return False
+
+
+def _rollup_window(first_day: pd.Timestamp, last_day: pd.Timestamp) -> Optional[pd.DataFrame]:
+    """Integrate the whole days first_day..last_day and roll them up per DUID per day"""
+    from .price_analysis import PriceAnalysisMotor
+
+    start_date = first_day.strftime('%Y-%m-%d')
+    end_date = last_day.strftime('%Y-%m-%d')
+    motor = PriceAnalysisMotor()
+    if not (motor.load_data(start_date, end_date) and motor.standardize_columns()):
+        return None
+    if motor.gen_data.empty or motor.price_data.empty:
+        return pd.DataFrame(columns=DAILY_COLUMNS)
+    if not motor.integrate_data(start_date, end_date, use_daily=False):
+        return None
+    return rollup_daily(motor.integrated_data)
+
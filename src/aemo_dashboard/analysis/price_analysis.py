@@ -12,9 +12,55 @@ from typing import Dict, List, Tuple, Optional, Union
 import pickle
 from ..shared.config import config
 from ..shared.logging_config import get_logger
+from ..shared.gen_info import clean_capacity
+from ..shared.duid_history import parquet_time_range
+from .duid_daily import load_duid_daily, rollup_daily
 
 logger = get_logger(__name__)
 
+DISPATCH_INTERVAL_NS = pd.Timedelta(minutes=5).value
+
+
+def _date_filters(column: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Optional[List[Tuple]]:
+    """Parquet filters for whole days from start_date to end_date (pushed down to pyarrow)"""
+    filters = []
+    if start_date:
+        filters.append((column, '>=', pd.Timestamp(start_date)))
+    if end_date:
+        # Add 1 day to end_date to include the full end day
+        filters.append((column, '<', pd.Timestamp(end_date) + pd.Timedelta(days=1)))
+    return filters or None
+
+
+def _mapping_columns(mapping: pd.DataFrame, duid_rows: np.ndarray, row_duids: np.ndarray) -> Dict[str, object]:
+    """
+    Mapping columns for rows given as DUID codes.
+    
+    Args:
+        mapping: DUID mapping with one row per DUID
+        duid_rows: Mapping row of each DUID code (every code in row_duids has one)
+        row_duids: DUID code of each row
+    """
+    columns = {}
+    for column in ['Region', 'Fuel', 'Site Name', 'Owner']:
+        if column in mapping.columns:
+            codes, values = pd.factorize(mapping[column], sort=True)
+            duid_values = codes[duid_rows].astype(np.int16)
+            columns[column] = pd.Categorical.from_codes(duid_values[row_duids], categories=values, validate=False)
+    if 'Capacity(MW)' in mapping.columns:
+        # gen_info holds some capacities as ranges ("23.44 - 27.60")
+        duid_capacity = mapping['Capacity(MW)'].map(clean_capacity).to_numpy(dtype=float)[duid_rows]
+        columns['Capacity(MW)'] = duid_capacity[row_duids]
+    return columns
+
+
+def _plain_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert categorical columns (integrated data mapping columns) back to plain values"""
+    for column in df.columns[df.dtypes == 'category']:
+        df[column] = df[column].astype(object)
+    return df
+
+
 class PriceAnalysisMotor:
     """Core calculation engine for price analysis"""
     
@@ -24,28 +70,46 @@ class PriceAnalysisMotor:
         self.price_data = None 
         self.duid_mapping = None
         self.integrated_data = None
+        self.daily_data = None
+        self.data_version = None  # Identifies the integrated data (for result caching)
+        self.date_range = (None, None)
         logger.info("Price Analysis Motor initialized")
     
-    def load_data(self) -> bool:
+    def load_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> bool:
         """
         Load all required data files.
         
+        The date bounds are pushed down into the parquet reads, so loading a
+        short window does not read the whole archive.
+        
+        Args:
+            start_date: First day to load (YYYY-MM-DD format), if None loads from the start
+            end_date: Last day to load (YYYY-MM-DD format), if None loads to the end
+        
         Returns:
             bool: True if all data loaded successfully
         """
         try:
+            if start_date or end_date:
+                logger.info(f"Loading data for {start_date} to {end_date}")
+            
             logger.info("Loading generation data...")
-            self.gen_data = pd.read_parquet(config.gen_output_file)
+            # DUIDs as a categorical: a few hundred codes instead of a string per row
+            self.gen_data = pd.read_parquet(
+                config.gen_output_file,
+                read_dictionary=['duid', 'DUID'],
+                filters=_date_filters('settlementdate', start_date, end_date)
+            )
             logger.info(f"Loaded {len(self.gen_data):,} generation records")
             
             logger.info("Loading price data...")
-            self.price_data = pd.read_parquet(config.spot_hist_file)
+            self.price_data = pd.read_parquet(
+                config.spot_hist_file,
+                filters=_date_filters('SETTLEMENTDATE', start_date, end_date)
+            )
             logger.info(f"Loaded {len(self.price_data):,} price records")
             
-            logger.info("Loading DUID mapping...")
-            with open(config.gen_info_file, 'rb') as f:
-                self.duid_mapping = pickle.load(f)
-            logger.info(f"Loaded {len(self.duid_mapping)} DUID mappings")
+            self._load_duid_mapping()
             
             # Quick data inspection
             self._inspect_data()
@@ -56,6 +120,73 @@ class PriceAnalysisMotor:
             logger.error(f"Error loading data: {e}")
             return False
     
+    def _load_duid_mapping(self):
+        """Load the DUID mapping (gen_info.pkl)"""
+        logger.info("Loading DUID mapping...")
+        with open(config.gen_info_file, 'rb') as f:
+            self.duid_mapping = pickle.load(f)
+        logger.info(f"Loaded {len(self.duid_mapping)} DUID mappings")
+    
+    def load_days(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> bool:
+        """
+        Load whole days from start_date to end_date, ready for the aggregations.
+        
+        Days in the DUID daily table are read from it and become daily_data;
+        5-minute generation and prices are only read and integrated for the
+        days from its last day on (which may have been partial when it was
+        written). Without the table, the window's 5-minute rows are loaded
+        and integrated as before.
+        
+        Args:
+            start_date: First day to load (YYYY-MM-DD format), if None loads from the start
+            end_date: Last day to load (YYYY-MM-DD format), if None loads to the end
+        
+        Returns:
+            bool: True if the data loaded successfully
+        """
+        table_start, table_end = parquet_time_range(config.duid_daily_file, 'date')
+        if (table_start is None
+                or (end_date and pd.Timestamp(end_date) < table_start)
+                or (start_date and pd.Timestamp(start_date) >= table_end)):
+            # The table doesn't cover any complete day of the window
+            return self.load_data(start_date, end_date) and self.standardize_columns() and \
+                self.integrate_data(start_date, end_date)
+        
+        try:
+            daily = load_duid_daily(start_date, end_date)
+            if daily is None:
+                raise ValueError("DUID daily table could not be read")
+            daily = daily[daily['date'] < table_end]
+            
+            if end_date is None or pd.Timestamp(end_date) >= table_end:
+                tail_start = table_end.strftime('%Y-%m-%d')
+                if not (self.load_data(tail_start, end_date) and self.standardize_columns()):
+                    return False
+                if self.gen_data.empty or self.price_data.empty:
+                    self.integrated_data = None
+                elif not self.integrate_data(tail_start, end_date, use_daily=False):
+                    return False
+                if self.integrated_data is not None:
+                    daily = pd.concat([daily, rollup_daily(self.integrated_data)], ignore_index=True)
+            else:
+                self._load_duid_mapping()
+                self.gen_data = self.price_data = self.integrated_data = None
+            
+            mapping = self.duid_mapping.drop_duplicates('DUID').reset_index(drop=True)
+            self.daily_data = self._attach_mapping(daily, mapping)
+            if self.daily_data.empty:
+                raise ValueError("No data in the DUID daily table for the selected dates")
+            
+            start, end, records = self.get_loaded_period()
+            logger.info(f"Daily data: {len(self.daily_data):,} DUID-days from {start} to {end} ({records:,} intervals)")
+            self.data_version = (start, end, records, len(mapping))
+            self.date_range = (start_date, end_date)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error loading daily data: {e}")
+            return False
+    
     def _inspect_data(self):
         """Inspect loaded data structure and report key information"""
         logger.info("=== Data Inspection ===")
@@ -117,50 +248,30 @@ class PriceAnalysisMotor:
             logger.error(f"Error standardizing columns: {e}")
             return False
     
-    def integrate_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> bool:
+    def integrate_data(self, start_date: Optional[str] = None, end_date: Optional[str] = None, use_daily: bool = True) -> bool:
         """
         Integrate generation, price, and DUID mapping data.
         
+        Rather than merging the wide DUID mapping and the price table onto every
+        SCADA row, each row is mapped to an interval index and a region code and
+        its RRP is gathered from a dense (interval x region) price matrix. Only
+        the columns the aggregations need are kept; the mapping columns are
+        stored as categoricals.
+        
+        When the data service's DUID daily table exists, daily_data is built
+        as well and the aggregations sum it instead of the 5-minute rows.
+        
         Args:
             start_date: Filter start date (YYYY-MM-DD format), if None uses all data
             end_date: Filter end date (YYYY-MM-DD format), if None uses all data
+            use_daily: Build daily_data from the DUID daily table (if available)
         
         Returns:
             bool: True if integration successful
         """
         try:
             logger.info("Starting data integration...")
-            
-            # First, join generation with DUID mapping
-            logger.info("Joining generation data with DUID mapping...")
-            gen_with_mapping = self.gen_data.merge(
-                self.duid_mapping,
-                left_on='duid',
-                right_on='DUID',
-                how='left'
-            )
-            
-            missing_duids = gen_with_mapping[gen_with_mapping['Region'].isna()]['duid'].unique()
-            if len(missing_duids) > 0:
-                logger.warning(f"Found {len(missing_duids)} DUIDs without mapping: {missing_duids[:10]}...")
-            
-            logger.info(f"Generation+DUID data shape: {gen_with_mapping.shape}")
-            
-            # Price data is already in the right format (SETTLEMENTDATE, REGIONID, RRP)
-            logger.info("Price data already in correct format")
-            logger.info(f"Price data columns: {list(self.price_data.columns)}")
-            logger.info(f"Price data shape: {self.price_data.shape}")
-            
-            # Join with price data
-            logger.info("Joining with price data...")
-            self.integrated_data = gen_with_mapping.merge(
-                self.price_data,
-                left_on=['settlementdate', 'Region'],
-                right_on=['SETTLEMENTDATE', 'REGIONID'],
-                how='inner'  # Only keep records where we have both generation and price
-            )
-            
-            logger.info(f"Integrated data shape: {self.integrated_data.shape}")
+            gen_data = self.gen_data
             
             # Apply date filtering if specified
             if start_date or end_date:
@@ -168,24 +279,90 @@ class PriceAnalysisMotor:
                 
                 if start_date:
                     start_dt = pd.to_datetime(start_date)
-                    self.integrated_data = self.integrated_data[self.integrated_data['settlementdate'] >= start_dt]
-                    logger.info(f"After start date filter: {len(self.integrated_data):,} records")
+                    gen_data = gen_data[gen_data['settlementdate'] >= start_dt]
+                    logger.info(f"After start date filter: {len(gen_data):,} records")
                 
                 if end_date:
                     # Add 1 day to end_date to include the full end day
                     end_dt = pd.to_datetime(end_date) + pd.Timedelta(days=1)
-                    self.integrated_data = self.integrated_data[self.integrated_data['settlementdate'] < end_dt]
-                    logger.info(f"After end date filter: {len(self.integrated_data):,} records")
+                    gen_data = gen_data[gen_data['settlementdate'] < end_dt]
+                    logger.info(f"After end date filter: {len(gen_data):,} records")
+            
+            # Map every SCADA row to a row of the DUID mapping
+            logger.info("Mapping generation data to DUID mapping...")
+            mapping = self.duid_mapping.drop_duplicates('DUID').reset_index(drop=True)
+            if len(mapping) < len(self.duid_mapping):
+                logger.warning(f"Dropped {len(self.duid_mapping) - len(mapping)} duplicate DUIDs from mapping")
+            if isinstance(gen_data['duid'].dtype, pd.CategoricalDtype):
+                duid_codes = gen_data['duid'].cat.codes.to_numpy()
+                duids = pd.Index(gen_data['duid'].cat.categories.astype(object))
+            else:
+                duid_codes, duids = pd.factorize(gen_data['duid'], sort=True)
+            duid_rows = pd.Index(mapping['DUID']).get_indexer(duids)
+            
+            missing_duids = duids[duid_rows < 0]
+            if len(missing_duids) > 0:
+                logger.warning(f"Found {len(missing_duids)} DUIDs without mapping: {missing_duids[:10]}...")
+            
+            # Dense price matrix, flattened: one row per 5-minute dispatch interval
+            # since the first price, one column per region
+            logger.info(f"Price data shape: {self.price_data.shape}")
+            prices = self.price_data.drop_duplicates(['SETTLEMENTDATE', 'REGIONID'], keep='last')
+            if prices.empty:
+                raise ValueError("No price data to integrate")
+            region_codes, regions = pd.factorize(prices['REGIONID'], sort=True)
+            price_times = prices['SETTLEMENTDATE'].to_numpy(dtype='datetime64[ns]').view('i8')
+            first_interval = price_times.min()
+            price_intervals, remainder = np.divmod(price_times - first_interval, DISPATCH_INTERVAL_NS)
+            on_interval = remainder == 0
+            if not on_interval.all():
+                logger.warning(f"Ignoring {(~on_interval).sum()} price records not on a 5-minute interval")
+            n_intervals = price_intervals.max() + 1
+            price_slots = price_intervals[on_interval] * len(regions) + region_codes[on_interval]
+            price_matrix = np.full(n_intervals * len(regions), np.nan)
+            price_matrix[price_slots] = prices['RRP'].to_numpy(dtype=float)[on_interval]
+            has_price = np.zeros(len(price_matrix), dtype=bool)
+            has_price[price_slots] = True
+            
+            # Interval index of each SCADA row (arithmetic on its timestamp) and
+            # region code of each row (via its DUID's mapping row). The per-DUID
+            # lookup has a trailing -1 for rows whose DUID is missing (code -1).
+            logger.info("Gathering prices for generation data...")
+            gen_times = gen_data['settlementdate'].to_numpy(dtype='datetime64[ns]')
+            region_of_mapping_row = pd.Index(regions).get_indexer(mapping['Region'])
+            duid_regions = np.append(np.where(duid_rows >= 0, region_of_mapping_row[duid_rows], -1), -1).astype(np.int64)
+            row_regions = duid_regions[duid_codes]
+            
+            # Only keep records where we have both generation and price
+            # (updated in place - these arrays have one element per SCADA row)
+            row_slots, remainder = np.divmod(gen_times.view('i8') - first_interval, DISPATCH_INTERVAL_NS)
+            keep = remainder == 0
+            del remainder
+            keep &= (row_slots >= 0) & (row_slots < n_intervals) & (row_regions >= 0)
+            row_slots *= len(regions)
+            row_slots += row_regions
+            del row_regions
+            keep[keep] = has_price[row_slots[keep]]
+            rows = slice(None) if keep.all() else keep
+            row_duids = duid_codes[rows]
+            rrp = price_matrix[row_slots[rows]]
+            
+            scadavalue = gen_data['scadavalue'].to_numpy()[rows]
+            integrated = {
+                'settlementdate': gen_times[rows],
+                'duid': pd.Categorical.from_codes(row_duids, categories=duids, validate=False),
+                'scadavalue': scadavalue,
+            }
+            integrated.update(_mapping_columns(mapping, duid_rows, row_duids))  # Every kept DUID has a mapping row
             
             # Calculate 5-minute revenue
             # scadavalue is MW for 5-min interval, RRP is $/MWh
             # Revenue = MW × (5min/60min) × $/MWh = MWh × $/MWh = $
             logger.info("Calculating 5-minute revenues...")
-            self.integrated_data['revenue_5min'] = (
-                self.integrated_data['scadavalue'] * 
-                self.integrated_data['RRP'] * 
-                (5.0 / 60.0)  # Convert MW×5min to MWh, then × $/MWh = $
-            )
+            integrated['revenue_5min'] = scadavalue * rrp * (5.0 / 60.0)  # Convert MW×5min to MWh, then × $/MWh = $
+            
+            self.integrated_data = pd.DataFrame(integrated, copy=False)
+            logger.info(f"Integrated data shape: {self.integrated_data.shape}")
             
             # Report data overlap period
             overlap_start = self.integrated_data['settlementdate'].min()
@@ -195,12 +372,117 @@ class PriceAnalysisMotor:
             logger.info(f"Data overlap period: {overlap_start} to {overlap_end} ({overlap_days} days)")
             logger.info(f"Records in overlap period: {len(self.integrated_data):,}")
             
+            # New intervals or mapping rows give a new version, so cached results go stale
+            self.data_version = (overlap_start, overlap_end, len(self.integrated_data), len(mapping))
+            self.date_range = (start_date, end_date)
+            self.daily_data = self._build_daily_data(mapping, start_date, end_date) if use_daily else None
+            
             return True
             
         except Exception as e:
             logger.error(f"Error integrating data: {e}")
             return False
     
+    def _build_daily_data(self, mapping: pd.DataFrame, start_date: Optional[str], end_date: Optional[str]) -> Optional[pd.DataFrame]:
+        """
+        DUID x day rows covering the integrated data, with the mapping columns.
+        
+        Days in the DUID daily table are taken from it. Days it does not cover
+        (before it starts, and from its last day on, which may have been partial
+        when it was written) are rolled up from the integrated 5-minute rows.
+        
+        Returns:
+            DataFrame of daily rows, or None if the table is not available
+        """
+        try:
+            if self.integrated_data.empty:
+                return None
+            daily = load_duid_daily(start_date, end_date)
+            if daily is None or daily.empty:
+                return None
+            
+            times = self.integrated_data['settlementdate']
+            table_start = max(daily['date'].min(), times.min().normalize())
+            table_end = min(daily['date'].max(), times.max().normalize())
+            daily = daily[(daily['date'] >= table_start) & (daily['date'] < table_end)]
+            rest = self.integrated_data[(times < table_start) | (times >= table_end)]
+            daily = self._attach_mapping(pd.concat([daily, rollup_daily(rest)], ignore_index=True), mapping)
+            
+            logger.info(f"Daily data: {len(daily):,} DUID-days ({len(rest):,} intervals rolled up outside the daily table)")
+            return daily
+            
+        except Exception as e:
+            logger.error(f"Error building daily data, using 5-minute data: {e}")
+            return None
+    
+    @staticmethod
+    def _attach_mapping(daily: pd.DataFrame, mapping: pd.DataFrame) -> pd.DataFrame:
+        """Attach the mapping columns to daily rows the same way as for the 5-minute rows"""
+        duid_codes, duids = pd.factorize(daily['duid'], sort=True)
+        duid_rows = pd.Index(mapping['DUID']).get_indexer(duids)
+        mapped = duid_rows[duid_codes] >= 0
+        if not mapped.all():
+            daily = daily[mapped]
+            duid_codes = duid_codes[mapped]
+        return daily.assign(
+            duid=pd.Categorical.from_codes(duid_codes, categories=duids, validate=False),
+            **_mapping_columns(mapping, duid_rows, duid_codes)
+        ).sort_values(['date', 'duid'], ignore_index=True)
+    
+    def _query_data(self) -> pd.DataFrame:
+        """Rows the aggregations run on: daily rows when available, else 5-minute rows"""
+        if self.daily_data is not None:
+            return self.daily_data
+        if self.integrated_data is None:
+            raise ValueError("Data not integrated yet. Call integrate_data() first.")
+        return self.integrated_data
+    
+    def get_loaded_period(self) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp], int]:
+        """
+        First and last interval of the loaded data and its number of 5-minute records.
+        
+        Returns:
+            Tuple of (first interval, last interval, record count), (None, None, 0) if nothing is loaded
+        """
+        if self.daily_data is not None and len(self.daily_data) > 0:
+            return (self.daily_data['first_interval'].min(), self.daily_data['last_interval'].max(),
+                    int(self.daily_data['interval_count'].sum()))
+        if self.integrated_data is not None and len(self.integrated_data) > 0:
+            times = self.integrated_data['settlementdate']
+            return times.min(), times.max(), len(self.integrated_data)
+        return None, None, 0
+    
+    def _group_totals(self, data: pd.DataFrame, group_columns: List[str]) -> pd.DataFrame:
+        """Generation and revenue totals, date range and record count per group"""
+        if 'generation_sum' in data.columns:
+            # Daily rows - the 5-minute sums, counts and ranges are additive
+            grouped = data.groupby(group_columns, observed=True).agg(
+                total_generation_sum=('generation_sum', 'sum'),
+                total_revenue_dollars=('revenue_sum', 'sum'),
+                start_date=('first_interval', 'min'),
+                end_date=('last_interval', 'max'),
+                record_count=('interval_count', 'sum')
+            ).round(2)
+        else:
+            grouped = data.groupby(group_columns, observed=True).agg({
+                'scadavalue': 'sum',        # Total generation (sum of MW readings across 5min intervals)
+                'revenue_5min': 'sum',      # Total revenue ($)
+                'settlementdate': ['min', 'max', 'count']  # Date range and record count
+            }).round(2)
+            
+            # Flatten column names
+            grouped.columns = ['total_generation_sum', 'total_revenue_dollars', 'start_date', 'end_date', 'record_count']
+        return grouped
+    
+    def _group_capacity(self, data: pd.DataFrame, group_columns: List[str]) -> pd.Series:
+        """Installed capacity per group: the sum over the group's DUIDs, each counted once
+        
+        Doesn't depend on row order, so daily and 5-minute rows give the same capacity.
+        """
+        duid_columns = group_columns if 'duid' in group_columns else group_columns + ['duid']
+        duid_capacity = data.groupby(duid_columns, observed=True)['Capacity(MW)'].first()
+        return duid_capacity.groupby(level=group_columns, observed=True).sum()
+    
     def calculate_aggregated_prices(self, hierarchy: List[str]) -> pd.DataFrame:
         """
         Calculate aggregated average prices for a given hierarchy.
@@ -214,21 +496,11 @@ class PriceAnalysisMotor:
         try:
             logger.info(f"Calculating aggregated prices for hierarchy: {hierarchy}")
             
-            if self.integrated_data is None:
-                raise ValueError("Data not integrated yet. Call integrate_data() first.")
-            
-            # Filter out any missing values in hierarchy columns
-            data = self.integrated_data.dropna(subset=hierarchy)
+            # Rows with missing hierarchy values are left out by groupby (no filtered copy needed)
+            data = self._query_data()
             
             # Group by hierarchy and calculate aggregations
-            grouped = data.groupby(hierarchy).agg({
-                'scadavalue': 'sum',        # Total generation (sum of MW readings across 5min intervals)
-                'revenue_5min': 'sum',      # Total revenue ($)
-                'settlementdate': ['min', 'max', 'count']  # Date range and record count
-            }).round(2)
-            
-            # Flatten column names
-            grouped.columns = ['total_generation_sum', 'total_revenue_dollars', 'start_date', 'end_date', 'record_count']
+            grouped = self._group_totals(data, hierarchy)
             
             # Calculate actual MWh generation
             # scadavalue sum = sum of MW readings across intervals
@@ -242,8 +514,7 @@ class PriceAnalysisMotor:
             
             # Add capacity factor information if we can
             if 'Capacity(MW)' in data.columns:
-                capacity_info = data.groupby(hierarchy)['Capacity(MW)'].first()
-                grouped['capacity_mw'] = capacity_info
+                grouped['capacity_mw'] = self._group_capacity(data, hierarchy)
                 
                 # Calculate capacity utilization using correct formula
                 # Time span in hours = (end_date - start_date).total_seconds() / 3600
@@ -255,7 +526,7 @@ class PriceAnalysisMotor:
                 ).round(1)
             
             # Reset index to make hierarchy columns regular columns
-            result = grouped.reset_index()
+            result = _plain_columns(grouped.reset_index())
             
             # Sort by total revenue (highest first)
             result = result.sort_values('total_revenue_dollars', ascending=False)
@@ -270,18 +541,20 @@ class PriceAnalysisMotor:
     
     def get_available_date_range(self) -> Tuple[Optional[str], Optional[str]]:
         """
-        Get the available date range from integrated data.
+        Get the available date range from the loaded data.
         
         Returns:
             Tuple of (start_date, end_date) as strings in YYYY-MM-DD format
         """
-        if self.integrated_data is None or len(self.integrated_data) == 0:
+        start, end, _ = self.get_loaded_period()
+        if start is None:
             return None, None
         
-        start_date = self.integrated_data['settlementdate'].min().strftime('%Y-%m-%d')
-        end_date = self.integrated_data['settlementdate'].max().strftime('%Y-%m-%d')
-        
-        return start_date, end_date
+        return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+    
+    def get_available_fuels(self) -> List[str]:
+        """Fuel types in the loaded data"""
+        return self._query_data()['Fuel'].unique().tolist()
     
     def get_available_hierarchies(self) -> Dict[str, List[str]]:
         """
@@ -290,11 +563,11 @@ class PriceAnalysisMotor:
         Returns:
             Dict mapping hierarchy names to column lists
         """
-        if self.integrated_data is None:
+        try:
+            available_columns = set(self._query_data().columns)
+        except ValueError:
             return {}
         
-        available_columns = set(self.integrated_data.columns)
-        
         hierarchies = {}
         
         # Check what columns are available
@@ -314,35 +587,28 @@ class PriceAnalysisMotor:
         
         return hierarchies
     
-    def calculate_duid_details(self, hierarchy: List[str]) -> pd.DataFrame:
+    def calculate_duid_details(self, hierarchy: List[str], data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Calculate detailed DUID-level data for expandable detail rows.
         
         Args:
             hierarchy: The hierarchy used for grouping (without DUID)
+            data: Rows to aggregate (daily or 5-minute), defaults to all loaded data
             
         Returns:
             DataFrame with DUID-level details that can be used for expandable rows
         """
         try:
-            if self.integrated_data is None:
-                raise ValueError("Data not integrated yet. Call integrate_data() first.")
+            if data is None:
+                data = self._query_data()
             
             # Create hierarchy with DUID added for detail calculation
             detail_hierarchy = hierarchy + ['duid']
             
-            # Filter out any missing values in hierarchy columns
-            data = self.integrated_data.dropna(subset=detail_hierarchy)
+            # Rows with missing hierarchy values are left out by groupby (no filtered copy needed)
             
             # Group by full hierarchy including DUID for details
-            grouped = data.groupby(detail_hierarchy).agg({
-                'scadavalue': 'sum',        # Total generation (sum of MW readings across 5min intervals)
-                'revenue_5min': 'sum',      # Total revenue ($)
-                'settlementdate': ['min', 'max', 'count']  # Date range and record count
-            }).round(2)
-            
-            # Flatten column names
-            grouped.columns = ['total_generation_sum', 'total_revenue_dollars', 'start_date', 'end_date', 'record_count']
+            grouped = self._group_totals(data, detail_hierarchy)
             
             # Calculate actual MWh generation
             # scadavalue sum = sum of MW readings across intervals
@@ -356,8 +622,7 @@ class PriceAnalysisMotor:
             
             # Add capacity factor information if we can
             if 'Capacity(MW)' in data.columns:
-                capacity_info = data.groupby(detail_hierarchy)['Capacity(MW)'].first()
-                grouped['capacity_mw'] = capacity_info
+                grouped['capacity_mw'] = self._group_capacity(data, detail_hierarchy)
                 
                 # Calculate capacity utilization using correct formula
                 time_span_hours = (grouped['end_date'] - grouped['start_date']).dt.total_seconds() / 3600
@@ -368,7 +633,7 @@ class PriceAnalysisMotor:
                 ).round(1)
             
             # Reset index to make hierarchy columns regular columns
-            result = grouped.reset_index()
+            result = _plain_columns(grouped.reset_index())
             
             # Sort by hierarchy and then by total revenue
             sort_columns = hierarchy + ['total_revenue_dollars']
@@ -444,39 +709,31 @@ class PriceAnalysisMotor:
             DataFrame with both group totals and individual DUIDs for hierarchical display
         """
         try:
-            if self.integrated_data is None:
-                raise ValueError("Data not integrated yet. Call integrate_data() first.")
+            # Take the data once; a concurrent reload rebinds the motor's frames
+            # but never modifies them, so this query sees one consistent snapshot
+            source_data = self._query_data()
+            duid_mapping = self.duid_mapping
             
             logger.info(f"Creating hierarchical data for hierarchy: {hierarchy}")
             logger.info(f"Applying filters - Regions: {region_filters}, Fuels: {fuel_filters}")
             
-            # Apply filters to the integrated data before processing
-            filtered_data = self.integrated_data.copy()
-            
-            # Apply region filter
+            # Apply the filters as one mask - the source data is neither copied nor modified
+            mask = None
             if region_filters:
-                filtered_data = filtered_data[filtered_data['Region'].isin(region_filters)]
-                logger.info(f"After region filter: {len(filtered_data)} records")
-            
-            # Apply fuel filter  
+                mask = source_data['Region'].isin(region_filters)
             if fuel_filters:
-                filtered_data = filtered_data[filtered_data['Fuel'].isin(fuel_filters)]
-                logger.info(f"After fuel filter: {len(filtered_data)} records")
+                fuel_mask = source_data['Fuel'].isin(fuel_filters)
+                mask = fuel_mask if mask is None else mask & fuel_mask
+            filtered_data = source_data if mask is None else source_data[mask]
+            logger.info(f"After filters: {len(filtered_data)} records")
             
             if len(filtered_data) == 0:
                 logger.warning("No data left after applying filters")
                 return pd.DataFrame()
             
-            # Temporarily store the original data and use filtered data
-            original_data = self.integrated_data
-            self.integrated_data = filtered_data
-            
             # Calculate DUID-level details (these will be the leaf nodes)
             duid_hierarchy = hierarchy + ['duid']
-            duid_data = self.calculate_duid_details(hierarchy)
-            
-            # Restore original data
-            self.integrated_data = original_data
+            duid_data = self.calculate_duid_details(hierarchy, data=filtered_data)
             
             if duid_data.empty:
                 logger.warning("No DUID data available for hierarchical display")
@@ -497,23 +754,21 @@ class PriceAnalysisMotor:
             # Filter the DUID data to only include display columns
             filtered_duid_data = duid_data[display_columns].copy()
             
-            # Add Station Name and Owner columns from the original integrated data
+            # Add Station Name and Owner columns from the DUID mapping
             if not filtered_duid_data.empty:
                 # Get unique DUIDs from the filtered data
                 duids = filtered_duid_data['duid'].unique()
                 
-                # Extract Station Name (Site Name) and Owner info for these DUIDs
-                duid_info = original_data.groupby('duid').agg({
-                    'Site Name': 'first',
-                    'Owner': 'first'
-                }).reset_index()
+                # Station Name (Site Name) and Owner are per-DUID mapping attributes, so
+                # look them up for these DUIDs rather than grouping the whole dataset
+                info_columns = [col for col in ['Site Name', 'Owner'] if col in duid_mapping.columns]
+                duid_info = (duid_mapping.drop_duplicates('DUID')
+                             .set_index('DUID')[info_columns]
+                             .reindex(pd.Index(duids, name='duid'))
+                             .reset_index())
                 
                 # Merge this info into the filtered data
-                filtered_duid_data = filtered_duid_data.merge(
-                    duid_info[duid_info['duid'].isin(duids)],
-                    on='duid',
-                    how='left'
-                )
+                filtered_duid_data = filtered_duid_data.merge(duid_info, on='duid', how='left')
                 
                 # Rename for user-friendly display
                 if 'Site Name' in filtered_duid_data.columns:
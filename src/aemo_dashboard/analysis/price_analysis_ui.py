@@ -5,17 +5,43 @@ This module provides Panel components for the Average Price Analysis tab,
 including hierarchy selection and tabulator display.
 """
 
+import copy
 import pandas as pd
 import panel as pn
 from typing import Dict, List, Optional
+from functools import partial
 import param
+import threading
 from datetime import datetime, timedelta
 
 from .price_analysis import PriceAnalysisMotor
+from ..shared.background import RequestCoordinator
+from ..shared.config import config
+from ..shared.shared_data import LRUCache, get_shared, refresh_shared
 from ..shared.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Aggregated and hierarchical tables shared by all sessions, keyed by
+# (data version, date range, grouping, region filters, fuel filters)
+_table_cache = LRUCache(config.price_analysis_cache_size, name='Price analysis table')
+
+# Every data column the hierarchical table can show - tables are cached with
+# all of them and projected onto the selected columns
+HIERARCHY_DATA_COLUMNS = ['generation_mwh', 'total_revenue_dollars', 'average_price_per_mwh', 'capacity_utilization_pct', 'capacity_mw']
+
+
+def _load_motor() -> Optional[PriceAnalysisMotor]:
+    """Load the full history into a new motor (None on failure)"""
+    logger.info("Loading data into calculation motor...")
+    motor = PriceAnalysisMotor()
+    if not motor.load_days():
+        logger.error("Failed to load data")
+        return None
+    logger.info("Data successfully loaded")
+    return motor
+
+
 class PriceAnalysisUI(param.Parameterized):
     """UI component for price analysis with flexible aggregation"""
     
@@ -33,6 +59,13 @@ class PriceAnalysisUI(param.Parameterized):
         self.motor = PriceAnalysisMotor()
         self.data_loaded = False
         self.current_data = pd.DataFrame()
+        # Serialises motor reloads/aggregations running in the background worker pool
+        self._compute_lock = threading.Lock()
+        # Rapid clicks collapse into one aggregation; a pending reload (new dates,
+        # refresh) is kept until a computation picks it up.
+        self._requests = RequestCoordinator(lock=self._compute_lock, description='price analysis table')
+        self._pending_prepare = None
+        self._pending_on_done = None
         
         # Initialize the motor
         self._initialize_motor()
@@ -58,21 +91,25 @@ class PriceAnalysisUI(param.Parameterized):
         
         logger.info("Price Analysis UI initialized")
     
-    def _initialize_motor(self):
-        """Initialize the calculation motor with data"""
+    def _initialize_motor(self, refresh: bool = False):
+        """Initialize the calculation motor with data
+
+        The integrated history is shared by all sessions; this session works on
+        a shallow copy so date filtering only rebinds the copy's frames.
+
+        Args:
+            refresh: Reload the shared history instead of reusing it
+        """
         try:
-            logger.info("Loading data into calculation motor...")
-            if self.motor.load_data():
-                if self.motor.standardize_columns():
-                    if self.motor.integrate_data():
-                        self.data_loaded = True
-                        logger.info("Data successfully loaded and integrated")
-                    else:
-                        logger.error("Failed to integrate data")
-                else:
-                    logger.error("Failed to standardize columns")
+            if refresh:
+                shared_motor = refresh_shared('price analysis motor', _load_motor)
+            else:
+                shared_motor = get_shared('price analysis motor', _load_motor)
+            if shared_motor is not None:
+                self.motor = copy.copy(shared_motor)
+                self.data_loaded = True
             else:
-                logger.error("Failed to load data")
+                self.data_loaded = False
         except Exception as e:
             logger.error(f"Error initializing motor: {e}")
             self.data_loaded = False
@@ -83,11 +120,10 @@ class PriceAnalysisUI(param.Parameterized):
         # Status indicator
         if self.data_loaded:
             status_msg = "✅ Data loaded successfully"
-            overlap_start = self.motor.integrated_data['settlementdate'].min()
-            overlap_end = self.motor.integrated_data['settlementdate'].max()
+            overlap_start, overlap_end, records = self.motor.get_loaded_period()
             overlap_days = (overlap_end - overlap_start).days
             status_msg += f" | Data period: {overlap_start.strftime('%Y-%m-%d')} to {overlap_end.strftime('%Y-%m-%d')} ({overlap_days} days)"
-            status_msg += f" | Records: {len(self.motor.integrated_data):,}"
+            status_msg += f" | Records: {records:,}"
         else:
             status_msg = "❌ Failed to load data"
         
@@ -221,10 +257,11 @@ class PriceAnalysisUI(param.Parameterized):
     def _get_table_title(self) -> str:
         """Generate dynamic table title with date information"""
         try:
-            if self.data_loaded and hasattr(self.motor, 'integrated_data') and len(self.motor.integrated_data) > 0:
-                start_date = self.motor.integrated_data['settlementdate'].min().strftime('%Y-%m-%d')
-                end_date = self.motor.integrated_data['settlementdate'].max().strftime('%Y-%m-%d')
-                days = (self.motor.integrated_data['settlementdate'].max() - self.motor.integrated_data['settlementdate'].min()).days
+            first_interval, last_interval, records = self.motor.get_loaded_period() if self.data_loaded else (None, None, 0)
+            if records > 0:
+                start_date = first_interval.strftime('%Y-%m-%d')
+                end_date = last_interval.strftime('%Y-%m-%d')
+                days = (last_interval - first_interval).days
                 
                 if self.active_date_preset == 7:
                     return f"## Aggregated Results - Last 7 Days ({start_date} to {end_date})"
@@ -280,43 +317,34 @@ class PriceAnalysisUI(param.Parameterized):
             
             logger.info(f"Applying date filter: {start_date_str} to {end_date_str}")
             
-            # Reload data with date filter
-            if self.motor.load_data():
-                if self.motor.standardize_columns():
-                    if self.motor.integrate_data(start_date_str, end_date_str):
-                        self.data_loaded = True
-                        
-                        # Force complete rebuild of the table with new filtered data
-                        self._calculate_and_update_table()
-                        
-                        # Update status
-                        if len(self.motor.integrated_data) > 0:
-                            filtered_start = self.motor.integrated_data['settlementdate'].min()
-                            filtered_end = self.motor.integrated_data['settlementdate'].max()
-                            filtered_days = (filtered_end - filtered_start).days
-                            status_msg = f"✅ Date filter applied | Period: {filtered_start.strftime('%Y-%m-%d')} to {filtered_end.strftime('%Y-%m-%d')} ({filtered_days} days)"
-                            status_msg += f" | Records: {len(self.motor.integrated_data):,}"
-                        else:
-                            status_msg = "⚠️ No data found for selected date range"
-                        
-                        self.status_text.object = f"**Status:** {status_msg}"
-                        logger.info("Date filter applied successfully")
-                    else:
-                        logger.error("Failed to integrate data with date filter")
-                else:
-                    logger.error("Failed to standardize columns for date filtering")
-            else:
-                logger.error("Failed to reload data for date filtering")
+            # Reload data with date filter and force a complete rebuild of the table
+            # with the new filtered data (both run in the background)
+            self._calculate_and_update_table(
+                prepare=partial(self._reload_for_dates, start_date_str, end_date_str),
+                on_done=self._update_date_filter_status
+            )
                 
         except Exception as e:
             logger.error(f"Error applying date filter: {e}")
     
+    def _update_date_filter_status(self):
+        """Show the filtered data period in the status line"""
+        filtered_start, filtered_end, records = self.motor.get_loaded_period()
+        if records > 0:
+            filtered_days = (filtered_end - filtered_start).days
+            status_msg = f"✅ Date filter applied | Period: {filtered_start.strftime('%Y-%m-%d')} to {filtered_end.strftime('%Y-%m-%d')} ({filtered_days} days)"
+            status_msg += f" | Records: {records:,}"
+        else:
+            status_msg = "⚠️ No data found for selected date range"
+        
+        self.status_text.object = f"**Status:** {status_msg}"
+    
     def _create_grouping_controls(self):
         """Create improved grouping controls with category selection and item filters"""
         try:
             # Get unique values from data for filter options
             regions = ['NSW1', 'QLD1', 'SA1', 'TAS1', 'VIC1']  # Known regions
-            fuels = self.motor.integrated_data['Fuel'].unique().tolist() if self.motor.integrated_data is not None else ['Coal', 'Gas', 'Solar', 'Wind']
+            fuels = self.motor.get_available_fuels() if self.data_loaded else ['Coal', 'Gas', 'Solar', 'Wind']
             technologies = ['CCGT', 'OCGT', 'Steam', 'PV', 'Wind'] # Common tech types
             
             # Category selection: Which dimensions to group by
@@ -418,28 +446,20 @@ class PriceAnalysisUI(param.Parameterized):
     def _on_update_analysis(self, event):
         """Handle unified update analysis button click - combines date filtering and grouping"""
         try:
-            # Step 1: Apply date filtering first (if date controls exist)
+            # Step 1: Apply date filtering first (if date controls exist and the dates changed) -
+            # the reload itself runs in the background together with the table calculation.
+            # Otherwise the table comes from the cache (or the loaded data) without a reload.
+            reload_for_dates = None
             if hasattr(self, 'start_date_picker') and hasattr(self.start_date_picker, 'value'):
                 start_date_str = self.start_date_picker.value.strftime('%Y-%m-%d') if self.start_date_picker.value else None
                 end_date_str = self.end_date_picker.value.strftime('%Y-%m-%d') if self.end_date_picker.value else None
                 
-                logger.info(f"Applying date filter: {start_date_str} to {end_date_str}")
-                
-                # Reload data with date filter
-                if self.motor.load_data():
-                    if self.motor.standardize_columns():
-                        if self.motor.integrate_data(start_date_str, end_date_str):
-                            self.data_loaded = True
-                            logger.info("Date filter applied successfully")
-                        else:
-                            logger.error("Failed to integrate data with date filter")
-                            return
-                    else:
-                        logger.error("Failed to standardize columns for date filtering")
-                        return
+                if not self._dates_loaded(start_date_str, end_date_str):
+                    logger.info(f"Applying date filter: {start_date_str} to {end_date_str}")
+                    reload_for_dates = partial(self._reload_for_dates, start_date_str, end_date_str)
                 else:
-                    logger.error("Failed to reload data for date filtering")
-                    return
+                    # Dates set back to the loaded window - drop a reload still pending for others
+                    self._pending_prepare = None
             
             # Step 2: Apply grouping and column selections
             # Check if widgets are properly initialized
@@ -481,16 +501,39 @@ class PriceAnalysisUI(param.Parameterized):
             
             logger.info(f"Applied unified update - grouping: {self.selected_grouping}, columns: {self.selected_columns}")
             
-            # Step 3: Rebuild the table with all selections
-            self._calculate_and_update_table()
+            # Step 3: Rebuild the table with all selections, then update the status
+            self._calculate_and_update_table(prepare=reload_for_dates, on_done=self._update_analysis_status)
             
-            # Step 4: Update status with current data state and mark as custom if dates were manually changed
-            if len(self.motor.integrated_data) > 0:
-                filtered_start = self.motor.integrated_data['settlementdate'].min()
-                filtered_end = self.motor.integrated_data['settlementdate'].max()
+        except Exception as e:
+            logger.error(f"Error in unified update analysis: {e}")
+    
+    def _dates_loaded(self, start_date_str: Optional[str], end_date_str: Optional[str]) -> bool:
+        """Whether the motor already holds exactly this date window"""
+        if (start_date_str, end_date_str) == self.motor.date_range:
+            return True
+        # Loaded without a filter (the whole history) - the same as picking its first and last days
+        return self.motor.date_range == (None, None) and \
+            (start_date_str, end_date_str) == self.motor.get_available_date_range()
+    
+    def _reload_for_dates(self, start_date_str: Optional[str], end_date_str: Optional[str]) -> bool:
+        """Reload the motor with a date filter (runs in the worker pool)"""
+        # Whole days come from the DUID daily table - 5-minute rows are only
+        # read for the days it does not cover yet
+        if self.motor.load_days(start_date_str, end_date_str):
+            self.data_loaded = True
+            logger.info("Date filter applied successfully")
+            return True
+        logger.error("Failed to reload data for date filtering")
+        return False
+    
+    def _update_analysis_status(self):
+        """Update status with current data state and mark as custom if dates were manually changed"""
+        try:
+            filtered_start, filtered_end, records = self.motor.get_loaded_period()
+            if records > 0:
                 filtered_days = (filtered_end - filtered_start).days
                 status_msg = f"✅ Analysis updated | Period: {filtered_start.strftime('%Y-%m-%d')} to {filtered_end.strftime('%Y-%m-%d')} ({filtered_days} days)"
-                status_msg += f" | Records: {len(self.motor.integrated_data):,}"
+                status_msg += f" | Records: {records:,}"
                 
                 # Check if date range was manually changed (not matching any preset)
                 if hasattr(self, 'start_date_picker') and hasattr(self.start_date_picker, 'value'):
@@ -520,7 +563,7 @@ class PriceAnalysisUI(param.Parameterized):
             self.status_text.object = f"**Status:** {status_msg}"
             
         except Exception as e:
-            logger.error(f"Error in unified update analysis: {e}")
+            logger.error(f"Error updating analysis status: {e}")
     
     def _on_uncheck_all_regions_change(self, event):
         """Handle uncheck all regions checkbox change"""
@@ -609,22 +652,69 @@ class PriceAnalysisUI(param.Parameterized):
     def _on_refresh_click(self, event):
         """Handle refresh button click"""
         logger.info("Refreshing analysis data...")
-        self._initialize_motor()
+        
+        def reload():
+            self._initialize_motor(refresh=True)
+            return self.data_loaded
+        
+        self._calculate_and_update_table(prepare=reload, on_done=self._update_refresh_status)
+    
+    def _update_refresh_status(self):
+        """Show the refreshed data period in the status line"""
         if self.data_loaded:
-            self._calculate_and_update_table()
             # Update status
-            overlap_start = self.motor.integrated_data['settlementdate'].min()
-            overlap_end = self.motor.integrated_data['settlementdate'].max()
+            overlap_start, overlap_end, records = self.motor.get_loaded_period()
             overlap_days = (overlap_end - overlap_start).days
             status_msg = f"✅ Data refreshed successfully | Data period: {overlap_start.strftime('%Y-%m-%d')} to {overlap_end.strftime('%Y-%m-%d')} ({overlap_days} days)"
-            status_msg += f" | Records: {len(self.motor.integrated_data):,}"
+            status_msg += f" | Records: {records:,}"
             self.status_text.object = f"**Status:** {status_msg}"
     
-    def _calculate_and_update_table(self):
-        """Calculate aggregated data and update the table using dynamic grouping"""
-        if not self.data_loaded:
-            return
+    def _calculate_and_update_table(self, prepare=None, on_done=None):
+        """Calculate aggregated data and update the table using dynamic grouping
+
+        The aggregation runs in the background worker pool and the table is
+        swapped in on the session's document when it is ready.
+
+        Args:
+            prepare: Optional callable run first in the worker (e.g. reloading the
+                motor for new dates); the update is abandoned if it returns False.
+                It replaces any prepare step still pending from a superseded update.
+            on_done: Optional callable run on the document after the table is updated
+        """
+        # The layout holds on to the containers, so they must exist before the result arrives
+        if self.tabulator_container is None:
+            self.tabulator_container = pn.Column(
+                pn.pane.Markdown("**Calculating...**"), sizing_mode='stretch_width'
+            )
+        if self.detail_container is None:
+            self.detail_container = pn.Column(sizing_mode='stretch_width')
         
+        if prepare is not None:
+            self._pending_prepare = prepare
+            self._pending_on_done = on_done
+        elif on_done is not None:
+            self._pending_on_done = on_done
+        
+        def compute():
+            pending, self._pending_prepare = self._pending_prepare, None
+            if pending is not None and not pending():
+                return None
+            if not self.data_loaded:
+                return None
+            return self._compute_table_data()
+        
+        def apply(result):
+            if result is None:
+                return
+            self._show_table(result)
+            done, self._pending_on_done = self._pending_on_done, None
+            if done is not None:
+                done()
+        
+        self._requests.request(compute, apply, loading=[self.tabulator_container])
+    
+    def _compute_table_data(self) -> Dict:
+        """Run the aggregation for the current grouping/columns (safe to run off the event loop)"""
         try:
             # Use dynamic grouping selection
             hierarchy_columns = self.selected_grouping if hasattr(self, 'selected_grouping') and self.selected_grouping else ['Fuel']
@@ -654,30 +744,28 @@ class PriceAnalysisUI(param.Parameterized):
             logger.info(f"Calculating aggregations for grouping: {hierarchy_columns}")
             logger.info(f"Selected display columns: {selected_columns}")
             
-            # Calculate aggregated data
-            aggregated_data = self.motor.calculate_aggregated_prices(hierarchy_columns)
-            
-            # Sort the data according to the hierarchy order for proper display
-            if not aggregated_data.empty and hierarchy_columns:
-                # Sort by all hierarchy columns to ensure proper ordering
-                try:
-                    aggregated_data = aggregated_data.sort_values(hierarchy_columns)
-                    logger.info(f"Data sorted by hierarchy: {hierarchy_columns}")
-                except Exception as e:
-                    logger.warning(f"Could not sort by all hierarchy columns: {e}")
-                    # Fallback to sorting by available columns
-                    available_sort_cols = [col for col in hierarchy_columns if col in aggregated_data.columns]
-                    if available_sort_cols:
-                        aggregated_data = aggregated_data.sort_values(available_sort_cols)
+            # Get filter selections if they exist
+            region_filters = getattr(self, 'selected_region_filters', None)
+            fuel_filters = getattr(self, 'selected_fuel_filters', None)
+            
+            # The column selection only projects the tables, so it is not part of the key
+            cache_key = (
+                self.motor.data_version,
+                self.motor.date_range,
+                tuple(hierarchy_columns),
+                tuple(sorted(region_filters)) if region_filters else (),
+                tuple(sorted(fuel_filters)) if fuel_filters else ()
+            )
+            cached = _table_cache.get(cache_key)
+            if cached is None:
+                aggregated_data, hierarchical_data = self._aggregate_tables(hierarchy_columns, region_filters, fuel_filters)
+                if not aggregated_data.empty and not hierarchical_data.empty:
+                    _table_cache.put(cache_key, (aggregated_data, hierarchical_data))
+            else:
+                aggregated_data, hierarchical_data = cached
             
             if aggregated_data.empty:
-                self.tabulator_table = pn.pane.Markdown("**No data available for selected grouping**")
-                if self.tabulator_container is None:
-                    self.tabulator_container = pn.Column(self.tabulator_table, sizing_mode='stretch_width')
-                else:
-                    self.tabulator_container.clear()
-                    self.tabulator_container.append(self.tabulator_table)
-                return
+                return {'message': "**No data available for selected grouping**"}
             
             # Filter data to only show selected columns (plus grouping columns)
             # Ensure selected columns actually exist in the data
@@ -696,14 +784,6 @@ class PriceAnalysisUI(param.Parameterized):
             logger.info(f"Valid selected columns: {valid_selected_columns}")
             logger.info(f"Display columns: {display_columns}")
             
-            # Get filter selections if they exist
-            region_filters = getattr(self, 'selected_region_filters', None)
-            fuel_filters = getattr(self, 'selected_fuel_filters', None)
-            
-            # Create hierarchical data that includes both totals and DUIDs for proper grouping
-            # Pass the original column names to the hierarchical data method
-            hierarchical_data = self.motor.create_hierarchical_data(hierarchy_columns, selected_columns, region_filters, fuel_filters)
-            
             if not hierarchical_data.empty:
                 # Filter hierarchical data to only show user-selected columns
                 # Map user-selected column names to the formatted column names in hierarchical data
@@ -734,9 +814,57 @@ class PriceAnalysisUI(param.Parameterized):
                 logger.info(f"Displaying columns: {display_cols}")
                 logger.info(f"Available hierarchical columns: {list(hierarchical_data.columns)}")
                 
+                return {'data': filtered_hierarchical_data, 'hierarchy_columns': hierarchy_columns, 'grouped': True}
+            
+            # Fallback: Simple table without grouping
+            return {'data': filtered_data, 'hierarchy_columns': hierarchy_columns, 'grouped': False}
+            
+        except Exception as e:
+            logger.error(f"Error calculating aggregations: {e}")
+            return {'message': f"**Error calculating data:** {e}"}
+    
+    def _aggregate_tables(self, hierarchy_columns: List[str], region_filters, fuel_filters):
+        """
+        Compute the aggregated table and the hierarchical (group + DUID) table.
+        
+        Both are computed with every data column; callers project them onto the
+        selected columns and must not modify them (they may be cached).
+        """
+        # Calculate aggregated data
+        aggregated_data = self.motor.calculate_aggregated_prices(hierarchy_columns)
+        
+        # Sort the data according to the hierarchy order for proper display
+        if not aggregated_data.empty and hierarchy_columns:
+            # Sort by all hierarchy columns to ensure proper ordering
+            try:
+                aggregated_data = aggregated_data.sort_values(hierarchy_columns)
+                logger.info(f"Data sorted by hierarchy: {hierarchy_columns}")
+            except Exception as e:
+                logger.warning(f"Could not sort by all hierarchy columns: {e}")
+                # Fallback to sorting by available columns
+                available_sort_cols = [col for col in hierarchy_columns if col in aggregated_data.columns]
+                if available_sort_cols:
+                    aggregated_data = aggregated_data.sort_values(available_sort_cols)
+        
+        # Create hierarchical data that includes both totals and DUIDs for proper grouping
+        hierarchical_data = self.motor.create_hierarchical_data(hierarchy_columns, HIERARCHY_DATA_COLUMNS, region_filters, fuel_filters)
+        
+        return aggregated_data, hierarchical_data
+    
+    def _show_table(self, result: Dict):
+        """Build the Tabulator for a computed result and swap it into the container"""
+        try:
+            if 'message' in result:
+                self.tabulator_table = pn.pane.Markdown(result['message'])
+                self.tabulator_container.clear()
+                self.tabulator_container.append(self.tabulator_table)
+                return
+            
+            hierarchy_columns = result['hierarchy_columns']
+            if result['grouped']:
                 # Use hierarchical data that includes both group totals and individual DUIDs
                 self.tabulator_table = pn.widgets.Tabulator(
-                    value=filtered_hierarchical_data,
+                    value=result['data'],
                     groupby=hierarchy_columns,  # Panel handles the multi-level grouping
                     pagination=None,  # Disable pagination for scrolling
                     sizing_mode='stretch_width',
@@ -797,7 +925,7 @@ class PriceAnalysisUI(param.Parameterized):
             else:
                 # Fallback: Simple table without grouping
                 self.tabulator_table = pn.widgets.Tabulator(
-                    value=filtered_data,
+                    value=result['data'],
                     pagination=None,  # Disable pagination for scrolling
                     sizing_mode='stretch_width',
                     height=800,
@@ -844,18 +972,11 @@ class PriceAnalysisUI(param.Parameterized):
             
             # Note: Individual DUIDs are now included in the hierarchical table above
             # Users can click on group headers to expand and see the DUIDs
-            if self.detail_container is None:
-                self.detail_container = pn.Column(sizing_mode='stretch_width')
-            else:
-                self.detail_container.clear()
+            self.detail_container.clear()
             
-            # Create or update the tabulator container
-            if self.tabulator_container is None:
-                self.tabulator_container = pn.Column(self.tabulator_table, sizing_mode='stretch_width')
-            else:
-                # Update the container with the new tabulator
-                self.tabulator_container.clear()
-                self.tabulator_container.append(self.tabulator_table)
+            # Update the container with the new tabulator
+            self.tabulator_container.clear()
+            self.tabulator_container.append(self.tabulator_table)
             
             logger.info(f"Table updated with hierarchical data (aggregated totals + individual DUIDs)")
             
@@ -864,14 +985,11 @@ class PriceAnalysisUI(param.Parameterized):
                 self.table_title.object = self._get_table_title()
             
         except Exception as e:
-            logger.error(f"Error calculating aggregations: {e}")
+            logger.error(f"Error displaying aggregations: {e}")
             error_msg = pn.pane.Markdown(f"**Error calculating data:** {e}")
             self.tabulator_table = error_msg
-            if self.tabulator_container is None:
-                self.tabulator_container = pn.Column(error_msg, sizing_mode='stretch_width')
-            else:
-                self.tabulator_container.clear()
-                self.tabulator_container.append(error_msg)
+            self.tabulator_container.clear()
+            self.tabulator_container.append(error_msg)
     
     def _get_tabulator_columns(self, hierarchy_columns: List[str]) -> Dict:
         """Configure tabulator columns based on hierarchy"""
@@ -4,5 +4,9 @@ Provides tools for data validation, health checks, and system diagnostics.
 """
 
 from .data_validity_check import DataValidityChecker, format_check_results
+from .integrity import format_integrity_report, gap_report, run_integrity_scan, scan_dataset
+from .synthetic_data import build_fleet, generate_dataset
 
-__all__ = ['DataValidityChecker', 'format_check_results']
\ No newline at end of file
+__all__ = ['DataValidityChecker', 'format_check_results',
+           'format_integrity_report', 'gap_report', 'run_integrity_scan', 'scan_dataset',
+           'build_fleet', 'generate_dataset']
\ No newline at end of file
@@ -2,19 +2,54 @@
 """
 Data Validity Check for AEMO Dashboard
 Provides comprehensive analysis of data coverage and quality across all parquet files.
+
+Record counts, date ranges and value ranges come from the parquet metadata
+and row group statistics, and missing intervals from the integrity scanner,
+so the files are never loaded whole.
 """
 
-import pandas as pd
 import pickle
+import pyarrow.parquet as pq
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from .integrity import parquet_column_range, run_integrity_scan
 from ..shared.config import config
+from ..shared.duid_history import parquet_time_range
 from ..shared.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+
+def _file_overview(path, time_column: str) -> Dict:
+    """Records, columns and date range of a parquet file, from its metadata"""
+    parquet_file = pq.ParquetFile(path)
+    start, end = parquet_time_range(path, time_column)
+    return {
+        'records': parquet_file.metadata.num_rows,
+        'columns': [c for c in parquet_file.schema_arrow.names if not c.startswith('__')],
+        'date_range': {
+            'start': start,
+            'end': end,
+            'days': (end - start).days if start is not None else 0
+        }
+    }
+
+
+def _unique_values(path, column: str) -> list:
+    """Distinct values of one column (read dictionary-encoded, on its own)"""
+    table = pq.read_table(path, columns=[column], read_dictionary=[column])
+    return sorted(v for v in table.column(column).unique().dictionary.to_pylist() if v is not None) if table.num_rows else []
+
+
+def _value_range(path, column: str) -> Dict:
+    low, high = parquet_column_range(path, column)
+    return {
+        'min': float(low) if low is not None else None,
+        'max': float(high) if high is not None else None
+    }
+
 class DataValidityChecker:
     """Comprehensive data validity and coverage analysis"""
     
@@ -25,33 +60,25 @@ class DataValidityChecker:
     def check_generation_data(self) -> Dict:
         """Check generation data validity and coverage"""
         try:
-            gen_df = pd.read_parquet(config.gen_output_file)
-            gen_df['settlementdate'] = pd.to_datetime(gen_df['settlementdate'])
+            path = config.gen_output_file
+            overview = _file_overview(path, 'settlementdate')
             
             # Load DUID mapping for additional context
             with open(config.gen_info_file, 'rb') as f:
                 gen_info = pickle.load(f)
             
+            sample = pq.ParquetFile(path).iter_batches(batch_size=2)
             result = {
                 'status': 'success',
-                'records': len(gen_df),
-                'columns': list(gen_df.columns),
-                'date_range': {
-                    'start': gen_df['settlementdate'].min(),
-                    'end': gen_df['settlementdate'].max(),
-                    'days': (gen_df['settlementdate'].max() - gen_df['settlementdate'].min()).days
-                },
-                'unique_duids': gen_df['duid'].nunique() if 'duid' in gen_df.columns else 0,
-                'mapped_duids': len(gen_info) if gen_info else 0,
-                'generation_range': {
-                    'min': gen_df['scadavalue'].min() if 'scadavalue' in gen_df.columns else None,
-                    'max': gen_df['scadavalue'].max() if 'scadavalue' in gen_df.columns else None
-                },
-                'sample_data': gen_df.head(2).to_dict('records') if len(gen_df) > 0 else []
+                **overview,
+                'unique_duids': len(_unique_values(path, 'duid')) if 'duid' in overview['columns'] else 0,
+                'mapped_duids': len(gen_info) if gen_info is not None else 0,
+                'generation_range': _value_range(path, 'scadavalue'),
+                'sample_data': next(sample).to_pandas().to_dict('records') if overview['records'] > 0 else []
             }
             
             # Check for region information in DUID mapping
-            if gen_info and isinstance(gen_info, dict) and len(gen_info) > 0:
+            if isinstance(gen_info, dict) and len(gen_info) > 0:
                 sample_duid = list(gen_info.keys())[0]
                 if isinstance(gen_info[sample_duid], dict):
                     result['duid_mapping_fields'] = list(gen_info[sample_duid].keys())
@@ -70,31 +97,15 @@ class DataValidityChecker:
     def check_price_data(self) -> Dict:
         """Check price data validity and coverage"""
         try:
-            price_df = pd.read_parquet(config.spot_hist_file)
-            
-            # Handle index vs column for SETTLEMENTDATE
-            if 'SETTLEMENTDATE' in price_df.columns:
-                date_col = 'SETTLEMENTDATE'
-            else:
-                price_df = price_df.reset_index()
-                date_col = 'SETTLEMENTDATE'
-                
-            price_df[date_col] = pd.to_datetime(price_df[date_col])
+            # SETTLEMENTDATE is stored as a column even though it is read back as the index
+            path = config.spot_hist_file
+            overview = _file_overview(path, 'SETTLEMENTDATE')
             
             result = {
                 'status': 'success',
-                'records': len(price_df),
-                'columns': list(price_df.columns),
-                'date_range': {
-                    'start': price_df[date_col].min(),
-                    'end': price_df[date_col].max(),
-                    'days': (price_df[date_col].max() - price_df[date_col].min()).days
-                },
-                'regions': sorted(price_df['REGIONID'].unique().tolist()) if 'REGIONID' in price_df.columns else [],
-                'price_range': {
-                    'min': float(price_df['RRP'].min()) if 'RRP' in price_df.columns else None,
-                    'max': float(price_df['RRP'].max()) if 'RRP' in price_df.columns else None
-                }
+                **overview,
+                'regions': _unique_values(path, 'REGIONID') if 'REGIONID' in overview['columns'] else [],
+                'price_range': _value_range(path, 'RRP')
             }
             
             return result
@@ -117,23 +128,14 @@ class DataValidityChecker:
                     'file_path': str(config.transmission_output_file)
                 }
                 
-            trans_df = pd.read_parquet(config.transmission_output_file)
-            trans_df['settlementdate'] = pd.to_datetime(trans_df['settlementdate'])
+            path = config.transmission_output_file
+            overview = _file_overview(path, 'settlementdate')
             
             result = {
                 'status': 'success',
-                'records': len(trans_df),
-                'columns': list(trans_df.columns),
-                'date_range': {
-                    'start': trans_df['settlementdate'].min(),
-                    'end': trans_df['settlementdate'].max(),
-                    'days': (trans_df['settlementdate'].max() - trans_df['settlementdate'].min()).days
-                },
-                'interconnectors': sorted(trans_df['interconnectorid'].unique().tolist()) if 'interconnectorid' in trans_df.columns else [],
-                'flow_range': {
-                    'min': float(trans_df['meteredmwflow'].min()) if 'meteredmwflow' in trans_df.columns else None,
-                    'max': float(trans_df['meteredmwflow'].max()) if 'meteredmwflow' in trans_df.columns else None
-                }
+                **overview,
+                'interconnectors': _unique_values(path, 'interconnectorid') if 'interconnectorid' in overview['columns'] else [],
+                'flow_range': _value_range(path, 'meteredmwflow')
             }
             
             return result
@@ -156,25 +158,22 @@ class DataValidityChecker:
                     'file_path': str(config.rooftop_solar_file)
                 }
                 
-            solar_df = pd.read_parquet(config.rooftop_solar_file)
-            solar_df['settlementdate'] = pd.to_datetime(solar_df['settlementdate'])
+            path = config.rooftop_solar_file
+            overview = _file_overview(path, 'settlementdate')
             
             # Get regional columns (exclude settlementdate)
-            region_cols = [col for col in solar_df.columns if col != 'settlementdate']
+            region_cols = [col for col in overview['columns'] if col != 'settlementdate']
+            region_ranges = [_value_range(path, col) for col in region_cols]
+            mins = [r['min'] for r in region_ranges if r['min'] is not None]
+            maxs = [r['max'] for r in region_ranges if r['max'] is not None]
             
             result = {
                 'status': 'success',
-                'records': len(solar_df),
-                'columns': list(solar_df.columns),
-                'date_range': {
-                    'start': solar_df['settlementdate'].min(),
-                    'end': solar_df['settlementdate'].max(),
-                    'days': (solar_df['settlementdate'].max() - solar_df['settlementdate'].min()).days
-                },
+                **overview,
                 'regions': region_cols,
                 'generation_range': {
-                    'min': float(solar_df[region_cols].min().min()) if region_cols else None,
-                    'max': float(solar_df[region_cols].max().max()) if region_cols else None
+                    'min': min(mins) if mins else None,
+                    'max': max(maxs) if maxs else None
                 }
             }
             
@@ -253,6 +252,24 @@ class DataValidityChecker:
             coverage_analysis['gaps_identified'].append("Rooftop solar data missing")
             coverage_analysis['recommendations'].append("🔧 Check rooftop solar data collection")
         
+        # Missing intervals found by the integrity scan
+        incomplete = False
+        for dataset, scan in self.results.get('integrity', {}).items():
+            if scan.get('status') != 'success':
+                continue
+            if scan['missing_intervals']:
+                coverage_analysis['gaps_identified'].append(
+                    f"{dataset}: {scan['missing_intervals']:,} missing intervals in {len(scan['gaps'])} gaps"
+                )
+            for key, key_scan in scan['keys'].items():
+                if key_scan['missing_intervals'] > scan['missing_intervals']:
+                    coverage_analysis['gaps_identified'].append(
+                        f"{dataset} {key}: {key_scan['missing_intervals']:,} missing intervals in {len(key_scan['gaps'])} gaps"
+                    )
+            incomplete = incomplete or scan['missing_intervals'] or any(k['missing_intervals'] for k in scan['keys'].values())
+        if incomplete:
+            coverage_analysis['recommendations'].append("🔧 See the integrity report (aemo-integrity-check) for the missing intervals")
+        
         return coverage_analysis
     
     def run_complete_check(self) -> Dict:
@@ -264,6 +281,7 @@ class DataValidityChecker:
         self.results['price'] = self.check_price_data()
         self.results['transmission'] = self.check_transmission_data()
         self.results['rooftop_solar'] = self.check_rooftop_solar_data()
+        self.results['integrity'] = run_integrity_scan()
         
         # Analyze coverage
         self.results['coverage_analysis'] = self.analyze_data_coverage()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Integrity and gap scanner for the AEMO data files.
+
+Answers the coverage questions - first and last interval, intervals per day
+and which 5-minute slots are missing (30-minute for rooftop solar files
+written before it was interpolated to 5 minutes), for each dataset and for
+each region or interconnector - without loading the files into pandas:
+
+- the first and last interval come from the Parquet row group statistics
+- the rest comes from one pass over the timestamp column (and the region,
+  interconnector or DUID column, read dictionary-encoded) in batches, which
+  marks the slots present in a bitmap. Row groups outside the requested
+  window are skipped using their statistics.
+
+Memory is bounded by the batch size and the bitmaps (one byte per slot per
+key, about 3MB for 5 years of 5-minute intervals and 6 interconnectors).
+Generation is checked per region by mapping each DUID through gen_info.pkl.
+
+Usage:
+    python -m aemo_dashboard.diagnostics.integrity [--datasets prices transmission] [--days 30]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..shared.config import config
+from ..shared.duid_history import parquet_time_range
+from ..shared.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# file: config attribute, time: timestamp column, key: region/interconnector
+# column (None for wide files with a column per region), minutes: interval length
+# (None to infer it from the file)
+DATASETS = {
+    'generation': {'file': 'gen_output_file', 'time': 'settlementdate', 'key': 'duid', 'minutes': 5},
+    'prices': {'file': 'spot_hist_file', 'time': 'SETTLEMENTDATE', 'key': 'REGIONID', 'minutes': 5},
+    'transmission': {'file': 'transmission_output_file', 'time': 'settlementdate', 'key': 'interconnectorid', 'minutes': 5},
+    'rooftop': {'file': 'rooftop_solar_file', 'time': 'settlementdate', 'key': None, 'minutes': None},
+}
+
+BATCH_SIZE = 1_000_000
+
+GAP_COLUMNS = ['dataset', 'key', 'start', 'end', 'intervals']
+
+
+def parquet_column_range(path, column: str) -> Tuple[Optional[object], Optional[object]]:
+    """Minimum and maximum of a column from the row group statistics (None if unavailable)"""
+    metadata = pq.ParquetFile(path).metadata
+    if column not in metadata.schema.names:
+        return None, None
+    column_index = metadata.schema.names.index(column)
+    mins, maxs = [], []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column_index).statistics
+        if stats is None or not stats.has_min_max:
+            return None, None
+        mins.append(stats.min)
+        maxs.append(stats.max)
+    return (min(mins), max(maxs)) if mins else (None, None)
+
+
+def scan_dataset(name: str, start=None, end=None) -> Dict:
+    """
+    Scan one dataset's coverage.
+
+    Args:
+        name: Dataset name (a key of DATASETS)
+        start, end: Optional window to check (defaults to the whole file)
+
+    Returns:
+        Dict with status, first/last interval, expected/present/missing
+        interval counts, off-grid rows, 'gaps' (DataFrame of start, end,
+        intervals), 'daily' (DataFrame of expected, present, missing per day)
+        and 'keys' (per region or interconnector: first, missing_intervals, gaps)
+    """
+    spec = DATASETS[name]
+    path = getattr(config, spec['file'])
+    if not os.path.exists(path):
+        return {'status': 'missing', 'file_path': str(path)}
+
+    try:
+        first, last = parquet_time_range(path, spec['time'])
+        if first is None:
+            return {'status': 'empty', 'file_path': str(path)}
+
+        minutes = spec['minutes'] or _infer_interval_minutes(path, spec['time'])
+        freq = pd.Timedelta(minutes=minutes)
+        grid_start = max(first, pd.Timestamp(start)).ceil(freq) if start is not None else first.ceil(freq)
+        grid_end = min(last, pd.Timestamp(end)).floor(freq) if end is not None else last.floor(freq)
+        if grid_end < grid_start:
+            return {'status': 'empty', 'file_path': str(path), 'first': first, 'last': last}
+
+        scan = _SlotScan(grid_start, grid_end, freq, _key_groups(name))
+        scan.read(path, spec)
+
+        result = {
+            'status': 'success',
+            'file_path': str(path),
+            'first': first,
+            'last': last,
+            'interval_minutes': minutes,
+            'window': (grid_start, grid_end),
+            'expected_intervals': len(scan.present),
+            'present_intervals': int(scan.present.sum()),
+            'missing_intervals': int(len(scan.present) - scan.present.sum()),
+            'off_grid_rows': scan.off_grid_rows,
+            'gaps': scan.gaps(scan.present),
+            'daily': scan.daily_counts(),
+            'keys': {},
+        }
+        for key, index in sorted(scan.key_ids.items()):
+            present = scan.key_present[index]
+            key_first = int(np.argmax(present))
+            if not present[key_first]:
+                continue
+            # A region or interconnector is checked from when it first appears
+            result['keys'][key] = {
+                'first': grid_start + key_first * freq,
+                'missing_intervals': int(len(present) - key_first - present[key_first:].sum()),
+                'gaps': scan.gaps(present, offset=key_first),
+            }
+        return result
+
+    except Exception as e:
+        logger.error(f"Error scanning {name} data: {e}")
+        return {'status': 'error', 'error': str(e), 'file_path': str(path)}
+
+
+def run_integrity_scan(datasets: Optional[Iterable[str]] = None, start=None, end=None) -> Dict[str, Dict]:
+    """Scan each dataset (all of them by default); dataset name -> scan_dataset result"""
+    results = {}
+    for name in datasets or DATASETS:
+        scan_start = datetime.now()
+        results[name] = scan_dataset(name, start, end)
+        logger.info(f"Scanned {name} data in {(datetime.now() - scan_start).total_seconds():.2f}s: "
+                    f"{results[name].get('missing_intervals', 0)} missing intervals")
+    return results
+
+
+def gap_report(results: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    All gaps in a scan as one table (GAP_COLUMNS).
+
+    key is None for intervals missing from the whole dataset, otherwise the
+    region or interconnector missing them.
+    """
+    frames = []
+    for name, result in results.items():
+        if result.get('status') != 'success':
+            continue
+        frames.append(result['gaps'].assign(dataset=name, key=None))
+        for key, key_result in result['keys'].items():
+            frames.append(key_result['gaps'].assign(dataset=name, key=key))
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=GAP_COLUMNS)
+    return pd.concat(frames, ignore_index=True)[GAP_COLUMNS]
+
+
+def format_integrity_report(results: Dict[str, Dict], max_gaps: int = 10) -> str:
+    """Format scan results for display"""
+    output = ["=== AEMO DATA INTEGRITY REPORT ===\n"]
+    for name, result in results.items():
+        output.append(f"{name.upper()} DATA:")
+        status = result.get('status')
+        if status == 'missing':
+            output.append(f"  ❌ File not found: {result['file_path']}\n")
+            continue
+        if status != 'success':
+            output.append(f"  ❌ {result.get('error', 'No data')}\n")
+            continue
+
+        window_start, window_end = result['window']
+        output.append(f"  📅 {window_start} to {window_end} ({result['interval_minutes']}-minute intervals)")
+        output.append(f"  ✅ {result['present_intervals']:,} of {result['expected_intervals']:,} intervals present")
+        if result['missing_intervals']:
+            output.append(f"  🚨 {result['missing_intervals']:,} missing in {len(result['gaps'])} gaps")
+        if result['off_grid_rows']:
+            output.append(f"  ⚠️ {result['off_grid_rows']:,} rows not on an interval boundary")
+
+        # Only keys missing more than the dataset as a whole
+        incomplete = [(key, key_result) for key, key_result in result['keys'].items()
+                      if key_result['missing_intervals'] > result['missing_intervals']]
+        for key, key_result in incomplete:
+            output.append(f"  🔍 {key}: {key_result['missing_intervals']:,} missing in {len(key_result['gaps'])} gaps")
+
+        gaps = result['gaps']
+        for gap in gaps.head(max_gaps).itertuples():
+            output.append(f"    - {gap.start} to {gap.end} ({gap.intervals} intervals)")
+        if len(gaps) > max_gaps:
+            output.append(f"    ... and {len(gaps) - max_gaps} more")
+        output.append("")
+    return "\n".join(output)
+
+
+class _SlotScan:
+    """Bitmaps of the interval slots present, for a dataset and for each key"""
+
+    def __init__(self, grid_start: pd.Timestamp, grid_end: pd.Timestamp, freq: pd.Timedelta,
+                 key_groups: Optional[Dict[str, str]]):
+        self.grid_start = grid_start
+        self.freq = freq
+        self.key_groups = key_groups
+        self._start_ns = grid_start.value
+        self._freq_ns = freq.value
+        n_slots = (grid_end - grid_start) // freq + 1
+        self.present = np.zeros(n_slots, dtype=bool)
+        self.key_present = np.zeros((0, n_slots), dtype=bool)
+        self.key_ids = {}
+        self.off_grid_rows = 0
+
+    def read(self, path, spec: Dict):
+        time_column, key_column = spec['time'], spec['key']
+        parquet_file = pq.ParquetFile(path, read_dictionary=[key_column] if key_column else None)
+        names = parquet_file.schema_arrow.names
+        value_columns = [] if key_column else [c for c in names if c != time_column and not c.startswith('__')]
+        columns = [time_column] + ([key_column] if key_column else value_columns)
+
+        window_end_ns = self._start_ns + (len(self.present) - 1) * self._freq_ns
+        for row_groups in self._row_groups(parquet_file, time_column, window_end_ns):
+            for batch in parquet_file.iter_batches(batch_size=BATCH_SIZE, row_groups=row_groups, columns=columns):
+                times = batch.column(time_column).to_numpy(zero_copy_only=False)
+                offsets = times.astype('datetime64[ns]').view('int64') - self._start_ns
+                in_window = (offsets >= 0) & (offsets <= window_end_ns - self._start_ns)
+                on_grid = offsets % self._freq_ns == 0
+                self.off_grid_rows += int((in_window & ~on_grid).sum())
+                rows = np.flatnonzero(in_window & on_grid)
+                slots = offsets[rows] // self._freq_ns
+                self.present[slots] = True
+
+                if key_column:
+                    self._mark_keys(batch.column(key_column), rows, slots)
+                else:
+                    for column in value_columns:
+                        index = self._key_index(column)
+                        valid = batch.column(column).is_valid().to_numpy(zero_copy_only=False)[rows]
+                        self.key_present[index, slots[valid]] = True
+
+    def _row_groups(self, parquet_file, time_column: str, window_end_ns: int):
+        """Row groups that may hold rows in the window, one list per contiguous run"""
+        metadata = parquet_file.metadata
+        column_index = metadata.schema.names.index(time_column)
+        runs, current = [], []
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column_index).statistics
+            if stats is not None and stats.has_min_max and (
+                    pd.Timestamp(stats.max).value < self._start_ns or pd.Timestamp(stats.min).value > window_end_ns):
+                if current:
+                    runs.append(current)
+                    current = []
+                continue
+            current.append(i)
+        if current:
+            runs.append(current)
+        return runs
+
+    def _mark_keys(self, column: pa.Array, rows: np.ndarray, slots: np.ndarray):
+        if not pa.types.is_dictionary(column.type):
+            column = column.dictionary_encode()
+        # Key index for each dictionary entry (-1 for DUIDs with no region)
+        dictionary = column.dictionary.to_pylist()
+        if self.key_groups is not None:
+            dictionary = [self.key_groups.get(value) for value in dictionary]
+        lookup = np.array([-1 if value is None else self._key_index(value) for value in dictionary] + [-1])
+        codes = column.indices.fill_null(len(dictionary)).to_numpy(zero_copy_only=False)
+        keys = lookup[codes[rows]]
+        known = keys >= 0
+        self.key_present[keys[known], slots[known]] = True
+
+    def _key_index(self, key: str) -> int:
+        index = self.key_ids.get(key)
+        if index is None:
+            index = self.key_ids[key] = len(self.key_ids)
+            self.key_present = np.vstack([self.key_present, np.zeros((1, len(self.present)), dtype=bool)])
+        return index
+
+    def gaps(self, present: np.ndarray, offset: int = 0) -> pd.DataFrame:
+        """Runs of missing slots (from slot offset on) as start, end (last missing interval), intervals"""
+        missing = np.concatenate(([0], ~present[offset:], [0])).astype(np.int8)
+        edges = np.flatnonzero(np.diff(missing))
+        starts, ends = edges[::2] + offset, edges[1::2] + offset
+        return pd.DataFrame({
+            'start': self.grid_start + starts * self.freq,
+            'end': self.grid_start + (ends - 1) * self.freq,
+            'intervals': ends - starts,
+        })
+
+    def daily_counts(self) -> pd.DataFrame:
+        """Expected, present and missing intervals per calendar day"""
+        slot_times = self._start_ns + np.arange(len(self.present), dtype=np.int64) * self._freq_ns
+        day_ns = pd.Timedelta(days=1).value
+        first_day = slot_times[0] // day_ns
+        days = slot_times // day_ns - first_day
+        expected = np.bincount(days)
+        present = np.bincount(days[self.present], minlength=len(expected))
+        index = pd.date_range(pd.Timestamp(first_day * day_ns), periods=len(expected), freq='D', name='date')
+        return pd.DataFrame({'expected': expected, 'present': present, 'missing': expected - present}, index=index)
+
+
+def _infer_interval_minutes(path, time_column: str, default: int = 30) -> int:
+    """Interval length of a file from the smallest step between its first timestamps"""
+    batch = next(pq.ParquetFile(path).iter_batches(batch_size=10_000, columns=[time_column]), None)
+    if batch is None:
+        return default
+    times = np.unique(batch.column(0).to_numpy(zero_copy_only=False).astype('datetime64[ns]'))
+    steps = np.diff(times)
+    steps = steps[steps > np.timedelta64(0)]
+    return int(steps.min() // np.timedelta64(1, 'm')) if len(steps) else default
+
+
+def _key_groups(name: str) -> Optional[Dict[str, str]]:
+    """DUID -> region for generation, which is checked per region; None for other datasets"""
+    if name != 'generation':
+        return None
+    try:
+        with open(config.gen_info_file, 'rb') as f:
+            gen_info = pickle.load(f)
+        return dict(zip(gen_info['DUID'], gen_info['Region']))
+    except Exception as e:
+        logger.error(f"Error loading gen_info.pkl - generation not checked per region: {e}")
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the AEMO data files for missing intervals")
+    parser.add_argument('--datasets', nargs='+', choices=list(DATASETS), help="Datasets to check (default: all)")
+    parser.add_argument('--start', help="Check from this time (default: start of each file)")
+    parser.add_argument('--end', help="Check up to this time (default: end of each file)")
+    parser.add_argument('--days', type=int, help="Check only the last N days")
+    parser.add_argument('--max-gaps', type=int, default=10, help="Gaps to list per dataset")
+    parser.add_argument('--gaps-csv', help="Write every gap (dataset, key, start, end, intervals) to this CSV file")
+    args = parser.parse_args(argv)
+
+    start = pd.Timestamp(args.start) if args.start else None
+    if args.days:
+        start = pd.Timestamp.now().floor('D') - pd.Timedelta(days=args.days)
+
+    results = run_integrity_scan(args.datasets, start, args.end)
+    print(format_integrity_report(results, max_gaps=args.max_gaps))
+    if args.gaps_csv:
+        gap_report(results).to_csv(args.gaps_csv, index=False)
+        print(f"Gap report written to {args.gaps_csv}")
+
+    # Non-zero exit when anything is missing, for use from scripts
+    complete = all(r.get('status') == 'success' and not r['missing_intervals']
+                   and not any(k['missing_intervals'] for k in r['keys'].values())
+                   for r in results.values())
+    return 0 if complete else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
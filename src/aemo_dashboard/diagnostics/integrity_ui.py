@@ -0,0 +1,119 @@
+"""
+Data Integrity UI - diagnostics tab showing coverage and gaps for every dataset.
+
+The scan (see integrity.py) runs in the worker pool and its results are
+shared by all sessions for a few minutes, per window.
+"""
+
+import pandas as pd
+import panel as pn
+
+from .integrity import gap_report, run_integrity_scan
+from ..shared.background import run_in_background
+from ..shared.logging_config import get_logger
+from ..shared.shared_data import get_shared, refresh_shared
+
+logger = get_logger(__name__)
+
+# Window label -> days checked (None for the whole of each file)
+WINDOWS = {'Last 7 days': 7, 'Last 30 days': 30, 'Last year': 365, 'All data': None}
+
+# Scans are shared between sessions for this long
+SCAN_MAX_AGE_MINUTES = 15
+
+
+def _scan_builder(days):
+    def build():
+        start = pd.Timestamp.now().floor('D') - pd.Timedelta(days=days) if days else None
+        return run_integrity_scan(start=start)
+    return build
+
+
+def _summary_table(results) -> pd.DataFrame:
+    """One row per dataset: window, interval counts and completeness"""
+    rows = []
+    for name, result in results.items():
+        if result.get('status') != 'success':
+            rows.append({'Dataset': name, 'Status': result.get('error', result.get('status'))})
+            continue
+        window_start, window_end = result['window']
+        incomplete_keys = [key for key, key_result in result['keys'].items() if key_result['missing_intervals']]
+        rows.append({
+            'Dataset': name,
+            'Status': 'complete' if not result['missing_intervals'] and not incomplete_keys else 'gaps',
+            'From': window_start,
+            'To': window_end,
+            'Interval (min)': result['interval_minutes'],
+            'Expected': result['expected_intervals'],
+            'Missing': result['missing_intervals'],
+            'Gaps': len(result['gaps']),
+            'Complete %': round(100 * result['present_intervals'] / result['expected_intervals'], 3),
+            'Incomplete regions/interconnectors': ', '.join(incomplete_keys),
+        })
+    return pd.DataFrame(rows)
+
+
+def _daily_missing_table(results) -> pd.DataFrame:
+    """Days with missing intervals, per dataset"""
+    frames = []
+    for name, result in results.items():
+        if result.get('status') != 'success':
+            continue
+        daily = result['daily']
+        frames.append(daily[daily['missing'] > 0].reset_index().assign(dataset=name))
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=['dataset', 'date', 'expected', 'present', 'missing'])
+    return pd.concat(frames, ignore_index=True)[['dataset', 'date', 'expected', 'present', 'missing']]
+
+
+def create_integrity_tab():
+    """
+    Create and return the Data Integrity tab component.
+
+    Returns:
+        Panel component for the Data Integrity tab
+    """
+    try:
+        window_select = pn.widgets.Select(name="Window", options=list(WINDOWS), value='Last 30 days', width=200)
+        rescan_button = pn.widgets.Button(name="Rescan", button_type="primary", width=120)
+        results_section = pn.Column(pn.pane.Markdown("**Scanning data files...**"), sizing_mode='stretch_width')
+
+        def show(results):
+            if not results:
+                results_section[:] = [pn.pane.Markdown("Integrity scan failed - see the logs.")]
+                return
+            table_options = dict(theme='midnight', show_index=False, disabled=True, sizing_mode='stretch_width')
+            gaps = gap_report(results).fillna({'key': 'all'})
+            results_section[:] = [
+                pn.pane.Markdown("### Coverage"),
+                pn.widgets.Tabulator(_summary_table(results), **table_options),
+                pn.pane.Markdown(f"### Gaps ({len(gaps)})"),
+                pn.widgets.Tabulator(gaps, pagination='local', page_size=20, **table_options),
+                pn.pane.Markdown("### Days with missing intervals"),
+                pn.widgets.Tabulator(_daily_missing_table(results), pagination='local', page_size=20, **table_options),
+            ]
+
+        def scan(rescan=False):
+            key = f"integrity scan ({window_select.value})"
+            build = _scan_builder(WINDOWS[window_select.value])
+            if rescan:
+                compute = lambda: refresh_shared(key, build)
+            else:
+                compute = lambda: get_shared(key, build, max_age_minutes=SCAN_MAX_AGE_MINUTES)
+            run_in_background(compute, show, loading=[results_section], description='integrity scan')
+
+        window_select.param.watch(lambda event: scan(), 'value')
+        rescan_button.on_click(lambda event: scan(rescan=True))
+        scan()
+
+        return pn.Column(
+            pn.pane.Markdown("## Data Integrity"),
+            pn.Row(window_select, rescan_button),
+            results_section,
+            sizing_mode='stretch_width'
+        )
+
+    except Exception as e:
+        logger.error(f"Error creating Data Integrity tab: {e}")
+        return pn.pane.Markdown(f"**Error creating Data Integrity tab:** {e}")
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Synthetic AEMO datasets at production scale, for load and memory testing.
+
+Writes the four data files and gen_info.pkl in the production schemas
+(the files the data service writes), so pointing DATA_DIR at the output
+runs the dashboard, the collectors' readers and the diagnostics against
+them:
+
+- gen_output.parquet: about 600 DUIDs with the NEM's fuel and region mix
+  (no coal in SA or Tasmania, hydro mostly in Tasmania, ...). Solar follows
+  the sun and daily cloud cover, wind a smoothed weather series shared
+  within a region, and thermal, hydro and battery units respond to price.
+  Thermal units have multi-day outages.
+- spot_hist.parquet: regional prices driven by demand net of wind and
+  solar, with negative prices at midday and spikes up to the market price cap
+- transmission_flows.parquet: six interconnectors, with flows following the
+  price difference between their regions within varying limits
+- rooftop_solar.parquet: 5-minute rooftop output by region
+
+Everything is generated with NumPy a month at a time and appended to the
+files, so memory stays bounded and 5 years (about 250M generation rows)
+takes minutes. The same seed gives the same data.
+
+Usage:
+    python -m aemo_dashboard.diagnostics.synthetic_data OUTPUT_DIR [--years 5] [--end 2025-07-01]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..shared.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+REGIONS = ['NSW1', 'QLD1', 'SA1', 'TAS1', 'VIC1']
+
+# Default file names (as in config) - point DATA_DIR at the output directory
+FILES = {
+    'generation': 'gen_output.parquet',
+    'prices': 'spot_hist.parquet',
+    'transmission': 'transmission_flows.parquet',
+    'rooftop': 'rooftop_solar.parquet',
+}
+GEN_INFO_FILE = 'gen_info.pkl'
+
+# Fuel: (DUIDs per region in a 600-DUID fleet, unit capacity range in MW)
+FLEET = {
+    'Solar': ({'NSW1': 45, 'QLD1': 45, 'SA1': 15, 'TAS1': 0, 'VIC1': 30}, (20, 350)),
+    'Wind': ({'NSW1': 25, 'QLD1': 15, 'SA1': 25, 'TAS1': 10, 'VIC1': 40}, (30, 450)),
+    'Battery Storage': ({'NSW1': 15, 'QLD1': 12, 'SA1': 15, 'TAS1': 1, 'VIC1': 15}, (10, 300)),
+    'Coal': ({'NSW1': 18, 'QLD1': 22, 'SA1': 0, 'TAS1': 0, 'VIC1': 10}, (280, 720)),
+    'CCGT': ({'NSW1': 4, 'QLD1': 6, 'SA1': 4, 'TAS1': 1, 'VIC1': 2}, (150, 400)),
+    'OCGT': ({'NSW1': 12, 'QLD1': 14, 'SA1': 14, 'TAS1': 4, 'VIC1': 16}, (30, 350)),
+    'Gas other': ({'NSW1': 2, 'QLD1': 8, 'SA1': 10, 'TAS1': 2, 'VIC1': 4}, (20, 200)),
+    'Water': ({'NSW1': 22, 'QLD1': 8, 'SA1': 0, 'TAS1': 40, 'VIC1': 14}, (10, 300)),
+    'Biomass': ({'NSW1': 6, 'QLD1': 10, 'SA1': 2, 'TAS1': 0, 'VIC1': 2}, (5, 50)),
+    'Other': ({'NSW1': 10, 'QLD1': 10, 'SA1': 5, 'TAS1': 2, 'VIC1': 8}, (1, 30)),
+}
+
+SITE_SUFFIX = {
+    'Solar': 'Solar Farm', 'Wind': 'Wind Farm', 'Battery Storage': 'Battery',
+    'Coal': 'Power Station', 'CCGT': 'Power Station', 'OCGT': 'Peaking Plant',
+    'Gas other': 'Gas Plant', 'Water': 'Hydro', 'Biomass': 'Bioenergy', 'Other': 'Landfill Gas',
+}
+
+# Units per site (default 1-2)
+UNITS_PER_SITE = {'Coal': (2, 4), 'CCGT': (1, 2), 'OCGT': (1, 4), 'Water': (1, 4)}
+
+# Fuels with forced outages
+THERMAL_FUELS = ['Coal', 'CCGT', 'OCGT', 'Gas other', 'Water', 'Biomass', 'Other']
+
+OWNERS = [
+    'Coastal Power', 'Southern Generation', 'Inland Energy', 'Ridgeline Renewables',
+    'Harbour Energy', 'Eastern Hydro', 'Sunbelt Solar', 'Westwind Energy', 'Range Power',
+    'Valley Energy Co', 'Tableland Generation', 'Bayside Power', 'Gulf Energy',
+    'Highland Hydro', 'Plains Renewables',
+]
+
+SITE_WORDS = (
+    ['Bay', 'Mount', 'Lake', 'Glen', 'Port', 'Red', 'Black', 'Silver', 'Green', 'North',
+     'South', 'West', 'East', 'Long', 'High', 'Sand', 'Stone', 'Wattle', 'Gum', 'Iron',
+     'Cedar', 'Hill', 'Bright', 'Cold', 'Golden', 'Kings', 'Oak', 'Rock', 'Salt', 'Swan'],
+    ['water', 'wood', 'ridge', 'field', 'vale', 'creek', 'hill', 'brook', 'ford', 'gate',
+     'downs', 'park', 'plains', 'view', 'stone', 'bank', 'lands', 'dale', 'well', 'bridge'],
+)
+
+# Baseline price ($/MWh) and how much wind and solar depress it, per region
+REGION_PRICE = {'NSW1': 95.0, 'QLD1': 85.0, 'SA1': 105.0, 'TAS1': 75.0, 'VIC1': 80.0}
+SOLAR_PENETRATION = {'NSW1': 0.35, 'QLD1': 0.45, 'SA1': 0.6, 'TAS1': 0.1, 'VIC1': 0.4}
+WIND_PENETRATION = {'NSW1': 0.15, 'QLD1': 0.1, 'SA1': 0.45, 'TAS1': 0.3, 'VIC1': 0.3}
+
+# Rooftop solar peak output (MW) per region
+ROOFTOP_CAPACITY = {'NSW1': 6500.0, 'QLD1': 6000.0, 'SA1': 2400.0, 'TAS1': 350.0, 'VIC1': 5000.0}
+
+# Interconnector: (from region, to region, export limit, import limit) - positive flow is from -> to
+INTERCONNECTORS = {
+    'N-Q-MNSP1': ('NSW1', 'QLD1', 210.0, -110.0),
+    'NSW1-QLD1': ('NSW1', 'QLD1', 700.0, -1200.0),
+    'T-V-MNSP1': ('TAS1', 'VIC1', 500.0, -480.0),
+    'V-S-MNSP1': ('VIC1', 'SA1', 220.0, -200.0),
+    'V-SA': ('VIC1', 'SA1', 650.0, -650.0),
+    'VIC1-NSW1': ('VIC1', 'NSW1', 1400.0, -1100.0),
+}
+
+MARKET_PRICE_CAP = 17500.0
+MARKET_PRICE_FLOOR = -1000.0
+
+# Price spike events per region per year
+SPIKES_PER_YEAR = 30
+
+INTERVAL = pd.Timedelta(minutes=5)
+
+
+def _letter_suffix(number: int) -> str:
+    """1 -> 'A', 26 -> 'Z', 27 -> 'AA', ..."""
+    letters = ''
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def build_fleet(n_duids: int = 600, seed: int = 0) -> pd.DataFrame:
+    """
+    A synthetic gen_info table with the NEM's fuel and region mix.
+
+    Returns:
+        DataFrame with DUID, Site Name, Owner, Region, Fuel, Capacity(MW)
+    """
+    rng = np.random.default_rng(seed)
+    scale = n_duids / sum(sum(counts.values()) for counts, _ in FLEET.values())
+    site_names = [f"{first}{second}" for first in SITE_WORDS[0] for second in SITE_WORDS[1]]
+    site_names = iter([site_names[i] for i in rng.permutation(len(site_names))])
+    codes = set()
+    rows = []
+
+    for fuel, (counts, (low, high)) in FLEET.items():
+        min_units, max_units = UNITS_PER_SITE.get(fuel, (1, 2))
+        for region, count in counts.items():
+            remaining = int(round(count * scale))
+            while remaining > 0:
+                units = min(remaining, int(rng.integers(min_units, max_units + 1)))
+                try:
+                    name = next(site_names)
+                except StopIteration:
+                    # More sites than name combinations - number them
+                    name = f"{SITE_WORDS[0][len(rows) % len(SITE_WORDS[0])]}field {len(rows)}"
+                code = name.upper().replace(' ', '')[:6]
+                suffix = 0
+                while code in codes:
+                    # Shared prefix - swap the tail for letters (the station search strips
+                    # trailing digits, so a digit would merge unrelated sites into one station)
+                    suffix += 1
+                    letters = _letter_suffix(suffix)
+                    code = f"{name.upper().replace(' ', '')[:6 - len(letters)]}{letters}"
+                codes.add(code)
+
+                owner = OWNERS[int(rng.integers(len(OWNERS)))]
+                capacity = round(float(rng.uniform(low, high)), 1)
+                for unit in range(1, units + 1):
+                    rows.append({
+                        'DUID': f"{code}{unit}",
+                        'Site Name': f"{name} {SITE_SUFFIX[fuel]}",
+                        'Owner': owner,
+                        'Region': region,
+                        'Fuel': fuel,
+                        'Capacity(MW)': capacity,
+                    })
+                remaining -= units
+
+    return pd.DataFrame(rows)
+
+
+def generate_dataset(output_dir, days: Optional[float] = None, years: Optional[float] = None,
+                     end=None, n_duids: int = 600, seed: int = 0,
+                     datasets: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+    """
+    Write a synthetic dataset.
+
+    Args:
+        output_dir: Directory for the files (created if needed; existing files are replaced)
+        days, years: Length of the data (default 1 year)
+        end: Last interval (default: today's midnight)
+        n_duids: Number of DUIDs in the fleet
+        seed: Random seed
+        datasets: Files to write (keys of FILES, default all); gen_info.pkl is always written
+
+    Returns:
+        Dict of dataset -> {'path', 'rows', 'seconds'}
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    datasets = list(datasets or FILES)
+
+    end = pd.Timestamp(end).floor(INTERVAL) if end is not None else pd.Timestamp.now().floor('D')
+    length = pd.Timedelta(days=days if days is not None else 365.25 * (years or 1))
+    start = (end - length).ceil(INTERVAL) + INTERVAL
+
+    fleet = build_fleet(n_duids, seed)
+    with open(output_dir / GEN_INFO_FILE, 'wb') as f:
+        pickle.dump(fleet, f)
+    logger.info(f"Synthetic fleet: {len(fleet)} DUIDs written to {output_dir / GEN_INFO_FILE}")
+
+    model = _Model(start, end, fleet, seed)
+    writers = {name: _ChunkWriter(output_dir / FILES[name]) for name in datasets}
+    started = time.perf_counter()
+
+    try:
+        for times in _monthly_chunks(start, end):
+            chunk = model.chunk(times)
+            if 'generation' in writers:
+                writers['generation'].write(model.generation_table(times, chunk))
+            if 'prices' in writers:
+                writers['prices'].write(model.price_table(times, chunk))
+            if 'transmission' in writers:
+                writers['transmission'].write(model.transmission_table(times, chunk))
+            if 'rooftop' in writers:
+                writers['rooftop'].write(model.rooftop_table(times, chunk))
+            logger.info(f"Synthetic data: {times[-1]:%Y-%m} written ({time.perf_counter() - started:.0f}s)")
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    results = {
+        name: {'path': str(writer.path), 'rows': writer.rows, 'seconds': round(writer.seconds, 1)}
+        for name, writer in writers.items()
+    }
+    logger.info(f"Synthetic data {start} to {end} written to {output_dir} in "
+                f"{time.perf_counter() - started:.0f}s: " +
+                ', '.join(f"{name} {result['rows']:,} rows" for name, result in results.items()))
+    return results
+
+
+def _monthly_chunks(start: pd.Timestamp, end: pd.Timestamp):
+    """Interval timestamps from start to end, a calendar month at a time"""
+    chunk_start = start
+    while chunk_start <= end:
+        next_month = (chunk_start.to_period('M') + 1).start_time
+        chunk_end = min(end, next_month)
+        # Intervals are labelled by their end, so midnight on the 1st closes the month
+        yield pd.date_range(chunk_start, chunk_end, freq=INTERVAL)
+        chunk_start = chunk_end + INTERVAL
+
+
+class _ChunkWriter:
+    """Appends tables to a parquet file, one row group batch per chunk"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows = 0
+        self.seconds = 0.0
+        self._writer = None
+        self._tmp_path = path.with_name(path.name + '.tmp')
+
+    def write(self, table: pa.Table):
+        started = time.perf_counter()
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._tmp_path, table.schema, compression='snappy')
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+        self.seconds += time.perf_counter() - started
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            os.replace(self._tmp_path, self.path)
+
+
+class _Model:
+    """
+    Weather, demand and price model shared by all datasets.
+
+    Slow-moving drivers are drawn once for the whole period - hourly wind
+    and demand noise, daily cloud cover, unit availability and price spikes -
+    so chunks join up; each chunk interpolates them to 5 minutes and adds
+    interval-level noise.
+    """
+
+    def __init__(self, start: pd.Timestamp, end: pd.Timestamp, fleet: pd.DataFrame, seed: int):
+        self.rng = np.random.default_rng(seed + 1)
+        # Interval noise for each file has its own stream, so a subset of files matches the full set
+        self.noise = {name: np.random.default_rng([seed, i]) for i, name in enumerate(FILES)}
+        self.start = start
+        self.origin = start.normalize()
+        n_regions = len(REGIONS)
+
+        # Hourly drivers, from the midnight before start to the hour after end
+        hours = int((end - self.origin) / pd.Timedelta(hours=1)) + 2
+        self.wind_hourly = self._logistic(self._smoothed_noise(hours, n_regions, sigma=8.0) * 1.3 - 0.6)
+        self.demand_hourly = self._smoothed_noise(hours, n_regions, sigma=3.0)
+        self.limit_hourly = self._smoothed_noise(hours, len(INTERCONNECTORS), sigma=6.0, common=0.0)
+
+        # Daily cloud cover (1 = clear), correlated across regions
+        days = hours // 24 + 2
+        common = self.rng.beta(5, 1.8, size=(days, 1))
+        self.clear_sky_daily = np.clip(0.6 * common + 0.4 * self.rng.beta(5, 1.8, size=(days, n_regions)), 0.05, 1.0)
+
+        # Fleet
+        self.duids = fleet['DUID'].to_numpy()
+        self.capacity = fleet['Capacity(MW)'].to_numpy(dtype=float)
+        self.unit_region = pd.Index(REGIONS).get_indexer(fleet['Region'])
+        self.fuel_units = {fuel: np.flatnonzero(fleet['Fuel'].to_numpy() == fuel) for fuel in FLEET}
+        self.unit_bias = self.rng.normal(0, 1, len(fleet))
+        self.availability = self._availability(days, fleet['Fuel'].isin(THERMAL_FUELS).to_numpy())
+
+        self.spikes = self._spikes(start, end)
+
+    def _smoothed_noise(self, length: int, columns: int, sigma: float, common: float = 0.6) -> np.ndarray:
+        """Standardised Gaussian-smoothed noise, partly shared between columns"""
+        width = int(4 * sigma)
+        kernel = np.exp(-0.5 * (np.arange(-width, width + 1) / sigma) ** 2)
+        kernel /= kernel.sum()
+        noise = self.rng.standard_normal((length + 2 * width, columns + 1))
+        smooth = np.column_stack([np.convolve(noise[:, i], kernel, mode='valid') for i in range(columns + 1)])
+        smooth = common * smooth[:, -1:] + (1 - common) * smooth[:, :-1]
+        return (smooth - smooth.mean(axis=0)) / smooth.std(axis=0)
+
+    @staticmethod
+    def _logistic(x: np.ndarray) -> np.ndarray:
+        return 1.0 / (1.0 + np.exp(-x))
+
+    def _availability(self, days: int, thermal: np.ndarray) -> np.ndarray:
+        """Days x units availability: thermal units fail ~1%/day and return ~15%/day"""
+        available = np.ones((days, len(thermal)), dtype=bool)
+        state = np.ones(len(thermal), dtype=bool)
+        draws = self.rng.random((days, len(thermal)))
+        for day in range(days):
+            state = np.where(state, draws[day] > 0.01, draws[day] < 0.15) | ~thermal
+            available[day] = state
+        return available
+
+    def _spikes(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Price spike events: start, intervals, region index and price, mostly in the evening peak"""
+        years = (end - start) / pd.Timedelta(days=365.25)
+        count = self.rng.poisson(SPIKES_PER_YEAR * years * len(REGIONS))
+        total = int((end - start) / INTERVAL) + 1
+        starts = self.rng.integers(0, total, count)
+        # Move most spikes to 5pm-8pm
+        evening = self.rng.random(count) < 0.7
+        day_start = (starts // 288) * 288
+        starts = np.where(evening, day_start + self.rng.integers(17 * 12, 20 * 12, count), starts)
+        return pd.DataFrame({
+            'start': start + starts * INTERVAL,
+            'intervals': self.rng.integers(1, 13, count),
+            'region': self.rng.integers(0, len(REGIONS), count),
+            'price': np.exp(self.rng.uniform(np.log(300), np.log(MARKET_PRICE_CAP), count)),
+        })
+
+    def _hourly(self, series: np.ndarray, times: pd.DatetimeIndex) -> np.ndarray:
+        """Interpolate an hourly series (hours from origin) to the chunk's intervals"""
+        x = (times - self.origin) / pd.Timedelta(hours=1)
+        return np.column_stack([np.interp(x, np.arange(len(series)), series[:, i]) for i in range(series.shape[1])])
+
+    def chunk(self, times: pd.DatetimeIndex) -> Dict[str, np.ndarray]:
+        """Region-level drivers for a chunk: solar and wind capacity factors, demand and price (intervals x regions)"""
+        n = len(times)
+        hour = (times.hour + times.minute / 60).to_numpy()[:, None]
+        season = np.cos(2 * np.pi * (times.dayofyear.to_numpy()[:, None] + 10) / 365.25)  # 1 at midsummer
+        day = ((times - self.origin) // pd.Timedelta(days=1)).to_numpy()
+
+        # Sun: half day length from ~4.9h (June) to ~7.3h (December), noon at 12:30
+        half_day = 6.1 + 1.2 * season
+        sun = np.clip(np.cos(np.pi / 2 * (hour - 12.5) / half_day), 0, None) ** 1.4 * (0.85 + 0.15 * season)
+        sun = np.where(np.abs(hour - 12.5) < half_day, sun, 0.0)
+        clear = self.clear_sky_daily[day]
+        flicker = 1 - 0.25 * (1 - clear) * np.abs(self.rng.standard_normal((n, len(REGIONS))))
+        solar = np.clip(sun * clear * flicker, 0, 1)
+
+        wind = self._hourly(self.wind_hourly, times)
+
+        # Demand: morning and evening peaks, higher in winter and midsummer
+        profile = 0.12 * np.exp(-((hour - 8) / 2) ** 2) + 0.22 * np.exp(-((hour - 18.5) / 2.5) ** 2)
+        demand = 0.75 + profile + 0.06 * np.abs(season) + 0.05 * self._hourly(self.demand_hourly, times)
+
+        solar_share = np.array([SOLAR_PENETRATION[r] for r in REGIONS])
+        wind_share = np.array([WIND_PENETRATION[r] for r in REGIONS])
+        base_price = np.array([REGION_PRICE[r] for r in REGIONS])
+        net = demand - solar_share * solar - wind_share * wind
+        price = base_price * (0.3 + 1.2 * np.clip(net, 0, None) ** 2) + 12 * self.rng.standard_normal((n, len(REGIONS)))
+        # Oversupply pushes prices negative
+        price -= 140 * np.clip(0.35 - net, 0, None) / 0.35
+
+        spikes = self.spikes[(self.spikes['start'] <= times[-1]) &
+                             (self.spikes['start'] + self.spikes['intervals'] * INTERVAL > times[0])]
+        for spike in spikes.itertuples():
+            offset = int((spike.start - times[0]) / INTERVAL)
+            first, last = max(0, offset), min(n, offset + int(spike.intervals))
+            decay = spike.price * 0.7 ** (np.arange(first, last) - offset)
+            price[first:last, spike.region] = np.maximum(price[first:last, spike.region], decay)
+        price = np.clip(price, MARKET_PRICE_FLOOR, MARKET_PRICE_CAP)
+
+        return {'solar': solar, 'wind': wind, 'demand': demand, 'price': price, 'day': day}
+
+    def generation_table(self, times: pd.DatetimeIndex, chunk: Dict[str, np.ndarray]) -> pa.Table:
+        n, units = len(times), len(self.duids)
+        cf = np.zeros((n, units))
+        noise = self.noise['generation'].standard_normal((n, units))
+        available = self.availability[chunk['day']]
+
+        for fuel, idx in self.fuel_units.items():
+            if not len(idx):
+                continue
+            region = self.unit_region[idx]
+            price = chunk['price'][:, region]
+            if fuel == 'Solar':
+                value = chunk['solar'][:, region] * (0.9 + 0.05 * self.unit_bias[idx]) * (1 + 0.03 * noise[:, idx])
+                # Curtailed at negative prices
+                value = np.where(price < -20, value * 0.3, value)
+            elif fuel == 'Wind':
+                value = chunk['wind'][:, region] + 0.08 * self.unit_bias[idx] + 0.04 * noise[:, idx]
+                value = np.where(price < -40, value * 0.2, value)
+            elif fuel == 'Coal':
+                value = 0.55 + 0.9 * (chunk['demand'][:, region] - 0.85) + 0.01 * noise[:, idx]
+                value = np.clip(value, 0.4, 0.95)
+            elif fuel == 'CCGT':
+                value = np.clip((price - 60) / 120, 0, 0.95)
+            elif fuel == 'OCGT':
+                value = np.clip((price - 250) / 300, 0, 1)
+            elif fuel == 'Gas other':
+                value = np.clip(0.15 + (price - 80) / 300, 0, 0.8)
+            elif fuel == 'Water':
+                value = 0.1 + 0.7 * np.clip((price - 70) / 150, 0, 1) + 0.05 * noise[:, idx]
+            elif fuel == 'Battery Storage':
+                # Discharge into high prices, charge from low ones
+                value = np.clip((price - 150) / 200, 0, 1) - 0.6 * np.clip((40 - price) / 80, 0, 1)
+            else:
+                value = (0.45 if fuel == 'Biomass' else 0.3) + 0.05 * noise[:, idx]
+
+            if fuel in THERMAL_FUELS:
+                value = value * available[:, idx]
+            lower = -1.0 if fuel == 'Battery Storage' else 0.0
+            cf[:, idx] = np.clip(value, lower, 1.0)
+
+        values = cf * self.capacity
+        # Small auxiliary load when solar farms are idle
+        solar = self.fuel_units['Solar']
+        values[:, solar] = np.where(values[:, solar] > 0, values[:, solar], -0.1 * np.abs(noise[:, solar]))
+
+        return pa.table({
+            'settlementdate': pa.array(np.repeat(times.to_numpy(), units)),
+            'duid': pa.DictionaryArray.from_arrays(
+                pa.array(np.tile(np.arange(units, dtype=np.int32), n)), pa.array(self.duids)
+            ).cast(pa.string()),
+            'scadavalue': pa.array(values.ravel()),
+        })
+
+    def price_table(self, times: pd.DatetimeIndex, chunk: Dict[str, np.ndarray]) -> pa.Table:
+        prices = pd.DataFrame({
+            'SETTLEMENTDATE': np.repeat(times.to_numpy(), len(REGIONS)),
+            'REGIONID': np.tile(REGIONS, len(times)),
+            'RRP': chunk['price'].ravel(),
+        }).set_index('SETTLEMENTDATE')
+        return pa.Table.from_pandas(prices, preserve_index=True)
+
+    def transmission_table(self, times: pd.DatetimeIndex, chunk: Dict[str, np.ndarray]) -> pa.Table:
+        n, count = len(times), len(INTERCONNECTORS)
+        regions = pd.Index(REGIONS)
+        from_region = regions.get_indexer([spec[0] for spec in INTERCONNECTORS.values()])
+        to_region = regions.get_indexer([spec[1] for spec in INTERCONNECTORS.values()])
+        limit_scale = 0.85 + 0.1 * self._hourly(self.limit_hourly, times)
+        export_limit = np.array([spec[2] for spec in INTERCONNECTORS.values()]) * limit_scale
+        import_limit = np.array([spec[3] for spec in INTERCONNECTORS.values()]) * limit_scale
+
+        # Flow towards the higher price, saturating at the limits
+        pull = np.tanh((chunk['price'][:, to_region] - chunk['price'][:, from_region]) / 40)
+        noise = self.noise['transmission'].standard_normal((n, count))
+        flow = np.where(pull > 0, pull * export_limit, -pull * import_limit) + 0.05 * export_limit * noise
+        flow = np.clip(flow, import_limit, export_limit)
+
+        return pa.table({
+            'settlementdate': pa.array(np.repeat(times.to_numpy(), count)),
+            'interconnectorid': pa.array(np.tile(list(INTERCONNECTORS), n)),
+            'meteredmwflow': pa.array(flow.ravel()),
+            'mwflow': pa.array((flow * (1 + 0.01 * self.noise['transmission'].standard_normal((n, count)))).ravel()),
+            'exportlimit': pa.array(export_limit.ravel()),
+            'importlimit': pa.array(import_limit.ravel()),
+            'mwlosses': pa.array((0.015 * np.abs(flow) + 0.3 * np.abs(noise)).ravel()),
+        })
+
+    def rooftop_table(self, times: pd.DatetimeIndex, chunk: Dict[str, np.ndarray]) -> pa.Table:
+        capacity = np.array([ROOFTOP_CAPACITY[r] for r in REGIONS])
+        output = chunk['solar'] * capacity
+        return pa.table({'settlementdate': pa.array(times.to_numpy()),
+                         **{region: pa.array(output[:, i]) for i, region in enumerate(REGIONS)}})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic AEMO dataset in the production schemas")
+    parser.add_argument('output_dir', help="Directory for the data files and gen_info.pkl")
+    length = parser.add_mutually_exclusive_group()
+    length.add_argument('--years', type=float, help="Years of data (default 1)")
+    length.add_argument('--days', type=float, help="Days of data")
+    parser.add_argument('--end', help="Last interval (default: today's midnight)")
+    parser.add_argument('--duids', type=int, default=600, help="DUIDs in the fleet (default 600)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default 0)")
+    parser.add_argument('--datasets', nargs='+', choices=list(FILES), help="Files to write (default: all)")
+    parser.add_argument('--force', action='store_true', help="Replace existing files in the output directory")
+    args = parser.parse_args(argv)
+
+    output_dir = Path(args.output_dir)
+    existing = [name for name in list(FILES.values()) + [GEN_INFO_FILE] if (output_dir / name).exists()]
+    if existing and not args.force:
+        print(f"{output_dir} already contains {', '.join(existing)} - use --force to replace them")
+        return 1
+
+    results = generate_dataset(output_dir, days=args.days, years=args.years, end=args.end,
+                               n_duids=args.duids, seed=args.seed, datasets=args.datasets)
+    for name, result in results.items():
+        size = os.path.getsize(result['path']) / (1024 * 1024)
+        print(f"{name}: {result['rows']:,} rows, {size:.1f}MB ({result['path']})")
+    print(f"\nTo use it: DATA_DIR={output_dir.resolve()} (with the *_FILE variables unset)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Real-time Energy Generation Dashboard with HvPlot
+Real-time Energy Generation Dashboard with Bokeh
 Shows interactive generation by fuel type with scrollable time window.
 Supports both server and Pyodide (serverless) deployment.
 """
@@ -9,30 +9,34 @@ import pandas as pd
 import numpy as np
 import panel as pn
 import param
-import holoviews as hv
-import hvplot.pandas
-import asyncio
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 import pickle
 from pathlib import Path
-import json
 import sys
-from bokeh.models import DatetimeTickFormatter
 from dotenv import load_dotenv
 
 from ..shared.config import config
 from ..shared.logging_config import setup_logging, get_logger
-from ..shared.email_alerts import EmailAlertManager
+from ..shared.unknown_duids import load_unknown_duids
+from ..shared.gen_info import clean_capacity
+from ..shared.background import RequestCoordinator, run_in_background
+from ..shared.refresh_broker import broker as refresh_broker
+from ..shared.shared_data import LRUCache
+from ..shared.streaming_charts import (StackedAreaChart, MultiLineChart, BandLineChart,
+                                       message_figure, datetime_formatter)
 from ..analysis.price_analysis_ui import create_price_analysis_tab
 from ..station.station_analysis_ui import create_station_analysis_tab
 from ..nem_dash.nem_dash_tab import create_nem_dash_tab_with_updates
+from ..diagnostics.integrity_ui import create_integrity_tab
 
 # Set up logging
 setup_logging()
 logger = get_logger(__name__)
 
-# Configure Panel and HoloViews BEFORE extension loading
+# Configure Panel before extension loading
 pn.config.theme = 'dark'
 pn.extension('tabulator', 'plotly', template='material')
 
@@ -52,29 +56,51 @@ pn.config.raw_css.append("""
     border-radius: 4px 4px 0 0;
 }
 """)
-hv.extension('bokeh')
-
-# Logging is set up in imports
-
-# Configure dark theme with grid enabled
-hv.opts.defaults(
-    hv.opts.Area(
-        width=1200,  # Use larger fixed width
-        height=500,
-        alpha=0.8,
-        show_grid=False,
-        toolbar='above'
-    ),
-    hv.opts.Overlay(
-        show_grid=False,
-        toolbar='above'
-    )
-)
 
 # File paths from shared config
 GEN_INFO_FILE = config.gen_info_file
 GEN_OUTPUT_FILE = config.gen_output_file
 
+# Rows read by incremental refreshes; sessions notified of the same new data
+# ask for the same rows, so they share one read
+_new_rows_cache = LRUCache(16, name='Incremental refresh rows')
+
+# Interconnectors for each region; 'to_' means positive AEMO flow is an import into the region
+INTERCONNECTOR_MAPPING = {
+    'NSW1': {
+        'NSW1-QLD1': 'from_nsw',      # Positive = export to QLD
+        'VIC1-NSW1': 'to_nsw',        # Positive = import from VIC
+        'N-Q-MNSP1': 'from_nsw'       # DirectLink: Positive = export to QLD
+    },
+    'QLD1': {
+        'NSW1-QLD1': 'to_qld',        # Positive = import from NSW
+        'N-Q-MNSP1': 'to_qld'         # DirectLink: Positive = import from NSW
+    },
+    'VIC1': {
+        'VIC1-NSW1': 'from_vic',      # Positive = export to NSW
+        'V-SA': 'from_vic',           # Positive = export to SA
+        'V-S-MNSP1': 'from_vic',      # Murraylink: Positive = export to SA
+        'T-V-MNSP1': 'to_vic'         # Basslink: Positive = import from TAS
+    },
+    'SA1': {
+        'V-SA': 'to_sa',              # Positive = import from VIC
+        'V-S-MNSP1': 'to_sa'          # Murraylink: Positive = import from VIC
+    },
+    'TAS1': {
+        'T-V-MNSP1': 'from_tas'       # Basslink: Positive = export to VIC
+    }
+}
+
+# Colors for the transmission chart lines
+INTERCONNECTOR_COLORS = {
+    'NSW1-QLD1': '#ff6b6b',    # Red
+    'VIC1-NSW1': '#4ecdc4',    # Cyan
+    'V-SA': '#45b7d1',         # Light Blue
+    'T-V-MNSP1': '#96ceb4',    # Light Green
+    'N-Q-MNSP1': '#ffd93d',    # Yellow
+    'V-S-MNSP1': '#dda0dd'     # Plum
+}
+
 # Add this function anywhere in your gen_dash.py file
 def create_sample_env_file():
     """Create a sample .env file with all available options"""
@@ -126,27 +152,10 @@ LOG_FILE=dashboard.log
     print("   2. Edit .env with your iCloud email settings")
     print("   3. Get an iCloud App-Specific Password from appleid.apple.com")
 
-    from bokeh.models import DatetimeTickFormatter
-
-def apply_datetime_formatter(plot, element):
-    """
-    A Bokeh hook that forces the X axis to stay as real datetimes.
-    """
-    plot.handles['xaxis'].formatter = DatetimeTickFormatter(
-        hours="%H:%M", days="%H:%M", months="%b %d", years="%Y"
-    )
-
-from bokeh.models import PrintfTickFormatter
-
-def apply_numeric_yaxis_formatter(plot, element):
-    """
-    Forces the LEFT (generation) axis to use integer formatting.
-    """
-    plot.handles['yaxis'].formatter = PrintfTickFormatter(format="%.0f")
 
 class EnergyDashboard(param.Parameterized):
     """
-    Real-time energy generation dashboard with HvPlot
+    Real-time energy generation dashboard with Bokeh
     """
     
     # Parameters for user controls
@@ -182,13 +191,39 @@ class EnergyDashboard(param.Parameterized):
         self.duid_to_fuel = {}
         self.duid_to_region = {}
         self.last_update = None
-        self.update_task = None
         # Hours will be determined dynamically based on time_range selection
-        self._plot_objects = {}  # Cache for plot objects
-        
-        # Initialize email alert manager
-        self.email_manager = EmailAlertManager()
-        
+        self._lazy_tabs = {}  # Tab index -> (placeholder, name, factory) until first opened
+        # Processed frames for NEM and every region, kept between refreshes so region
+        # switches only select from memory and auto-update only appends new intervals.
+        # _data_version is bumped whenever the raw frames are (re)loaded.
+        self._region_cache = None
+        self._data_version = 0
+        self._last_gen_interval = None
+        # Serialises reloads/refreshes running in the background worker pool
+        self._compute_lock = threading.Lock()
+        # Region/date/refresh changes are coalesced into one render of the latest
+        # selection; the flags record what the next computation has to do.
+        self._requests = RequestCoordinator(lock=self._compute_lock, description='generation dashboard update')
+        self._reload_pending = False
+        self._window_changed = False
+        self._append_pending = False
+        # Views built on this dashboard's frames (Nem-dash), refreshed once a render shows new data
+        self._render_listeners = []
+        self._rendered_version = None
+        # Charts live on persistent ColumnDataSources and are refreshed with stream/patch
+        self._gen_chart = StackedAreaChart(self.get_fuel_colors(), width=1200, height=300, price_height=250)
+        self._util_chart = MultiLineChart(
+            self.get_fuel_colors(), width=1200, height=400,
+            ylabel='Capacity Utilization (%)', y_range=(0, 100), y_format='%.0f%%', value_format='{0.1f}%'
+        )
+        self._transmission_chart = BandLineChart(
+            INTERCONNECTOR_COLORS, width=1200, height=400, ylabel='Flow (MW)',
+            hover_fields=[('Flow', 'value', '{0.0f} MW'), ('Limit', 'limit', '{0.0f} MW'),
+                          ('Utilization', 'percent', '{0.1f}%'), ('Status', 'status', ''),
+                          ('Direction', 'direction', '')]
+        )
+        self._formatters = {}
+
         # Load initial data
         self.load_reference_data()
         
@@ -204,49 +239,31 @@ class EnergyDashboard(param.Parameterized):
         self._initialize_panes()
         
     def _initialize_panes(self):
-        """Initialize plot panes with proper document handling"""
-        try:
-            # Create fresh plots for initialization
-            gen_plot = self.create_plot()
-            util_plot = self.create_utilization_plot()
-            transmission_plot = self.create_transmission_plot()
-            
-            # Create panes with explicit sizing and disable axis linking
-            self.plot_pane = pn.pane.HoloViews(
-                gen_plot,
-                sizing_mode='stretch_width',
-                height=600,  # Back to normal height
-                margin=(5, 5),
-                linked_axes=False  # Prevent UFuncTypeError when switching tabs
-            )
-            
-            self.utilization_pane = pn.pane.HoloViews(
-                util_plot,
-                sizing_mode='stretch_width',
-                height=500,
-                margin=(5, 5),
-                linked_axes=False  # Prevent UFuncTypeError when switching tabs
-            )
-            
-            self.transmission_pane = pn.pane.HoloViews(
-                transmission_plot,
-                sizing_mode='stretch_width',
-                height=400,
-                margin=(5, 5),
-                linked_axes=False  # Prevent UFuncTypeError when switching tabs
-            )
-            
-            # Set initial visibility
-            self.plot_pane.visible = True
-            self.utilization_pane.visible = True
-            self.transmission_pane.visible = True
-            
-        except Exception as e:
-            logger.error(f"Error initializing panes: {e}")
-            # Create fallback empty panes
-            self.plot_pane = pn.pane.HTML("Loading generation chart...", height=600)
-            self.utilization_pane = pn.pane.HTML("Loading utilization chart...", height=500)
-            self.transmission_pane = pn.pane.HTML("Loading transmission chart...", height=400)
+        """Create the chart panes with placeholder figures
+
+        Nothing is loaded here, so creating a session does not wait for the data:
+        create_dashboard() queues the first render, which loads in the background
+        and fills the panes. From then on the Bokeh models stay the same between
+        refreshes, only their ColumnDataSources are streamed/patched.
+        """
+        self.plot_pane = pn.pane.Bokeh(
+            message_figure("Loading generation chart...", height=600),
+            sizing_mode='stretch_width',
+            height=600,
+            margin=(5, 5)
+        )
+        self.utilization_pane = pn.pane.Bokeh(
+            message_figure("Loading utilization chart...", height=500),
+            sizing_mode='stretch_width',
+            height=500,
+            margin=(5, 5)
+        )
+        self.transmission_pane = pn.pane.Bokeh(
+            message_figure("Loading transmission chart...", height=400),
+            sizing_mode='stretch_width',
+            height=400,
+            margin=(5, 5)
+        )
         
     def load_reference_data(self):
         """Load DUID to fuel/region mapping from gen_info.pkl"""
@@ -268,220 +285,9 @@ class EnergyDashboard(param.Parameterized):
         except Exception as e:
             logger.error(f"Error loading gen_info.pkl: {e}")
     
-    def load_duid_exception_list(self):
-        """Load the list of DUIDs to ignore for email alerts"""
-        exception_file = config.data_dir / "duid_exceptions.json"
-        try:
-            if exception_file.exists():
-                with open(exception_file, 'r') as f:
-                    data = json.load(f)
-                    # Return as a set for fast lookup
-                    return set(data.get('exception_duids', []))
-            else:
-                return set()
-        except Exception as e:
-            logger.error(f"Error loading DUID exception list: {e}")
-            return set()
-    
-    def save_duid_exception_list(self, exception_duids):
-        """Save the list of DUIDs to ignore for email alerts"""
-        exception_file = config.data_dir / "duid_exceptions.json"
-        try:
-            # Convert set to list for JSON serialization
-            data = {
-                'exception_duids': sorted(list(exception_duids)),
-                'last_updated': datetime.now().isoformat(),
-                'note': 'DUIDs in this list will not trigger email alerts'
-            }
-            with open(exception_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            logger.info(f"Saved {len(exception_duids)} DUIDs to exception list")
-        except Exception as e:
-            logger.error(f"Error saving DUID exception list: {e}")
-    
-    def add_duids_to_exception_list(self, duids_to_add):
-        """Add DUIDs to the exception list"""
-        current_exceptions = self.load_duid_exception_list()
-        current_exceptions.update(duids_to_add)
-        self.save_duid_exception_list(current_exceptions)
-        logger.info(f"Added {len(duids_to_add)} DUIDs to exception list")
-    
-    def handle_unknown_duids(self, unknown_duids, df):
-        """Handle unknown DUIDs - log and potentially send alerts"""
-        
-        # Load exception list
-        exception_duids = self.load_duid_exception_list()
-        
-        # Filter out DUIDs that are in the exception list
-        new_unknown_duids = unknown_duids - exception_duids
-        known_exception_duids = unknown_duids & exception_duids
-        
-        # Always log the issue
-        logger.warning(f"🚨 Found {len(unknown_duids)} unknown DUIDs not in gen_info.pkl:")
-        logger.warning(f"   - {len(new_unknown_duids)} are NEW (will trigger email if enabled)")
-        logger.warning(f"   - {len(known_exception_duids)} are in exception list (no email)")
-        
-        for duid in sorted(unknown_duids):
-            # Get some sample data for this DUID
-            duid_data = df[df['duid'] == duid]
-            if not duid_data.empty:
-                sample = duid_data.iloc[-1]  # Most recent record
-                exception_flag = " [EXCEPTION LIST]" if duid in exception_duids else " [NEW]"
-                logger.warning(f"  - {duid}: {sample['scadavalue']:.1f} MW at {sample['settlementdate']}{exception_flag}")
-            else:
-                logger.warning(f"  - {duid}: No data found")
-        
-        # Only send email for new unknown DUIDs not in exception list
-        if new_unknown_duids:
-            # Check if email alerts are enabled
-            if os.getenv('ENABLE_EMAIL_ALERTS', 'true').lower() == 'true':
-                if self.should_send_email_alert(new_unknown_duids):
-                    self.send_unknown_duid_email(new_unknown_duids, df)
-                    
-                    # After sending email, optionally add these to exception list
-                    # to prevent repeated emails about the same DUIDs
-                    if os.getenv('AUTO_ADD_TO_EXCEPTIONS', 'true').lower() == 'true':
-                        self.add_duids_to_exception_list(new_unknown_duids)
-                        logger.info("Auto-added alerted DUIDs to exception list")
-            else:
-                logger.info(f"Email alerts disabled - would have alerted about {len(new_unknown_duids)} new DUIDs")
-
-    def should_send_email_alert(self, unknown_duids):
-        """Check if we should send an email alert (rate limiting)"""
-        # Load cache of previously alerted DUIDs
-        cache_file = config.data_dir / "unknown_duids_alerts.json"
-        alert_cache = {}
-        
-        try:
-            if cache_file.exists():
-                with open(cache_file, 'r') as f:
-                    alert_cache = json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading alert cache: {e}")
-        
-        # Check if any DUID needs alerting (hasn't been alerted in last 24 hours)
-        now = datetime.now()
-        duids_needing_alert = []
-        
-        for duid in unknown_duids:
-            if duid not in alert_cache:
-                duids_needing_alert.append(duid)
-            else:
-                last_alert = datetime.fromisoformat(alert_cache[duid])
-                if (now - last_alert).total_seconds() > 24 * 3600:  # 24 hours
-                    duids_needing_alert.append(duid)
-        
-        if duids_needing_alert:
-            # Update cache for DUIDs we're about to alert
-            for duid in duids_needing_alert:
-                alert_cache[duid] = now.isoformat()
-            
-            # Save updated cache
-            try:
-                with open(cache_file, 'w') as f:
-                    json.dump(alert_cache, f, indent=2, default=str)
-            except Exception as e:
-                logger.error(f"Error saving alert cache: {e}")
-            
-            return True
-        
-        return False
-
-    def send_unknown_duid_email(self, unknown_duids, df):
-        """Send email alert about unknown DUIDs"""
-        try:
-            # Email configuration - use environment variables
-            sender_email = os.getenv('ALERT_EMAIL')
-            sender_password = os.getenv('ALERT_PASSWORD') 
-            recipient_email = os.getenv('RECIPIENT_EMAIL', sender_email)
-            smtp_server = os.getenv('SMTP_SERVER', 'smtp.mail.me.com')  # Default to iCloud
-            smtp_port = int(os.getenv('SMTP_PORT', '587'))
-            
-            if not all([sender_email, sender_password]):
-                logger.error("Email credentials not configured. Set ALERT_EMAIL and ALERT_PASSWORD environment variables.")
-                return
-            
-            # Create email
-            msg = MIMEMultipart()
-            msg['From'] = sender_email
-            msg['To'] = recipient_email
-            msg['Subject'] = f"⚠️ Unknown DUIDs in Energy Dashboard - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            
-            # Create email body
-            body = self.create_alert_email_body(unknown_duids, df)
-            msg.attach(MIMEText(body, 'html'))
-            
-            # Send email using configured SMTP server
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(sender_email, sender_password)
-                server.send_message(msg)
-            
-            logger.info(f"✅ Email alert sent for {len(unknown_duids)} unknown DUIDs via {smtp_server}")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to send email alert: {e}")
-
-    def create_alert_email_body(self, unknown_duids, df):
-        """Create HTML email body"""
-        # Get sample data for each unknown DUID
-        duid_samples = []
-        for duid in sorted(unknown_duids)[:10]:  # Limit to 10 for email size
-            duid_data = df[df['duid'] == duid]
-            if not duid_data.empty:
-                sample = duid_data.iloc[-1]
-                duid_samples.append({
-                    'duid': duid,
-                    'power': sample['scadavalue'],
-                    'time': sample['settlementdate'],
-                    'records': len(duid_data)
-                })
-        
-        # Build HTML
-        samples_html = ""
-        for sample in duid_samples:
-            samples_html += f"""
-            <tr>
-                <td>{sample['duid']}</td>
-                <td>{sample['power']:.1f} MW</td>
-                <td>{sample['time']}</td>
-                <td>{sample['records']}</td>
-            </tr>
-            """
-        
-        body = f"""
-        <html>
-        <body>
-            <h2>🚨 Unknown DUIDs Detected</h2>
-            <p><strong>Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>Found <strong>{len(unknown_duids)} unknown DUID(s)</strong> not in gen_info.pkl</p>
-            
-            <h3>Sample Data:</h3>
-            <table border="1" style="border-collapse: collapse;">
-            <tr>
-                <th>DUID</th>
-                <th>Latest Power</th>
-                <th>Latest Time</th>
-                <th>Records (24h)</th>
-            </tr>
-            {samples_html}
-            </table>
-            
-            <h3>Action Required:</h3>
-            <ul>
-                <li>Update gen_info.pkl with new DUID information</li>
-                <li>Check AEMO data sources for DUID details</li>
-                <li>Verify these are legitimate new generation units</li>
-            </ul>
-            
-            <p><em>All unknown DUIDs: {', '.join(sorted(unknown_duids))}</em></p>
-        </body>
-        </html>
-        """
-        return body
-    
     def load_generation_data(self):
-        """Enhanced version that checks for unknown DUIDs and sends alerts"""
+        """Load generation data for the selected time range, mapped to fuel and region"""
+        self._data_version += 1
         try:
             if os.path.exists(GEN_OUTPUT_FILE):
                 # Calculate time window based on selected time range
@@ -495,29 +301,12 @@ class EnergyDashboard(param.Parameterized):
                 
                 # Filter to time window
                 df = df[df['settlementdate'] >= start_time]
-                
-                # *** NEW: CHECK FOR UNKNOWN DUIDs BEFORE MAPPING ***
-                all_duids_in_data = set(df['duid'].unique())
-                known_duids = set(self.duid_to_fuel.keys())
-                unknown_duids = all_duids_in_data - known_duids
-                
-                # Log and potentially alert about unknown DUIDs
-                if unknown_duids:
-                    self.handle_unknown_duids(unknown_duids, df)
-                
-                # Add fuel and region information
-                df['fuel'] = df['duid'].map(self.duid_to_fuel)
-                df['region'] = df['duid'].map(self.duid_to_region)
-                
-                # Log how much data is being dropped
-                original_count = len(df)
-                df = df.dropna(subset=['fuel', 'region'])
-                dropped_count = original_count - len(df)
-                
-                if dropped_count > 0:
-                    logger.warning(f"Dropped {dropped_count} records ({dropped_count/original_count*100:.1f}%) due to unknown DUIDs")
-                
+
+                df = self._map_generation_rows(df)
+                self._update_unknown_duids()
+
                 self.gen_output_df = df
+                self._last_gen_interval = df['settlementdate'].max() if not df.empty else None
                 logger.info(f"Loaded {len(df)} generation records for {self.time_range}")
                 
             else:
@@ -527,18 +316,74 @@ class EnergyDashboard(param.Parameterized):
         except Exception as e:
             logger.error(f"Error loading generation data: {e}")
             self.gen_output_df = pd.DataFrame()
+            self._last_gen_interval = None
+
+    def _update_unknown_duids(self):
+        """Note DUIDs missing from gen_info.pkl, as recorded by the data service
+
+        The data service checks each new interval as it is collected and sends
+        the alerts (see shared.unknown_duids), so the session only reads its table.
+        """
+        unknown = load_unknown_duids()
+        new_unknown = set(unknown['duid']) - self.session_unknown_duids
+        if new_unknown:
+            logger.warning(f"🚨 {len(new_unknown)} DUIDs not in gen_info.pkl are excluded from the charts: "
+                           f"{', '.join(sorted(new_unknown))}")
+        self.session_unknown_duids = set(unknown['duid'])
+
+    def _map_generation_rows(self, df):
+        """Add fuel/region columns to raw SCADA rows, dropping unknown DUIDs"""
+        # Add fuel and region information
+        df = df.copy()
+        df['fuel'] = df['duid'].map(self.duid_to_fuel)
+        df['region'] = df['duid'].map(self.duid_to_region)
+
+        # Log how much data is being dropped
+        original_count = len(df)
+        df = df.dropna(subset=['fuel', 'region'])
+        dropped_count = original_count - len(df)
+
+        if dropped_count > 0:
+            logger.warning(f"Dropped {dropped_count} records ({dropped_count/original_count*100:.1f}%) due to unknown DUIDs")
+
+        return df
+
+    def _read_parquet_since(self, path, column, since):
+        """Read only the rows of a parquet file with column > since (pushed down to pyarrow)
 
-    def load_price_data(self):
-        """Load and process price data from parquet file"""
+        Reads are shared between sessions until the file changes.
+        """
+        stat = os.stat(path)
+        key = (str(path), column, pd.Timestamp(since), stat.st_mtime_ns, stat.st_size)
+        rows = _new_rows_cache.get(key)
+        if rows is None:
+            rows = pd.read_parquet(path, filters=[(column, '>', pd.Timestamp(since))])
+            _new_rows_cache.put(key, rows)
+        # Callers convert columns in place
+        return rows.copy()
+
+    def load_price_data(self, since=None, region=None):
+        """Load and process price data from parquet file.
+
+        If since is given, only intervals after it are read (incremental refresh).
+        Prices are for the selected region unless region is given.
+        """
+        return self._clean_region_prices(self._read_price_rows(since), region or self.region)
+
+    def _read_price_rows(self, since=None):
+        """Read price rows for all regions, filtered to the selected time range"""
         try:
             price_file = config.spot_hist_file
-            
+
             if not os.path.exists(price_file):
                 logger.error(f"Price data file not found at {price_file}")
                 return pd.DataFrame()
-            
+
             # Load parquet file
-            df = pd.read_parquet(price_file)
+            if since is not None:
+                df = self._read_parquet_since(price_file, 'SETTLEMENTDATE', since)
+            else:
+                df = pd.read_parquet(price_file)
             
             # Debug: Check the structure
             logger.info(f"Price data columns: {df.columns.tolist()}")
@@ -578,16 +423,30 @@ class EnergyDashboard(param.Parameterized):
                 logger.info(f"Using fallback time filter for 'All Data': last 90 days")
             
             logger.info(f"Price data shape after time filtering: {df.shape}")
+            logger.info(f"Available regions in data: {df['REGIONID'].unique()}")
+            return df
             
+        except Exception as e:
+            logger.error(f"Error loading price data: {e}")
+            import traceback
+            traceback.print_exc()
+            return pd.DataFrame()
+
+    def _clean_region_prices(self, df, region):
+        """Select one region's prices and resample them onto 5-minute intervals"""
+        try:
+            if df.empty:
+                logger.warning("No price data found for the specified time window and region")
+                return pd.DataFrame()
+
             # Filter by region
-            if self.region != 'NEM':
-                df = df[df['REGIONID'] == self.region]
+            if region != 'NEM':
+                df = df[df['REGIONID'] == region]
             else:
                 # For NEM, use NSW1 as representative (or you could average all regions)
                 df = df[df['REGIONID'] == 'NSW1']
             
             logger.info(f"Price data shape after region filtering: {df.shape}")
-            logger.info(f"Available regions in data: {df['REGIONID'].unique()}")
             
             # Ensure data is sorted by time
             df = df.sort_values('SETTLEMENTDATE')
@@ -610,7 +469,7 @@ class EnergyDashboard(param.Parameterized):
                 # Reset index to get settlementdate back as column
                 clean_df = clean_df.reset_index()
                 
-                logger.info(f"Loaded {len(clean_df)} price records for {self.time_range}")
+                logger.info(f"Loaded {len(clean_df)} price records for {region}, {self.time_range}")
                 if not clean_df.empty:
                     logger.info(f"Price range: ${clean_df['RRP'].min():.2f} to ${clean_df['RRP'].max():.2f}")
                     logger.info(f"Time range: {clean_df['settlementdate'].min()} to {clean_df['settlementdate'].max()}")
@@ -622,13 +481,12 @@ class EnergyDashboard(param.Parameterized):
                 return pd.DataFrame()
             
         except Exception as e:
-            logger.error(f"Error loading price data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"Error processing price data for {region}: {e}")
             return pd.DataFrame()
 
     def load_transmission_data(self):
         """Load and process transmission flow data from parquet file"""
+        self._data_version += 1
         try:
             transmission_file = config.transmission_output_file
             
@@ -800,6 +658,7 @@ class EnergyDashboard(param.Parameterized):
 
     def load_rooftop_solar_data(self):
         """Load and process rooftop solar data from parquet file"""
+        self._data_version += 1
         try:
             rooftop_file = config.rooftop_solar_file
             
@@ -869,244 +728,168 @@ class EnergyDashboard(param.Parameterized):
             logger.error(f"Error loading rooftop solar data: {e}")
             self.rooftop_df = pd.DataFrame()
 
-    def calculate_regional_transmission_flows(self):
-        """Calculate net transmission flows for the selected region"""
-        if self.transmission_df is None or self.transmission_df.empty or self.region == 'NEM':
-            return pd.DataFrame(), pd.DataFrame()
-        
-        try:
-            df = self.transmission_df.copy()
-            
-            # Define interconnector mapping for each region
-            interconnector_mapping = {
-                'NSW1': {
-                    'NSW1-QLD1': 'from_nsw',      # Positive = export to QLD
-                    'VIC1-NSW1': 'to_nsw',        # Positive = import from VIC  
-                    'N-Q-MNSP1': 'from_nsw'       # DirectLink: Positive = export to QLD
-                },
-                'QLD1': {
-                    'NSW1-QLD1': 'to_qld',        # Positive = import from NSW
-                    'N-Q-MNSP1': 'to_qld'         # DirectLink: Positive = import from NSW
-                },
-                'VIC1': {
-                    'VIC1-NSW1': 'from_vic',      # Positive = export to NSW
-                    'V-SA': 'from_vic',           # Positive = export to SA
-                    'V-S-MNSP1': 'from_vic',      # Murraylink: Positive = export to SA
-                    'T-V-MNSP1': 'to_vic'         # Basslink: Positive = import from TAS
-                },
-                'SA1': {
-                    'V-SA': 'to_sa',              # Positive = import from VIC
-                    'V-S-MNSP1': 'to_sa'          # Murraylink: Positive = import from VIC
-                },
-                'TAS1': {
-                    'T-V-MNSP1': 'from_tas'       # Basslink: Positive = export to VIC
-                }
-            }
-            
-            region_interconnectors = interconnector_mapping.get(self.region, {})
-            if not region_interconnectors:
-                logger.warning(f"No interconnectors defined for region {self.region}")
-                return pd.DataFrame(), pd.DataFrame()
-            
-            # Filter transmission data for this region's interconnectors
-            region_transmission = df[df['interconnectorid'].isin(region_interconnectors.keys())].copy()
-            
-            if region_transmission.empty:
-                logger.warning(f"No transmission data found for {self.region}")
-                return pd.DataFrame(), pd.DataFrame()
-            
-            # Apply flow direction corrections based on region perspective
-            def correct_flow_direction(row):
-                interconnector = row['interconnectorid']
-                flow_type = region_interconnectors[interconnector]
-                flow = row['meteredmwflow']
-                
-                # Correct sign based on region perspective
-                if flow_type.startswith('to_'):
-                    # This interconnector brings power TO our region (import)
-                    return flow  # Positive = import
-                else:
-                    # This interconnector takes power FROM our region (export)  
-                    return -flow  # Negative = export
-            
-            region_transmission['regional_flow'] = region_transmission.apply(correct_flow_direction, axis=1)
-            
-            # Aggregate net flows by time (sum all interconnectors for this region)
-            net_flows = region_transmission.groupby('settlementdate')['regional_flow'].sum().reset_index()
-            net_flows.columns = ['settlementdate', 'net_transmission_mw']
-            
-            # Create individual line data for the third chart
-            line_data = region_transmission.pivot(
-                index='settlementdate', 
-                columns='interconnectorid', 
-                values='regional_flow'
-            ).fillna(0).reset_index()
-            
-            logger.info(f"Calculated transmission flows for {self.region}: "
-                       f"{len(net_flows)} time points, "
-                       f"{len(region_interconnectors)} interconnectors")
-            
-            return net_flows, line_data
-            
-        except Exception as e:
-            logger.error(f"Error calculating transmission flows: {e}")
-            return pd.DataFrame(), pd.DataFrame()
-
-    
     def process_data_for_region(self):
-        """Process generation data for selected region and add transmission flows"""
+        """Generation by fuel type (with transmission flows and rooftop solar) for the selected region"""
+        frames = self._get_region_frames()
+        return frames['generation'].copy() if frames else pd.DataFrame()
+
+    def _get_region_frames(self, region=None):
+        """Cached frames for one region, rebuilding the cache for all regions if the data changed
+
+        Returns None until the generation data has been loaded (by the first render).
+        """
+        if self.gen_output_df is None:
+            return None
+        if self._region_cache is None or self._region_cache['version'] != self._data_version:
+            self._build_region_cache()
+        return self._region_cache['regions'].get(region or self.region)
+
+    def _build_region_cache(self):
+        """Compute generation, utilization, net flow, rooftop and price frames for NEM and every region"""
+        # Load transmission and rooftop solar data if not already loaded
+        if self.transmission_df is None:
+            self.load_transmission_data()
+        if self.rooftop_df is None:
+            self.load_rooftop_solar_data()
+
+        regions = self._compute_region_frames()
+
+        price_rows = self._read_price_rows()
+        for region, frames in regions.items():
+            frames['price'] = self._clean_region_prices(price_rows, region)
+
+        self._region_cache = {'version': self._data_version, 'regions': regions}
+        logger.info(f"Built region cache (data version {self._data_version}) for {list(regions)}")
+
+    def _compute_region_frames(self, tail_start=None):
+        """Compute the frames for NEM and every region in one grouped pass
+
+        Returns {region: {'generation', 'utilization', 'net_flow', 'rooftop'}}. If
+        tail_start is given, only intervals at or after it are computed, so an
+        incremental refresh can recompute just the tail of the cached frames.
+        """
+        empty_series = pd.Series(dtype=float, index=pd.DatetimeIndex([], name='settlementdate'))
+        frames = {
+            region: {'generation': pd.DataFrame(), 'utilization': pd.DataFrame(),
+                     'net_flow': empty_series, 'rooftop': empty_series}
+            for region in self.param.region.objects
+        }
+
         if self.gen_output_df is None or self.gen_output_df.empty:
-            return pd.DataFrame()
-        
-        df = self.gen_output_df.copy()
-        
-        # Filter by region
-        if self.region != 'NEM':
-            df = df[df['region'] == self.region]
-        
-        # Group by time and fuel type
-        df['settlementdate'] = pd.to_datetime(df['settlementdate'])
-        
+            return frames
+
+        df = self.gen_output_df
+        if tail_start is not None:
+            df = df[df['settlementdate'] >= tail_start]
+
         # Apply time range filtering
         start_datetime, end_datetime = self._get_effective_date_range()
         if start_datetime is not None:
             df = df[(df['settlementdate'] >= start_datetime) & (df['settlementdate'] <= end_datetime)]
             logger.info(f"Filtered generation data to {start_datetime.date()} - {end_datetime.date()}: {len(df)} records")
-        
-        # Always use 5-minute intervals without resampling
-        result = df.groupby([
-            pd.Grouper(key='settlementdate', freq='5min'),
-            'fuel'
-        ])['scadavalue'].sum().reset_index()
-        
-        # Pivot to get fuel types as columns
-        pivot_df = result.pivot(index='settlementdate', columns='fuel', values='scadavalue')
-        pivot_df = pivot_df.fillna(0)
-        
-        # Add transmission flows if available and not NEM region
-        if self.region != 'NEM':
-            try:
-                # Load transmission data if not already loaded
-                if self.transmission_df is None:
-                    self.load_transmission_data()
-                
-                # Calculate transmission flows for this region
-                net_flows, _ = self.calculate_regional_transmission_flows()
-                
-                if not net_flows.empty:
-                    # Convert to same time index as generation data
-                    net_flows['settlementdate'] = pd.to_datetime(net_flows['settlementdate'])
-                    net_flows.set_index('settlementdate', inplace=True)
-                    
-                    # Align with generation data timeframe
-                    common_index = pivot_df.index.intersection(net_flows.index)
-                    if len(common_index) > 0:
-                        # Split transmission into imports (positive) and exports (negative)
-                        # Ensure we're getting the right column and it's numeric
-                        transmission_series = net_flows.reindex(pivot_df.index, fill_value=0)['net_transmission_mw']
-                        # Convert to float to ensure numeric type
-                        transmission_values = pd.to_numeric(transmission_series, errors='coerce').fillna(0)
-                        
-                        # Add transmission imports (positive values only) - goes to top of stack
-                        pivot_df['Transmission Flow'] = pd.Series(
-                            np.where(transmission_values.values > 0, transmission_values.values, 0),
-                            index=transmission_values.index
-                        )
-                        
-                        # Add transmission exports (negative values only) - goes below battery
-                        pivot_df['Transmission Exports'] = pd.Series(
-                            np.where(transmission_values.values < 0, transmission_values.values, 0),
-                            index=transmission_values.index
-                        )
-                        
-                        logger.info(f"Added transmission flows: Imports max {pivot_df['Transmission Flow'].max():.1f}MW, "
-                                   f"Exports min {pivot_df['Transmission Exports'].min():.1f}MW")
-                    else:
-                        logger.warning("No overlapping time data between generation and transmission")
-                        
-            except Exception as e:
-                logger.error(f"Error adding transmission flows: {e}")
-        
-        # Add rooftop solar data if available
-        try:
-            # Load rooftop solar data if not already loaded
-            if self.rooftop_df is None:
-                self.load_rooftop_solar_data()
-            
-            if not self.rooftop_df.empty:
-                rooftop_df = self.rooftop_df.copy()
-                rooftop_df['settlementdate'] = pd.to_datetime(rooftop_df['settlementdate'])
-                rooftop_df.set_index('settlementdate', inplace=True)
-                
-                # No resampling needed - rooftop solar is already in MW values
-                
-                if self.region == 'NEM':
-                    # For NEM view, sum all main regions (ending in '1')
-                    main_regions = ['NSW1', 'QLD1', 'SA1', 'TAS1', 'VIC1']
-                    available_regions = [r for r in main_regions if r in rooftop_df.columns]
-                    
-                    if available_regions:
-                        # Sum rooftop solar across all regions
-                        total_rooftop = rooftop_df[available_regions].sum(axis=1)
-                        rooftop_values = total_rooftop.reindex(pivot_df.index)
-                        
-                        # Forward-fill missing values at the end (up to 2 hours)
-                        # This handles the case where rooftop data is less recent than generation data
-                        rooftop_values = rooftop_values.fillna(method='ffill', limit=24)  # 24 * 5min = 2 hours
-                        
-                        # Apply gentle decay for extended forward-fill periods
-                        last_valid_idx = rooftop_values.last_valid_index()
-                        if last_valid_idx is not None and last_valid_idx < rooftop_values.index[-1]:
-                            # Calculate how many periods we're forward-filling
-                            fill_start_pos = rooftop_values.index.get_loc(last_valid_idx) + 1
-                            fill_periods = len(rooftop_values) - fill_start_pos
-                            
-                            if fill_periods > 0:
-                                # Apply exponential decay for realism (solar decreases over time)
-                                last_value = rooftop_values.iloc[fill_start_pos - 1]
-                                decay_rate = 0.98  # 2% decay per 5-minute period
-                                for i in range(fill_periods):
-                                    rooftop_values.iloc[fill_start_pos + i] = last_value * (decay_rate ** (i + 1))
-                        
-                        # Fill any remaining NaN with 0
-                        rooftop_values = rooftop_values.fillna(0)
-                        pivot_df['Rooftop Solar'] = rooftop_values
-                        
-                        logger.info(f"Added rooftop solar (NEM total): max {pivot_df['Rooftop Solar'].max():.1f}MW, "
-                                   f"avg {pivot_df['Rooftop Solar'].mean():.1f}MW")
-                        
-                elif self.region.endswith('1') and self.region in rooftop_df.columns:
-                    # For individual regions
-                    rooftop_values = rooftop_df.reindex(pivot_df.index)[self.region]
-                    
-                    # Forward-fill missing values at the end (up to 2 hours)
-                    rooftop_values = rooftop_values.fillna(method='ffill', limit=24)
-                    
-                    # Apply gentle decay for extended forward-fill periods
-                    last_valid_idx = rooftop_values.last_valid_index()
-                    if last_valid_idx is not None and last_valid_idx < rooftop_values.index[-1]:
-                        fill_start_pos = rooftop_values.index.get_loc(last_valid_idx) + 1
-                        fill_periods = len(rooftop_values) - fill_start_pos
-                        
-                        if fill_periods > 0:
-                            last_value = rooftop_values.iloc[fill_start_pos - 1]
-                            decay_rate = 0.98  # 2% decay per 5-minute period
-                            for i in range(fill_periods):
-                                rooftop_values.iloc[fill_start_pos + i] = last_value * (decay_rate ** (i + 1))
-                    
-                    # Fill any remaining NaN with 0
-                    rooftop_values = rooftop_values.fillna(0)
+
+        if df.empty:
+            return frames
+
+        # One grouped pass over interval x region x fuel; NEM is the sum over regions
+        by_region = df.groupby(['settlementdate', 'region', 'fuel'])['scadavalue'].sum()
+        fuel_pivots = {'NEM': by_region.groupby(level=['settlementdate', 'fuel']).sum().unstack('fuel', fill_value=0)}
+        present_regions = set(by_region.index.get_level_values('region'))
+        for region in frames:
+            if region in present_regions:
+                fuel_pivots[region] = by_region.xs(region, level='region').unstack('fuel', fill_value=0)
+
+        net_flows = self._calculate_net_flows(tail_start)
+        fuel_capacity = self._get_fuel_capacity()
+        rooftop_df = None
+        if self.rooftop_df is not None and not self.rooftop_df.empty:
+            rooftop_df = self.rooftop_df.set_index('settlementdate')
+
+        for region, pivot_df in fuel_pivots.items():
+            frames[region]['utilization'] = self._calculate_utilization(
+                pivot_df, fuel_capacity.get(region, pd.Series(dtype=float))
+            )
+
+            # Add transmission flows (not for NEM - interconnectors net out)
+            if region != 'NEM' and region in net_flows.columns:
+                net_flow = net_flows[region].reindex(pivot_df.index).fillna(0)
+                # Imports (positive) go to the top of the stack, exports (negative) below battery
+                pivot_df['Transmission Flow'] = net_flow.clip(lower=0)
+                pivot_df['Transmission Exports'] = net_flow.clip(upper=0)
+                frames[region]['net_flow'] = net_flow
+
+            # Add rooftop solar data if available
+            if rooftop_df is not None:
+                rooftop_values = self._align_rooftop(rooftop_df, region, pivot_df.index)
+                if rooftop_values is not None:
                     pivot_df['Rooftop Solar'] = rooftop_values
-                    
-                    logger.info(f"Added rooftop solar: max {pivot_df['Rooftop Solar'].max():.1f}MW, "
-                               f"avg {pivot_df['Rooftop Solar'].mean():.1f}MW")
-                               
-                elif not self.region.endswith('1'):
-                    logger.info(f"Rooftop solar data not available for sub-region {self.region} (only available for main regions ending in '1')")
-                        
-        except Exception as e:
-            logger.error(f"Error adding rooftop solar data: {e}")
-        
+                    frames[region]['rooftop'] = rooftop_values
+
+            frames[region]['generation'] = self._order_fuel_columns(pivot_df)
+
+        return frames
+
+    def _calculate_net_flows(self, tail_start=None):
+        """Net interconnector flow into each region (positive = import), one column per region"""
+        if self.transmission_df is None or self.transmission_df.empty:
+            return pd.DataFrame()
+
+        df = self.transmission_df
+        if tail_start is not None:
+            df = df[df['settlementdate'] >= tail_start]
+
+        # 'to_' interconnectors bring power TO the region (positive = import),
+        # the others take power FROM the region (negative = export)
+        directions = pd.DataFrame(
+            [(region, interconnector, 1.0 if flow_type.startswith('to_') else -1.0)
+             for region, interconnectors in INTERCONNECTOR_MAPPING.items()
+             for interconnector, flow_type in interconnectors.items()],
+            columns=['region', 'interconnectorid', 'direction']
+        )
+        flows = df[['settlementdate', 'interconnectorid', 'meteredmwflow']].merge(directions, on='interconnectorid')
+        if flows.empty:
+            return pd.DataFrame()
+
+        flows['regional_flow'] = flows['meteredmwflow'] * flows['direction']
+        return flows.groupby(['settlementdate', 'region'])['regional_flow'].sum().unstack('region')
+
+    def _align_rooftop(self, rooftop_df, region, index):
+        """Rooftop solar for a region on the generation index, or None if not available"""
+        # Rooftop solar is already in MW values - no resampling needed
+        main_regions = ['NSW1', 'QLD1', 'SA1', 'TAS1', 'VIC1']
+        if region == 'NEM':
+            # For NEM view, sum all main regions (ending in '1')
+            available_regions = [r for r in main_regions if r in rooftop_df.columns]
+            if not available_regions:
+                return None
+            rooftop_values = rooftop_df[available_regions].sum(axis=1)
+        elif region.endswith('1') and region in rooftop_df.columns:
+            rooftop_values = rooftop_df[region]
+        else:
+            if not region.endswith('1'):
+                logger.info(f"Rooftop solar data not available for sub-region {region} (only available for main regions ending in '1')")
+            return None
+
+        rooftop_values = rooftop_values.reindex(index)
+
+        # Forward-fill missing values at the end (up to 2 hours)
+        # This handles the case where rooftop data is less recent than generation data
+        rooftop_values = rooftop_values.ffill(limit=24)  # 24 * 5min = 2 hours
+
+        # Apply gentle decay for extended forward-fill periods (solar decreases over time)
+        last_valid_idx = rooftop_values.last_valid_index()
+        if last_valid_idx is not None and last_valid_idx < rooftop_values.index[-1]:
+            fill_start_pos = rooftop_values.index.get_loc(last_valid_idx) + 1
+            fill_periods = len(rooftop_values) - fill_start_pos
+            last_value = rooftop_values.iloc[fill_start_pos - 1]
+            decay_rate = 0.98  # 2% decay per 5-minute period
+            rooftop_values.iloc[fill_start_pos:] = last_value * decay_rate ** np.arange(1, fill_periods + 1)
+
+        # Fill any remaining NaN with 0
+        return rooftop_values.fillna(0)
+
+    def _order_fuel_columns(self, pivot_df):
+        """Reorder pivot columns into the stacking order used by the generation chart"""
         # Define preferred fuel order with transmission at correct positions
         preferred_order = [
             'Transmission Flow',     # NEW: At top of stack (positive values)
@@ -1132,113 +915,36 @@ class EnergyDashboard(param.Parameterized):
         
         # Reorder the dataframe
         pivot_df = pivot_df[final_order]
-        
+
         return pivot_df
-    
+
     def calculate_capacity_utilization(self):
         """Calculate capacity utilization by fuel type for selected region"""
-        if self.gen_output_df is None or self.gen_output_df.empty:
-            return pd.DataFrame()
-        
-        df = self.gen_output_df.copy()
-        
-        # Filter by region
-        if self.region != 'NEM':
-            df = df[df['region'] == self.region]
-        
-        # Group generation by time and fuel type
-        df['settlementdate'] = pd.to_datetime(df['settlementdate'])
-        
-        # Apply time range filtering
-        start_datetime, end_datetime = self._get_effective_date_range()
-        if start_datetime is not None:
-            df = df[(df['settlementdate'] >= start_datetime) & (df['settlementdate'] <= end_datetime)]
-        
-        # Always aggregate generation by 5-minute intervals and fuel type
-        generation = df.groupby([
-            pd.Grouper(key='settlementdate', freq='5min'),
-            'fuel'
-        ])['scadavalue'].sum().reset_index()
-        
-        # Get capacity data by fuel type for the region
+        frames = self._get_region_frames()
+        return frames['utilization'].copy() if frames else pd.DataFrame()
+
+    def _get_fuel_capacity(self):
+        """Installed capacity by fuel type for NEM and each region: {region: Series}"""
         capacity_df = self.gen_info_df.copy()
-        if self.region != 'NEM':
-            capacity_df = capacity_df[capacity_df['Region'] == self.region]
-        
-        # Clean and convert capacity data - handle string ranges and non-numeric values
-        def clean_capacity(capacity):
-            if pd.isna(capacity):
-                return 0
-            if isinstance(capacity, str):
-                # Handle range strings like "23.44 - 27.60"
-                if ' - ' in capacity:
-                    try:
-                        # Take the average of the range
-                        parts = capacity.split(' - ')
-                        return (float(parts[0]) + float(parts[1])) / 2
-                    except ValueError:
-                        return 0
-                else:
-                    try:
-                        return float(capacity)
-                    except ValueError:
-                        return 0
-            try:
-                return float(capacity)
-            except (ValueError, TypeError):
-                return 0
-        
         capacity_df['Clean_Capacity'] = capacity_df['Capacity(MW)'].apply(clean_capacity)
-        
-        # Sum capacity by fuel type using the cleaned capacity
-        fuel_capacity = capacity_df.groupby('Fuel')['Clean_Capacity'].sum()
-        
-        # Debug: Log capacity data for troubleshooting
-        logger.info(f"Fuel capacities for {self.region}: {fuel_capacity.to_dict()}")
-        
-        # Calculate utilization for each time period and fuel
-        utilization_data = []
-        for _, row in generation.iterrows():
-            fuel = row['fuel']
-            if fuel in fuel_capacity.index and fuel_capacity[fuel] > 0:
-                generation_mw = row['scadavalue']
-                capacity_mw = fuel_capacity[fuel]
-                utilization = (generation_mw / capacity_mw) * 100
-                
-                # Debug logging for first few calculations
-                if len(utilization_data) < 5:
-                    logger.info(f"Fuel: {fuel}, Generation: {generation_mw:.2f} MW, Capacity: {capacity_mw:.2f} MW, Utilization: {utilization:.2f}%")
-                
-                # Cap at 100% to handle any data anomalies and negative values
-                utilization = max(0, min(utilization, 100))
-                utilization_data.append({
-                    'settlementdate': row['settlementdate'],
-                    'fuel': fuel,
-                    'utilization': utilization
-                })
-        
-        if not utilization_data:
+
+        fuel_capacity = {'NEM': capacity_df.groupby('Fuel')['Clean_Capacity'].sum()}
+        for region, region_capacity in capacity_df.groupby('Region'):
+            fuel_capacity[region] = region_capacity.groupby('Fuel')['Clean_Capacity'].sum()
+        return fuel_capacity
+
+    def _calculate_utilization(self, pivot_df, fuel_capacity):
+        """Utilization (% of installed capacity) for each fuel column of a generation pivot"""
+        fuels = [fuel for fuel in pivot_df.columns if fuel_capacity.get(fuel, 0) > 0]
+        if not fuels:
             logger.warning("No utilization data calculated")
             return pd.DataFrame()
-        
-        utilization_df = pd.DataFrame(utilization_data)
-        
-        # Debug: Check the raw utilization values
-        logger.info(f"Sample utilization values: {utilization_df['utilization'].head().tolist()}")
-        
-        # Pivot to get fuel types as columns
-        pivot_df = utilization_df.pivot(index='settlementdate', columns='fuel', values='utilization')
-        pivot_df = pivot_df.fillna(0)
-        
-        # Additional safety: ensure all values are between 0 and 100
-        pivot_df = pivot_df.clip(lower=0, upper=100)
-        
-        # Debug: Check final pivot values
-        logger.info(f"Final pivot data shape: {pivot_df.shape}")
-        logger.info(f"Final pivot max values: {pivot_df.max().to_dict()}")
-        
-        return pivot_df
-    
+
+        utilization = pivot_df[fuels].div(fuel_capacity[fuels]) * 100
+
+        # Cap at 0-100% to handle any data anomalies and negative values
+        return utilization.clip(lower=0, upper=100)
+
     def get_fuel_colors(self):
         """Define colors for different fuel types - all distinct and visually clear"""
         fuel_colors = {
@@ -1261,715 +967,242 @@ class EnergyDashboard(param.Parameterized):
     
     
 
-    def create_plot(self):
-        """Create the HvPlot visualization with generation and price charts stacked vertically"""
+    def create_plot(self, data=None, price_df=None):
+        """Sync the generation chart (with the price chart underneath) and return its Bokeh model
+
+        When data/price_df are not supplied the data is loaded fresh and the frames
+        for every region are rebuilt, so the auto-update loop can append to them
+        incrementally and region switches only select from memory. The chart keeps
+        the same ColumnDataSources between calls, so a refresh only sends the rows
+        that changed.
+        """
         try:
-            # Load fresh data
-            self.load_generation_data()
-            data = self.process_data_for_region()
-            
-            if data.empty:
-                # Create empty plot with message
-                empty_plot = hv.Text(0.5, 0.5, 'No data available').opts(
-                    xlim=(0, 1),
-                    ylim=(0, 1),
-                    bgcolor='black',
-                    width=1200,
-                    height=400,
-                    color='white',
-                    fontsize=16
-                )
-                return empty_plot
-            
-            # Get colors
-            fuel_colors = self.get_fuel_colors()
-            
-            # Use all available fuel types in the order they appear (already sorted)
-            fuel_types = list(data.columns)
-            
-            if not fuel_types:
-                # Fallback empty plot
-                return hv.Text(0.5, 0.5, 'No generation data for selected region').opts(
-                    bgcolor='black',
-                    color='white',
-                    fontsize=14
-                )
-            
-            # Create stacked area plot with special handling for negative values (battery & transmission exports)
-            plot_data = data[fuel_types].copy().reset_index()
-            
-            # Check if Battery Storage exists and has negative values
-            battery_col = 'Battery Storage'
-            transmission_exports_col = 'Transmission Exports'
-            has_battery = battery_col in plot_data.columns
-            has_transmission_exports = transmission_exports_col in plot_data.columns
-            
-            # Determine if we need special negative value handling
-            has_negative_values = (
-                (has_battery and (plot_data[battery_col].values < 0).any()) or
-                (has_transmission_exports and (plot_data[transmission_exports_col].values < 0).any())
-            )
-            
-            if has_negative_values:
-                # Prepare data for main positive stack (exclude transmission exports from main plot)
-                positive_fuel_types = [f for f in fuel_types if f != transmission_exports_col]
-                plot_data_positive = plot_data.copy()
-                
-                # Handle battery storage negative values
-                if has_battery:
-                    battery_data = plot_data[battery_col].copy()
-                    plot_data_positive[battery_col] = pd.Series(
-                        np.where(battery_data.values >= 0, battery_data.values, 0),
-                        index=battery_data.index
-                    )  # Only positive values
-                
-                # Create the main stacked area plot (positive values only, no transmission exports)
-                main_plot = plot_data_positive.hvplot.area(
-                    x='settlementdate',
-                    y=positive_fuel_types,
-                    stacked=True,
-                    width=1200,
-                    height=300,  # Reduced height to make room for price chart
-                    ylabel='Generation (MW)',
-                    xlabel='',  # Remove x-label since it will be on the price chart
-                    grid=True,
-                    legend='right',
-                    bgcolor='black',
-                    color=[fuel_colors.get(fuel, '#6272a4') for fuel in positive_fuel_types],
-                    alpha=0.8,
-                    hover=True,
-                    hover_tooltips=[('Fuel Type', '$name')]
-                )
-                
-                # Create negative values as a single stacked area plot
-                negative_columns = []
-                plot_data_negative = plot_data[['settlementdate']].copy()
-                negative_colors = []
-                
-                # Add transmission exports negative values first (will appear at bottom)
-                if has_transmission_exports and (plot_data[transmission_exports_col].values < 0).any():
-                    plot_data_negative[transmission_exports_col] = pd.Series(
-                        np.where(plot_data[transmission_exports_col].values < 0, plot_data[transmission_exports_col].values, 0),
-                        index=plot_data.index
-                    )
-                    negative_columns.append(transmission_exports_col)
-                    negative_colors.append(fuel_colors.get('Transmission Flow', '#ffb6c1'))
-                
-                # Add battery negative values second (will appear on top - higher priority)
-                if has_battery and (plot_data[battery_col].values < 0).any():
-                    plot_data_negative[battery_col] = pd.Series(
-                        np.where(plot_data[battery_col].values < 0, plot_data[battery_col].values, 0),
-                        index=plot_data.index
-                    )
-                    negative_columns.append(battery_col)
-                    negative_colors.append(fuel_colors.get('Battery Storage', '#9370db'))
-                
-                # Create the negative stacked area plot if we have negative values
-                if negative_columns:
-                    # Log the order for debugging
-                    logger.info(f"Negative columns order: {negative_columns}")
-                    logger.info(f"Negative colors order: {negative_colors}")
-                    logger.info(f"Negative data - Transmission min: {plot_data_negative.get('Transmission Exports', pd.Series()).min() if 'Transmission Exports' in plot_data_negative.columns else 'N/A'}")
-                    logger.info(f"Negative data - Battery min: {plot_data_negative.get('Battery Storage', pd.Series()).min() if 'Battery Storage' in plot_data_negative.columns else 'N/A'}")
-                    
-                    # Create individual area plots for each negative component
-                    negative_plots = []
-                    
-                    # First plot transmission exports (bottom layer)
-                    if 'Transmission Exports' in plot_data_negative.columns:
-                        transmission_plot = plot_data_negative.hvplot.area(
-                            x='settlementdate',
-                            y='Transmission Exports',
-                            stacked=False,
-                            width=1200,
-                            height=300,
-                            color='#ffb6c1',  # Light pink
-                            alpha=0.8,
-                            hover=True,
-                            legend=False
-                        )
-                        negative_plots.append(transmission_plot)
-                    
-                    # Then plot battery storage (top layer)
-                    if 'Battery Storage' in plot_data_negative.columns:
-                        battery_plot = plot_data_negative.hvplot.area(
-                            x='settlementdate',
-                            y='Battery Storage',
-                            stacked=False,
-                            width=1200,
-                            height=300,
-                            color='#9370db',  # Purple
-                            alpha=0.8,
-                            hover=True,
-                            legend=False
-                        )
-                        negative_plots.append(battery_plot)
-                    
-                    # Combine all plots
-                    if negative_plots:
-                        negative_combined = negative_plots[0]
-                        for plot in negative_plots[1:]:
-                            negative_combined = negative_combined * plot
-                        area_plot = main_plot * negative_combined
-                    else:
-                        area_plot = main_plot
-                else:
-                    area_plot = main_plot
-                
-                time_range_display = self._get_time_range_display()
-                area_plot = area_plot.opts(
-                    title=f'Generation by Fuel Type - {self.region} ({time_range_display}) | data:AEMO, design ITK',
-                    show_grid=False,
-                    bgcolor='black',
-                    xaxis=None,  # Hide x-axis since price chart will show it
-                    hooks=[self._get_datetime_formatter_hook()]
-                )
-                
-            else:
-                # No negative values - exclude transmission exports from main plot (they should always be negative)
-                positive_fuel_types = [f for f in fuel_types if f != transmission_exports_col]
-                time_range_display = self._get_time_range_display()
-                area_plot = plot_data.hvplot.area(
-                    x='settlementdate',
-                    y=positive_fuel_types,
-                    stacked=True,
-                    width=1200,
-                    height=300,  # Reduced height to make room for price chart
-                    title=f'Generation by Fuel Type - {self.region} ({time_range_display}) | data:AEMO, design ITK',
-                    ylabel='Generation (MW)',
-                    xlabel='',  # Remove x-label since it will be on the price chart
-                    grid=True,
-                    legend='right',
-                    bgcolor='black',
-                    color=[fuel_colors.get(fuel, '#6272a4') for fuel in positive_fuel_types],
-                    alpha=0.8,
-                    hover=True,
-                    hover_tooltips=[('Fuel Type', '$name')]
-                ).opts(
-                    show_grid=False,
-                    bgcolor='black',
-                    xaxis=None  # Hide x-axis since price chart will show it
-                )
-            
-            # Load and create price chart
-            price_df = self.load_price_data()
-            
+            if data is None:
+                # Load fresh data
+                self.load_generation_data()
+                frames = self._get_region_frames()
+                data, price_df = frames['generation'], frames['price']
+
+            if data.empty or len(data.columns) == 0:
+                return message_figure('No data available', width=1200, height=400)
+
+            # Price data for the chart underneath
+            if price_df is None:
+                price_df = self._get_region_frames()['price']
+
             if price_df.empty:
-                # If no price data, return just the generation plot with x-axis restored
-                return area_plot.opts(xaxis='bottom', xlabel='Time')
-            
-            # Create price line chart
-            price_plot = price_df.hvplot.line(
-                x='settlementdate',
-                y='RRP',
-                width=1200,
-                height=250,  # Smaller height - about half of generation chart
-                ylabel='Price ($/MWh)',
-                xlabel='Time',
-                grid=True,
-                bgcolor='black',
-                color='white',
-                line_width=2,
-                alpha=0.8,
-                hover=True,
-                hover_tooltips=[('Price', '@RRP{$0.2f}')]
-            ).opts(
-                show_grid=False,
-                bgcolor='black',
-                hooks=[self._get_datetime_formatter_hook()]
-            )
-            
-            # Stack the plots vertically using Layout (just generation + price)
-            # Disable shared_axes to prevent UFuncTypeError when switching tabs
-            combined_layout = (area_plot + price_plot).cols(1).opts(
-                shared_axes=False,  # Disable to prevent UFuncTypeError
-                merge_tools=True   # Merge toolbars into a single toolbar
+                logger.warning("No price data - showing generation chart only")
+
+            time_range_display = self._get_time_range_display()
+            model = self._gen_chart.update(
+                data,
+                title=f'Generation by Fuel Type - {self.region} ({time_range_display}) | data:AEMO, design ITK',
+                formatter=self._get_datetime_formatter(),
+                price_df=price_df
             )
-            
+
             self.last_update = datetime.now()
             logger.info(f"Plot updated for {self.region}, {self.time_range}")
-            
-            return combined_layout
-            
+
+            return model
+
         except Exception as e:
             logger.error(f"Error creating plot: {e}")
-            # Return fallback plot
-            return hv.Text(0.5, 0.5, f'Error creating plot: {str(e)}').opts(
-                bgcolor='black',
-                color='red',
-                fontsize=12
-            )
-    
+            return message_figure(f'Error creating plot: {str(e)}', width=1200, height=400)
+
+    def _calculate_transmission_chart_data(self, region_interconnectors):
+        """Build the wide flow/limit frame for the transmission chart (one column set per interconnector)"""
+        region_transmission = self.transmission_df[
+            self.transmission_df['interconnectorid'].isin(region_interconnectors.keys())
+        ]
+        if region_transmission.empty:
+            return pd.DataFrame(), []
+
+        logger.info(f"Transmission chart for {self.region}: {len(region_transmission)} records, "
+                    f"{region_transmission['interconnectorid'].nunique()} interconnectors")
+
+        # Convert to regional perspective: 'to_' interconnectors bring power into the region
+        flow_type = region_transmission['interconnectorid'].map(region_interconnectors)
+        direction = np.where(flow_type.str.startswith('to_'), 1.0, -1.0)
+        metered = region_transmission['meteredmwflow'].to_numpy(dtype=float)
+        regional_flow = metered * direction
+
+        # The applicable limit follows the AEMO flow direction and is shown on the
+        # same side of zero as the regional flow
+        limit = np.where(metered >= 0,
+                         region_transmission['exportlimit'].to_numpy(dtype=float),
+                         region_transmission['importlimit'].to_numpy(dtype=float))
+        applicable_limit = np.where(regional_flow >= 0, limit, -limit)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent = np.where(applicable_limit != 0, np.abs(regional_flow / applicable_limit) * 100, 0.0)
+
+        # Shade from flow to limit (unused capacity) only when both are on the same side of zero
+        same_side = (regional_flow >= 0) == (applicable_limit >= 0)
+        band = np.where(same_side, applicable_limit, regional_flow)
+
+        processed = pd.DataFrame({
+            'settlementdate': region_transmission['settlementdate'].to_numpy(),
+            'interconnectorid': region_transmission['interconnectorid'].to_numpy(),
+            'value': regional_flow,
+            'band': band,
+            'limit': applicable_limit,
+            'percent': percent,
+            'status': np.where(percent >= 95, 'At Capacity (≥95%)',
+                               np.where(percent >= 80, 'High Utilization (≥80%)', 'Normal Operation')),
+            'direction': np.where(regional_flow >= 0, 'Import', 'Export')
+        })
+
+        columns = {}
+        series = []
+        for interconnector in region_interconnectors.keys():
+            ic_data = processed[processed['interconnectorid'] == interconnector]
+            if ic_data.empty:
+                logger.info(f"No data for interconnector {interconnector}")
+                continue
+
+            ic_data = ic_data.drop_duplicates('settlementdate', keep='last').set_index('settlementdate').sort_index()
+            key = interconnector.replace('-', '_')
+            for field in ['value', 'band', 'limit', 'percent', 'status', 'direction']:
+                columns[f'{key}_{field}'] = ic_data[field]
+            series.append((key, interconnector))
+
+        if not series:
+            return pd.DataFrame(), []
+
+        frame = pd.DataFrame(columns).sort_index()
+        text_columns = [c for c in frame.columns if c.endswith('_status') or c.endswith('_direction')]
+        frame[text_columns] = frame[text_columns].fillna('')
+        frame.index.name = 'settlementdate'
+        return frame, series
+
     def create_transmission_plot(self):
-        """Create transmission flow line chart with limit areas showing unused capacity"""
+        """Sync the transmission flow chart (flows with shaded unused capacity to the limit)"""
         try:
-            import holoviews as hv
-            
             # Skip transmission chart for NEM (no specific region)
             if self.region == 'NEM':
-                return hv.Text(0.5, 0.5, 'Transmission flows not available for NEM view\nSelect a specific region').opts(
-                    xlim=(0, 1),
-                    ylim=(0, 1),
-                    bgcolor='black',
-                    width=1200,
-                    height=300,
-                    color='white',
-                    fontsize=14
-                )
-            
+                return message_figure('Transmission flows not available for NEM view - select a specific region',
+                                      width=1200, height=300)
+
             # Load transmission data if needed
             if self.transmission_df is None:
                 self.load_transmission_data()
-            
-            # Get the raw transmission data with limits
+
             if self.transmission_df is None or self.transmission_df.empty:
-                return hv.Text(0.5, 0.5, f'No transmission data for {self.region}').opts(
-                    xlim=(0, 1),
-                    ylim=(0, 1),
-                    bgcolor='black',
-                    width=1200,
-                    height=300,
-                    color='white',
-                    fontsize=14
-                )
-            
-            # Define interconnector mapping for each region
-            interconnector_mapping = {
-                'NSW1': {
-                    'NSW1-QLD1': 'from_nsw',      # Positive = export to QLD
-                    'VIC1-NSW1': 'to_nsw',        # Positive = import from VIC  
-                    'N-Q-MNSP1': 'from_nsw'       # DirectLink: Positive = export to QLD
-                },
-                'QLD1': {
-                    'NSW1-QLD1': 'to_qld',        # Positive = import from NSW
-                    'N-Q-MNSP1': 'to_qld'         # DirectLink: Positive = import from NSW
-                },
-                'VIC1': {
-                    'VIC1-NSW1': 'from_vic',      # Positive = export to NSW
-                    'V-SA': 'from_vic',           # Positive = export to SA
-                    'V-S-MNSP1': 'from_vic',      # Murraylink: Positive = export to SA
-                    'T-V-MNSP1': 'to_vic'         # Basslink: Positive = import from TAS
-                },
-                'SA1': {
-                    'V-SA': 'to_sa',              # Positive = import from VIC
-                    'V-S-MNSP1': 'to_sa'          # Murraylink: Positive = import from VIC
-                },
-                'TAS1': {
-                    'T-V-MNSP1': 'from_tas'       # Basslink: Positive = export to VIC
-                }
-            }
-            
-            region_interconnectors = interconnector_mapping.get(self.region, {})
+                return message_figure(f'No transmission data for {self.region}', width=1200, height=300)
+
+            region_interconnectors = INTERCONNECTOR_MAPPING.get(self.region, {})
             if not region_interconnectors:
-                return hv.Text(0.5, 0.5, f'No transmission lines for {self.region}').opts(
-                    xlim=(0, 1),
-                    ylim=(0, 1),
-                    bgcolor='black',
-                    width=1200,
-                    height=300,
-                    color='white',
-                    fontsize=14
-                )
-            
-            # Filter transmission data for this region's interconnectors
-            region_transmission = self.transmission_df[
-                self.transmission_df['interconnectorid'].isin(region_interconnectors.keys())
-            ].copy()
-            
-            # Debug logging
-            logger.info(f"=== Transmission Plot Debug for {self.region} ===")
-            logger.info(f"Total transmission records: {len(self.transmission_df)}")
-            logger.info(f"Region interconnectors: {list(region_interconnectors.keys())}")
-            logger.info(f"Filtered transmission records: {len(region_transmission)}")
-            if not region_transmission.empty:
-                logger.info(f"Date range: {region_transmission['settlementdate'].min()} to {region_transmission['settlementdate'].max()}")
-                logger.info(f"Unique interconnectors in data: {region_transmission['interconnectorid'].unique()}")
-                logger.info(f"Sample data (first 5 rows):")
-                logger.info(region_transmission[['settlementdate', 'interconnectorid', 'meteredmwflow', 'exportlimit', 'importlimit']].head())
-            
-            if region_transmission.empty:
-                return hv.Text(0.5, 0.5, f'No transmission data for {self.region}').opts(
-                    xlim=(0, 1),
-                    ylim=(0, 1),
-                    bgcolor='black',
-                    width=1200,
-                    height=300,
-                    color='white',
-                    fontsize=14
-                )
-            
-            # Apply flow direction corrections and get limits
-            def process_flow_and_limits(row):
-                interconnector = row['interconnectorid']
-                flow_type = region_interconnectors[interconnector]
-                meteredmwflow = row['meteredmwflow']  # Original AEMO flow
-                import_limit = row['importlimit']
-                export_limit = row['exportlimit']
-                
-                # Convert to regional perspective
-                if flow_type.startswith('to_'):
-                    # This interconnector brings power TO our region (import)
-                    regional_flow = meteredmwflow  # Positive = import to our region
-                else:
-                    # This interconnector takes power FROM our region (export)  
-                    regional_flow = -meteredmwflow  # Negative = export from our region
-                
-                # Determine applicable limit based on regional flow direction
-                # The logic: always show the limit in the same direction as the actual flow
-                # For positive regional flow (import): show positive limit (max import capacity)
-                # For negative regional flow (export): show negative limit (max export capacity)
-                
-                if regional_flow >= 0:
-                    # Importing to our region - use positive limit
-                    if flow_type.startswith('to_'):
-                        # This interconnector normally brings power TO our region
-                        applicable_limit = export_limit if meteredmwflow >= 0 else import_limit
-                    else:
-                        # This interconnector normally takes power FROM our region, but flow is reversed
-                        applicable_limit = import_limit if meteredmwflow < 0 else export_limit
-                else:
-                    # Exporting from our region - use negative limit
-                    if flow_type.startswith('to_'):
-                        # This interconnector normally brings power TO our region, but flow is reversed
-                        applicable_limit = -(import_limit if meteredmwflow < 0 else export_limit)
-                    else:
-                        # This interconnector normally takes power FROM our region
-                        applicable_limit = -(export_limit if meteredmwflow >= 0 else import_limit)
-                
-                return regional_flow, applicable_limit
-            
-            # Process flows and limits
-            region_transmission[['regional_flow', 'applicable_limit']] = region_transmission.apply(
-                lambda row: pd.Series(process_flow_and_limits(row)), axis=1
-            )
-            
-            # Debug processed data
-            logger.info(f"=== After Processing ===")
-            logger.info(f"Processed data shape: {region_transmission.shape}")
-            if not region_transmission.empty:
-                logger.info(f"Regional flow range: {region_transmission['regional_flow'].min():.1f} to {region_transmission['regional_flow'].max():.1f}")
-                logger.info(f"Sample processed data (first 5 rows):")
-                logger.info(region_transmission[['settlementdate', 'interconnectorid', 'regional_flow', 'applicable_limit']].head())
-            
-            # Create visualizations for each interconnector separately
-            plot_elements = []
-            
-            # Define colors for different interconnectors
-            interconnector_colors = {
-                'NSW1-QLD1': '#ff6b6b',    # Red
-                'VIC1-NSW1': '#4ecdc4',    # Cyan
-                'V-SA': '#45b7d1',         # Light Blue
-                'T-V-MNSP1': '#96ceb4',    # Light Green
-                'N-Q-MNSP1': '#ffd93d',    # Yellow
-                'V-S-MNSP1': '#dda0dd'     # Plum
-            }
-            
-            # Create plots for each interconnector
-            for interconnector in region_interconnectors.keys():
-                ic_data = region_transmission[region_transmission['interconnectorid'] == interconnector].copy()
-                
-                if ic_data.empty:
-                    logger.info(f"No data for interconnector {interconnector}")
-                    continue
-                
-                logger.info(f"=== Creating plot for {interconnector} ===")
-                logger.info(f"Data points: {len(ic_data)}")
-                
-                # Sort by time
-                ic_data = ic_data.sort_values('settlementdate')
-                
-                # Get color for this interconnector
-                color = interconnector_colors.get(interconnector, '#ffb6c1')
-                
-                # Use the applicable limit directly (no filtering)
-                ic_data['dynamic_limit'] = ic_data['applicable_limit']
-                
-                # Log limit info for debugging
-                if not ic_data.empty:
-                    avg_flow = ic_data['regional_flow'].mean()
-                    avg_limit = ic_data['applicable_limit'].abs().mean()
-                    logger.info(f"Interconnector {interconnector}: avg flow={avg_flow:.1f}MW, avg limit={avg_limit:.1f}MW")
-                
-                # Prepare data for filled area and hover
-                area_data = []
-                hover_data = []
-                
-                for _, row in ic_data.iterrows():
-                    time = row['settlementdate']
-                    flow = row['regional_flow']
-                    limit = row['dynamic_limit']
-                    
-                    # Calculate percentage of limit used
-                    if limit != 0:
-                        percent_of_limit = abs(flow / limit) * 100
-                    else:
-                        percent_of_limit = 0
-                    
-                    # Create area from flow to limit (showing unused capacity)
-                    if flow >= 0 and limit >= 0:  # Import scenario
-                        area_data.append((time, flow, limit))
-                    elif flow < 0 and limit < 0:  # Export scenario  
-                        area_data.append((time, flow, limit))
-                    else:
-                        # No area when flow and limit have different signs
-                        area_data.append((time, flow, flow))
-                    
-                    # Store hover data
-                    hover_data.append({
-                        'settlementdate': time,
-                        'flow': flow,
-                        'limit': limit,
-                        'percent': percent_of_limit,
-                        'direction': 'Import' if flow >= 0 else 'Export',
-                        'interconnector': interconnector
-                    })
-                
-                if not area_data:
-                    continue
-                
-                area_df = pd.DataFrame(area_data, columns=['settlementdate', 'flow', 'limit'])
-                hover_df = pd.DataFrame(hover_data)
-                
-                # Create the filled area for this interconnector
-                filled_area = area_df.hvplot.area(
-                    x='settlementdate',
-                    y='flow',
-                    y2='limit',
-                    alpha=0.3,
-                    color=color,
-                    hover=False,
-                    label=f'{interconnector} unused capacity'
-                ).opts(
-                    hooks=[self._get_datetime_formatter_hook()]
-                )
-                
-                # Create the main flow line with enhanced tooltips
-                hover_df['capacity_status'] = hover_df['percent'].apply(
-                    lambda x: 'At Capacity (≥95%)' if x >= 95 else 
-                             'High Utilization (≥80%)' if x >= 80 else 
-                             'Normal Operation'
-                )
-                
-                flow_line = hover_df.hvplot.line(
-                    x='settlementdate',
-                    y='flow',
-                    color=color,
-                    line_width=3,
-                    alpha=1.0,
-                    label=interconnector,
-                    hover_cols=['limit', 'percent', 'direction', 'interconnector', 'capacity_status'],
-                    hover_tooltips=[
-                        ('Interconnector', '@interconnector'),
-                        ('Time', '@settlementdate{%F %H:%M}'),
-                        ('Flow', '@flow{0.0f} MW'),
-                        ('Limit', '@limit{0.0f} MW'),
-                        ('Utilization', '@percent{0.1f}%'),
-                        ('Status', '@capacity_status'),
-                        ('Direction', '@direction')
-                    ],
-                    hover_formatters={'@settlementdate': 'datetime'}
-                ).opts(
-                    hooks=[self._get_datetime_formatter_hook()]
-                )
-                
-                plot_elements.extend([filled_area, flow_line])
-            
-            # Add horizontal line at y=0
-            zero_line = hv.HLine(0).opts(
-                color='white',
-                alpha=0.3,
-                line_width=1,
-                line_dash='dashed'
+                return message_figure(f'No transmission lines for {self.region}', width=1200, height=300)
+
+            # Computed once per region for the cached data, dropped when new intervals arrive
+            frames = self._get_region_frames()
+            if 'transmission' not in frames:
+                frames['transmission'] = self._calculate_transmission_chart_data(region_interconnectors)
+            frame, series = frames['transmission']
+            if frame.empty:
+                return message_figure(f'No transmission data available for {self.region}', width=1200, height=400)
+
+            time_range_display = self._get_time_range_display()
+            return self._transmission_chart.update(
+                frame,
+                series,
+                title=f'Transmission Flows with Limits - {self.region} ({time_range_display})',
+                formatter=self._get_datetime_formatter()
             )
-            
-            # Combine all elements
-            if plot_elements:
-                time_range_display = self._get_time_range_display()
-                
-                # Create a more robust datetime formatter hook
-                def transmission_formatter_hook(plot, element):
-                    # Try different ways to access the x-axis
-                    xaxis = None
-                    if hasattr(plot, 'handles') and 'xaxis' in plot.handles:
-                        xaxis = plot.handles['xaxis']
-                    elif hasattr(plot, 'state'):
-                        # For composite plots, might need to access differently
-                        try:
-                            xaxis = plot.state.below[0]  # Bokeh puts x-axis in 'below'
-                        except:
-                            pass
-                    
-                    if xaxis:
-                        if self.time_range == '1':
-                            xaxis.formatter = DatetimeTickFormatter(hours="%H:%M", days="%H:%M")
-                        elif self.time_range == '7':
-                            xaxis.formatter = DatetimeTickFormatter(hours="%a %H:%M", days="%a %d", months="%b %d")
-                        else:
-                            xaxis.formatter = DatetimeTickFormatter(hours="%m/%d", days="%m/%d", months="%b %d", years="%Y")
-                
-                # Calculate the actual x-axis range from the data
-                if region_transmission.empty:
-                    x_range = None
-                else:
-                    x_min = region_transmission['settlementdate'].min()
-                    x_max = region_transmission['settlementdate'].max()
-                    # Add small padding (1% of range) - convert to pandas Timedelta
-                    time_diff = x_max - x_min
-                    padding = pd.Timedelta(seconds=time_diff.total_seconds() * 0.01)
-                    x_range = (x_min - padding, x_max + padding)
-                
-                combined_plot = hv.Overlay(plot_elements + [zero_line]).opts(
-                    width=1200,
-                    height=400,  # Increased height to accommodate multiple lines
-                    bgcolor='black',
-                    ylabel='Flow (MW)',
-                    xlabel='Time',
-                    title=f'Transmission Flows with Limits - {self.region} ({time_range_display})',
-                    show_grid=False,
-                    legend_position='right',
-                    framewise=True,  # Force complete recomputation on updates
-                    xlim=x_range,  # Explicitly set x-axis range
-                    apply_ranges=False,  # Prevent automatic range determination
-                    hooks=[self._get_datetime_formatter_hook()]  # Re-add hooks
-                )
-            else:
-                combined_plot = hv.Text(0.5, 0.5, f'No transmission data available for {self.region}').opts(
-                    xlim=(0, 1),
-                    ylim=(0, 1),
-                    bgcolor='black',
-                    width=1200,
-                    height=400,
-                    color='white',
-                    fontsize=14
-                )
-            
-            return combined_plot
-            
+
         except Exception as e:
             logger.error(f"Error creating transmission plot: {e}")
             import traceback
             logger.error(traceback.format_exc())
-            return hv.Text(0.5, 0.5, 'Error loading transmission data').opts(
-                xlim=(0, 1),
-                ylim=(0, 1),
-                bgcolor='black',
-                width=1200,
-                height=300,
-                color='white',
-                fontsize=12
-            )
+            return message_figure('Error loading transmission data', width=1200, height=300)
 
-    
-    def create_utilization_plot(self):
-        """Create capacity utilization line chart with proper document handling"""
+    def create_utilization_plot(self, utilization_data=None):
+        """Sync the capacity utilization line chart and return its Bokeh figure"""
         try:
-            utilization_data = self.calculate_capacity_utilization()
-            
+            if utilization_data is None:
+                utilization_data = self.calculate_capacity_utilization()
+
             if utilization_data.empty:
-                # Create empty plot with message
-                empty_plot = hv.Text(0.5, 0.5, 'No utilization data available').opts(
-                    xlim=(0, 1),
-                    ylim=(0, 1),
-                    bgcolor='black',
-                    width=1200,
-                    height=400,
-                    color='white',
-                    fontsize=14
-                )
-                return empty_plot
-            
+                return message_figure('No utilization data available', width=1200, height=400)
+
             # Get colors (same as generation chart for consistency)
             fuel_colors = self.get_fuel_colors()
-            
-            # Reset index to make time a column
-            plot_data = utilization_data.reset_index()
-            
+
             # Get available fuel types
             fuel_types = [col for col in utilization_data.columns if col in fuel_colors]
-            
+
             if not fuel_types:
-                return hv.Text(0.5, 0.5, 'No fuel data for utilization chart').opts(
-                    bgcolor='black',
-                    color='white',
-                    fontsize=14
-                )
-            
-            # Create line plot for capacity utilization with different Y dimension name
+                return message_figure('No fuel data for utilization chart', width=1200, height=400)
+
             time_range_display = self._get_time_range_display()
-            line_plot = plot_data.hvplot.line(
-                x='settlementdate',
-                y=fuel_types,
-                width=1200,
-                height=400,
+            return self._util_chart.update(
+                utilization_data[fuel_types],
                 title=f'Capacity Utilization by Fuel Type - {self.region} ({time_range_display}) | data:AEMO, design ITK',
-                ylabel='Capacity Utilization (%)',
-                xlabel='Time',
-                grid=False,
-                legend='right',
-                bgcolor='black',
-                color=[fuel_colors.get(fuel, '#6272a4') for fuel in fuel_types],
-                alpha=0.8,
-                hover=True,
-                hover_tooltips=[('Fuel Type', '$name'), ('Utilization', '@$name{0.1f}%')],
-                ylim=(0, 100)  # Force Y-axis to 0-100%
-            ).opts(
-                show_grid=False,
-                toolbar='above',
-                bgcolor='black',
-                ylim=(0, 100),  # Double ensure Y-axis range
-                yformatter='%.0f%%'  # Format Y-axis as percentage
+                formatter=self._get_datetime_formatter()
             )
-            
-            # Rename the Y dimension to make it independent from generation MW axis
-            line_plot = line_plot.redim(**{fuel: f'{fuel}_utilization' for fuel in fuel_types})
-            
-            return line_plot
-            
+
         except Exception as e:
             logger.error(f"Error creating utilization plot: {e}")
-            # Return fallback plot
-            return hv.Text(0.5, 0.5, f'Error creating utilization plot: {str(e)}').opts(
-                bgcolor='black',
-                color='red',
-                fontsize=12
-            )
+            return message_figure(f'Error creating utilization plot: {str(e)}', width=1200, height=400)
     
     def update_plot(self):
-        """Update all plots with fresh data and proper error handling"""
+        """Update all plots with fresh data and proper error handling
+
+        Loading and aggregating the data runs in the background worker pool;
+        the charts are synced on the session's document once it is done.
+        """
         try:
             logger.info("Starting plot update...")
-            
-            # Create new plots
-            new_generation_plot = self.create_plot()
-            new_utilization_plot = self.create_utilization_plot()
-            new_transmission_plot = self.create_transmission_plot()
-            
+            self._reload_pending = True
+            self._request_render()
+
+        except Exception as e:
+            logger.error(f"Error updating plots: {e}")
+            # Don't crash the application, just log and continue
+
+    def _request_render(self):
+        """Queue a render of the current selection, superseding any queued one"""
+        self._requests.request(
+            self._prepare_frames,
+            lambda _: self._render_cached_region(),
+            loading=[self.plot_pane, self.utilization_pane, self.transmission_pane]
+        )
+
+    def _prepare_frames(self):
+        """Do the pending reload/append and build the region frames (runs off the event loop)
+
+        Pending work is recorded in flags rather than passed along, so a burst of
+        changes collapses into a single reload for the final selection.
+        """
+        if self._reload_pending:
+            self._reload_pending = False
+            self._append_pending = False  # A full reload includes any new intervals
+            if self._window_changed:
+                self._window_changed = False
+                # Reloaded lazily for the new window
+                self.transmission_df = None
+                self.rooftop_df = None
+            self.load_generation_data()
+            logger.info("Plot data reloaded")
+        elif self._append_pending:
+            self._append_pending = False
+            self._append_new_intervals()
+        return self._get_region_frames()
+
+    def _apply_plots(self, new_generation_plot, new_utilization_plot, new_transmission_plot):
+        """Show the chart models in the panes and refresh the header timestamp
+
+        The charts update their ColumnDataSources in place, so a pane is only
+        re-assigned when its model was rebuilt (new fuel set, message figure).
+        """
+        try:
             # Safely update the panes
-            if self.plot_pane is not None:
-                self.plot_pane.object = new_generation_plot
-            
-            if self.utilization_pane is not None:
-                self.utilization_pane.object = new_utilization_plot
-            
-            if self.transmission_pane is not None:
-                self.transmission_pane.object = new_transmission_plot
-                
-                # Post-render formatting: Access Bokeh figure after HoloViews renders it
-                try:
-                    # Get the Bokeh model from the pane
-                    bokeh_model = self.transmission_pane.get_root()
-                    if hasattr(bokeh_model, 'below'):
-                        for axis in bokeh_model.below:
-                            if hasattr(axis, 'formatter'):
-                                # Apply formatter based on time range
-                                if self.time_range == '1':
-                                    axis.formatter = DatetimeTickFormatter(hours="%H:%M", days="%H:%M")
-                                elif self.time_range == '7':
-                                    axis.formatter = DatetimeTickFormatter(hours="%a %H:%M", days="%a %d", months="%b %d")
-                                else:
-                                    axis.formatter = DatetimeTickFormatter(hours="%m/%d", days="%m/%d", months="%b %d", years="%Y")
-                except Exception as e:
-                    logger.debug(f"Post-render formatting attempt failed: {e}")
+            for pane, model in [(self.plot_pane, new_generation_plot),
+                                (self.utilization_pane, new_utilization_plot),
+                                (self.transmission_pane, new_transmission_plot)]:
+                if pane is not None and pane.object is not model:
+                    pane.object = model
             
             # Update the header with new time
             if self.header_section is not None:
@@ -1982,48 +1215,198 @@ class EnergyDashboard(param.Parameterized):
                 </div>
                 """
                 self.header_section.object = header_html
-            
-            logger.info("Plot update completed successfully")
-            
+
         except Exception as e:
-            logger.error(f"Error updating plots: {e}")
-            # Don't crash the application, just log and continue
-    
-    async def auto_update_loop(self):
-        """Automatic update loop every 4.5 minutes with better error handling"""
-        while True:
+            logger.error(f"Error applying plots: {e}")
+
+    def _get_window_start(self):
+        """Earliest interval kept in memory for the current selection"""
+        start_datetime, _ = self._get_effective_date_range()
+        if start_datetime is None:
+            # Same fallback the loaders use for "All Data"
+            return datetime.now() - timedelta(days=90)
+        return start_datetime
+
+    def _append_tail(self, cached, tail, tail_start, window_start):
+        """Replace cached rows from tail_start onwards with tail and drop rows before window_start"""
+        if cached is None or cached.empty:
+            combined = tail
+        elif tail.empty:
+            combined = cached[cached.index < tail_start]
+        else:
+            combined = pd.concat([cached[cached.index < tail_start], tail])
+        if combined.empty:
+            return combined
+        combined = combined[combined.index >= window_start]
+        return combined.fillna(0)
+
+    def _append_transmission_tail(self, window_start):
+        """Append transmission rows newer than the cached ones and trim to the window"""
+        if self.transmission_df is None or self.transmission_df.empty:
+            return  # Loaded lazily by the charts that need it
+
+        transmission_file = config.transmission_output_file
+        if not os.path.exists(transmission_file):
+            return
+
+        last_interval = self.transmission_df['settlementdate'].max()
+        new_rows = self._read_parquet_since(transmission_file, 'settlementdate', last_interval)
+        if new_rows.empty:
+            return
+
+        if not pd.api.types.is_datetime64_any_dtype(new_rows['settlementdate']):
+            new_rows['settlementdate'] = pd.to_datetime(new_rows['settlementdate'])
+
+        df = pd.concat([self.transmission_df, new_rows], ignore_index=True)
+        self.transmission_df = df[df['settlementdate'] >= window_start]
+        self._data_version += 1
+        logger.info(f"Appended {len(new_rows)} transmission records")
+
+    def refresh_incremental(self):
+        """Append only the intervals that arrived since the last refresh.
+
+        Reads rows newer than the last cached interval, recomputes the region
+        frames for that tail only, drops rows that have fallen out of the window
+        and then re-renders from the in-memory frames. Falls back to a full
+        update_plot() when the region cache is missing or out of date. The
+        file reads and recompute run in the background worker pool.
+        """
+        if (self._last_gen_interval is None or self._region_cache is None
+                or self._region_cache['version'] != self._data_version):
+            self.update_plot()
+            return
+
+        self._append_pending = True
+        self._request_render()
+
+    def _append_new_intervals(self):
+        """Read new intervals and splice their recomputed frames into the region cache
+
+        Returns:
+            True if new intervals were appended
+        """
+        try:
+            if not os.path.exists(GEN_OUTPUT_FILE):
+                logger.error(f"gen_output.parquet not found at {GEN_OUTPUT_FILE}")
+                return False
+
+            # Nothing new can land in a window that has already closed
+            _, end_datetime = self._get_effective_date_range()
+            if end_datetime is not None and self._last_gen_interval >= end_datetime:
+                logger.info("Incremental refresh: selected window is closed, nothing to append")
+                return False
+
+            new_rows = self._read_parquet_since(GEN_OUTPUT_FILE, 'settlementdate', self._last_gen_interval)
+            if new_rows.empty:
+                logger.info("Incremental refresh: no new generation intervals")
+                return False
+
+            window_start = self._get_window_start()
+            last_new_interval = new_rows['settlementdate'].max()
+
+            # Recompute from the earliest interval that can change: the new intervals,
+            # plus the rooftop values near the end of the 30-minute spline (a new reading
+            # moves the last few knots) and anything decayed forward past the last reading
+            tail_start = self._last_gen_interval + pd.Timedelta(minutes=5)
+            if self.rooftop_df is not None and not self.rooftop_df.empty:
+                rooftop_settle = self.rooftop_df['settlementdate'].max() - pd.Timedelta(hours=3)
+                tail_start = min(tail_start, rooftop_settle)
+
+            new_rows = self._map_generation_rows(new_rows)
+            gen_df = pd.concat([self.gen_output_df, new_rows], ignore_index=True)
+            self.gen_output_df = gen_df[gen_df['settlementdate'] >= window_start]
+            self._last_gen_interval = last_new_interval
+            self._data_version += 1
+
+            self._append_transmission_tail(window_start)
+            # Rooftop is a small 30-minute file; re-reading keeps the 5-minute conversion consistent
+            if self.rooftop_df is not None:
+                self.load_rooftop_solar_data()
+
+            # Recompute the tail for every region in one pass and splice it into the cache
+            tail = self._compute_region_frames(tail_start=tail_start)
+            regions = self._region_cache['regions']
+            for region, cached in regions.items():
+                for key in ('generation', 'utilization', 'net_flow', 'rooftop'):
+                    cached[key] = self._append_tail(cached[key], tail[region][key], tail_start, window_start)
+                cached['generation'] = self._order_fuel_columns(cached['generation'])
+                cached.pop('transmission', None)
+
+            last_prices = [cached['price']['settlementdate'].max() for cached in regions.values()
+                           if not cached['price'].empty]
+            price_rows = self._read_price_rows(since=min(last_prices) if last_prices else None)
+            for region, cached in regions.items():
+                cached['price'] = self._append_price_tail(cached['price'], price_rows, region, window_start)
+
+            self._region_cache['version'] = self._data_version
+
+            logger.info(f"Incremental refresh appended {len(new_rows)} generation records up to {last_new_interval}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error in incremental refresh: {e}")
+            return False
+
+    def _append_price_tail(self, cached, price_rows, region, window_start):
+        """Append one region's new price intervals to its cached prices and trim to the window"""
+        price_tail = self._clean_region_prices(price_rows, region)
+        if cached.empty:
+            return price_tail
+        if not price_tail.empty:
+            price_tail = price_tail[price_tail['settlementdate'] > cached['settlementdate'].max()]
+        price_df = pd.concat([cached, price_tail], ignore_index=True)
+        return price_df[price_df['settlementdate'] >= window_start].reset_index(drop=True)
+
+    def _render_cached_region(self):
+        """Re-render the charts for the selected region from the region cache"""
+        frames = self._get_region_frames()
+        self._apply_plots(
+            self.create_plot(data=frames['generation'], price_df=frames['price']),
+            self.create_utilization_plot(utilization_data=frames['utilization']),
+            self.create_transmission_plot()
+        )
+        if self._rendered_version != self._data_version:
+            self._rendered_version = self._data_version
+            self._notify_render_listeners()
+
+    def on_data_rendered(self, callback):
+        """Call callback() on the document after the charts have been rendered with new data
+
+        Runs after the background reload/append, so the region frames are
+        current and reading them does not recompute anything.
+        """
+        self._render_listeners.append(callback)
+
+    def _notify_render_listeners(self):
+        for callback in list(self._render_listeners):
             try:
-                await asyncio.sleep(270)  # 4.5 minutes
-                # Update plots in both tabs
-                self.update_plot()
-                logger.info("Auto-update completed")
-            except asyncio.CancelledError:
-                logger.info("Auto-update loop cancelled")
-                break
+                callback()
             except Exception as e:
-                logger.error(f"Error in auto-update loop: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute before retrying
-    
+                logger.error(f"Error in render callback: {e}")
+
     def start_auto_update(self):
-        """Start the auto-update task - only when event loop is running"""
-        try:
-            # Cancel existing task if running
-            if self.update_task is not None and not self.update_task.done():
-                self.update_task.cancel()
-            
-            # Start new task
-            self.update_task = asyncio.create_task(self.auto_update_loop())
-            logger.info("Auto-update started")
-        except RuntimeError as e:
-            # No event loop running yet - will start later
-            logger.info(f"Event loop not ready - auto-update will start when served: {e}")
-            pass
+        """Refresh this session whenever the process-wide refresh broker sees new data"""
+        refresh_broker.subscribe(self._on_new_data)
+
+    def _on_new_data(self, version):
+        # Append new intervals only - region/date changes still do a full update
+        logger.info(f"New data (version {version}) - refreshing dashboard")
+        self.refresh_incremental()
     
     @param.depends('region', watch=True)
     def on_region_change(self):
         """Called when region parameter changes"""
         logger.info(f"Region changed to: {self.region}")
-        self.update_plot()
+        if self.gen_output_df is None:
+            self.update_plot()
+            return
+        try:
+            # Every region is computed for the loaded data - just select and re-render.
+            # Goes through the request coordinator so it supersedes a pending render
+            # and waits for a reload/refresh in progress.
+            self._request_render()
+        except Exception as e:
+            logger.error(f"Error switching region: {e}")
     
     @param.depends('time_range', watch=True)
     def on_time_range_change(self):
@@ -2031,18 +1414,16 @@ class EnergyDashboard(param.Parameterized):
         logger.info(f"Time range changed to: {self.time_range}")
         # Update start/end dates based on preset selection
         self._update_date_range_from_preset()
-        # Clear cached data so it reloads with new time range
-        self.transmission_df = None
-        self.rooftop_df = None
+        # Cached data is cleared by the reload so it loads with the new time range
+        self._window_changed = True
         self.update_plot()
     
     @param.depends('start_date', 'end_date', watch=True)
     def on_date_change(self):
         """Called when custom date range changes"""
         logger.info(f"Date range changed to: {self.start_date} - {self.end_date}")
-        # Clear cached data so it reloads with new date range
-        self.transmission_df = None
-        self.rooftop_df = None
+        # Cached data is cleared by the reload so it loads with the new date range
+        self._window_changed = True
         self.update_plot()
     
     def _update_date_range_from_preset(self):
@@ -2061,9 +1442,8 @@ class EnergyDashboard(param.Parameterized):
             # Keep current custom dates
             return
         
-        # Update the date parameters
-        self.start_date = start_date
-        self.end_date = end_date
+        # Update both date parameters in one batch so on_date_change fires once
+        self.param.update(start_date=start_date, end_date=end_date)
     
     def _get_effective_date_range(self):
         """Get the effective start and end datetime for data filtering"""
@@ -2096,31 +1476,12 @@ class EnergyDashboard(param.Parameterized):
                     return f"{self.start_date.strftime('%Y-%m-%d')} to {self.end_date.strftime('%Y-%m-%d')}"
             return "Custom Range"
     
-    def _get_datetime_formatter_hook(self):
+    def _get_datetime_formatter(self):
         """Get appropriate datetime formatter based on time range"""
-        def formatter_hook(plot, element):
-            if self.time_range == '1':
-                # For 24 hours, show hours
-                plot.handles['xaxis'].formatter = DatetimeTickFormatter(
-                    hours="%H:%M",
-                    days="%H:%M"
-                )
-            elif self.time_range == '7':
-                # For 7 days, show day names or dates
-                plot.handles['xaxis'].formatter = DatetimeTickFormatter(
-                    hours="%a %H:%M",  # Mon 14:00
-                    days="%a %d",      # Mon 15
-                    months="%b %d"
-                )
-            else:
-                # For 30 days or longer, show dates
-                plot.handles['xaxis'].formatter = DatetimeTickFormatter(
-                    hours="%m/%d",
-                    days="%m/%d",
-                    months="%b %d",
-                    years="%Y"
-                )
-        return formatter_hook
+        # Reuse one formatter per time range so refreshes don't resend the model
+        if self.time_range not in self._formatters:
+            self._formatters[self.time_range] = datetime_formatter(self.time_range)
+        return self._formatters[self.time_range]
     
     def test_vol_price(self):
         """Test method to verify vol_price functionality"""
@@ -2273,23 +1634,22 @@ class EnergyDashboard(param.Parameterized):
             # Generation tab with embedded region selector and subtabs
             generation_tab = self._create_generation_tab()
             
-            # Price analysis tab
-            try:
-                logger.info("Creating price analysis tab...")
-                price_analysis_tab = create_price_analysis_tab()
-                logger.info("Price analysis tab created successfully")
-            except Exception as e:
-                logger.error(f"Error creating price analysis tab: {e}")
-                price_analysis_tab = pn.pane.Markdown(f"**Error loading Price Analysis:** {e}")
-            
-            # Station analysis tab
-            try:
-                logger.info("Creating station analysis tab...")
-                station_analysis_tab = create_station_analysis_tab()
-                logger.info("Station analysis tab created successfully")
-            except Exception as e:
-                logger.error(f"Error creating station analysis tab: {e}")
-                station_analysis_tab = pn.pane.Markdown(f"**Error loading Station Analysis:** {e}")
+            # Price and station analysis tabs load the full history (and the integrity
+            # tab scans it), so they are placeholders until first opened (see _on_tab_activated)
+            price_analysis_tab = pn.Column(
+                pn.pane.Markdown("**Loading Price Analysis...**"), sizing_mode='stretch_width'
+            )
+            station_analysis_tab = pn.Column(
+                pn.pane.Markdown("**Loading Station Analysis...**"), sizing_mode='stretch_width'
+            )
+            integrity_tab = pn.Column(
+                pn.pane.Markdown("**Loading Data Integrity...**"), sizing_mode='stretch_width'
+            )
+            self._lazy_tabs = {
+                2: (price_analysis_tab, "Price Analysis", create_price_analysis_tab),
+                3: (station_analysis_tab, "Station Analysis", create_station_analysis_tab),
+                4: (integrity_tab, "Data Integrity", create_integrity_tab),
+            }
             
             # Create tabbed interface with Nem-dash as first tab
             tabs = pn.Tabs(
@@ -2297,10 +1657,12 @@ class EnergyDashboard(param.Parameterized):
                 ("Generation by Fuel", generation_tab),
                 ("Average Price Analysis", price_analysis_tab),
                 ("Station Analysis", station_analysis_tab),
+                ("Data Integrity", integrity_tab),
                 dynamic=True,
                 closable=False,
                 sizing_mode='stretch_width'
             )
+            tabs.param.watch(self._on_tab_activated, 'active')
             
             # Complete dashboard layout
             dashboard = pn.Column(
@@ -2320,18 +1682,43 @@ class EnergyDashboard(param.Parameterized):
             return pn.pane.HTML(f"<h1>Error creating dashboard: {str(e)}</h1>", 
                               sizing_mode='stretch_width')
 
+    def _on_tab_activated(self, event):
+        """Build a lazily created tab the first time it is opened"""
+        lazy_tab = self._lazy_tabs.pop(event.new, None)
+        if lazy_tab is None:
+            return
+        placeholder, name, create_tab = lazy_tab
+
+        def build():
+            logger.info(f"Creating {name} tab...")
+            start = time.time()
+            try:
+                content = create_tab()
+                logger.info(f"{name} tab created in {time.time() - start:.2f}s")
+                return content
+            except Exception as e:
+                logger.error(f"Error creating {name} tab: {e}")
+                return pn.pane.Markdown(f"**Error loading {name}:** {e}")
+
+        def show(content):
+            placeholder[:] = [content]
+
+        run_in_background(build, show, loading=[placeholder], description=f"{name} tab")
+
 def create_app():
     """Create the Panel application with proper session handling"""
     def _create_dashboard():
         """Factory function to create a new dashboard instance per session"""
         try:
+            start = time.time()
             # Create dashboard instance
             dashboard = EnergyDashboard()
             
             # Create the app
             app = dashboard.create_dashboard()
+            logger.info(f"Dashboard session created in {time.time() - start:.2f}s")
             
-            # Start auto-update for this session
+            # Refresh this session when the broker sees new data
             def start_dashboard_updates():
                 try:
                     dashboard.start_auto_update()
@@ -2393,6 +1780,9 @@ def main():
     
     # Create the app factory (your existing code)
     app_factory = create_app()
+
+    # One process-wide data check notifies every open session
+    refresh_broker.start()
     
     # Determine port based on environment variable or default
     port = int(os.getenv('DASHBOARD_PORT', '5008'))
@@ -12,6 +12,8 @@ from datetime import datetime, timedelta
 
 from ..shared.config import config
 from ..shared.logging_config import get_logger
+from ..shared.refresh_broker import broker as refresh_broker
+from ..shared.streaming_charts import StackedAreaChart, message_figure
 
 logger = get_logger(__name__)
 
@@ -445,17 +447,17 @@ def prepare_generation_for_stacking(gen_data, transmission_data=None, rooftop_da
         return pd.DataFrame()
 
 
-def create_24hour_generation_chart(pivot_df):
+def create_24hour_generation_chart(pivot_df, chart=None):
     """
-    Create 24-hour stacked area chart with proper battery handling
+    Sync the 24-hour stacked area chart with pivot_df and return its Bokeh model
+
+    Args:
+        pivot_df: Generation by fuel type indexed by settlementdate
+        chart: StackedAreaChart to update in place (a new one is created if omitted)
     """
     try:
         if pivot_df.empty:
-            return pn.pane.HTML(
-                "<div style='width:800px;height:400px;display:flex;align-items:center;justify-content:center;'>"
-                "<h3>No generation data available for last 24 hours</h3></div>",
-                width=800, height=400
-            )
+            return message_figure("No generation data available for last 24 hours", width=800, height=400)
         
         # Rename Battery Storage to Battery for consistency
         if 'Battery Storage' in pivot_df.columns:
@@ -465,144 +467,108 @@ def create_24hour_generation_chart(pivot_df):
         fuel_types = [col for col in pivot_df.columns if col not in ['settlementdate']]
         
         if not fuel_types:
-            return pn.pane.HTML(
-                "<div style='width:800px;height:400px;display:flex;align-items:center;justify-content:center;'>"
-                "<h3>No fuel type data available</h3></div>",
-                width=800, height=400
-            )
-        
-        # Separate positive and negative values for battery
-        plot_data_positive = pivot_df.copy()
-        battery_col = 'Battery'
-        has_battery = battery_col in plot_data_positive.columns
-        
-        # Handle battery - only keep positive values in main plot
-        if has_battery:
-            plot_data_positive[battery_col] = plot_data_positive[battery_col].clip(lower=0)
-        
-        # Get fuel types for positive stacking (all fuels)
-        positive_fuel_types = fuel_types
-        
-        # Create main stacked area plot with positive values
-        main_plot = plot_data_positive.hvplot.area(
-            x='settlementdate',
-            y=positive_fuel_types,
-            stacked=True,
-            width=800,
-            height=400,
-            ylabel='Generation (MW)',
-            xlabel='Time',
-            color=[FUEL_COLORS.get(fuel, '#888888') for fuel in positive_fuel_types],
-            alpha=0.8,
-            hover_cols=['settlementdate'] + positive_fuel_types,
-            legend='right'
-        )
-        
-        # Check if we have negative battery values
-        if has_battery and (pivot_df[battery_col].values < 0).any():
-            # Create negative battery data
-            plot_data_negative = pd.DataFrame(index=pivot_df.index)
-            plot_data_negative['settlementdate'] = plot_data_negative.index
-            plot_data_negative[battery_col] = pd.Series(
-                np.where(pivot_df[battery_col].values < 0, pivot_df[battery_col].values, 0),
-                index=pivot_df.index
-            )
-            
-            # Create battery negative area plot
-            battery_negative_plot = plot_data_negative.hvplot.area(
-                x='settlementdate',
-                y=battery_col,
-                stacked=False,
-                width=800,
-                height=400,
-                color=FUEL_COLORS.get('Battery', '#9370DB'),
-                alpha=0.8,
-                hover=True,
-                legend=False  # Legend already shown in main plot
-            )
-            
-            # Combine positive and negative plots
-            area_plot = main_plot * battery_negative_plot
-        else:
-            area_plot = main_plot
+            return message_figure("No fuel type data available", width=800, height=400)
         
-        # Apply styling options
-        area_plot = area_plot.opts(
-            title="NEM Generation - Last 24 Hours",
-            show_grid=False,
-            toolbar='above',
-            fontsize={'title': 14, 'labels': 12, 'xticks': 10, 'yticks': 10}
-        )
+        if chart is None:
+            chart = _create_overview_chart()
         
-        return pn.pane.HoloViews(area_plot, sizing_mode='fixed', width=800, height=400, 
-                                css_classes=['chart-no-border'],
-                                linked_axes=False)  # Disable axis linking to prevent UFuncTypeError
+        # Battery charging is drawn below zero, everything else stacks upwards
+        return chart.update(pivot_df[fuel_types], title="NEM Generation - Last 24 Hours")
         
     except Exception as e:
         logger.error(f"Error creating generation chart: {e}")
-        return pn.pane.HTML(
-            f"<div style='width:800px;height:400px;display:flex;align-items:center;justify-content:center;'>"
-            f"<h3>Error creating chart: {e}</h3></div>",
-            width=800, height=400
-        )
+        return message_figure(f"Error creating chart: {e}", width=800, height=400)
 
 
-def create_generation_overview_component(dashboard_instance=None):
+def _create_overview_chart():
+    """Persistent stacked area chart used by the overview component"""
+    return StackedAreaChart(
+        FUEL_COLORS,
+        width=800,
+        height=400,
+        negative_columns=('Battery',),
+        positive_only_columns=('Battery',)
+    )
+
+
+def load_generation_overview_data(dashboard_instance=None):
     """
-    Create the complete 24-hour generation overview component
+    Prepare the last 24 hours of generation by fuel type for the overview chart
     """
-    def update_generation_overview():
+    # Try to use dashboard's processed data first if available
+    if dashboard_instance and hasattr(dashboard_instance, 'process_data_for_region'):
+        logger.info("Using dashboard's process_data_for_region() method")
         try:
-            # Try to use dashboard's processed data first if available
-            if dashboard_instance and hasattr(dashboard_instance, 'process_data_for_region'):
-                logger.info("Using dashboard's process_data_for_region() method")
-                try:
-                    # Use the dashboard's own method to get processed data
-                    gen_data = dashboard_instance.process_data_for_region()
-                    logger.info(f"Dashboard processed data shape: {gen_data.shape if not gen_data.empty else 'empty'}")
-                    logger.info(f"Dashboard processed data columns: {list(gen_data.columns) if not gen_data.empty else 'none'}")
-                    
-                    if not gen_data.empty:
-                        # This data is already processed by fuel type and filtered by the dashboard's time range
-                        # Convert to format needed for stacking (add SETTLEMENTDATE column)
-                        if gen_data.index.name == 'settlementdate':
-                            gen_data = gen_data.reset_index()
-                            gen_data['SETTLEMENTDATE'] = gen_data['settlementdate']
-                        elif 'settlementdate' not in gen_data.columns:
-                            gen_data = gen_data.reset_index()
-                            gen_data['SETTLEMENTDATE'] = gen_data.index
-                        
-                        # Take last 24 hours worth (288 records = 24h * 12 per hour)
-                        gen_data = gen_data.tail(288)
-                        logger.info(f"Using dashboard processed data: {len(gen_data)} records (last 24h equivalent)")
-                except Exception as e:
-                    logger.error(f"Error using dashboard processed data: {e}")
-                    gen_data = pd.DataFrame()
-            else:
-                # Fallback to loading data directly
-                logger.info("Loading generation data directly")
-                gen_data = load_generation_data()
-            
-            transmission_data = load_transmission_data()
-            rooftop_data = load_rooftop_solar_data()
-            
-            # Prepare data for stacking
-            pivot_df = prepare_generation_for_stacking(gen_data, transmission_data, rooftop_data)
-            
-            # Create chart
-            chart = create_24hour_generation_chart(pivot_df)
-            
-            return chart
+            # Use the dashboard's own method to get processed data
+            gen_data = dashboard_instance.process_data_for_region()
+            logger.info(f"Dashboard processed data shape: {gen_data.shape if not gen_data.empty else 'empty'}")
+            logger.info(f"Dashboard processed data columns: {list(gen_data.columns) if not gen_data.empty else 'none'}")
             
+            if not gen_data.empty:
+                # This data is already processed by fuel type and filtered by the dashboard's time range
+                # Convert to format needed for stacking (add SETTLEMENTDATE column)
+                if gen_data.index.name == 'settlementdate':
+                    gen_data = gen_data.reset_index()
+                    gen_data['SETTLEMENTDATE'] = gen_data['settlementdate']
+                elif 'settlementdate' not in gen_data.columns:
+                    gen_data = gen_data.reset_index()
+                    gen_data['SETTLEMENTDATE'] = gen_data.index
+                
+                # Take last 24 hours worth (288 records = 24h * 12 per hour)
+                gen_data = gen_data.tail(288)
+                logger.info(f"Using dashboard processed data: {len(gen_data)} records (last 24h equivalent)")
+        except Exception as e:
+            logger.error(f"Error using dashboard processed data: {e}")
+            gen_data = pd.DataFrame()
+    else:
+        # Fallback to loading data directly
+        logger.info("Loading generation data directly")
+        gen_data = load_generation_data()
+    
+    # Shared by all sessions and reloaded once when the files change
+    transmission_data = refresh_broker.shared('nem-dash transmission', load_transmission_data)
+    rooftop_data = refresh_broker.shared('nem-dash rooftop solar', load_rooftop_solar_data)
+    
+    # Prepare data for stacking
+    return prepare_generation_for_stacking(gen_data, transmission_data, rooftop_data)
+
+
+def create_generation_overview_with_refresh(dashboard_instance=None):
+    """
+    Create the 24-hour generation overview together with its refresh callback
+
+    The chart is built once on a persistent ColumnDataSource; calling the
+    returned refresh function streams/patches only the intervals that changed.
+
+    Returns:
+        Tuple of (Panel pane, refresh function)
+    """
+    chart = _create_overview_chart()
+    pane = pn.pane.Bokeh(sizing_mode='fixed', width=800, height=400,
+                         css_classes=['chart-no-border'])
+    
+    def refresh_generation_overview():
+        try:
+            pivot_df = load_generation_overview_data(dashboard_instance)
+            model = create_24hour_generation_chart(pivot_df, chart)
         except Exception as e:
             logger.error(f"Error updating generation overview: {e}")
-            return pn.pane.HTML(
-                f"<div style='width:800px;height:400px;display:flex;align-items:center;justify-content:center;'>"
-                f"<h3>Error loading generation overview: {e}</h3></div>",
-                width=800, height=400
-            )
+            model = message_figure(f"Error loading generation overview: {e}", width=800, height=400)
+        
+        # Only re-send the model when it was rebuilt; otherwise the source update is enough
+        if pane.object is not model:
+            pane.object = model
     
-    return pn.pane.panel(update_generation_overview)
+    refresh_generation_overview()
+    return pane, refresh_generation_overview
+
+
+def create_generation_overview_component(dashboard_instance=None):
+    """
+    Create the complete 24-hour generation overview component
+    """
+    pane, _ = create_generation_overview_with_refresh(dashboard_instance)
+    return pane
 
 
 if __name__ == "__main__":
@@ -5,9 +5,11 @@ Combines price section, renewable energy gauge, and 24-hour generation overview
 
 import panel as pn
 from ..shared.logging_config import get_logger
+from ..shared.refresh_broker import broker as refresh_broker
 from .price_components import create_price_section
 from .renewable_gauge import create_renewable_gauge_component
-from .generation_overview import create_generation_overview_component
+from .generation_overview import (create_generation_overview_component,
+                                  create_generation_overview_with_refresh)
 
 # Custom CSS to remove chart borders
 CUSTOM_CSS = """
@@ -30,12 +32,13 @@ CUSTOM_CSS = """
 logger = get_logger(__name__)
 
 
-def create_nem_dash_tab(dashboard_instance=None):
+def create_nem_dash_tab(dashboard_instance=None, generation_overview=None):
     """
     Create the complete Nem-dash tab layout
     
     Args:
         dashboard_instance: Reference to main dashboard for data sharing
+        generation_overview: Pre-built generation overview pane (created if omitted)
         
     Returns:
         Panel component containing the complete Nem-dash layout
@@ -46,7 +49,8 @@ def create_nem_dash_tab(dashboard_instance=None):
         # Create individual components
         price_section = create_price_section()
         renewable_gauge = create_renewable_gauge_component(dashboard_instance)
-        generation_overview = create_generation_overview_component(dashboard_instance)
+        if generation_overview is None:
+            generation_overview = create_generation_overview_component(dashboard_instance)
         
         # Create the layout with new arrangement:
         # Top row: Generation chart (left) + Price section (right)
@@ -103,8 +107,9 @@ def create_nem_dash_tab_with_updates(dashboard_instance=None, auto_update=True):
         Panel component with auto-update capability
     """
     try:
-        # Create the basic tab
-        tab = create_nem_dash_tab(dashboard_instance)
+        # Create the basic tab; the generation chart is kept and refreshed in place
+        generation_overview, refresh_generation_overview = create_generation_overview_with_refresh(dashboard_instance)
+        tab = create_nem_dash_tab(dashboard_instance, generation_overview=generation_overview)
         
         if auto_update:
             def update_all_components():
@@ -116,9 +121,8 @@ def create_nem_dash_tab_with_updates(dashboard_instance=None, auto_update=True):
                     top_row = tab[0]  # Row with generation chart and price section
                     bottom_row = tab[1]  # Row with gauge
                     
-                    # Update generation overview
-                    new_overview = create_generation_overview_component(dashboard_instance)
-                    top_row[0] = new_overview
+                    # Update generation overview (streams new intervals into the existing chart)
+                    refresh_generation_overview()
                     
                     # Update price section
                     new_price_section = create_price_section()
@@ -133,9 +137,14 @@ def create_nem_dash_tab_with_updates(dashboard_instance=None, auto_update=True):
                 except Exception as e:
                     logger.error(f"Error updating Nem-dash components: {e}")
             
-            # Set up periodic updates (every 4.5 minutes = 270000ms)
-            pn.state.add_periodic_callback(update_all_components, 270000)
-            logger.info("Auto-update enabled for Nem-dash tab (4.5 minute intervals)")
+            if dashboard_instance is not None and hasattr(dashboard_instance, 'on_data_rendered'):
+                # Updated after the dashboard has appended the new data, so the overview
+                # reads its up-to-date frames instead of recomputing them on the document
+                dashboard_instance.on_data_rendered(update_all_components)
+            else:
+                # No dashboard to follow - updated when the refresh broker sees new data
+                refresh_broker.subscribe(lambda version: update_all_components())
+            logger.info("Auto-update enabled for Nem-dash tab (on new data)")
         
         return tab
         
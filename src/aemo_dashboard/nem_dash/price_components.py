@@ -13,7 +13,9 @@ import numpy as np
 from pathlib import Path
 
 from ..shared.config import config
+from ..shared.latest_snapshot import read_latest
 from ..shared.logging_config import get_logger
+from ..shared.refresh_broker import broker as refresh_broker
 
 logger = get_logger(__name__)
 
@@ -101,6 +103,17 @@ def load_price_data():
         return pd.DataFrame()
 
 
+def get_shared_price_data():
+    """
+    Latest prices from the data service's snapshot, or (without one) the
+    price table shared by all sessions, reloaded once when the price file changes
+    """
+    prices = read_latest('prices')
+    if prices is None:
+        prices = refresh_broker.shared('nem-dash prices', load_price_data)
+    return prices if prices is not None else pd.DataFrame()
+
+
 def create_price_table(prices):
     """
     Create styled price table showing recent prices and averages
@@ -214,7 +227,7 @@ def create_price_section():
     Create the complete price section with table and chart
     """
     def update_price_components():
-        prices = load_price_data()
+        prices = get_shared_price_data()
         table = create_price_table(prices)
         chart = create_price_chart(prices)
         
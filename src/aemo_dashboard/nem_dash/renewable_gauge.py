@@ -12,6 +12,7 @@ import json
 from pathlib import Path
 
 from ..shared.config import config
+from ..shared.latest_snapshot import read_latest
 from ..shared.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -120,6 +121,29 @@ def calculate_renewable_percentage(gen_data):
         return 0.0
 
 
+def load_latest_fuel_mix():
+    """
+    NEM generation by fuel type for the latest interval, from the latest-state snapshot
+
+    Returns:
+        Series of MW by fuel (including Rooftop Solar), or None without a snapshot
+    """
+    fuel_mix = read_latest('fuel_mix')
+    if fuel_mix is None or fuel_mix.empty:
+        return None
+
+    latest = fuel_mix[fuel_mix['settlementdate'] == fuel_mix['settlementdate'].max()]
+    gen_data = latest.groupby('fuel')['scadavalue'].sum()
+
+    rooftop = read_latest('rooftop')
+    if rooftop is not None and not rooftop.empty:
+        # Most recent 30-minute reading at or before the interval
+        readings = rooftop[rooftop['settlementdate'] <= latest['settlementdate'].iloc[0]]
+        if not readings.empty:
+            gen_data['Rooftop Solar'] = readings.drop(columns='settlementdate').iloc[-1].sum()
+    return gen_data
+
+
 def update_records(current_percentage):
     """
     Update historical records if current percentage sets new records
@@ -328,19 +352,11 @@ def create_renewable_gauge_component(dashboard_instance=None):
                     gen_data = None
             
             if gen_data is None or (hasattr(gen_data, 'empty') and gen_data.empty):
-                logger.warning("No dashboard data available, trying direct load...")
-                # Fallback: load data directly (less efficient)
+                logger.warning("No dashboard data available, using the latest-state snapshot...")
                 try:
-                    gen_file = config.gen_output_file
-                    if Path(gen_file).exists():
-                        gen_data = pd.read_parquet(gen_file)
-                        if not gen_data.empty:
-                            # Get latest data point
-                            gen_data = gen_data.tail(100).groupby('FUEL_CAT').sum()
-                    else:
-                        gen_data = None
+                    gen_data = load_latest_fuel_mix()
                 except Exception as e:
-                    logger.error(f"Error loading generation data: {e}")
+                    logger.error(f"Error loading latest fuel mix: {e}")
                     gen_data = None
             
             # Calculate renewable percentage
@@ -0,0 +1,218 @@
+"""
+Background computation for dashboard callbacks.
+
+Heavy recomputes (parquet reads, groupby/pivot work over long date ranges)
+are submitted to a process-wide worker pool so that a session's UI stays
+responsive while they run. The result is applied back on the session's
+Bokeh document through pn.state.execute, which schedules it on the event
+loop with the document lock held.
+
+RequestCoordinator sits in front of run_in_background for callbacks that
+fire in bursts (preset buttons that also move the date pickers, rapid
+region clicks): it debounces the requests, numbers them, and makes sure
+only the latest one renders.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import panel as pn
+from panel.io.state import set_curdoc
+
+from .config import config
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Worker pool shared by all sessions (created on first use)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=config.background_workers,
+                thread_name_prefix='dashboard-worker'
+            )
+            logger.info(f"Started background worker pool with {config.background_workers} threads")
+    return _executor
+
+
+def run_in_background(compute, apply, loading=(), lock=None, description='background task', doc=None):
+    """
+    Run compute() in the worker pool and apply(result) on the session's document.
+
+    Without a server session (scripts, startup before a document exists) both
+    steps run inline, so callers behave the same outside `panel serve`.
+
+    Args:
+        compute: Callable doing the heavy work; it must not modify components
+            that are already displayed
+        apply: Callable receiving compute()'s result, run on the document's event loop
+        loading: Panel components to show a loading spinner on while compute runs
+        lock: Optional lock serialising computations that share state (e.g. a motor)
+        description: Name used in log messages
+        doc: Document to apply the result on (defaults to pn.state.curdoc)
+
+    Returns:
+        The Future for the computation, or None when it ran inline
+    """
+    doc = doc or pn.state.curdoc
+    if doc is None or doc.session_context is None:
+        apply(_locked(compute, lock)())
+        return None
+
+    loading = [component for component in loading if component is not None]
+    for component in loading:
+        component.loading = True
+
+    def _apply(future):
+        try:
+            if future.cancelled():
+                # Superseded before it started - nothing to apply
+                return
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Error in {description}: {e}")
+        else:
+            try:
+                apply(result)
+            except Exception as e:
+                logger.error(f"Error applying {description}: {e}")
+        finally:
+            for component in loading:
+                component.loading = False
+
+    def _schedule(future):
+        # Runs on the worker thread; hand the result back to the session's event loop
+        try:
+            with set_curdoc(doc):
+                pn.state.execute(partial(_apply, future), schedule=True)
+        except Exception as e:
+            # The session may have been closed while the computation ran
+            logger.warning(f"Could not apply {description}: {e}")
+
+    future = get_executor().submit(_locked(compute, lock))
+    future.add_done_callback(_schedule)
+    return future
+
+
+def _locked(compute, lock):
+    """Wrap compute so it runs while holding lock (if any)"""
+    if lock is None:
+        return compute
+
+    def _run():
+        with lock:
+            return compute()
+    return _run
+
+
+class RequestCoordinator:
+    """
+    Per-session coordinator for recomputes triggered by parameter changes.
+
+    Each request() bumps the generation number and (re)starts a short
+    debounce timer, so a burst of changes is coalesced into one computation.
+    When the timer fires the latest request is submitted to the worker pool;
+    queued work from an older generation is cancelled, work that already
+    started is skipped or discarded when it finishes. Only the latest
+    generation's result is applied.
+
+    Because superseded requests are dropped, compute callables should work
+    from the object's current state (and any pending-work flags) rather
+    than from arguments captured at request time.
+    """
+
+    def __init__(self, lock=None, debounce_ms=None, description='request'):
+        self.lock = lock
+        self.debounce_ms = config.debounce_ms if debounce_ms is None else debounce_ms
+        self.description = description
+        self.generation = 0
+        self._timer = None
+        self._future = None
+        self._state_lock = threading.Lock()
+
+    def request(self, compute, apply, loading=()):
+        """
+        Ask for compute() to run and its result to be applied.
+
+        Args:
+            compute: Callable doing the heavy work off the event loop
+            apply: Callable receiving compute()'s result on the document
+            loading: Panel components to show a loading spinner on until applied
+        """
+        doc = pn.state.curdoc
+        loading = [component for component in loading if component is not None]
+
+        with self._state_lock:
+            self.generation += 1
+            generation = self.generation
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._future is not None:
+                # Only succeeds if it has not started yet
+                self._future.cancel()
+
+            if doc is None or doc.session_context is None:
+                inline = True
+            else:
+                inline = False
+                self._timer = threading.Timer(
+                    self.debounce_ms / 1000,
+                    self._submit, args=(doc, generation, compute, apply, loading)
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+        if inline:
+            # No session to debounce against - run straight away
+            run_in_background(compute, apply, lock=self.lock, description=self.description)
+            return
+
+        for component in loading:
+            component.loading = True
+
+    def _submit(self, doc, generation, compute, apply, loading):
+        """Debounce window elapsed - submit the request unless it was superseded"""
+        with self._state_lock:
+            if generation != self.generation:
+                return
+            self._timer = None
+            self._future = run_in_background(
+                partial(self._compute_if_current, generation, compute),
+                partial(self._apply_if_current, generation, apply, loading),
+                lock=self.lock,
+                description=self.description,
+                doc=doc
+            )
+
+    def _compute_if_current(self, generation, compute):
+        if generation != self.generation:
+            logger.info(f"Skipping superseded {self.description} (generation {generation})")
+            return _SUPERSEDED
+        try:
+            return compute()
+        except Exception as e:
+            logger.error(f"Error in {self.description}: {e}")
+            return _FAILED
+
+    def _apply_if_current(self, generation, apply, loading, result):
+        if result is _SUPERSEDED or generation != self.generation:
+            # A newer request owns the loading state and will render
+            logger.info(f"Discarding result of superseded {self.description} (generation {generation})")
+            return
+        for component in loading:
+            component.loading = False
+        if result is not _FAILED:
+            apply(result)
+
+
+# Markers passed from _compute_if_current to _apply_if_current
+_SUPERSEDED = object()
+_FAILED = object()
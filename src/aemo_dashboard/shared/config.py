@@ -65,6 +65,15 @@ class Config:
         self.gen_info_file = self._get_file_path('GEN_INFO_FILE', 'gen_info.pkl')
         self.transmission_output_file = self._get_file_path('TRANSMISSION_OUTPUT_FILE', 'transmission_flows.parquet')
         self.rooftop_solar_file = self._get_file_path('ROOFTOP_SOLAR_FILE', 'rooftop_solar.parquet')
+        self.duid_daily_file = self._get_file_path('DUID_DAILY_FILE', 'duid_daily.parquet')
+        self.gen_by_duid_dir = self._get_file_path('GEN_BY_DUID_DIR', 'gen_by_duid')
+        self.duid_hourly_dir = self._get_file_path('DUID_HOURLY_DIR', 'duid_hourly')
+        self.latest_dir = self._get_file_path('LATEST_DIR', 'latest')
+        self.price_alert_state_file = self._get_file_path('PRICE_ALERT_STATE_FILE', 'price_alert_state.pkl')
+        self.data_events_file = self._get_file_path('DATA_EVENTS_FILE', 'data_events.json')
+        self.data_events_dir = self._get_file_path('DATA_EVENTS_DIR', 'data_events')
+        self.unknown_duids_file = self._get_file_path('UNKNOWN_DUIDS_FILE', 'unknown_duids.parquet')
+        self.raw_cache_dir = self._get_file_path('RAW_CACHE_DIR', 'raw_cache')
     
     def _get_file_path(self, env_var: str, default_name: str) -> Path:
         """Get file path from environment or use default in data directory"""
@@ -115,7 +124,23 @@ class Config:
     @property
     def dashboard_host(self) -> str:
         return os.getenv('DASHBOARD_HOST', 'localhost')
-    
+
+    @property
+    def background_workers(self) -> int:
+        return int(os.getenv('DASHBOARD_WORKERS', '4'))
+
+    @property
+    def debounce_ms(self) -> int:
+        return int(os.getenv('DASHBOARD_DEBOUNCE_MS', '200'))
+
+    @property
+    def refresh_check_seconds(self) -> int:
+        return int(os.getenv('DASHBOARD_REFRESH_CHECK_SECONDS', '30'))
+
+    @property
+    def price_analysis_cache_size(self) -> int:
+        return int(os.getenv('PRICE_ANALYSIS_CACHE_SIZE', '32'))
+
     # Price alert thresholds
     @property
     def high_price_threshold(self) -> float:
@@ -155,6 +180,19 @@ class Config:
     def aemo_interconnector_url(self) -> str:
         return os.getenv('AEMO_INTERCONNECTOR_URL', 'http://nemweb.com.au/Reports/Current/DispatchIS_Reports/')
     
+    # Gap repair
+    @property
+    def gap_repair_interval_hours(self) -> float:
+        return float(os.getenv('GAP_REPAIR_INTERVAL_HOURS', '6'))
+    
+    @property
+    def gap_repair_days(self) -> int:
+        return int(os.getenv('GAP_REPAIR_DAYS', '35'))
+    
+    @property
+    def gap_repair_concurrency(self) -> int:
+        return int(os.getenv('GAP_REPAIR_CONCURRENCY', '4'))
+    
     # Alert behavior
     @property
     def alert_cooldown_hours(self) -> int:
@@ -0,0 +1,165 @@
+"""
+"New data" events from the data service to the dashboards.
+
+After each collection cycle commits new intervals, the data service calls
+publish_data_event(). The event records, per dataset, the latest interval
+and the event's sequence number (version):
+
+    {"version": 42, "published": "...",
+     "datasets": {"prices": {"interval": "2025-07-01T10:05:00", "version": 42}, ...}}
+
+It is written atomically to data_events.json (the sequence file, which
+also keeps the last event for every dataset) and sent as a datagram to
+every dashboard process listening on a Unix socket in the data_events/
+directory. DataEventListener receives them, so a dashboard reacts within
+moments of a commit instead of on its next poll. Where Unix sockets are
+not available, listeners are skipped and the sequence file is still
+written for processes that watch it.
+"""
+
+import json
+import os
+import socket
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+from .config import config
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Unix socket paths are limited to about 100 bytes
+MAX_SOCKET_PATH = 100
+MAX_EVENT_BYTES = 65_536
+
+
+def read_data_events() -> Optional[dict]:
+    """The last published event for every dataset, or None if none has been published"""
+    try:
+        with open(config.data_events_file) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Error reading data events: {e}")
+        return None
+
+
+def publish_data_event(intervals: Dict[str, pd.Timestamp]) -> Optional[dict]:
+    """
+    Publish that datasets advanced to new intervals.
+
+    Args:
+        intervals: Dataset name -> latest interval now committed
+
+    Returns:
+        The published event, or None if it could not be written
+    """
+    try:
+        previous = read_data_events() or {'version': 0, 'datasets': {}}
+        version = previous['version'] + 1
+        datasets = dict(previous['datasets'])
+        for name, interval in intervals.items():
+            datasets[name] = {'interval': pd.Timestamp(interval).isoformat(), 'version': version}
+        event = {'version': version, 'published': datetime.now().isoformat(), 'datasets': datasets}
+
+        # Write then rename so readers never see a partial file
+        path = config.data_events_file
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(event))
+        os.replace(tmp_path, path)
+
+        sent = _send_to_listeners(json.dumps(event).encode())
+        logger.info(f"Published data event {version} ({', '.join(intervals)}) to {sent} listeners")
+        return event
+
+    except Exception as e:
+        logger.error(f"Error publishing data event: {e}")
+        return None
+
+
+def _send_to_listeners(payload: bytes) -> int:
+    events_dir = config.data_events_dir
+    if not hasattr(socket, 'AF_UNIX') or not events_dir.exists():
+        return 0
+
+    sent = 0
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        for path in events_dir.glob('*.sock'):
+            try:
+                sock.sendto(payload, str(path))
+                sent += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                # The listening process has exited without removing its socket
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not send data event to {path.name}: {e}")
+    return sent
+
+
+class DataEventListener:
+    """
+    Receives data events on a Unix datagram socket in a background thread.
+
+    Each process binds its own socket (named after its pid) in the
+    data_events/ directory and calls callback(event) for every event.
+    """
+
+    def __init__(self, callback: Callable[[dict], None]):
+        self.callback = callback
+        self.path = config.data_events_dir / f"{os.getpid()}.sock"
+        self._sock = None
+        self._thread = None
+
+    def start(self) -> bool:
+        """
+        Start listening.
+
+        Returns:
+            bool: True if listening; False where Unix sockets are not available
+        """
+        if self._thread is not None:
+            return True
+        if not hasattr(socket, 'AF_UNIX'):
+            logger.info("Unix sockets not available - data events not received")
+            return False
+        if len(str(self.path)) > MAX_SOCKET_PATH:
+            logger.warning(f"Data events socket path too long, not listening: {self.path}")
+            return False
+
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            self.path.unlink(missing_ok=True)
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            self._sock.bind(str(self.path))
+        except OSError as e:
+            logger.error(f"Could not listen for data events on {self.path}: {e}")
+            return False
+
+        self._thread = threading.Thread(target=self._receive, name='data-events', daemon=True)
+        self._thread.start()
+        logger.info(f"Listening for data events on {self.path}")
+        return True
+
+    def stop(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self.path.unlink(missing_ok=True)
+        self._thread = None
+
+    def _receive(self):
+        sock = self._sock
+        while True:
+            try:
+                payload = sock.recv(MAX_EVENT_BYTES)
+            except OSError:
+                # Socket closed by stop()
+                return
+            try:
+                self.callback(json.loads(payload))
+            except Exception as e:
+                logger.error(f"Error handling data event: {e}")
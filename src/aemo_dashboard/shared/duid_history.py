@@ -0,0 +1,250 @@
+"""
+DUID-sorted copy of the generation history, one file per closed month or year.
+
+gen_output.parquet is in time order, so finding one unit's history means
+reading every row group. The data service also writes each closed (complete)
+month to gen_by_duid/YYYY-MM.parquet sorted by DUID, then time, in small row
+groups with statistics and a page index, and merges the months of a closed
+year into gen_by_duid/YYYY.parquet. The duid min/max statistics then let a
+read skip every row group except the one or two holding the unit in each
+file. read_duid_history combines these files with the open month (and any
+month not copied yet) from the time-ordered file.
+
+pyarrow cannot write Parquet bloom filters; on a sorted column the min/max
+statistics already prune exactly, so they are not needed here.
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .config import config
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Small row groups, so that reading one unit touches only a few of them
+ROW_GROUP_SIZE = 50_000
+
+
+def parquet_time_range(path, column: str) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """First and last value of a timestamp column, from the parquet row group statistics"""
+    if not os.path.exists(path):
+        return None, None
+
+    metadata = pq.ParquetFile(path).metadata
+    column_index = metadata.schema.names.index(column)
+    mins, maxs = [], []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column_index).statistics
+        if stats is None or not stats.has_min_max:
+            # No statistics - read the column instead
+            times = pd.read_parquet(path, columns=[column])[column]
+            return (times.min(), times.max()) if len(times) else (None, None)
+        mins.append(stats.min)
+        maxs.append(stats.max)
+    if not mins:
+        return None, None
+    return pd.Timestamp(min(mins)), pd.Timestamp(max(maxs))
+
+
+def _period_path(period: pd.Period) -> Path:
+    return config.gen_by_duid_dir / f"{period}.parquet"
+
+
+def sorted_periods(directory: Path) -> List[pd.Period]:
+    """Months (YYYY-MM) and compacted years (YYYY) with a file in directory, oldest first"""
+    if not directory.exists():
+        return []
+    periods = [
+        pd.Period(path.stem, freq='Y' if len(path.stem) == 4 else 'M')
+        for path in directory.glob('*.parquet')
+    ]
+    return sorted(periods, key=lambda period: period.start_time)
+
+
+def history_periods() -> List[pd.Period]:
+    """Months and compacted years that have a DUID-sorted generation file, oldest first"""
+    return sorted_periods(config.gen_by_duid_dir)
+
+
+def update_duid_history(since: Optional[datetime] = None) -> bool:
+    """
+    Bring the DUID-sorted history up to date with the generation data.
+
+    A month is closed once the generation data has moved into a later month.
+    Once a year has closed, its months are compacted into one file so a long
+    history is read from a handful of files. Files covering `since` onwards
+    are rewritten, for when older generation data has been repaired.
+
+    Args:
+        since: Rewrite the history from the month containing this date
+
+    Returns:
+        bool: True if the DUID-sorted history is up to date
+    """
+    try:
+        gen_start, gen_end = parquet_time_range(config.gen_output_file, 'settlementdate')
+        if gen_start is None:
+            logger.warning("No generation data - DUID-sorted history not updated")
+            return False
+
+        config.gen_by_duid_dir.mkdir(exist_ok=True)
+        if since is not None:
+            rewrite_from = pd.Period(since, freq='M').start_time
+            for period in history_periods():
+                if (period + 1).start_time > rewrite_from:
+                    _period_path(period).unlink()
+
+        periods = history_periods()
+        for month in pd.period_range(gen_start, gen_end, freq='M')[:-1]:
+            if not any(period.start_time <= month.start_time < (period + 1).start_time for period in periods):
+                write_sorted([_read_month(month)], _period_path(month))
+
+        # Compact the months of closed years
+        month_files = [period for period in history_periods() if period.freqstr == 'M']
+        for year in sorted({month.year for month in month_files if month.year < gen_end.year}):
+            _compact_year(year, [month for month in month_files if month.year == year])
+        return True
+
+    except Exception as e:
+        logger.error(f"Error updating DUID-sorted generation history: {e}")
+        return False
+
+
+def _read_month(month: pd.Period) -> pd.DataFrame:
+    """One month of the generation data, sorted by DUID then time"""
+    month_data = pd.read_parquet(
+        config.gen_output_file,
+        filters=[('settlementdate', '>=', month.start_time), ('settlementdate', '<', (month + 1).start_time)]
+    )
+    return month_data.sort_values(['duid', 'settlementdate'], ignore_index=True)
+
+
+def _compact_year(year: int, months: List[pd.Period]):
+    """Merge a closed year's month files into one DUID-sorted year file"""
+    compact_sorted([_period_path(month) for month in months], _period_path(pd.Period(str(year), freq='Y')))
+
+
+def compact_sorted(paths: List[Path], target: Path, sort_columns=('duid', 'settlementdate'), row_group_size=ROW_GROUP_SIZE):
+    """Merge DUID-sorted files into one DUID-sorted file at target, then delete them"""
+    if target.exists():
+        # Left over from an interrupted compaction - the target already has them
+        for path in paths:
+            path.unlink()
+        return
+
+    duids = sorted(set().union(*(pd.read_parquet(path, columns=['duid'])['duid'].unique() for path in paths)))
+
+    # A block of DUIDs at a time, so the merged data is never held in memory
+    def duid_blocks(block_size=50):
+        for i in range(0, len(duids), block_size):
+            block = pd.read_parquet(paths, filters=[('duid', 'in', duids[i:i + block_size])])
+            yield block.sort_values(list(sort_columns), ignore_index=True)
+
+    write_sorted(duid_blocks(), target, sort_columns, row_group_size)
+    for path in paths:
+        path.unlink()
+    logger.info(f"Compacted {len(paths)} DUID-sorted files into {target.parent.name}/{target.name}")
+
+
+def write_sorted(frames, path: Path, sort_columns=('duid', 'settlementdate'), row_group_size=ROW_GROUP_SIZE):
+    """Write frames (already sorted by sort_columns) to path with small, indexed row groups"""
+    # Write then rename so readers never see a partial file
+    tmp_path = path.with_suffix('.tmp')
+    writer = None
+    records = 0
+    try:
+        for frame in frames:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    tmp_path, table.schema,
+                    compression='snappy',
+                    write_statistics=True,
+                    write_page_index=True,
+                    sorting_columns=[pq.SortingColumn(table.schema.get_field_index(column)) for column in sort_columns]
+                )
+            writer.write_table(table.cast(writer.schema), row_group_size=row_group_size)
+            records += len(frame)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        return
+    os.replace(tmp_path, path)
+    logger.info(f"Wrote DUID-sorted {path.parent.name}/{path.name}: {records:,} records")
+
+
+def read_duid_history(duids: Union[str, List[str]], start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    Read the generation history of one or more DUIDs.
+
+    Args:
+        duids: DUID or list of DUIDs
+        start_date: Earliest interval to read (optional)
+        end_date: Latest interval to read (optional)
+
+    Returns:
+        DataFrame with the generation file's columns, sorted by DUID then time
+    """
+    duids = [duids] if isinstance(duids, str) else list(duids)
+    start = pd.Timestamp(start_date) if start_date is not None else None
+    end = pd.Timestamp(end_date) if end_date is not None else None
+
+    time_filters = []
+    if start is not None:
+        time_filters.append(('settlementdate', '>=', start))
+    if end is not None:
+        time_filters.append(('settlementdate', '<=', end))
+
+    periods = [
+        period for period in history_periods()
+        if (start is None or (period + 1).start_time > start) and (end is None or period.start_time <= end)
+    ]
+
+    frames = []
+    if periods:
+        frames.append(pd.read_parquet(
+            [_period_path(period) for period in periods],
+            filters=[('duid', 'in', duids)] + time_filters
+        ))
+
+    # Everything the DUID-sorted files do not cover comes from the time-ordered file
+    gaps = _uncovered_ranges(periods, start, end)
+    if gaps:
+        frames.append(pd.read_parquet(
+            config.gen_output_file,
+            filters=[[('duid', 'in', duids)] + gap for gap in gaps]
+        ))
+
+    if not frames:
+        # Empty date range
+        return pd.DataFrame(columns=['settlementdate', 'duid', 'scadavalue'])
+    history = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return history.sort_values(['duid', 'settlementdate'], ignore_index=True)
+
+
+def _uncovered_ranges(periods: List[pd.Period], start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> List[List[Tuple]]:
+    """Time filters (one conjunction per range) for the parts of start..end not covered by periods"""
+    ranges = []
+    cursor = start
+    for period in periods:
+        if cursor is None or cursor < period.start_time:
+            gap = [('settlementdate', '<', period.start_time)]
+            if cursor is not None:
+                gap.insert(0, ('settlementdate', '>=', cursor))
+            ranges.append(gap)
+        cursor = (period + 1).start_time
+    if end is None or cursor is None or cursor <= end:
+        gap = [('settlementdate', '>=', cursor)] if cursor is not None else []
+        if end is not None:
+            gap.append(('settlementdate', '<=', end))
+        ranges.append(gap)
+    return ranges
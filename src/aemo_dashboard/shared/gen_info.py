@@ -0,0 +1,29 @@
+"""
+Helpers for the generator information table (gen_info.pkl).
+"""
+
+import pandas as pd
+
+
+def clean_capacity(capacity) -> float:
+    """Convert a Capacity(MW) entry to float - handles string ranges and non-numeric values"""
+    if pd.isna(capacity):
+        return 0
+    if isinstance(capacity, str):
+        # Handle range strings like "23.44 - 27.60"
+        if ' - ' in capacity:
+            try:
+                # Take the average of the range
+                parts = capacity.split(' - ')
+                return (float(parts[0]) + float(parts[1])) / 2
+            except ValueError:
+                return 0
+        else:
+            try:
+                return float(capacity)
+            except ValueError:
+                return 0
+    try:
+        return float(capacity)
+    except (ValueError, TypeError):
+        return 0
@@ -0,0 +1,152 @@
+"""
+"Latest state" snapshot for widgets that show the current interval.
+
+The Nem-dash price table, renewable gauge and spot display need only the
+last few intervals, but the history files hold years. After each
+collection cycle the data service writes the last day of each to a small,
+uncompressed Arrow IPC file in latest/, which readers memory-map instead
+of decoding Parquet:
+
+    prices.arrow    RRP by SETTLEMENTDATE (index) x region, as the price table shows it
+    fuel_mix.arrow  settlementdate, region, fuel, scadavalue
+    flows.arrow     settlementdate, interconnectorid, meteredmwflow
+    rooftop.arrow   settlementdate and MW per region (30-minute readings)
+
+Each file is replaced atomically. read_latest() keeps the frame it read
+until the file changes, so a widget's repeated reads cost one stat.
+"""
+
+import os
+import pickle
+import threading
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from .config import config
+from .duid_history import parquet_time_range
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Intervals kept in the snapshot: one day of 5-minute intervals, enough for the
+# price table's 24 hour average
+SNAPSHOT_INTERVALS = 288
+
+_frames = {}  # name -> ((mtime_ns, size), frame)
+_frames_lock = threading.Lock()
+
+
+def update_latest_snapshot() -> bool:
+    """
+    Rewrite the snapshot files from the end of the data files.
+
+    Returns:
+        bool: True if every snapshot file was written
+    """
+    config.latest_dir.mkdir(exist_ok=True)
+    ok = True
+    for name, build in (('prices', _latest_prices), ('fuel_mix', _latest_fuel_mix),
+                        ('flows', _latest_flows), ('rooftop', _latest_rooftop)):
+        try:
+            frame = build()
+            if frame is None:
+                continue
+            _write_arrow(frame, name, preserve_index=(name == 'prices'))
+        except Exception as e:
+            logger.error(f"Error updating latest {name} snapshot: {e}")
+            ok = False
+    return ok
+
+
+def read_latest(name: str) -> Optional[pd.DataFrame]:
+    """
+    Read a snapshot frame ('prices', 'fuel_mix', 'flows' or 'rooftop').
+
+    The frame is shared between callers and must not be modified.
+
+    Returns:
+        DataFrame, or None if the snapshot has not been written
+    """
+    path = config.latest_dir / f"{name}.arrow"
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _frames_lock:
+        cached = _frames.get(name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    try:
+        with pa.memory_map(str(path)) as source:
+            frame = pa.ipc.open_file(source).read_all().to_pandas()
+    except Exception as e:
+        logger.error(f"Error reading latest {name} snapshot: {e}")
+        return None
+
+    with _frames_lock:
+        _frames[name] = (signature, frame)
+    return frame
+
+
+def _write_arrow(frame: pd.DataFrame, name: str, preserve_index: bool = False):
+    """Write frame as an uncompressed Arrow IPC file, then rename it into place"""
+    table = pa.Table.from_pandas(frame, preserve_index=preserve_index)
+    path = config.latest_dir / f"{name}.arrow"
+    tmp_path = path.with_suffix('.tmp')
+    with pa.OSFile(str(tmp_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def _read_tail(path, column: str, window: pd.Timedelta) -> Optional[pd.DataFrame]:
+    """Rows of a time-ordered parquet file within window of its last interval"""
+    if not os.path.exists(path):
+        return None
+    _, latest = parquet_time_range(path, column)
+    if latest is None:
+        return None
+    return pd.read_parquet(path, filters=[(column, '>', latest - window)])
+
+
+def _latest_prices() -> Optional[pd.DataFrame]:
+    rows = _read_tail(config.spot_hist_file, 'SETTLEMENTDATE', pd.Timedelta(minutes=5 * SNAPSHOT_INTERVALS))
+    if rows is None:
+        return None
+    if 'SETTLEMENTDATE' not in rows.columns:
+        rows = rows.reset_index()
+    return rows.pivot_table(index='SETTLEMENTDATE', columns='REGIONID', values='RRP', aggfunc='last')
+
+
+def _latest_fuel_mix() -> Optional[pd.DataFrame]:
+    rows = _read_tail(config.gen_output_file, 'settlementdate', pd.Timedelta(minutes=5 * SNAPSHOT_INTERVALS))
+    if rows is None:
+        return None
+    with open(config.gen_info_file, 'rb') as f:
+        gen_info = pickle.load(f)
+
+    units = gen_info.set_index('DUID')
+    rows['region'] = rows['duid'].map(units['Region'])
+    rows['fuel'] = rows['duid'].map(units['Fuel'])
+    # Unknown DUIDs cannot be placed in a region or fuel
+    rows = rows.dropna(subset=['region', 'fuel'])
+    return rows.groupby(['settlementdate', 'region', 'fuel'], as_index=False)['scadavalue'].sum()
+
+
+def _latest_flows() -> Optional[pd.DataFrame]:
+    rows = _read_tail(config.transmission_output_file, 'settlementdate', pd.Timedelta(minutes=5 * SNAPSHOT_INTERVALS))
+    if rows is None:
+        return None
+    return rows[['settlementdate', 'interconnectorid', 'meteredmwflow']].reset_index(drop=True)
+
+
+def _latest_rooftop() -> Optional[pd.DataFrame]:
+    rows = _read_tail(config.rooftop_solar_file, 'settlementdate', pd.Timedelta(minutes=5 * SNAPSHOT_INTERVALS))
+    if rows is None:
+        return None
+    return rows.reset_index(drop=True)
@@ -0,0 +1,200 @@
+"""
+Process-wide refresh broker for live sessions.
+
+The data service rewrites the parquet files every collection cycle and
+then publishes a data event (see data_events). Rather than every session
+running its own timer and re-reading the files, the broker checks the
+files' modification signatures once per process - as soon as an event
+arrives, and on a slow poll in case events are missed or the files are
+written by something else. When they change it bumps its version,
+rebuilds the shared values registered with it (see shared()) once in the
+worker pool, and then notifies each live session on that session's own
+document.
+
+Sessions are tracked through pn.state.on_session_created and
+on_session_destroyed, so a closed tab stops receiving refreshes and the
+refresh work does not grow with the number of viewers.
+"""
+
+import os
+import threading
+from functools import partial
+
+import panel as pn
+from panel.io.state import set_curdoc
+
+from .background import get_executor
+from .config import config
+from .data_events import DataEventListener
+from .logging_config import get_logger
+from .shared_data import get_shared, refresh_shared
+
+logger = get_logger(__name__)
+
+# Files written by the data service that the dashboard displays (and the
+# latest-state snapshot directory, whose files are renamed into place)
+WATCHED_FILES = ('gen_output_file', 'spot_hist_file', 'transmission_output_file', 'rooftop_solar_file', 'latest_dir')
+
+
+class RefreshBroker:
+    """
+    Detects new data once per process and notifies the live sessions.
+
+    Sessions call subscribe(callback) while they are being built; the
+    callback is run on the session's document with the new data version
+    each time the watched files change. Values derived from the files that
+    every session displays are fetched through shared(), so they are
+    rebuilt once per change instead of once per session.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._signatures = None
+        self._sessions = {}  # session id -> (document, [callbacks])
+        self._builders = {}  # shared key -> build callable
+        self._lock = threading.Lock()
+        self._checking = False
+        self._recheck = False
+        self._hooks_installed = False
+        self._listener = None
+
+    def start(self):
+        """
+        Install the process-wide session hooks.
+
+        Must be called outside a session (before pn.serve). The check timer
+        and event listener are started by the first subscription, on the
+        server's event loop.
+        """
+        with self._lock:
+            if self._hooks_installed:
+                return
+            self._hooks_installed = True
+        pn.state.on_session_created(self._session_created)
+        pn.state.on_session_destroyed(self._session_destroyed)
+
+    def subscribe(self, callback):
+        """
+        Call callback(version) on the current session's document when new data arrives.
+
+        Outside a server session there is nothing to notify and this does nothing.
+        """
+        doc = pn.state.curdoc
+        if doc is None or doc.session_context is None:
+            return
+
+        session_id = doc.session_context.id
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                # Session hooks not installed (e.g. served with `panel serve`) - track it directly
+                entry = self._sessions[session_id] = (doc, [])
+                doc.on_session_destroyed(self._session_destroyed)
+            entry[1].append(callback)
+            live_sessions = len(self._sessions)
+        self._start_watching()
+        logger.info(f"Refresh subscription added for session {session_id} ({live_sessions} live sessions)")
+
+    def shared(self, key, build):
+        """
+        Return the shared value for key, rebuilt once whenever the watched files change.
+
+        A failed build (None) is not cached; the previous value is kept.
+        Shared values must not be modified by callers.
+
+        Returns:
+            The shared value, or None if it could not be built
+        """
+        self._builders.setdefault(key, build)
+        return get_shared(key, build)
+
+    def check(self):
+        """Check the watched files for new data in the worker pool (at most one check at a time)"""
+        with self._lock:
+            if self._checking:
+                # Check again once the running check finishes, it may have looked too early
+                self._recheck = True
+                return
+            self._checking = True
+        get_executor().submit(self._refresh)
+
+    def _start_watching(self):
+        # Idempotent - the timer and listener are created once per process
+        pn.state.schedule_task('aemo_dashboard_refresh_broker', self.check,
+                               period=f'{config.refresh_check_seconds}s')
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = DataEventListener(self._on_data_event)
+        self._listener.start()
+
+    def _on_data_event(self, event):
+        logger.info(f"Data event {event.get('version')} received")
+        self.check()
+
+    def _file_signatures(self):
+        signatures = {}
+        for name in WATCHED_FILES:
+            try:
+                stat = os.stat(getattr(config, name))
+                signatures[name] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signatures[name] = None
+        return signatures
+
+    def _refresh(self):
+        try:
+            signatures = self._file_signatures()
+            previous, self._signatures = self._signatures, signatures
+            if previous is None or signatures == previous:
+                # On the first check sessions already have the current files
+                return
+
+            self.version += 1
+            changed = [name for name in WATCHED_FILES if signatures[name] != previous[name]]
+            logger.info(f"New data detected (version {self.version}): {', '.join(changed)}")
+
+            for key, build in list(self._builders.items()):
+                refresh_shared(key, build)
+            self._notify()
+        except Exception as e:
+            logger.error(f"Error checking for new data: {e}")
+        finally:
+            with self._lock:
+                self._checking = False
+                recheck, self._recheck = self._recheck, False
+            if recheck:
+                self.check()
+
+    def _notify(self):
+        with self._lock:
+            sessions = list(self._sessions.items())
+        for session_id, (doc, callbacks) in sessions:
+            for callback in list(callbacks):
+                try:
+                    with set_curdoc(doc):
+                        pn.state.execute(partial(self._run_callback, callback, self.version), schedule=True)
+                except Exception as e:
+                    # The session may have closed since it was listed
+                    logger.warning(f"Could not notify session {session_id}: {e}")
+        logger.info(f"Notified {len(sessions)} sessions of data version {self.version}")
+
+    def _run_callback(self, callback, version):
+        try:
+            callback(version)
+        except Exception as e:
+            logger.error(f"Error in refresh callback: {e}")
+
+    def _session_created(self, session_context):
+        with self._lock:
+            self._sessions.setdefault(session_context.id, (pn.state.curdoc, []))
+
+    def _session_destroyed(self, session_context):
+        with self._lock:
+            self._sessions.pop(session_context.id, None)
+            live_sessions = len(self._sessions)
+        logger.info(f"Session {session_context.id} closed ({live_sessions} live sessions)")
+
+
+# The broker shared by all sessions in this process
+broker = RefreshBroker()
@@ -0,0 +1,121 @@
+"""
+Process-wide cache for expensive, read-only data shared between sessions.
+
+The analysis motors load and integrate the full generation x price history,
+which takes seconds and a lot of memory. Building them once per process and
+handing each session a shallow copy (see copy.copy) means a new session only
+pays for that work when the shared copy is missing or older than the data
+update interval. Sessions that re-filter their copy (date ranges, station
+selection) only rebind attributes on the copy, so the shared frames are
+never modified.
+
+LRUCache holds results computed from that data (e.g. price analysis tables)
+so that sessions asking for the same view reuse one computation.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from .config import config
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_entries = {}  # key -> (built_at, value)
+_key_locks = {}
+_locks_lock = threading.Lock()
+
+
+def _key_lock(key):
+    with _locks_lock:
+        return _key_locks.setdefault(key, threading.Lock())
+
+
+def get_shared(key, build, max_age_minutes=None):
+    """
+    Return the shared value for key, building it with build() if needed.
+
+    Concurrent callers for the same key wait for a single build rather than
+    all loading the data themselves. A failed build (None) is not cached;
+    the previous value, if any, is kept and returned instead.
+
+    Args:
+        key: Name of the shared value
+        build: Callable returning the value, or None on failure
+        max_age_minutes: Rebuild when the value is older than this
+            (defaults to the dashboard update interval)
+
+    Returns:
+        The shared value, or None if it could not be built
+    """
+    if max_age_minutes is None:
+        max_age_minutes = config.update_interval_minutes
+
+    with _key_lock(key):
+        entry = _entries.get(key)
+        if entry is not None and time.time() - entry[0] < max_age_minutes * 60:
+            return entry[1]
+        return _build(key, build)
+
+
+def refresh_shared(key, build):
+    """Rebuild the shared value for key now and return it"""
+    with _key_lock(key):
+        return _build(key, build)
+
+
+def _build(key, build):
+    start = time.time()
+    value = build()
+    if value is None:
+        logger.error(f"Failed to build shared {key}")
+        entry = _entries.get(key)
+        return entry[1] if entry is not None else None
+    _entries[key] = (time.time(), value)
+    logger.info(f"Built shared {key} in {time.time() - start:.2f}s")
+    return value
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe least-recently-used cache shared between sessions.
+
+    Keys should include a version of the data the value was computed from,
+    so that values for superseded data are never hit and age out.
+    Cached values are shared - callers must not modify them.
+    """
+
+    def __init__(self, max_entries, name='cache'):
+        self.max_entries = max_entries
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = self._entries[key]
+            else:
+                self.misses += 1
+                value = None
+        logger.info(f"{self.name} cache {'hit' if value is not None else 'miss'} "
+                    f"(hits={self.hits}, misses={self.misses}, entries={len(self._entries)})")
+        return value
+
+    def put(self, key, value):
+        """Store value for key, evicting the least recently used entries beyond max_entries"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
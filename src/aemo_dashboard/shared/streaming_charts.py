@@ -0,0 +1,399 @@
+"""
+Persistent Bokeh charts for the live dashboard views.
+
+Each chart is built once per session on ColumnDataSources. Refreshes go
+through sync_source(), which patches rows whose values changed and streams
+new rows with rollover, so only the changed rows are sent to the browser
+instead of the whole plot.
+"""
+
+import numpy as np
+import pandas as pd
+from bokeh.layouts import column
+from bokeh.models import (ColumnDataSource, DatetimeTickFormatter, HoverTool,
+                          Label, PrintfTickFormatter, Range1d, Span)
+from bokeh.core.property.validation import without_property_validation
+from bokeh.plotting import figure
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Largest number of changed values sent as a patch before replacing the source data
+PATCH_LIMIT = 2000
+
+
+def datetime_formatter(time_range):
+    """X-axis datetime format used across the dashboard for a time range selection"""
+    if time_range == '1':
+        return DatetimeTickFormatter(hours="%H:%M", days="%H:%M")
+    elif time_range == '7':
+        return DatetimeTickFormatter(hours="%a %H:%M", days="%a %d", months="%b %d")
+    return DatetimeTickFormatter(hours="%m/%d", days="%m/%d", months="%b %d", years="%Y")
+
+
+def frame_to_columns(frame, x='settlementdate'):
+    """Convert a DataFrame with a datetime index into ColumnDataSource columns"""
+    data = {x: frame.index.values.astype('datetime64[ns]')}
+    for col in frame.columns:
+        data[str(col)] = frame[col].to_numpy()
+    return data
+
+
+def _changed_rows(old_values, new_values):
+    """Positions where two equal-length arrays differ (NaN == NaN)"""
+    old_values = np.asarray(old_values)
+    new_values = np.asarray(new_values)
+    if old_values.dtype.kind == 'f' and new_values.dtype.kind == 'f':
+        same = (old_values == new_values) | (np.isnan(old_values) & np.isnan(new_values))
+    else:
+        same = old_values == new_values
+    return np.flatnonzero(~same)
+
+
+@without_property_validation
+def sync_source(source, frame, x='settlementdate'):
+    """
+    Bring a ColumnDataSource in line with frame, sending only what changed.
+
+    Rows already in the source are patched where their values differ, rows
+    after the last one in the source are streamed, and rows that have fallen
+    out of the window are dropped through rollover. If the columns or the
+    time axis no longer line up, or most retained values changed (e.g. after
+    a region switch), the source data is replaced wholesale. The columns come
+    straight from DataFrames, so Bokeh's per-value property validation is
+    skipped.
+
+    Args:
+        source: ColumnDataSource previously filled by this function
+        frame: DataFrame with a datetime index holding the desired contents
+        x: Name of the time column in the source
+
+    Returns:
+        'replace', 'update' or 'none' describing what was sent
+    """
+    new_data = frame_to_columns(frame, x)
+    old_data = source.data
+
+    if (set(old_data.keys()) != set(new_data.keys())
+            or len(old_data.get(x, [])) == 0 or len(new_data[x]) == 0):
+        source.data = new_data
+        return 'replace'
+
+    old_x = np.asarray(old_data[x]).astype('datetime64[ns]')
+    new_x = new_data[x]
+
+    # The retained part of the source must be a prefix of the new frame
+    start = int(np.searchsorted(old_x, new_x[0]))
+    overlap = len(old_x) - start
+    if overlap > len(new_x) or not np.array_equal(old_x[start:], new_x[:overlap]):
+        source.data = new_data
+        return 'replace'
+
+    # Patch retained rows whose values were recomputed
+    patches = {}
+    patched_values = 0
+    for col, values in new_data.items():
+        if col == x:
+            continue
+        changed = _changed_rows(np.asarray(old_data[col])[start:], values[:overlap])
+        if len(changed):
+            patches[col] = list(zip((changed + start).tolist(), values[changed].tolist()))
+            patched_values += len(changed)
+
+    # Patches are validated value by value; past a point a full replace is cheaper
+    if patched_values > PATCH_LIMIT:
+        source.data = new_data
+        return 'replace'
+
+    if patches:
+        source.patch(patches)
+
+    # Stream new rows; rollover drops the rows that fell out of the window
+    if len(new_x) > overlap or start > 0:
+        source.stream({col: values[overlap:] for col, values in new_data.items()},
+                      rollover=len(new_x))
+
+    if patches or len(new_x) > overlap or start > 0:
+        return 'update'
+    return 'none'
+
+
+def message_figure(message, width=1200, height=400):
+    """Placeholder figure showing a message when there is nothing to plot"""
+    p = figure(width=width, height=height, toolbar_location=None,
+               x_range=Range1d(0, 1), y_range=Range1d(0, 1),
+               background_fill_color='black', sizing_mode='stretch_width')
+    p.axis.visible = False
+    p.grid.visible = False
+    p.add_layout(Label(x=0.5, y=0.5, text=message, text_align='center',
+                       text_baseline='middle', text_color='white', text_font_size='16px'))
+    return p
+
+
+def _base_figure(width, height, ylabel, x_range=None, tools='pan,wheel_zoom,box_zoom,reset,save'):
+    """Dark datetime figure matching the dashboard chart styling"""
+    kwargs = {'x_range': x_range} if x_range is not None else {}
+    p = figure(width=width, height=height, x_axis_type='datetime', tools=tools,
+               toolbar_location='above', background_fill_color='black',
+               sizing_mode='stretch_width', **kwargs)
+    p.grid.visible = False
+    p.yaxis.axis_label = ylabel
+    return p
+
+
+def _move_legend_right(p):
+    """Place the figure legend outside the plot area on the right"""
+    if p.legend:
+        legend = p.legend[0]
+        legend.click_policy = 'hide'
+        p.add_layout(legend, 'right')
+
+
+class StackedAreaChart:
+    """
+    Stacked generation area chart with an optional price line underneath.
+
+    Negative columns (transmission exports, battery charging) are stacked
+    downwards from zero so charging and exports show below the axis.
+    """
+
+    def __init__(self, colors, width=1200, height=300, price_height=None,
+                 negative_columns=('Battery Storage', 'Transmission Exports'),
+                 positive_only_columns=('Battery Storage',),
+                 ylabel='Generation (MW)'):
+        self.colors = colors
+        self.width = width
+        self.height = height
+        self.price_height = price_height
+        self.negative_columns = list(negative_columns)
+        self.positive_only_columns = list(positive_only_columns)
+        self.ylabel = ylabel
+
+        self.source = ColumnDataSource(data={})
+        self.price_source = ColumnDataSource(data={})
+        self.figure = None
+        self.price_figure = None
+        self.layout = None
+        self._stack_key = None
+        # Models already built for other stack layouts (e.g. NEM vs a region), reused on switch
+        self._built = {}
+
+    def _split(self, pivot_df):
+        """Split a fuel pivot into the positive stack and the negative stack"""
+        positive = [c for c in pivot_df.columns if c != 'Transmission Exports']
+        display = pd.DataFrame(index=pivot_df.index)
+        for col in positive:
+            values = pivot_df[col]
+            display[col] = values.clip(lower=0) if col in self.positive_only_columns else values
+
+        negative = []
+        for col in self.negative_columns:
+            if col in pivot_df.columns:
+                name = col if col == 'Transmission Exports' else f'{col} (charging)'
+                display[name] = pivot_df[col].clip(upper=0)
+                negative.append(name)
+        return display, positive, negative
+
+    def _build(self, positive, negative, with_price):
+        """Create the figures and renderers for a given set of stack columns"""
+        p = _base_figure(self.width, self.height, self.ylabel)
+        colors = [self.colors.get(col, '#6272a4') for col in positive]
+        renderers = p.varea_stack(stackers=positive, x='settlementdate', color=colors,
+                                  alpha=0.8, legend_label=positive, source=self.source)
+        for renderer, col in zip(renderers, positive):
+            renderer.name = col
+
+        if negative:
+            neg_colors = [self.colors.get(col.replace(' (charging)', ''), '#ffb6c1') for col in negative]
+            neg_renderers = p.varea_stack(stackers=negative, x='settlementdate', color=neg_colors,
+                                          alpha=0.8, source=self.source)
+            for renderer, col in zip(neg_renderers, negative):
+                renderer.name = col
+            renderers = renderers + neg_renderers
+
+        p.add_tools(HoverTool(renderers=renderers,
+                              tooltips=[('Fuel Type', '$name'),
+                                        ('Time', '@settlementdate{%F %H:%M}'),
+                                        ('MW', '@$name{0,0.0}')],
+                              formatters={'@settlementdate': 'datetime'}))
+        _move_legend_right(p)
+
+        self.figure = p
+        self.price_figure = None
+        if with_price:
+            p.xaxis.visible = False
+            price = _base_figure(self.width, self.price_height, 'Price ($/MWh)', x_range=p.x_range)
+            price_line = price.line('settlementdate', 'RRP', source=self.price_source,
+                                    color='white', line_width=2, alpha=0.8)
+            price.add_tools(HoverTool(renderers=[price_line],
+                                      tooltips=[('Time', '@settlementdate{%F %H:%M}'),
+                                                ('Price', '@RRP{$0.2f}')],
+                                      formatters={'@settlementdate': 'datetime'},
+                                      mode='vline'))
+            price.xaxis.axis_label = 'Time'
+            price.min_border_right = p.min_border_right
+            self.price_figure = price
+            self.layout = column(p, price, sizing_mode='stretch_width')
+        else:
+            p.xaxis.axis_label = 'Time'
+            self.layout = p
+
+    def update(self, pivot_df, title, formatter=None, price_df=None):
+        """
+        Sync the chart with pivot_df (and price_df) and return the Bokeh model.
+
+        The same model is returned on every call unless the set of fuel
+        columns changed, in which case the figure for that set is built once
+        and kept for later switches back to it.
+        """
+        display, positive, negative = self._split(pivot_df)
+        with_price = self.price_height is not None and price_df is not None and not price_df.empty
+        stack_key = (tuple(positive), tuple(negative), with_price)
+
+        if stack_key != self._stack_key:
+            if stack_key in self._built:
+                (self.source, self.price_source, self.figure,
+                 self.price_figure, self.layout) = self._built[stack_key]
+            else:
+                self.source = ColumnDataSource(data={})
+                self.price_source = ColumnDataSource(data={})
+                self._build(positive, negative, with_price)
+                self._built[stack_key] = (self.source, self.price_source, self.figure,
+                                          self.price_figure, self.layout)
+                logger.info(f"Built stacked area chart for {len(positive)} fuel types")
+            self._stack_key = stack_key
+
+        sync_source(self.source, display)
+        if with_price:
+            sync_source(self.price_source, price_df.set_index('settlementdate')[['RRP']])
+
+        self.figure.title.text = title
+        if formatter is not None:
+            axis_figure = self.price_figure if self.price_figure is not None else self.figure
+            axis_figure.xaxis.formatter = formatter
+        return self.layout
+
+
+class MultiLineChart:
+    """One line per column over a shared ColumnDataSource"""
+
+    def __init__(self, colors, width=1200, height=400, ylabel='', y_range=None,
+                 y_format=None, value_format='{0.1f}'):
+        self.colors = colors
+        self.width = width
+        self.height = height
+        self.ylabel = ylabel
+        self.y_range = y_range
+        self.y_format = y_format
+        self.value_format = value_format
+
+        self.source = ColumnDataSource(data={})
+        self.figure = None
+        self._columns = None
+        self._built = {}
+
+    def _build(self, columns):
+        """Create the figure with a line renderer per column"""
+        p = _base_figure(self.width, self.height, self.ylabel)
+        if self.y_range is not None:
+            p.y_range = Range1d(*self.y_range)
+        if self.y_format is not None:
+            p.yaxis.formatter = PrintfTickFormatter(format=self.y_format)
+
+        renderers = []
+        for col in columns:
+            renderer = p.line('settlementdate', col, source=self.source, line_width=2, alpha=0.8,
+                              color=self.colors.get(col, '#6272a4'), legend_label=col, name=col)
+            renderers.append(renderer)
+        p.add_tools(HoverTool(renderers=renderers,
+                              tooltips=[('Fuel Type', '$name'),
+                                        ('Time', '@settlementdate{%F %H:%M}'),
+                                        ('Value', '@$name' + self.value_format)],
+                              formatters={'@settlementdate': 'datetime'}))
+        p.xaxis.axis_label = 'Time'
+        _move_legend_right(p)
+        self.figure = p
+
+    def update(self, frame, title, formatter=None):
+        """Sync the chart with frame and return the Bokeh figure"""
+        columns = tuple(frame.columns)
+        if columns != self._columns:
+            if columns in self._built:
+                self.source, self.figure = self._built[columns]
+            else:
+                self.source = ColumnDataSource(data={})
+                self._build(columns)
+                self._built[columns] = (self.source, self.figure)
+            self._columns = columns
+
+        sync_source(self.source, frame)
+        self.figure.title.text = title
+        if formatter is not None:
+            self.figure.xaxis.formatter = formatter
+        return self.figure
+
+
+class BandLineChart:
+    """
+    Lines with a shaded band between each line and a second series.
+
+    Expects frame columns '<key>_value' and '<key>_band' for each series key,
+    plus any '<key>_<field>' columns referenced by the hover fields.
+    """
+
+    def __init__(self, colors, width=1200, height=400, ylabel='', hover_fields=None):
+        self.colors = colors
+        self.width = width
+        self.height = height
+        self.ylabel = ylabel
+        self.hover_fields = hover_fields or []
+
+        self.source = ColumnDataSource(data={})
+        self.figure = None
+        self._series = None
+        self._built = {}
+
+    def _build(self, series):
+        """Create the band and line renderers for each series"""
+        p = _base_figure(self.width, self.height, self.ylabel)
+        for key, label in series:
+            color = self.colors.get(label, '#ffb6c1')
+            p.varea(x='settlementdate', y1=f'{key}_value', y2=f'{key}_band', source=self.source,
+                    color=color, alpha=0.3, legend_label=f'{label} unused capacity')
+            line = p.line('settlementdate', f'{key}_value', source=self.source, color=color,
+                          line_width=3, legend_label=label)
+            tooltips = [('Series', label), ('Time', '@settlementdate{%F %H:%M}')]
+            tooltips += [(name, f'@{{{key}_{field}}}{fmt}') for name, field, fmt in self.hover_fields]
+            p.add_tools(HoverTool(renderers=[line], tooltips=tooltips,
+                                  formatters={'@settlementdate': 'datetime'}))
+
+        p.add_layout(Span(location=0, dimension='width', line_color='white',
+                          line_alpha=0.3, line_width=1, line_dash='dashed'))
+        p.xaxis.axis_label = 'Time'
+        _move_legend_right(p)
+        self.figure = p
+
+    def update(self, frame, series, title, formatter=None):
+        """
+        Sync the chart with frame and return the Bokeh figure.
+
+        Args:
+            frame: Wide DataFrame indexed by settlementdate
+            series: List of (key, label) pairs to draw
+        """
+        series = tuple(series)
+        if series != self._series:
+            if series in self._built:
+                self.source, self.figure = self._built[series]
+            else:
+                self.source = ColumnDataSource(data={})
+                self._build(series)
+                self._built[series] = (self.source, self.figure)
+            self._series = series
+
+        sync_source(self.source, frame)
+        self.figure.title.text = title
+        if formatter is not None:
+            self.figure.xaxis.formatter = formatter
+        return self.figure
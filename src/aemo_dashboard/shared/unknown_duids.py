@@ -0,0 +1,185 @@
+"""
+Registry of DUIDs seen in the SCADA data that are not in gen_info.pkl.
+
+The data service checks each new batch of generation rows against the set
+of known DUIDs as it is committed, so only the new intervals' DUIDs are
+looked at. A DUID seen for the first time is added to unknown_duids.parquet
+(first seen interval and time detected; last seen interval, MW and record
+count are kept up to date) and alerted once by email, unless it is in the
+exception list (duid_exceptions.json). When gen_info.pkl gains a DUID it
+is dropped from the table.
+
+Dashboards read the table with load_unknown_duids() rather than
+re-deriving it from the generation data.
+"""
+
+import json
+import os
+import pickle
+from datetime import datetime
+from typing import Dict, Set
+
+import pandas as pd
+
+from .config import config
+from .email_alerts import EmailAlertManager
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+UNKNOWN_COLUMNS = ['duid', 'first_seen', 'first_detected', 'last_seen', 'last_mw', 'records']
+
+
+def load_unknown_duids() -> pd.DataFrame:
+    """The unknown DUID table (UNKNOWN_COLUMNS), empty if none have been seen"""
+    path = config.unknown_duids_file
+    try:
+        if path.exists():
+            return pd.read_parquet(path)
+    except Exception as e:
+        logger.error(f"Error loading unknown DUID table: {e}")
+    return pd.DataFrame(columns=UNKNOWN_COLUMNS)
+
+
+def load_duid_exception_list() -> Set[str]:
+    """DUIDs that should not trigger unknown DUID alerts"""
+    exception_file = config.data_dir / "duid_exceptions.json"
+    try:
+        if exception_file.exists():
+            with open(exception_file, 'r') as f:
+                return set(json.load(f).get('exception_duids', []))
+    except Exception as e:
+        logger.error(f"Error loading DUID exception list: {e}")
+    return set()
+
+
+def add_duids_to_exception_list(duids_to_add: Set[str]) -> None:
+    """Add DUIDs to the exception list"""
+    exception_duids = load_duid_exception_list() | set(duids_to_add)
+    data = {
+        'exception_duids': sorted(exception_duids),
+        'last_updated': datetime.now().isoformat(),
+        'note': 'DUIDs in this list will not trigger email alerts'
+    }
+    try:
+        with open(config.data_dir / "duid_exceptions.json", 'w') as f:
+            json.dump(data, f, indent=2)
+        logger.info(f"Added {len(duids_to_add)} DUIDs to exception list")
+    except Exception as e:
+        logger.error(f"Error saving DUID exception list: {e}")
+
+
+class UnknownDuidRegistry:
+    """
+    Checks newly committed generation rows for DUIDs missing from gen_info.pkl.
+
+    The known DUIDs are held as a set and reloaded when gen_info.pkl changes.
+    """
+
+    def __init__(self):
+        self.known_duids = set()
+        self._gen_info_signature = None
+        self.table = load_unknown_duids().set_index('duid')
+
+    def record(self, new_rows: pd.DataFrame) -> Dict[str, dict]:
+        """
+        Record the unknown DUIDs in a batch of new generation rows.
+
+        Args:
+            new_rows: Rows with settlementdate, duid and scadavalue
+
+        Returns:
+            Sample data (power, time, records) for DUIDs seen for the first time
+        """
+        if new_rows is None or new_rows.empty:
+            return {}
+
+        try:
+            changed = self._refresh_known_duids()
+            unknown_rows = new_rows[~new_rows['duid'].isin(self.known_duids)]
+            if unknown_rows.empty:
+                if changed:
+                    self._save()
+                return {}
+
+            latest = unknown_rows.sort_values('settlementdate').groupby('duid').agg(
+                first_seen=('settlementdate', 'first'),
+                last_seen=('settlementdate', 'last'),
+                last_mw=('scadavalue', 'last'),
+                records=('settlementdate', 'count')
+            )
+            new_duids = latest.index.difference(self.table.index)
+
+            # Known unknowns - keep the latest reading
+            seen = latest.index.intersection(self.table.index)
+            self.table.loc[seen, ['last_seen', 'last_mw']] = latest.loc[seen, ['last_seen', 'last_mw']].to_numpy()
+            self.table.loc[seen, 'records'] = self.table.loc[seen, 'records'] + latest.loc[seen, 'records']
+
+            if len(new_duids):
+                added = latest.loc[new_duids].assign(first_detected=pd.Timestamp.now())[UNKNOWN_COLUMNS[1:]]
+                self.table = pd.concat([self.table, added]) if len(self.table) else added
+                logger.warning(f"🚨 New DUIDs not in gen_info.pkl: {', '.join(sorted(new_duids))}")
+            self._save()
+
+            return {
+                duid: {'power': latest.at[duid, 'last_mw'], 'time': latest.at[duid, 'last_seen'],
+                       'records': int(latest.at[duid, 'records'])}
+                for duid in new_duids
+            }
+
+        except Exception as e:
+            logger.error(f"Error checking for unknown DUIDs: {e}")
+            return {}
+
+    def send_alert(self, new_duids: Dict[str, dict]) -> bool:
+        """
+        Email an alert for newly seen DUIDs that are not in the exception list.
+
+        Sending blocks on SMTP, so the data service runs this in a worker thread.
+        """
+        alert_duids = set(new_duids) - load_duid_exception_list()
+        if not alert_duids:
+            return False
+
+        email_manager = EmailAlertManager(data_dir=config.data_dir)
+        if not email_manager.enabled:
+            logger.info(f"Email alerts disabled - would have alerted about {len(alert_duids)} new DUIDs")
+            return False
+
+        sent = email_manager.send_duid_alert(alert_duids, new_duids)
+        if sent and config.auto_add_to_exceptions:
+            # Prevent repeated emails about the same DUIDs
+            add_duids_to_exception_list(alert_duids)
+        return sent
+
+    def _refresh_known_duids(self) -> bool:
+        """Reload the known DUIDs if gen_info.pkl changed; True if the table changed"""
+        try:
+            stat = os.stat(config.gen_info_file)
+        except FileNotFoundError:
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._gen_info_signature:
+            return False
+
+        with open(config.gen_info_file, 'rb') as f:
+            gen_info = pickle.load(f)
+        self.known_duids = set(gen_info['DUID'])
+        self._gen_info_signature = signature
+
+        now_known = self.table.index.intersection(list(self.known_duids))
+        if len(now_known):
+            logger.info(f"DUIDs now in gen_info.pkl: {', '.join(sorted(now_known))}")
+            self.table = self.table.drop(now_known)
+            return True
+        return False
+
+    def _save(self) -> None:
+        path = config.unknown_duids_file
+        try:
+            # Write then rename so readers never see a partial file
+            tmp_path = path.with_suffix('.tmp')
+            self.table.rename_axis('duid').reset_index()[UNKNOWN_COLUMNS].to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error saving unknown DUID table: {e}")
@@ -9,6 +9,7 @@ import os
 import sys
 
 from ..shared.config import config
+from ..shared.latest_snapshot import read_latest
 from ..shared.logging_config import setup_logging, get_logger
 
 # Set up logging
@@ -127,6 +128,11 @@ dracula_style = {
 }
 
 def get_data():
+    # The data service's snapshot holds the last day, already pivoted
+    prices = read_latest('prices')
+    if prices is not None and not prices.empty:
+        return prices
+
     data = open_parquet_file(file_path)
     logger.info("file opened")
     prices = data.pivot(columns='REGIONID', values='RRP')
@@ -3,7 +3,9 @@
 AEMO Spot Price Updater - Parquet Version
 Downloads the latest AEMO dispatch data and updates the historical spot price file.
 Runs continuously, checking for updates every 4 minutes.
-Includes Twilio price alerts and automatic file cleanup.
+Price alerts are sent by the data service (aemo_data_service.price_alerts),
+which keeps the alert state in memory, so they are not checked here.
+Includes automatic file cleanup.
 Uses parquet format for better performance and compression.
 """
 
@@ -24,13 +26,6 @@ from ..shared.logging_config import setup_logging, get_logger
 setup_logging()
 logger = get_logger(__name__)
 
-try:
-    from .twilio_price_alerts import check_price_alerts
-except ImportError:
-    logger.warning("Twilio price alerts not available - install twilio package")
-    def check_price_alerts(data):
-        pass
-
 # Configuration from shared config
 AEMO_URL = config.aemo_dispatch_url
 PARQUET_FILE_PATH = config.spot_hist_file
@@ -276,12 +271,6 @@ def update_spot_prices():
         logger.info("No new prices - no records newer than existing data")
         return False
     
-    # CHECK FOR PRICE ALERTS before logging
-    try:
-        check_price_alerts(newer_records)
-    except Exception as e:
-        logger.error(f"Error checking price alerts: {e}")
-    
     # Log the new prices found
     settlement_time = newer_records.index[0]
     logger.info(f"New prices found for {settlement_time}:")
@@ -0,0 +1,192 @@
+"""
+Per-DUID hourly rollup of generation, revenue and price for the station charts.
+
+Station charts over more than a couple of days show hourly (or daily) points.
+Instead of resampling the selected units' 5-minute rows on every selection,
+the data service keeps duid_hourly/YYYY-MM.parquet up to date after every
+collection cycle: one row per DUID per hour, sorted by DUID so that reading
+a station touches only a few row groups per file. Once a year has closed its
+months are compacted into duid_hourly/YYYY.parquet, as for the DUID-sorted
+generation history. The columns are sums and counts, so units add up to
+stations and hours to days exactly.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Union
+
+import pandas as pd
+
+from ..shared.config import config
+from ..shared.duid_history import compact_sorted, parquet_time_range, sorted_periods, write_sorted
+from ..shared.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+HOURLY_COLUMNS = [
+    'hour', 'duid', 'generation_sum', 'generation_min', 'generation_max',
+    'revenue_sum', 'price_sum', 'weighted_price_sum', 'interval_count'
+]
+
+# A DUID has at most 744 hours a month - keep row groups to a few DUIDs each
+ROW_GROUP_SIZE = 8_192
+
+
+def rollup_hourly(integrated_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Roll integrated 5-minute rows up to one row per DUID per hour.
+
+    Hours are labelled by their start, as pandas resample('1h') does.
+
+    Args:
+        integrated_data: Rows with settlementdate, duid, scadavalue, revenue_5min and price
+
+    Returns:
+        DataFrame with HOURLY_COLUMNS, sorted by DUID then hour
+    """
+    if integrated_data.empty:
+        return pd.DataFrame(columns=HOURLY_COLUMNS)
+
+    data = pd.DataFrame({
+        'duid': integrated_data['duid'],
+        'hour': integrated_data['settlementdate'].dt.floor('h'),
+        'scadavalue': integrated_data['scadavalue'],
+        'revenue_5min': integrated_data['revenue_5min'],
+        'price': integrated_data['price'],
+        'weighted_price': integrated_data['scadavalue'] * integrated_data['price']
+    })
+    hourly = data.groupby(['duid', 'hour'], observed=True).agg(
+        generation_sum=('scadavalue', 'sum'),
+        generation_min=('scadavalue', 'min'),
+        generation_max=('scadavalue', 'max'),
+        revenue_sum=('revenue_5min', 'sum'),
+        price_sum=('price', 'sum'),
+        weighted_price_sum=('weighted_price', 'sum'),
+        interval_count=('hour', 'size')
+    ).reset_index()
+    hourly['duid'] = hourly['duid'].astype(object)
+    return hourly[HOURLY_COLUMNS]
+
+
+def _period_path(period: pd.Period):
+    return config.duid_hourly_dir / f"{period}.parquet"
+
+
+def update_duid_hourly(since: Optional[datetime] = None) -> bool:
+    """
+    Bring the hourly rollup up to date with the generation and price files.
+
+    Hours from `since` onwards are recomputed from the 5-minute data and
+    earlier hours are kept. By default `since` is the last stored hour, which
+    may have been partial when it was written. Without any stored months the
+    rollup is built from the start of the generation history a month at a time.
+    A compacted year containing `since` is recomputed from its first month.
+
+    Args:
+        since: Recompute hours from this time (e.g. after repairing older data)
+
+    Returns:
+        bool: True if the rollup was updated
+    """
+    try:
+        gen_start, gen_end = parquet_time_range(config.gen_output_file, 'settlementdate')
+        if gen_start is None:
+            logger.warning("No generation data - DUID hourly rollup not updated")
+            return False
+
+        config.duid_hourly_dir.mkdir(exist_ok=True)
+        periods = sorted_periods(config.duid_hourly_dir)
+        if since is None and periods:
+            last = periods[-1]
+            # A compacted year is complete; the last hour of a month may have been partial
+            since = parquet_time_range(_period_path(last), 'hour')[1] if last.freqstr == 'M' else (last + 1).start_time
+        start = pd.Timestamp(since).floor('h') if since is not None else gen_start.floor('h')
+
+        for period in periods:
+            if period.freqstr != 'M' and period.end_time >= start:
+                start = min(start, period.start_time)
+                _period_path(period).unlink()
+
+        for month in pd.period_range(start, gen_end, freq='M'):
+            path = _period_path(month)
+            window_start = max(start, month.start_time)
+            frames = []
+            if window_start > month.start_time and path.exists():
+                frames.append(pd.read_parquet(path, filters=[('hour', '<', window_start)]))
+
+            hourly = _rollup_window(window_start, (month + 1).start_time)
+            if hourly is None:
+                return False
+            frames.append(hourly)
+
+            frames = [frame for frame in frames if not frame.empty]
+            if frames:
+                month_data = pd.concat(frames, ignore_index=True).sort_values(['duid', 'hour'], ignore_index=True)
+                write_sorted([month_data], path, sort_columns=('duid', 'hour'), row_group_size=ROW_GROUP_SIZE)
+
+        # Compact the months of closed years
+        months = [period for period in sorted_periods(config.duid_hourly_dir) if period.freqstr == 'M']
+        for year in sorted({month.year for month in months if month.year < gen_end.year}):
+            compact_sorted(
+                [_period_path(month) for month in months if month.year == year],
+                _period_path(pd.Period(str(year), freq='Y')),
+                sort_columns=('duid', 'hour'),
+                row_group_size=ROW_GROUP_SIZE
+            )
+
+        logger.info(f"DUID hourly rollup updated from {start}")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error updating DUID hourly rollup: {e}")
+        return False
+
+
+def _rollup_window(start: pd.Timestamp, end: pd.Timestamp) -> Optional[pd.DataFrame]:
+    """Integrate the intervals from start up to (not including) end and roll them up per DUID per hour"""
+    from .station_analysis import StationAnalysisMotor
+
+    motor = StationAnalysisMotor()
+    if not (motor.load_data(start, end - pd.Timedelta(seconds=1)) and motor.standardize_columns()):
+        return None
+    if motor.gen_data.empty or motor.price_data.empty:
+        return pd.DataFrame(columns=HOURLY_COLUMNS)
+    if not motor.integrate_data():
+        return None
+    return rollup_hourly(motor.integrated_data)
+
+
+def read_duid_hourly(duids: Union[str, List[str]], start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    Read the stored hourly rows of one or more DUIDs.
+
+    Args:
+        duids: DUID or list of DUIDs
+        start_date: Earliest hour to read (optional)
+        end_date: Latest hour to read (optional)
+
+    Returns:
+        DataFrame with HOURLY_COLUMNS (empty if nothing is stored)
+    """
+    duids = [duids] if isinstance(duids, str) else list(duids)
+    start = pd.Timestamp(start_date).floor('h') if start_date is not None else None
+    end = pd.Timestamp(end_date) if end_date is not None else None
+
+    paths = [
+        _period_path(period) for period in sorted_periods(config.duid_hourly_dir)
+        if (start is None or period.end_time >= start) and (end is None or period.start_time <= end)
+    ]
+    if not paths:
+        return pd.DataFrame(columns=HOURLY_COLUMNS)
+
+    filters = [('duid', 'in', duids)]
+    if start is not None:
+        filters.append(('hour', '>=', start))
+    if end is not None:
+        filters.append(('hour', '<=', end))
+
+    try:
+        return pd.read_parquet(paths, filters=filters)
+    except Exception as e:
+        logger.error(f"Error reading DUID hourly rollup: {e}")
+        return pd.DataFrame(columns=HOURLY_COLUMNS)
@@ -12,7 +12,10 @@ from typing import Dict, List, Tuple, Optional, Union
 import pickle
 from datetime import datetime, timedelta
 from ..shared.config import config
+from ..shared.duid_history import read_duid_history
+from ..shared.gen_info import clean_capacity
 from ..shared.logging_config import get_logger
+from .duid_hourly import read_duid_hourly, rollup_hourly
 
 logger = get_logger(__name__)
 
@@ -25,23 +28,45 @@ class StationAnalysisMotor:
         self.price_data = None 
         self.duid_mapping = None
         self.integrated_data = None
+        self.duid_order = None  # Rows of integrated_data ordered by DUID, then time
+        self.duid_offsets = {}  # DUID -> (start, end) of its rows in duid_order
+        self.data_version = None  # Identifies the integrated data (for result caching)
         self.station_data = None  # Filtered data for selected station
         logger.info("Station Analysis Motor initialized")
     
-    def load_data(self) -> bool:
+    def load_data(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                  duids: Optional[List[str]] = None) -> bool:
         """
         Load all required data files.
         
+        The date bounds are pushed down into the parquet reads, so the
+        integration only joins the selected window. With duids, only those
+        units' generation is loaded, from the DUID-sorted history.
+        
+        Args:
+            start_date: Earliest interval to load (optional)
+            end_date: Latest interval to load (optional)
+            duids: Only load generation for these DUIDs (optional)
+            
         Returns:
             bool: True if all data loaded successfully
         """
         try:
             logger.info("Loading generation data...")
-            self.gen_data = pd.read_parquet(config.gen_output_file)
+            if duids:
+                self.gen_data = read_duid_history(duids, start_date, end_date)
+            else:
+                self.gen_data = pd.read_parquet(
+                    config.gen_output_file,
+                    filters=self._date_filters('settlementdate', start_date, end_date)
+                )
             logger.info(f"Loaded {len(self.gen_data):,} generation records")
             
             logger.info("Loading price data...")
-            self.price_data = pd.read_parquet(config.spot_hist_file)
+            self.price_data = pd.read_parquet(
+                config.spot_hist_file,
+                filters=self._date_filters('SETTLEMENTDATE', start_date, end_date)
+            )
             logger.info(f"Loaded {len(self.price_data):,} price records")
             
             logger.info("Loading DUID mapping...")
@@ -55,6 +80,15 @@ class StationAnalysisMotor:
             logger.error(f"Error loading data: {e}")
             return False
     
+    def _date_filters(self, column: str, start_date: Optional[datetime], end_date: Optional[datetime]) -> Optional[List[Tuple]]:
+        """Parquet filters for start_date <= column <= end_date (pushed down to pyarrow)"""
+        filters = []
+        if start_date:
+            filters.append((column, '>=', pd.Timestamp(start_date)))
+        if end_date:
+            filters.append((column, '<=', pd.Timestamp(end_date)))
+        return filters or None
+    
     def standardize_columns(self) -> bool:
         """
         Standardize column names and data types across datasets.
@@ -93,16 +127,30 @@ class StationAnalysisMotor:
             logger.error(f"Error standardizing columns: {e}")
             return False
     
-    def integrate_data(self) -> bool:
+    def integrate_data(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> bool:
         """
         Integrate generation and price data for analysis.
         
+        Args:
+            start_date: Only integrate intervals from this time (optional)
+            end_date: Only integrate intervals up to this time (optional)
+            
         Returns:
             bool: True if integration successful
         """
         try:
             logger.info("Starting data integration...")
             
+            # Trim the join inputs to the window before merging
+            gen_data = self.gen_data
+            price_data = self.price_data
+            if start_date:
+                gen_data = gen_data[gen_data['settlementdate'] >= start_date]
+                price_data = price_data[price_data['SETTLEMENTDATE'] >= start_date]
+            if end_date:
+                gen_data = gen_data[gen_data['settlementdate'] <= end_date]
+                price_data = price_data[price_data['SETTLEMENTDATE'] <= end_date]
+            
             # First, prepare DUID mapping DataFrame
             if isinstance(self.duid_mapping, pd.DataFrame):
                 duid_df = self.duid_mapping.copy()
@@ -127,7 +175,7 @@ class StationAnalysisMotor:
             
             logger.info("Joining generation data with DUID mapping...")
             # First merge generation with DUID mapping to get Region
-            gen_with_mapping = self.gen_data.merge(
+            gen_with_mapping = gen_data.merge(
                 duid_df,
                 left_on='duid',
                 right_on='DUID',
@@ -144,7 +192,7 @@ class StationAnalysisMotor:
             logger.info("Joining with price data...")
             # Then merge with price data using Region
             self.integrated_data = gen_with_mapping.merge(
-                self.price_data,
+                price_data,
                 left_on=['settlementdate', 'Region'],
                 right_on=['SETTLEMENTDATE', 'REGIONID'],
                 how='inner'  # Only keep records where we have both generation and price
@@ -174,6 +222,10 @@ class StationAnalysisMotor:
             
             self.integrated_data.rename(columns=rename_dict, inplace=True)
             
+            self._build_duid_offsets()
+            times = self.integrated_data['settlementdate']
+            self.data_version = (times.min(), times.max(), len(self.integrated_data))
+            
             logger.info(f"Data integration completed. {len(self.integrated_data):,} records available")
             return True
             
@@ -181,6 +233,46 @@ class StationAnalysisMotor:
             logger.error(f"Error integrating data: {e}")
             return False
     
+    def _build_duid_offsets(self):
+        """
+        Index the rows of each DUID in integrated_data, in time order.
+        
+        duid_order is a permutation of the rows clustered by DUID, then time,
+        and duid_offsets gives each DUID's range in it. A station lookup then
+        binary-searches the dates within its DUIDs' ranges and takes only the
+        rows it returns, instead of masking (and copying) the whole dataset.
+        The permutation avoids reordering the wide integrated frame itself.
+        """
+        duid_codes, duids = pd.factorize(self.integrated_data['duid'], sort=True, use_na_sentinel=False)
+        times = self.integrated_data['settlementdate'].to_numpy()
+        if (times[1:] >= times[:-1]).all():
+            # Already in time order (the usual case) - a stable sort on DUID is enough
+            self.duid_order = np.argsort(duid_codes, kind='stable')
+        else:
+            self.duid_order = np.lexsort((times, duid_codes))
+        
+        counts = np.bincount(duid_codes, minlength=len(duids))
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        self.duid_offsets = {
+            duid: (start, end) for duid, start, end in zip(duids, starts.tolist(), ends.tolist())
+        }
+    
+    def _station_rows(self, duids: List[str], start_date: Optional[datetime], end_date: Optional[datetime]) -> np.ndarray:
+        """Row positions in integrated_data for the DUIDs within the date range"""
+        times = self.integrated_data['settlementdate'].to_numpy()
+        row_ranges = []
+        for duid in dict.fromkeys(duids):
+            if duid not in self.duid_offsets:
+                continue
+            start, end = self.duid_offsets[duid]
+            rows = self.duid_order[start:end]
+            duid_times = times[rows]
+            first = np.searchsorted(duid_times, pd.Timestamp(start_date).to_datetime64(), 'left') if start_date else 0
+            last = np.searchsorted(duid_times, pd.Timestamp(end_date).to_datetime64(), 'right') if end_date else len(rows)
+            row_ranges.append(rows[first:last])
+        return np.concatenate(row_ranges) if row_ranges else np.array([], dtype=np.int64)
+    
     def filter_station_data(self, duid_or_duids: Union[str, List[str]], start_date: Optional[datetime] = None, 
                            end_date: Optional[datetime] = None) -> bool:
         """
@@ -207,16 +299,8 @@ class StationAnalysisMotor:
                 duids = duid_or_duids
                 filter_description = f"station with {len(duids)} units: {', '.join(duids)}"
             
-            # Filter by DUID(s) (use lowercase column name from generation data)
-            station_filter = self.integrated_data['duid'].isin(duids)
-            
-            # Apply date filters if provided
-            if start_date:
-                station_filter &= self.integrated_data['settlementdate'] >= start_date
-            if end_date:
-                station_filter &= self.integrated_data['settlementdate'] <= end_date
-            
-            filtered_data = self.integrated_data[station_filter].copy()
+            # Take only the DUIDs' rows in the date range (via the offset index)
+            filtered_data = self.integrated_data.take(self._station_rows(duids, start_date, end_date))
             
             if len(filtered_data) == 0:
                 logger.warning(f"No data found for {filter_description}")
@@ -259,17 +343,108 @@ class StationAnalysisMotor:
             logger.error(f"Error filtering station data: {e}")
             return False
     
-    def calculate_time_of_day_averages(self) -> pd.DataFrame:
+    def calculate_hourly_series(self, duid_or_duids: Union[str, List[str]], start_date: Optional[datetime] = None,
+                                end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Hourly series for a DUID or station, from the hourly rollup (see duid_hourly).
+        
+        Hours the rollup does not cover yet (its last, possibly partial hour and
+        anything after it) are rolled up from the integrated data, so the series
+        matches resampling the station's 5-minute rows.
+        
+        Args:
+            duid_or_duids: Single DUID string or list of DUIDs for station aggregation
+            start_date: Start date for filtering (optional)
+            end_date: End date for filtering (optional)
+            
+        Returns:
+            DataFrame with settlementdate (hour start), mean scadavalue, price and
+            revenue_5min per interval, volume_weighted_price, scadavalue_min/max
+            (for a station, the sums of its units' extremes) and interval_count
+        """
+        try:
+            duids = [duid_or_duids] if isinstance(duid_or_duids, str) else list(duid_or_duids)
+            stored = read_duid_hourly(duids, start_date, end_date)
+            
+            rollup_start = start_date
+            if not stored.empty:
+                rollup_start = stored['hour'].max()
+                stored = stored[stored['hour'] < rollup_start]
+            recent = rollup_hourly(self.integrated_data.take(self._station_rows(duids, rollup_start, end_date)))
+            
+            unit_hours = pd.concat([frame for frame in [stored, recent] if not frame.empty] or [recent], ignore_index=True)
+            if unit_hours.empty:
+                return pd.DataFrame()
+            
+            # Combine the units: sums per hour, and the hour's intervals once (as station mode does)
+            hours = unit_hours.groupby('hour').agg(
+                generation_sum=('generation_sum', 'sum'),
+                generation_min=('generation_min', 'sum'),
+                generation_max=('generation_max', 'sum'),
+                revenue_sum=('revenue_sum', 'sum'),
+                price_sum=('price_sum', 'sum'),
+                weighted_price_sum=('weighted_price_sum', 'sum'),
+                price_count=('interval_count', 'sum'),
+                interval_count=('interval_count', 'max')
+            )
+            
+            series = pd.DataFrame({
+                'settlementdate': hours.index,
+                'scadavalue': hours['generation_sum'] / hours['interval_count'],
+                'price': hours['price_sum'] / hours['price_count'],
+                'revenue_5min': hours['revenue_sum'] / hours['interval_count'],
+                'volume_weighted_price': hours['weighted_price_sum'] / hours['generation_sum'].where(hours['generation_sum'] != 0),
+                'scadavalue_min': hours['generation_min'],
+                'scadavalue_max': hours['generation_max'],
+                'interval_count': hours['interval_count']
+            }).reset_index(drop=True)
+            
+            logger.info(f"Hourly series: {len(stored):,} stored and {len(recent):,} recent unit-hours -> {len(series):,} hours")
+            return series
+            
+        except Exception as e:
+            logger.error(f"Error calculating hourly series: {e}")
+            return pd.DataFrame()
+    
+    @staticmethod
+    def combine_hourly_series(series: pd.DataFrame, by) -> pd.DataFrame:
+        """
+        Combine hours of an hourly series (e.g. into days or hours of day).
+        
+        Args:
+            series: Result of calculate_hourly_series
+            by: Group keys aligned with the series (e.g. its settlementdate floored to days)
+            
+        Returns:
+            DataFrame of interval-weighted mean scadavalue, revenue_5min and price per group
+        """
+        columns = ['scadavalue', 'revenue_5min', 'price']
+        counts = series['interval_count'].groupby(by).sum()
+        return series[columns].mul(series['interval_count'], axis=0).groupby(by).sum().div(counts, axis=0)
+    
+    def calculate_time_of_day_averages(self, hourly_series: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Calculate average performance metrics by hour of day.
         
+        Args:
+            hourly_series: Hourly series of the selection (calculate_hourly_series);
+                if given, the averages are combined from it instead of the 5-minute rows
+        
         Returns:
             DataFrame with hourly statistics
         """
-        if self.station_data is None or len(self.station_data) == 0:
+        use_series = hourly_series is not None and not hourly_series.empty
+        if not use_series and (self.station_data is None or len(self.station_data) == 0):
             return pd.DataFrame()
         
         try:
+            if use_series:
+                hourly_stats = self.combine_hourly_series(
+                    hourly_series, hourly_series['settlementdate'].dt.hour.rename('hour')
+                ).reset_index()
+                logger.info(f"Calculated time-of-day averages for {len(hourly_stats)} hours from the hourly series")
+                return hourly_stats
+            
             # Extract hour from datetime
             hourly_data = self.station_data.copy()
             hourly_data['hour'] = hourly_data['settlementdate'].dt.hour
@@ -381,6 +556,151 @@ class StationAnalysisMotor:
             logger.error(f"Error calculating performance metrics: {e}")
             return {}
     
+    def calculate_league_table(self, stations: Optional[List[Dict]] = None) -> pd.DataFrame:
+        """
+        Calculate performance metrics for every DUID (and multi-unit station) at once.
+        
+        Gives the metrics of calculate_performance_metrics for all units, plus
+        their average output by hour of day (columns h00-h23), from one grouped
+        pass over the integrated data in DUID order (see _build_duid_offsets).
+        Station rows sum their units' output per interval, as in station mode.
+        
+        Args:
+            stations: Station entries (StationSearchEngine.station_index) to add
+                as station rows; each needs 'duids', 'station_base' and 'station_name'
+            
+        Returns:
+            DataFrame with one row per DUID/station, highest revenue first
+        """
+        if self.integrated_data is None or not self.duid_offsets:
+            return pd.DataFrame()
+        
+        try:
+            data = self.integrated_data
+            duids = list(self.duid_offsets)
+            bounds = np.array(list(self.duid_offsets.values()))
+            starts, counts = bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+            order = self.duid_order
+            
+            # Row values in DUID, then time order (missing values add nothing to the sums)
+            raw_generation = data['scadavalue'].to_numpy(dtype=float)[order]
+            generation = np.nan_to_num(raw_generation)
+            revenue = np.nan_to_num(data['revenue_5min'].to_numpy(dtype=float)[order])
+            weighted = np.nan_to_num(raw_generation * data['price'].to_numpy(dtype=float)[order])
+            slots, slot_times = pd.factorize(data['settlementdate'].to_numpy()[order])
+            slot_hours = pd.DatetimeIndex(slot_times).hour.to_numpy()
+            
+            # One grouped pass keyed by (DUID, hour of day)
+            keys = np.repeat(np.arange(len(duids)), counts) * 24 + slot_hours[slots]
+            size = len(duids) * 24
+            hourly_generation = np.bincount(keys, generation, size).reshape(-1, 24)
+            hourly_readings = np.bincount(keys, ~np.isnan(raw_generation), size).reshape(-1, 24)
+            totals = {
+                'generation': hourly_generation.sum(axis=1),
+                'revenue': np.bincount(keys, revenue, size).reshape(-1, 24).sum(axis=1),
+                'weighted': np.bincount(keys, weighted, size).reshape(-1, 24).sum(axis=1),
+                'intervals': counts,
+                'operating': np.bincount(keys, raw_generation > 0, size).reshape(-1, 24).sum(axis=1),
+                'peak': np.fmax.reduceat(raw_generation, starts),
+            }
+            with np.errstate(invalid='ignore', divide='ignore'):
+                profiles = hourly_generation / hourly_readings
+            
+            # Descriptive columns from each DUID's first interval
+            info = data.take(order[starts]).reset_index(drop=True)
+            capacity = info['capacity_mw'].map(clean_capacity).to_numpy(dtype=float)
+            tables = [self._league_rows('DUID', duids, info, capacity, totals, profiles)]
+            
+            if stations:
+                tables.append(self._station_league_rows(
+                    stations, duids, starts, counts, info, capacity, totals, generation, slots, slot_hours
+                ))
+            
+            league = pd.concat(tables, ignore_index=True)
+            league = league.sort_values('total_revenue_millions', ascending=False, ignore_index=True)
+            logger.info(f"Calculated league table for {len(league)} DUIDs and stations")
+            return league
+            
+        except Exception as e:
+            logger.error(f"Error calculating league table: {e}")
+            return pd.DataFrame()
+    
+    def _station_league_rows(self, stations, duids, starts, counts, unit_info, capacity, totals, generation, slots, slot_hours) -> pd.DataFrame:
+        """League rows for multi-unit stations, from their units' rows (see calculate_league_table)"""
+        code_of = {duid: code for code, duid in enumerate(duids)}
+        n_slots = slots.max() + 1
+        entries, station_totals, profiles = [], [], []
+        for station in stations:
+            codes = [code_of[duid] for duid in station['duids'] if duid in code_of]
+            if not codes:
+                continue
+            rows = np.concatenate([np.arange(starts[code], starts[code] + counts[code]) for code in codes])
+            
+            # Station output per interval (units summed), as in station mode
+            present = np.bincount(slots[rows], minlength=n_slots) > 0
+            station_generation = np.bincount(slots[rows], generation[rows], n_slots)[present]
+            hours = slot_hours[present]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                profiles.append(np.bincount(hours, station_generation, 24) / np.bincount(hours, minlength=24))
+            
+            station_totals.append({
+                'generation': totals['generation'][codes].sum(),
+                'revenue': totals['revenue'][codes].sum(),
+                'weighted': totals['weighted'][codes].sum(),
+                'intervals': present.sum(),
+                'operating': (station_generation > 0).sum(),
+                'peak': station_generation.max(),
+                'capacity': capacity[codes].sum(),
+            })
+            entries.append({
+                'station_name': station.get('station_name'),
+                'region': station.get('region'),
+                # The station index has no fuel for some mapping formats - use the units'
+                'Fuel': station.get('fuel') or (unit_info['Fuel'].iloc[codes[0]] if 'Fuel' in unit_info else None),
+                'owner': station.get('owner'),
+                'id': station['station_base'],
+            })
+        
+        if not entries:
+            return pd.DataFrame()
+        station_totals = pd.DataFrame(station_totals)
+        info = pd.DataFrame(entries)
+        return self._league_rows(
+            'Station', info['id'].tolist(), info, station_totals.pop('capacity').to_numpy(),
+            {column: station_totals[column].to_numpy() for column in station_totals}, np.vstack(profiles)
+        )
+    
+    def _league_rows(self, row_type: str, ids: List[str], info: pd.DataFrame, capacity: np.ndarray,
+                     totals: Dict[str, np.ndarray], profiles: np.ndarray) -> pd.DataFrame:
+        """League table rows from per-row totals, using the calculate_performance_metrics formulas"""
+        generation_mwh = totals['generation'] * (5/60)  # Convert to MWh
+        hours_in_period = totals['intervals'] * (5/60)  # Convert 5-min intervals to hours
+        with np.errstate(invalid='ignore', divide='ignore'):
+            average_price = np.where(totals['generation'] > 0, totals['weighted'] / totals['generation'], 0)
+            capacity_factor = np.where(
+                (capacity > 0) & (hours_in_period > 0),
+                generation_mwh / (capacity * hours_in_period) * 100,
+                0
+            )
+        
+        rows = pd.DataFrame({
+            'type': row_type,
+            'id': ids,
+            'station_name': info['station_name'].to_numpy() if 'station_name' in info else None,
+            'region': info['region'].to_numpy() if 'region' in info else None,
+            'fuel_type': info['Fuel'].to_numpy() if 'Fuel' in info else None,
+            'owner': info['owner'].to_numpy() if 'owner' in info else None,
+            'capacity_mw': capacity,
+            'total_generation_gwh': generation_mwh / 1000,  # Convert to GWh
+            'total_revenue_millions': totals['revenue'] / 1_000_000,  # Convert to millions
+            'average_price': average_price,
+            'capacity_factor': capacity_factor,
+            'operating_hours': totals['operating'] * (5/60),
+            'peak_generation': totals['peak'],
+        })
+        profile_columns = pd.DataFrame(profiles, columns=[f"h{hour:02d}" for hour in range(24)])
+        return pd.concat([rows, profile_columns], axis=1)
+    
     def get_available_duids(self) -> List[str]:
         """
         Get list of all available DUIDs from the mapping.
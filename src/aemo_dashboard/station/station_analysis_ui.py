@@ -2,12 +2,15 @@
 Station Analysis UI Components - User interface for individual station analysis.
 
 This module provides Panel components for the Station Analysis tab with Material theme styling,
-including search interface, time series charts, time-of-day analysis, and summary statistics.
+including search interface, time series charts, time-of-day analysis, summary statistics
+and a league table of all units and stations.
 """
 
+import pickle
 import pandas as pd
 import panel as pn
 import param
+import threading
 import holoviews as hv
 import hvplot.pandas
 from typing import Dict, List, Optional
@@ -15,10 +18,59 @@ from datetime import datetime, timedelta
 
 from .station_analysis import StationAnalysisMotor
 from .station_search import StationSearchEngine
+from ..shared.background import RequestCoordinator, run_in_background
+from ..shared.config import config
+from ..shared.shared_data import get_shared
 from ..shared.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+LEAGUE_COLUMNS = {
+    'type': 'Type',
+    'id': 'DUID / Station',
+    'station_name': 'Name',
+    'region': 'Region',
+    'fuel_type': 'Fuel',
+    'owner': 'Owner',
+    'capacity_mw': 'Capacity (MW)',
+    'total_generation_gwh': 'Generation (GWh)',
+    'total_revenue_millions': 'Revenue ($M)',
+    'average_price': 'Avg Price ($/MWh)',
+    'capacity_factor': 'Capacity Factor (%)',
+    'operating_hours': 'Operating Hours',
+    'peak_generation': 'Peak (MW)',
+}
+
+
+def _load_search_engine():
+    """Build the station search index from gen_info (None on failure)"""
+    try:
+        with open(config.gen_info_file, 'rb') as f:
+            return StationSearchEngine(pickle.load(f))
+    except Exception as e:
+        logger.error(f"Error building station search index: {e}")
+        return None
+
+
+def _load_league_table(stations):
+    """
+    League table over the whole generation history (None on failure).
+    
+    The only view that needs every unit's history: the motor is loaded for it
+    and dropped once the table is built.
+    """
+    logger.info("Loading data for the station league table...")
+    motor = StationAnalysisMotor()
+    if not motor.load_data():
+        logger.error("Failed to load data")
+    elif not motor.standardize_columns():
+        logger.error("Failed to standardize columns")
+    elif not motor.integrate_data():
+        logger.error("Failed to integrate data")
+    else:
+        return motor.calculate_league_table(stations).round(2)
+    return None
+
 # Custom CSS for Material Design styling
 MATERIAL_CSS = """
 /* Material Design Card styling */
@@ -215,8 +267,13 @@ class StationAnalysisUI(param.Parameterized):
     def __init__(self):
         super().__init__()
         self.motor = StationAnalysisMotor()
+        self._loaded_selection = None  # (DUIDs, start, end) the motor holds
         self.search_engine = None
         self.data_loaded = False
+        # Serialises station filtering running in the background worker pool
+        self._compute_lock = threading.Lock()
+        # Only the latest station/date selection is rendered
+        self._requests = RequestCoordinator(lock=self._compute_lock, description='station analysis')
         
         # UI components
         self.search_input = None
@@ -235,22 +292,16 @@ class StationAnalysisUI(param.Parameterized):
         logger.info("Station Analysis UI initialized")
     
     def _initialize_components(self):
-        """Initialize the analysis motor and search engine"""
+        """Initialize the search engine
+
+        The search index is read-only and shared by all sessions. Generation
+        data is only loaded when a station is picked (see _load_selection).
+        """
         try:
-            logger.info("Loading data into station analysis motor...")
-            if self.motor.load_data():
-                if self.motor.standardize_columns():
-                    if self.motor.integrate_data():
-                        self.data_loaded = True
-                        # Initialize search engine with loaded DUID mapping
-                        self.search_engine = StationSearchEngine(self.motor.duid_mapping)
-                        logger.info("Station analysis components initialized successfully")
-                    else:
-                        logger.error("Failed to integrate data")
-                else:
-                    logger.error("Failed to standardize columns")
-            else:
-                logger.error("Failed to load data")
+            self.search_engine = get_shared('station search engine', _load_search_engine)
+            if self.search_engine is not None:
+                self.data_loaded = True
+                logger.info("Station analysis components initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing components: {e}")
             self.data_loaded = False
@@ -265,13 +316,30 @@ class StationAnalysisUI(param.Parameterized):
         search_card = self._create_search_card()
         self.charts_section = self._create_charts_section()
         
+        self.league_section = pn.Column(
+            pn.pane.Markdown("Calculating league table..."),
+            sizing_mode='stretch_width',
+            min_height=200
+        )
+        
         # Simple layout without redundant titles or status
-        main_layout = pn.Row(
-            search_card,
-            self.charts_section,
+        main_layout = pn.Column(
+            pn.Row(
+                search_card,
+                self.charts_section,
+                sizing_mode='stretch_width'
+            ),
+            self.league_section,
             sizing_mode='stretch_width'
         )
         
+        run_in_background(
+            self._build_league_table,
+            self._show_league_table,
+            loading=[self.league_section],
+            description='station league table'
+        )
+        
         return main_layout
     
     def _create_search_card(self):
@@ -588,7 +656,37 @@ class StationAnalysisUI(param.Parameterized):
             logger.error(f"Error showing search feedback: {e}")
     
     def _update_station_analysis(self):
-        """Update analysis charts and tables for the selected station"""
+        """Update analysis charts and tables for the selected station
+
+        Filtering, metrics and chart building run in the background worker
+        pool; the charts section is swapped on the session's document.
+        """
+        self._requests.request(
+            self._build_station_analysis,
+            self._show_station_analysis,
+            loading=[getattr(self, 'charts_section', None)]
+        )
+    
+    def _show_station_analysis(self, result):
+        """Show the content built by _build_station_analysis (or a feedback message)"""
+        if result is None:
+            return
+        if isinstance(result, str):
+            self._show_search_feedback(result)
+            return
+        
+        # Replace content
+        if hasattr(self, 'charts_section') and self.charts_section:
+            self.charts_section[:] = [result]
+            logger.info(f"Charts section updated")
+    
+    def _build_station_analysis(self):
+        """
+        Filter the data and build the analysis content for the selected station.
+        
+        Returns:
+            Panel layout to show, a feedback message string, or None
+        """
         try:
             # Determine what to analyze based on mode
             if self.analysis_mode == 'station' and self.selected_station_duids:
@@ -599,7 +697,7 @@ class StationAnalysisUI(param.Parameterized):
                 display_name = self.selected_duid
             else:
                 logger.warning("No station or DUID selected for analysis")
-                return
+                return None
             
             logger.info(f"Starting analysis for {display_name} in {self.analysis_mode} mode")
             
@@ -609,7 +707,8 @@ class StationAnalysisUI(param.Parameterized):
             
             logger.info(f"Filtering data from {start_dt} to {end_dt}")
             
-            if self.motor.filter_station_data(filter_target, start_dt, end_dt):
+            if self._load_selection(filter_target, start_dt, end_dt) and \
+                    self.motor.filter_station_data(filter_target, start_dt, end_dt):
                 
                 logger.info(f"Successfully filtered {len(self.motor.station_data)} records for {self.selected_duid}")
                 
@@ -618,14 +717,17 @@ class StationAnalysisUI(param.Parameterized):
                 metrics = self.motor.calculate_performance_metrics()
                 logger.info(f"Calculated metrics: {list(metrics.keys()) if metrics else 'None'}")
                 
+                # Hourly series from the precomputed rollup (for long periods and time-of-day)
+                hourly_series = self.motor.calculate_hourly_series(filter_target, start_dt, end_dt)
+                
                 # Calculate time-of-day averages
                 logger.info("Calculating time-of-day averages...")
-                time_of_day = self.motor.calculate_time_of_day_averages()
+                time_of_day = self.motor.calculate_time_of_day_averages(hourly_series)
                 logger.info(f"Time-of-day data shape: {time_of_day.shape if not time_of_day.empty else 'Empty'}")
                 
                 # Create components
                 logger.info("Creating time series charts...")
-                time_series_charts = self._create_time_series_charts()
+                time_series_charts = self._create_time_series_charts(hourly_series)
                 
                 logger.info("Creating time-of-day chart...")
                 time_of_day_chart = self._create_time_of_day_chart(time_of_day)
@@ -633,83 +735,108 @@ class StationAnalysisUI(param.Parameterized):
                 logger.info("Creating summary statistics...")
                 summary_stats = self._create_summary_statistics(metrics)
                 
-                # Update the charts section using proper Panel pattern
-                if hasattr(self, 'charts_section') and self.charts_section:
-                    # Get appropriate display name based on mode
-                    if self.analysis_mode == 'station' and self.selected_station_duids:
-                        # For station mode, use the first DUID to get station name
-                        station_info = self.search_engine.get_station_info(self.selected_station_duids[0])
-                        station_name = station_info.get('station_name', 'Unknown Station')
-                        display_title = f"{station_name} (Station: {len(self.selected_station_duids)} units)"
-                    else:
-                        # For DUID mode
-                        station_info = self.search_engine.get_station_info(self.selected_duid)
-                        station_name = station_info.get('station_name', self.selected_duid)
-                        display_title = f"{station_name} ({self.selected_duid})"
-                    
-                    logger.info(f"Updating charts section for {display_title}")
-                    
-                    # Create simple tabs without too many levels
-                    # For Time Series tab, put chart and stats side by side with better proportions
-                    chart_wrapper = pn.Column(time_series_charts, sizing_mode='stretch_width')
-                    time_series_content = pn.Row(
-                        chart_wrapper,  # Chart takes remaining space
-                        pn.Spacer(width=15),  # Small gap
-                        summary_stats,  # Fixed width table
-                        sizing_mode='stretch_width'
-                    )
-                    
-                    chart_tabs = pn.Tabs(
-                        ("Time Series", time_series_content),
-                        ("Time-of-Day", time_of_day_chart),
-                        dynamic=True,
-                        sizing_mode='stretch_width'
-                    )
-                    
-                    # Update with cleaner layout
-                    new_content = pn.Column(
-                        pn.pane.Markdown(f"## {display_title}", styles={'margin': '10px 0'}),
-                        chart_tabs,
-                        sizing_mode='stretch_width'
-                    )
-                    
-                    # Replace content
-                    self.charts_section[:] = [new_content]
-                    logger.info(f"Charts section updated")
+                # Get appropriate display name based on mode
+                if self.analysis_mode == 'station' and self.selected_station_duids:
+                    # For station mode, use the first DUID to get station name
+                    station_info = self.search_engine.get_station_info(self.selected_station_duids[0])
+                    station_name = station_info.get('station_name', 'Unknown Station')
+                    display_title = f"{station_name} (Station: {len(self.selected_station_duids)} units)"
+                else:
+                    # For DUID mode
+                    station_info = self.search_engine.get_station_info(self.selected_duid)
+                    station_name = station_info.get('station_name', self.selected_duid)
+                    display_title = f"{station_name} ({self.selected_duid})"
+                
+                logger.info(f"Updating charts section for {display_title}")
+                
+                # Create simple tabs without too many levels
+                # For Time Series tab, put chart and stats side by side with better proportions
+                chart_wrapper = pn.Column(time_series_charts, sizing_mode='stretch_width')
+                time_series_content = pn.Row(
+                    chart_wrapper,  # Chart takes remaining space
+                    pn.Spacer(width=15),  # Small gap
+                    summary_stats,  # Fixed width table
+                    sizing_mode='stretch_width'
+                )
+                
+                chart_tabs = pn.Tabs(
+                    ("Time Series", time_series_content),
+                    ("Time-of-Day", time_of_day_chart),
+                    dynamic=True,
+                    sizing_mode='stretch_width'
+                )
+                
+                # Update with cleaner layout
+                return pn.Column(
+                    pn.pane.Markdown(f"## {display_title}", styles={'margin': '10px 0'}),
+                    chart_tabs,
+                    sizing_mode='stretch_width'
+                )
                 
             else:
                 logger.warning(f"No data available for {self.selected_duid} in the specified time period")
-                self._show_search_feedback(f"No data available for {self.selected_duid} in the selected time period.")
+                return f"No data available for {self.selected_duid} in the selected time period."
                 
         except Exception as e:
             logger.error(f"Error updating station analysis: {e}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
+            return None
     
-    def _create_time_series_charts(self):
-        """Create dual-axis time series chart with smart resampling"""
+    def _load_selection(self, duids, start_dt, end_dt) -> bool:
+        """
+        Load the selected units' generation for the date range into the motor.
+        
+        Reads only those DUIDs, from the DUID-sorted history (read_duid_history),
+        and is skipped when the motor already holds this selection.
+        """
+        duids = [duids] if isinstance(duids, str) else list(duids)
+        selection = (tuple(duids), start_dt, end_dt)
+        if selection == self._loaded_selection:
+            return True
+        
+        motor = StationAnalysisMotor()
+        if not (motor.load_data(start_dt, end_dt, duids=duids) and motor.standardize_columns()
+                and motor.integrate_data()):
+            logger.error(f"Failed to load data for {', '.join(duids)}")
+            return False
+        self.motor = motor
+        self._loaded_selection = selection
+        return True
+    
+    def _create_time_series_charts(self, hourly_series=None):
+        """Create dual-axis time series chart with smart resampling
+        
+        Periods over 2 days are drawn from the hourly series (see
+        StationAnalysisMotor.calculate_hourly_series), combined into days for
+        periods over a year, rather than resampling the 5-minute rows.
+        """
         try:
             if self.motor.station_data is None or len(self.motor.station_data) == 0:
                 return pn.pane.Markdown("No data available for time series analysis.")
             
-            data = self.motor.station_data.copy()
-            
-            # Ensure settlementdate is properly formatted
-            if data['settlementdate'].dtype != 'datetime64[ns]':
-                data['settlementdate'] = pd.to_datetime(data['settlementdate'])
-            
-            # Set settlementdate as index for resampling
-            data = data.set_index('settlementdate').sort_index()
-            
             # Determine if we need resampling based on time period
-            time_span = data.index.max() - data.index.min()
+            settlement_dates = pd.to_datetime(self.motor.station_data['settlementdate'])
+            time_span = settlement_dates.max() - settlement_dates.min()
             time_span_days = time_span.total_seconds() / (24 * 3600)
             
             logger.info(f"Time span: {time_span_days:.1f} days")
             
-            if time_span_days > 2:
+            if time_span_days > 2 and hourly_series is not None and not hourly_series.empty:
+                if time_span_days > 365:
+                    # Daily points for periods over a year
+                    logger.info("Using daily data from the hourly series for time series chart")
+                    days = hourly_series['settlementdate'].dt.floor('D')
+                    chart_data = self.motor.combine_hourly_series(hourly_series, days)[['price', 'scadavalue']].dropna()
+                    freq_label = "Daily"
+                else:
+                    logger.info("Using the hourly series for time series chart")
+                    chart_data = hourly_series.set_index('settlementdate')[['price', 'scadavalue']].dropna()
+                    freq_label = "Hourly"
+            elif time_span_days > 2:
                 # Resample to hourly for longer periods
                 logger.info("Resampling to hourly data for time series chart")
+                data = self.motor.station_data.set_index('settlementdate').sort_index()
                 chart_data = data.resample('1h').agg({
                     'price': 'mean',           # Average price per hour
                     'scadavalue': 'mean'       # Average generation per hour
@@ -718,7 +845,7 @@ class StationAnalysisUI(param.Parameterized):
             else:
                 # Use 5-minute data for short periods
                 logger.info("Using 5-minute data for time series chart")
-                chart_data = data[['price', 'scadavalue']].dropna()
+                chart_data = self.motor.station_data.set_index('settlementdate').sort_index()[['price', 'scadavalue']].dropna()
                 freq_label = "5-minute"
             
             if len(chart_data) == 0:
@@ -931,6 +1058,49 @@ class StationAnalysisUI(param.Parameterized):
             logger.error(f"Error creating summary statistics: {e}")
             return pn.pane.Markdown(f"Error creating summary statistics: {e}")
 
+    def _build_league_table(self):
+        """
+        League table of every DUID and multi-unit station over the whole history.
+        
+        Returns:
+            DataFrame with display columns (shared by all sessions)
+        """
+        try:
+            return get_shared('station league table',
+                              lambda: _load_league_table(self.search_engine.station_index))
+            
+        except Exception as e:
+            logger.error(f"Error building league table: {e}")
+            return pd.DataFrame()
+    
+    def _show_league_table(self, league):
+        """Show the league table built by _build_league_table"""
+        try:
+            if league is None or league.empty:
+                self.league_section[:] = [pn.pane.Markdown("No league table available.")]
+                return
+            
+            profile_columns = [column for column in league.columns if column not in LEAGUE_COLUMNS]
+            league_table = pn.widgets.Tabulator(
+                league.rename(columns=LEAGUE_COLUMNS),
+                hidden_columns=profile_columns,  # Hourly output profile h00-h23
+                pagination='local',
+                page_size=20,
+                theme='midnight',
+                show_index=False,
+                disabled=True,
+                sizing_mode='stretch_width'
+            )
+            
+            self.league_section[:] = [
+                pn.pane.Markdown("### League Table - All Units and Stations"),
+                league_table
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error showing league table: {e}")
+            self.league_section[:] = [pn.pane.Markdown(f"Error creating league table: {e}")]
+
 def create_station_analysis_tab():
     """
     Create and return the Station Analysis tab component.
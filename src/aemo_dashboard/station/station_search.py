@@ -3,15 +3,104 @@ Station Search Engine - Fuzzy search functionality for stations and DUIDs.
 
 This module provides approximate search capabilities to help users find stations
 by name or DUID with auto-suggestions and fuzzy matching.
+
+Searches run on every keystroke, so the entries are indexed when the engine is
+built: an n-gram inverted index shortlists the entries sharing text with the
+query, which are then scored in one batch (rapidfuzz cdist), and a prefix trie
+answers auto-complete suggestions. Only shortlisted entries are scored, so a
+weak fuzzy match sharing no text with the query may be missed.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz, process
 from ..shared.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+NGRAM_SIZES = (2, 3)
+
+
+def _ngrams(text: str, size: int) -> set:
+    """Character n-grams of text"""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class _FuzzyIndex:
+    """
+    Bigram and trigram inverted index over search entries, with batch partial_ratio scoring.
+    
+    Entries sharing the most n-grams with the query are shortlisted and scored
+    together, so the work per query is bounded by shortlist_size rather than
+    the number of entries.
+    """
+    
+    def __init__(self, entries: List[Dict], fields: List[str], shortlist_size: int = 200):
+        self.shortlist_size = shortlist_size
+        # Lower-cased field values, one array per scored field
+        self.fields = {field: np.array([entry[field].lower() for entry in entries], dtype=object) for field in fields}
+        
+        postings = {}
+        for entry_id, entry in enumerate(entries):
+            for size in NGRAM_SIZES:
+                for gram in _ngrams(entry['searchable_text'], size):
+                    postings.setdefault(gram, []).append(entry_id)
+        self.postings = {gram: np.array(ids) for gram, ids in postings.items()}
+        self.size = len(entries)
+    
+    def shortlist(self, query: str, size: int, exclude: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Ids of the entries sharing the most n-grams of the given size with query.
+        
+        Args:
+            query: Lower-cased query
+            size: N-gram size (one of NGRAM_SIZES)
+            exclude: Entry ids to leave out (e.g. an earlier shortlist)
+            
+        Returns:
+            Up to shortlist_size entry ids, in index order
+        """
+        grams = [self.postings[gram] for gram in _ngrams(query, size) if gram in self.postings]
+        if not grams:
+            return np.array([], dtype=int)
+        overlap = np.bincount(np.concatenate(grams), minlength=self.size)
+        if exclude is not None:
+            overlap[exclude] = 0
+        matched = np.flatnonzero(overlap)
+        if len(matched) > self.shortlist_size:
+            matched = matched[np.argsort(-overlap[matched], kind='stable')[:self.shortlist_size]]
+        return np.sort(matched)
+    
+    def scores(self, query: str, entry_ids: np.ndarray) -> Dict[str, np.ndarray]:
+        """partial_ratio of query against each field of the given entries (0-100 integers)"""
+        return {
+            field: np.rint(process.cdist([query], values[entry_ids], scorer=fuzz.partial_ratio)[0]).astype(int)
+            for field, values in self.fields.items()
+        }
+
+
+class _PrefixTrie:
+    """Prefix trie mapping each prefix of the inserted keys to entry ids, in insertion order"""
+    
+    def __init__(self):
+        self.root = {}
+    
+    def insert(self, key: str, entry_id: int):
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+            node.setdefault(None, []).append(entry_id)
+    
+    def find(self, prefix: str) -> List[int]:
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get(None, [])
+
+
 class StationSearchEngine:
     """Fuzzy search engine for stations and DUIDs with aggregation support"""
     
@@ -25,6 +114,14 @@ class StationSearchEngine:
         self.duid_mapping = duid_mapping
         self.search_index = self._build_search_index()
         self.station_index = self._build_station_index()  # New: Station-level aggregation
+        
+        # Search structures over both indexes
+        self._duid_search = _FuzzyIndex(self.search_index, ['duid', 'station_name', 'searchable_text'])
+        self._station_search = _FuzzyIndex(self.station_index, ['station_name', 'searchable_text'])
+        self._prefix_trie = _PrefixTrie()
+        for entry_id, entry in enumerate(self.search_index):
+            self._prefix_trie.insert(entry['duid'].lower(), entry_id)
+            self._prefix_trie.insert(entry['station_name'].lower(), entry_id)
         logger.info(f"Search engine initialized with {len(self.search_index)} DUIDs and {len(self.station_index)} stations")
     
     def _build_search_index(self) -> List[Dict]:
@@ -40,25 +137,31 @@ class StationSearchEngine:
         if hasattr(self.duid_mapping, 'iterrows'):
             # It's a DataFrame - transpose to get DUIDs as index
             if 'DUID' in self.duid_mapping.columns:
-                # DUIDs are in a column
-                for _, row in self.duid_mapping.iterrows():
-                    duid = row['DUID']
-                    station_name = row.get('Site Name', row.get('Station Name', '')).strip() if pd.notna(row.get('Site Name', row.get('Station Name', ''))) else ''
-                    owner = row.get('Owner', '').strip() if pd.notna(row.get('Owner', '')) else ''
-                    region = row.get('Region', '').strip() if pd.notna(row.get('Region', '')) else ''
-                    capacity = row.get('Capacity(MW)', row.get('Nameplate Capacity (MW)', 0))
-                    capacity = capacity if pd.notna(capacity) else 0
-                    
+                # DUIDs are in a column - clean whole columns, then build the entries
+                mapping = self.duid_mapping
+                
+                def text_column(*names):
+                    for name in names:
+                        if name in mapping.columns:
+                            return mapping[name].where(mapping[name].notna(), '').astype(str).str.strip()
+                    return pd.Series('', index=mapping.index)
+                
+                station_names = text_column('Site Name', 'Station Name')
+                owners = text_column('Owner')
+                regions = text_column('Region')
+                capacity_column = next((name for name in ['Capacity(MW)', 'Nameplate Capacity (MW)'] if name in mapping.columns), None)
+                capacities = pd.to_numeric(mapping[capacity_column], errors='coerce').fillna(0) if capacity_column else pd.Series(0.0, index=mapping.index)
+                
+                for duid, station_name, owner, region, capacity in zip(mapping['DUID'], station_names, owners, regions, capacities):
                     search_entry = {
                         'duid': duid,
                         'station_name': station_name,
                         'owner': owner,
                         'fuel': '',  # May not be available in this format
                         'region': region,
-                        'capacity_mw': float(capacity) if capacity else 0,
+                        'capacity_mw': float(capacity),
                         'searchable_text': f"{duid} {station_name} {owner}".lower(),
-                        'display_name': f"{station_name} ({duid})" if station_name else duid,
-                        'full_info': row.to_dict()
+                        'display_name': f"{station_name} ({duid})" if station_name else duid
                     }
                     index.append(search_entry)
             else:
@@ -79,8 +182,7 @@ class StationSearchEngine:
                             'region': str(region).strip() if pd.notna(region) else '',
                             'capacity_mw': float(capacity) if pd.notna(capacity) and capacity else 0,
                             'searchable_text': f"{duid} {station_name} {owner}".lower(),
-                            'display_name': f"{station_name} ({duid})" if station_name else duid,
-                            'full_info': df_T[duid].to_dict()
+                            'display_name': f"{station_name} ({duid})" if station_name else duid
                         }
                         index.append(search_entry)
                     except Exception as e:
@@ -102,8 +204,7 @@ class StationSearchEngine:
                     'region': region,
                     'capacity_mw': info.get('Nameplate Capacity (MW)', 0),
                     'searchable_text': f"{duid} {station_name} {owner} {fuel}".lower(),
-                    'display_name': f"{station_name} ({duid})" if station_name else duid,
-                    'full_info': info
+                    'display_name': f"{station_name} ({duid})" if station_name else duid
                 }
                 index.append(search_entry)
         
@@ -197,41 +298,48 @@ class StationSearchEngine:
             return []
         
         query = query.lower().strip()
-        results = []
         
         # Choose which index to search based on mode
         search_data = self.station_index if mode == 'station' else self.search_index
+        fuzzy_index = self._station_search if mode == 'station' else self._duid_search
         
-        for entry in search_data:
-            # Calculate fuzzy match scores for different fields
-            if mode == 'station':
-                # For station mode, no DUID matching - focus on station name
-                name_score = fuzz.partial_ratio(query, entry['station_name'].lower())
-                text_score = fuzz.partial_ratio(query, entry['searchable_text'])
-                best_score = max(name_score, text_score)
-                
-                # Boost exact station name matches
-                if query.lower() in entry['station_name'].lower():
-                    best_score = min(100, best_score + 20)
-            else:
-                # For DUID mode, include DUID scoring
-                duid_score = fuzz.partial_ratio(query, entry['duid'].lower())
-                name_score = fuzz.partial_ratio(query, entry['station_name'].lower())
-                text_score = fuzz.partial_ratio(query, entry['searchable_text'])
-                best_score = max(duid_score, name_score, text_score)
-                
-                # Boost exact DUID matches
-                if query.upper() == entry['duid'].upper():
-                    best_score = 100
-            
-            if best_score >= min_score:
-                result = entry.copy()
-                result['score'] = best_score
-                results.append(result)
-        
-        # Sort by score (descending) and limit results
-        results.sort(key=lambda x: x['score'], reverse=True)
-        return results[:limit]
+        candidates = fuzzy_index.shortlist(query, min(len(query), max(NGRAM_SIZES)))
+        entry_ids, scores = self._score_candidates(fuzzy_index, query, candidates, min_score, mode)
+        if len(entry_ids) < limit and len(query) > min(NGRAM_SIZES):
+            # Too few matches (e.g. a misspelt query) - also score entries sharing character pairs
+            others = fuzzy_index.shortlist(query, min(NGRAM_SIZES), exclude=candidates)
+            more_ids, more_scores = self._score_candidates(fuzzy_index, query, others, min_score, mode)
+            entry_ids = np.concatenate([entry_ids, more_ids])
+            scores = np.concatenate([scores, more_scores])
+        
+        # Sort by score (descending, ties in index order) and limit results
+        order = np.lexsort((entry_ids, -scores))[:limit]
+        results = []
+        for entry_id, score in zip(entry_ids[order], scores[order]):
+            result = search_data[entry_id].copy()
+            result['score'] = int(score)
+            results.append(result)
+        return results
+    
+    def _score_candidates(self, fuzzy_index: _FuzzyIndex, query: str, entry_ids: np.ndarray,
+                          min_score: int, mode: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Best field score of each candidate entry, keeping those reaching min_score"""
+        if len(entry_ids) == 0:
+            return entry_ids, np.array([], dtype=int)
+        
+        field_scores = fuzzy_index.scores(query, entry_ids)
+        best_scores = np.max(np.vstack(list(field_scores.values())), axis=0)
+        if mode == 'station':
+            # Boost exact station name matches
+            names = fuzzy_index.fields['station_name'][entry_ids]
+            contains = np.fromiter((query in name for name in names), dtype=bool, count=len(names))
+            best_scores = np.where(contains, np.minimum(100, best_scores + 20), best_scores)
+        else:
+            # Boost exact DUID matches
+            best_scores = np.where(fuzzy_index.fields['duid'][entry_ids] == query, 100, best_scores)
+        
+        keep = best_scores >= min_score
+        return entry_ids[keep], best_scores[keep]
     
     def get_suggestions(self, partial_query: str, limit: int = 5) -> List[str]:
         """
@@ -247,18 +355,18 @@ class StationSearchEngine:
         if not partial_query or len(partial_query.strip()) < 1:
             return []
         
-        suggestions = []
         query = partial_query.lower().strip()
         
-        for entry in self.search_index:
-            # Check if any field starts with the query
-            if (entry['duid'].lower().startswith(query) or 
-                entry['station_name'].lower().startswith(query)):
-                suggestions.append(entry['display_name'])
-        
-        # Remove duplicates and limit
-        suggestions = list(dict.fromkeys(suggestions))  # Preserves order while removing duplicates
-        return suggestions[:limit]
+        # Entries whose DUID or station name starts with the query, in index order
+        entry_ids = sorted(set(self._prefix_trie.find(query)))
+        suggestions = []
+        for entry_id in entry_ids:
+            display_name = self.search_index[entry_id]['display_name']
+            if display_name not in suggestions:  # Remove duplicates, preserving order
+                suggestions.append(display_name)
+                if len(suggestions) == limit:
+                    break
+        return suggestions
     
     def get_exact_match(self, query: str) -> Optional[Dict]:
         """
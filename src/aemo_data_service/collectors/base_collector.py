@@ -168,6 +168,59 @@ class BaseCollector(ABC):
             logger.error(f"{self.name}: Error adding new data: {e}")
             return False
     
+    def get_key_columns(self) -> List[str]:
+        """
+        Return the columns that identify a record (interval first).
+        Subclasses with one record per unit/region per interval override this.
+        """
+        return ['settlementdate']
+    
+    def upsert_data(self, rows: pd.DataFrame) -> int:
+        """
+        Insert records that are missing from storage and save to parquet.
+        
+        Unlike add_new_data, rows older than the latest stored interval are
+        kept, so this can fill gaps. Rows whose key is already stored are
+        ignored.
+        
+        Args:
+            rows: Records to insert (same schema as the stored data)
+            
+        Returns:
+            Number of records added
+        """
+        try:
+            if not self.validate_data(rows):
+                return 0
+            
+            keys = self.get_key_columns()
+            index_name = self.data.index.name
+            existing = self.data.reset_index() if index_name else self.data
+            rows = rows.reset_index() if index_name else rows
+            rows = rows.drop_duplicates(subset=keys)
+            
+            # Only stored records in the new rows' time range can clash
+            times = existing[keys[0]]
+            stored = existing.loc[times.between(rows[keys[0]].min(), rows[keys[0]].max()), keys]
+            missing = ~pd.MultiIndex.from_frame(rows[keys]).isin(pd.MultiIndex.from_frame(stored))
+            rows = rows[missing]
+            if rows.empty:
+                logger.info(f"{self.name}: No missing records to insert")
+                return 0
+            
+            combined = pd.concat([existing, rows], ignore_index=True)
+            if index_name:
+                combined = combined.set_index(index_name)
+            self.data = self.sort_data(combined)
+            self.save_data()
+            
+            logger.info(f"{self.name}: Inserted {len(rows)} missing records")
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"{self.name}: Error inserting records: {e}")
+            return 0
+    
     def merge_data(self, existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
         """
         Merge new data with existing data.
@@ -13,6 +13,7 @@ from io import BytesIO
 from pathlib import Path
 from typing import Optional, List
 import asyncio
+import threading
 
 from .base_collector import BaseCollector
 from ..shared.config import config
@@ -29,8 +30,14 @@ class GenerationCollector(BaseCollector):
     for all registered units in the National Electricity Market.
     """
     
-    def __init__(self):
-        """Initialize the generation collector."""
+    def __init__(self, duid_registry=None):
+        """
+        Initialize the generation collector.
+        
+        Args:
+            duid_registry: Optional UnknownDuidRegistry given each batch of newly committed rows
+        """
+        self.duid_registry = duid_registry
         super().__init__(
             name="Generation SCADA",
             output_file=config.gen_output_file,
@@ -50,6 +57,10 @@ class GenerationCollector(BaseCollector):
         """Return required columns for generation data."""
         return ['settlementdate', 'duid', 'scadavalue']
     
+    def get_key_columns(self) -> List[str]:
+        """Return the columns that identify a record."""
+        return ['settlementdate', 'duid']
+    
     async def fetch_latest_data(self) -> Optional[pd.DataFrame]:
         """
         Fetch the latest SCADA data from NEMWEB.
@@ -186,44 +197,52 @@ class GenerationCollector(BaseCollector):
                 with zip_file.open(csv_filename) as csv_file:
                     csv_content = csv_file.read().decode('utf-8')
             
-            # Parse CSV content
-            lines = csv_content.strip().split('\n')
-            
-            # Find data lines (start with 'D')
-            data_rows = []
-            for line in lines:
-                if line.startswith('D,DISPATCH,UNIT_SCADA'):
-                    # Split CSV line and extract required fields
-                    fields = line.split(',')
-                    if len(fields) >= 7:  # Ensure we have all required fields
-                        settlementdate = fields[4].strip('"')
-                        duid = fields[5].strip('"')
-                        scadavalue = fields[6].strip('"')
-                        
-                        try:
-                            scadavalue = float(scadavalue)
-                        except ValueError:
-                            continue  # Skip invalid numeric values
-                        
-                        data_rows.append({
-                            'settlementdate': settlementdate,
-                            'duid': duid,
-                            'scadavalue': scadavalue
-                        })
+            return self.parse_csv(csv_content)
             
-            if data_rows:
-                df = pd.DataFrame(data_rows)
-                df['settlementdate'] = pd.to_datetime(df['settlementdate'])
-                logger.info(f"Parsed {len(df)} records")
-                return df
-            else:
-                logger.warning("No valid data rows found in file")
-                return None
-                
         except Exception as e:
             logger.error(f"Error downloading/parsing file {file_url}: {e}")
             return None
     
+    def parse_csv(self, csv_content: str) -> Optional[pd.DataFrame]:
+        """
+        Parse a DISPATCH_SCADA CSV file.
+        
+        Returns:
+            DataFrame with columns: settlementdate, duid, scadavalue (None if no rows)
+        """
+        lines = csv_content.strip().split('\n')
+        
+        # Find data lines (start with 'D')
+        data_rows = []
+        for line in lines:
+            if line.startswith('D,DISPATCH,UNIT_SCADA'):
+                # Split CSV line and extract required fields
+                fields = line.split(',')
+                if len(fields) >= 7:  # Ensure we have all required fields
+                    settlementdate = fields[4].strip('"')
+                    duid = fields[5].strip('"')
+                    scadavalue = fields[6].strip('"')
+                    
+                    try:
+                        scadavalue = float(scadavalue)
+                    except ValueError:
+                        continue  # Skip invalid numeric values
+                    
+                    data_rows.append({
+                        'settlementdate': settlementdate,
+                        'duid': duid,
+                        'scadavalue': scadavalue
+                    })
+        
+        if data_rows:
+            df = pd.DataFrame(data_rows)
+            df['settlementdate'] = pd.to_datetime(df['settlementdate'])
+            logger.info(f"Parsed {len(df)} records")
+            return df
+        else:
+            logger.warning("No valid data rows found in file")
+            return None
+    
     def is_new_data(self, new_df: pd.DataFrame) -> bool:
         """Check if the new data contains records not already in storage."""
         if self.data.empty:
@@ -243,6 +262,21 @@ class GenerationCollector(BaseCollector):
         
         return is_new
     
+    def add_new_data(self, new_df: pd.DataFrame) -> bool:
+        """Add new generation data, then check the committed intervals for unknown DUIDs."""
+        latest_existing = None if self.data.empty else self.data['settlementdate'].max()
+        if not super().add_new_data(new_df):
+            return False
+        
+        if self.duid_registry is not None:
+            committed = new_df if latest_existing is None else new_df[new_df['settlementdate'] > latest_existing]
+            new_duids = self.duid_registry.record(committed)
+            if new_duids:
+                # Sending email blocks on SMTP - don't hold up the collection cycle
+                threading.Thread(target=self.duid_registry.send_alert, args=(new_duids,),
+                                 name='unknown-duid-alert', daemon=True).start()
+        return True
+    
     def merge_data(self, existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
         """
         Merge new generation data with existing data.
@@ -31,8 +31,14 @@ class PriceCollector(BaseCollector):
     for all regions in the National Electricity Market.
     """
     
-    def __init__(self):
-        """Initialize the price collector."""
+    def __init__(self, alert_stage=None):
+        """
+        Initialize the price collector.
+        
+        Args:
+            alert_stage: Optional PriceAlertStage given each batch of newly committed prices
+        """
+        self.alert_stage = alert_stage
         super().__init__(
             name="Spot Prices",
             output_file=config.spot_hist_file,
@@ -53,6 +59,10 @@ class PriceCollector(BaseCollector):
         """Return required columns for price data."""
         return ['REGIONID', 'RRP']
     
+    def get_key_columns(self) -> List[str]:
+        """Return the columns that identify a record."""
+        return ['SETTLEMENTDATE', 'REGIONID']
+    
     async def fetch_latest_data(self) -> Optional[pd.DataFrame]:
         """
         Fetch the latest spot price data from NEMWEB.
@@ -234,6 +244,10 @@ class PriceCollector(BaseCollector):
             logger.error(f"Error parsing dispatch data: {e}")
             return pd.DataFrame()
     
+    def parse_csv(self, csv_content: str) -> Optional[pd.DataFrame]:
+        """Parse a DISPATCH CSV file (SETTLEMENTDATE index, REGIONID, RRP)."""
+        return self._parse_dispatch_data(csv_content)
+    
     def is_new_data(self, new_df: pd.DataFrame) -> bool:
         """Check if the new data contains records not already in storage."""
         if self.data.empty:
@@ -253,6 +267,17 @@ class PriceCollector(BaseCollector):
         
         return is_new
     
+    def add_new_data(self, new_df: pd.DataFrame) -> bool:
+        """Add new price data, then pass the committed intervals to the alert stage."""
+        latest_existing = None if self.data.empty else self.data.index.max()
+        if not super().add_new_data(new_df):
+            return False
+        
+        if self.alert_stage is not None:
+            committed = new_df if latest_existing is None else new_df[new_df.index > latest_existing]
+            self.alert_stage.process(committed)
+        return True
+    
     def merge_data(self, existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
         """
         Merge new price data with existing data.
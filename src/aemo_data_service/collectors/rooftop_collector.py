@@ -32,6 +32,8 @@ class RooftopCollector(BaseCollector):
     
     def __init__(self):
         """Initialize the rooftop collector."""
+        # Set before loading - the empty DataFrame (no file yet) has a column per region
+        self.regions = ['NSW1', 'QLD1', 'SA1', 'TAS1', 'VIC1']
         super().__init__(
             name="Rooftop Solar",
             output_file=config.rooftop_file,
@@ -39,7 +41,6 @@ class RooftopCollector(BaseCollector):
         )
         
         self.base_url = "http://nemweb.com.au/Reports/Current/ROOFTOP_PV/ACTUAL/"
-        self.regions = ['NSW1', 'QLD1', 'SA1', 'TAS1', 'VIC1']
         self.last_processed_files = set()
     
     def create_empty_dataframe(self) -> pd.DataFrame:
@@ -212,67 +213,70 @@ class RooftopCollector(BaseCollector):
                 with zip_file.open(csv_filename) as csv_file:
                     csv_content = csv_file.read().decode('utf-8')
             
-            # Parse CSV lines
-            lines = csv_content.strip().split('\n')
-            data_rows = []
-            
-            for line in lines:
-                if line.startswith('D,ROOFTOP,ACTUAL'):
-                    fields = line.split(',')
-                    if len(fields) >= 8:
-                        # Extract fields: interval_datetime, regionid, powermw
-                        interval_datetime = fields[4].strip('"')
-                        regionid = fields[5].strip('"')
-                        powermw = fields[6].strip('"')
-                        
-                        try:
-                            powermw = float(powermw) if powermw else 0.0
-                        except ValueError:
-                            continue
-                        
-                        data_rows.append({
-                            'settlementdate': interval_datetime,
-                            'regionid': regionid,
-                            'powermw': powermw
-                        })
-            
-            if not data_rows:
-                logger.warning("No valid rooftop data rows found")
-                return pd.DataFrame()
-            
-            # Create DataFrame and pivot
-            df = pd.DataFrame(data_rows)
-            df['settlementdate'] = pd.to_datetime(df['settlementdate'])
-            
-            # Pivot to get regions as columns
-            pivot_df = df.pivot_table(
-                index='settlementdate',
-                columns='regionid',
-                values='powermw',
-                aggfunc='first'
-            ).fillna(0)
-            
-            # Reset index and ensure all regions are present
-            pivot_df = pivot_df.reset_index()
-            
-            # Add missing regions as zero columns
-            for region in self.regions:
-                if region not in pivot_df.columns:
-                    pivot_df[region] = 0.0
-            
-            # Reorder columns
-            columns = ['settlementdate'] + self.regions
-            pivot_df = pivot_df[columns]
-            
-            logger.info(f"Parsed {len(pivot_df)} 30-minute rooftop records")
-            logger.info(f"Date range: {pivot_df['settlementdate'].min()} to {pivot_df['settlementdate'].max()}")
-            
-            return pivot_df
+            return self.parse_csv(csv_content)
             
         except Exception as e:
             logger.error(f"Error parsing rooftop ZIP: {e}")
             return pd.DataFrame()
     
+    def parse_csv(self, csv_content: str) -> pd.DataFrame:
+        """Parse a ROOFTOP_PV ACTUAL CSV file into a 30-minute DataFrame."""
+        lines = csv_content.strip().split('\n')
+        data_rows = []
+        
+        for line in lines:
+            if line.startswith('D,ROOFTOP,ACTUAL'):
+                fields = line.split(',')
+                if len(fields) >= 8:
+                    # Extract fields: interval_datetime, regionid, powermw
+                    interval_datetime = fields[4].strip('"')
+                    regionid = fields[5].strip('"')
+                    powermw = fields[6].strip('"')
+                    
+                    try:
+                        powermw = float(powermw) if powermw else 0.0
+                    except ValueError:
+                        continue
+                    
+                    data_rows.append({
+                        'settlementdate': interval_datetime,
+                        'regionid': regionid,
+                        'powermw': powermw
+                    })
+        
+        if not data_rows:
+            logger.warning("No valid rooftop data rows found")
+            return pd.DataFrame()
+        
+        # Create DataFrame and pivot
+        df = pd.DataFrame(data_rows)
+        df['settlementdate'] = pd.to_datetime(df['settlementdate'])
+        
+        # Pivot to get regions as columns
+        pivot_df = df.pivot_table(
+            index='settlementdate',
+            columns='regionid',
+            values='powermw',
+            aggfunc='first'
+        ).fillna(0)
+        
+        # Reset index and ensure all regions are present
+        pivot_df = pivot_df.reset_index()
+        
+        # Add missing regions as zero columns
+        for region in self.regions:
+            if region not in pivot_df.columns:
+                pivot_df[region] = 0.0
+        
+        # Reorder columns
+        columns = ['settlementdate'] + self.regions
+        pivot_df = pivot_df[columns]
+        
+        logger.info(f"Parsed {len(pivot_df)} 30-minute rooftop records")
+        logger.info(f"Date range: {pivot_df['settlementdate'].min()} to {pivot_df['settlementdate'].max()}")
+        
+        return pivot_df
+    
     def _convert_30min_to_5min(self, df_30min: pd.DataFrame) -> pd.DataFrame:
         """
         Convert 30-minute data to 5-minute intervals using cubic spline interpolation.
@@ -73,6 +73,10 @@ class TransmissionCollector(BaseCollector):
             'mwflow', 'exportlimit', 'importlimit', 'mwlosses'
         ]
     
+    def get_key_columns(self) -> List[str]:
+        """Return the columns that identify a record."""
+        return ['settlementdate', 'interconnectorid']
+    
     async def fetch_latest_data(self) -> Optional[pd.DataFrame]:
         """
         Fetch the latest transmission flow data from NEMWEB.
@@ -211,56 +215,64 @@ class TransmissionCollector(BaseCollector):
                 with zip_file.open(csv_filename) as csv_file:
                     csv_content = csv_file.read().decode('utf-8')
             
-            # Parse CSV content
-            lines = csv_content.strip().split('\n')
-            
-            # Find data lines (start with 'D,DISPATCH,INTERCONNECTORRES')
-            data_rows = []
-            for line in lines:
-                if line.startswith('D,DISPATCH,INTERCONNECTORRES'):
-                    # Split CSV line and extract required fields
-                    fields = line.split(',')
-                    if len(fields) >= 17:  # Ensure we have all required fields
-                        settlementdate = fields[4].strip('"')
-                        interconnectorid = fields[6].strip('"')
-                        meteredmwflow = fields[9].strip('"')
-                        mwflow = fields[10].strip('"')
-                        mwlosses = fields[11].strip('"')
-                        exportlimit = fields[15].strip('"') if len(fields) > 15 else '0'
-                        importlimit = fields[16].strip('"') if len(fields) > 16 else '0'
-                        
-                        try:
-                            meteredmwflow = float(meteredmwflow) if meteredmwflow else 0.0
-                            mwflow = float(mwflow) if mwflow else 0.0
-                            exportlimit = float(exportlimit) if exportlimit else 0.0
-                            importlimit = float(importlimit) if importlimit else 0.0
-                            mwlosses = float(mwlosses) if mwlosses else 0.0
-                        except ValueError:
-                            continue  # Skip invalid numeric values
-                        
-                        data_rows.append({
-                            'settlementdate': settlementdate,
-                            'interconnectorid': interconnectorid,
-                            'meteredmwflow': meteredmwflow,
-                            'mwflow': mwflow,
-                            'exportlimit': exportlimit,
-                            'importlimit': importlimit,
-                            'mwlosses': mwlosses
-                        })
+            return self.parse_csv(csv_content)
             
-            if data_rows:
-                df = pd.DataFrame(data_rows)
-                df['settlementdate'] = pd.to_datetime(df['settlementdate'])
-                logger.info(f"Parsed {len(df)} transmission flow records")
-                return df
-            else:
-                logger.warning("No valid transmission flow data rows found")
-                return None
-                
         except Exception as e:
             logger.error(f"Error downloading/parsing file {file_url}: {e}")
             return None
     
+    def parse_csv(self, csv_content: str) -> Optional[pd.DataFrame]:
+        """
+        Parse a DISPATCHIS CSV file.
+        
+        Returns:
+            DataFrame with interconnector flows and limits (None if no rows)
+        """
+        lines = csv_content.strip().split('\n')
+        
+        # Find data lines (start with 'D,DISPATCH,INTERCONNECTORRES')
+        data_rows = []
+        for line in lines:
+            if line.startswith('D,DISPATCH,INTERCONNECTORRES'):
+                # Split CSV line and extract required fields
+                fields = line.split(',')
+                if len(fields) >= 17:  # Ensure we have all required fields
+                    settlementdate = fields[4].strip('"')
+                    interconnectorid = fields[6].strip('"')
+                    meteredmwflow = fields[9].strip('"')
+                    mwflow = fields[10].strip('"')
+                    mwlosses = fields[11].strip('"')
+                    exportlimit = fields[15].strip('"') if len(fields) > 15 else '0'
+                    importlimit = fields[16].strip('"') if len(fields) > 16 else '0'
+                    
+                    try:
+                        meteredmwflow = float(meteredmwflow) if meteredmwflow else 0.0
+                        mwflow = float(mwflow) if mwflow else 0.0
+                        exportlimit = float(exportlimit) if exportlimit else 0.0
+                        importlimit = float(importlimit) if importlimit else 0.0
+                        mwlosses = float(mwlosses) if mwlosses else 0.0
+                    except ValueError:
+                        continue  # Skip invalid numeric values
+                    
+                    data_rows.append({
+                        'settlementdate': settlementdate,
+                        'interconnectorid': interconnectorid,
+                        'meteredmwflow': meteredmwflow,
+                        'mwflow': mwflow,
+                        'exportlimit': exportlimit,
+                        'importlimit': importlimit,
+                        'mwlosses': mwlosses
+                    })
+        
+        if data_rows:
+            df = pd.DataFrame(data_rows)
+            df['settlementdate'] = pd.to_datetime(df['settlementdate'])
+            logger.info(f"Parsed {len(df)} transmission flow records")
+            return df
+        else:
+            logger.warning("No valid transmission flow data rows found")
+            return None
+    
     def is_new_data(self, new_df: pd.DataFrame) -> bool:
         """Check if the new data contains records not already in storage."""
         if self.data.empty:
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Gap Repair for AEMO Data Service
+Fills the gaps found by the integrity scanner from NEMWEB's CURRENT and ARCHIVE files.
+
+Each missing interval is mapped to the file that published it: the 5-minute
+(30-minute for rooftop solar) file in the CURRENT directory while it is
+still there, otherwise the ARCHIVE zip for its day (week for rooftop
+solar), whose members are the same files. Files are downloaded
+concurrently and kept in the raw file cache, so an archive fetched for one
+gap is reused for the next. The rows are parsed by the dataset's
+collector, filtered to the missing intervals and inserted with
+upsert_data.
+
+Intervals that have been repaired, or that NEMWEB does not have, are not
+looked for again until the service restarts.
+"""
+
+import asyncio
+import os
+import re
+import zipfile
+from collections import defaultdict
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+import requests
+
+from .shared.config import config
+from .shared.logging_config import get_logger
+from aemo_dashboard.diagnostics.integrity import gap_report, run_integrity_scan
+
+logger = get_logger(__name__)
+
+NEMWEB_REPORTS_URL = "http://nemweb.com.au/Reports"
+
+# directory: report directory under CURRENT and ARCHIVE, prefix: file name before
+# the timestamp, minutes: interval of each file, preferred: name fragment picked
+# when several files share a timestamp
+SOURCES = {
+    'generation': {'directory': 'Dispatch_SCADA', 'prefix': 'PUBLIC_DISPATCHSCADA_', 'minutes': 5},
+    'prices': {'directory': 'Dispatch_Reports', 'prefix': 'PUBLIC_DISPATCH_', 'minutes': 5, 'preferred': '_LEGACY'},
+    'transmission': {'directory': 'DispatchIS_Reports', 'prefix': 'PUBLIC_DISPATCHIS_', 'minutes': 5},
+    'rooftop': {'directory': 'ROOFTOP_PV/ACTUAL', 'prefix': 'PUBLIC_ROOFTOP_PV_ACTUAL_MEASUREMENT_', 'minutes': 30},
+}
+
+# Use proper headers to avoid 403 errors
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def file_time(filename: str, prefix: str) -> Optional[pd.Timestamp]:
+    """
+    Timestamp in a NEMWEB file name (None if the name does not match).
+
+    CURRENT files carry the interval (YYYYMMDDHHMM), ARCHIVE zips the date
+    of their first day (YYYYMMDD).
+    """
+    match = re.match(re.escape(prefix) + r'(\d{8}(?:\d{4})?)\d*(?:_[^.]*)?\.(?:zip|csv)$', filename, re.IGNORECASE)
+    if not match:
+        return None
+    digits = match.group(1)
+    return pd.to_datetime(digits, format='%Y%m%d%H%M' if len(digits) == 12 else '%Y%m%d')
+
+
+class GapRepairer:
+    """
+    Fills gaps in the collectors' files from NEMWEB.
+
+    Rows are parsed and stored through the service's collectors, so a
+    repair must not run at the same time as a collection cycle.
+    """
+
+    def __init__(self, collectors: Dict[str, object], cache_dir: Optional[Path] = None):
+        """
+        Initialize the gap repairer.
+
+        Args:
+            collectors: Collectors by dataset name (see SOURCES)
+            cache_dir: Raw file cache (default config.raw_cache_dir)
+        """
+        self.collectors = collectors
+        self.cache_dir = Path(cache_dir or config.raw_cache_dir)
+        self.done = defaultdict(set)  # dataset -> intervals not to look for again
+        self.last_run = None
+        self._semaphore = None
+
+    async def run(self, datasets: Optional[Iterable[str]] = None, days: Optional[int] = None) -> Dict[str, pd.Timestamp]:
+        """
+        Scan for gaps and fill them.
+
+        Args:
+            datasets: Datasets to repair (default: every dataset with a collector)
+            days: How many days back to check (default config.gap_repair_days)
+
+        Returns:
+            Earliest repaired interval of each dataset that had records inserted
+        """
+        self.last_run = datetime.now()
+        datasets = [name for name in (datasets or self.collectors) if name in SOURCES and name in self.collectors]
+        start = pd.Timestamp.now().floor('D') - pd.Timedelta(days=days or config.gap_repair_days)
+        self._semaphore = asyncio.Semaphore(config.gap_repair_concurrency)
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(None, run_integrity_scan, datasets, start)
+        gaps = gap_report(results)
+
+        repaired = {}
+        for name in datasets:
+            result = results.get(name, {})
+            if result.get('status') != 'success':
+                logger.warning(f"Gap repair: {name} not scanned ({result.get('status')})")
+                continue
+
+            intervals = self._missing_intervals(gaps[gaps['dataset'] == name], result['interval_minutes'])
+            intervals -= self.done[name]
+            if not intervals:
+                logger.info(f"Gap repair: no {name} gaps to repair")
+                continue
+
+            try:
+                earliest = await self._repair_dataset(name, intervals, result['interval_minutes'])
+                if earliest is not None:
+                    repaired[name] = earliest
+            except Exception as e:
+                logger.error(f"Gap repair: error repairing {name}: {e}")
+
+        return repaired
+
+    def _missing_intervals(self, gaps: pd.DataFrame, minutes: int) -> Set[pd.Timestamp]:
+        """Every interval in the gaps (dataset-wide or for one region/interconnector)"""
+        intervals = set()
+        for gap in gaps.itertuples():
+            intervals.update(pd.date_range(gap.start, gap.end, freq=f'{minutes}min'))
+        return intervals
+
+    async def _repair_dataset(self, name: str, intervals: Set[pd.Timestamp], minutes: int) -> Optional[pd.Timestamp]:
+        """Fetch, parse and insert one dataset's missing intervals; returns the earliest inserted"""
+        source = SOURCES[name]
+        collector = self.collectors[name]
+        file_step = pd.Timedelta(minutes=source['minutes'])
+        interpolate = minutes < source['minutes']
+
+        file_times = {interval.floor(file_step) for interval in intervals}
+        if interpolate:
+            # 5-minute rooftop rows are interpolated towards the following period
+            file_times |= {time + file_step for time in file_times}
+        logger.info(f"Gap repair: {len(intervals)} missing {name} intervals, "
+                    f"{len(file_times)} source files")
+
+        contents, settled = await self._fetch_files(name, file_times)
+
+        loop = asyncio.get_running_loop()
+        frames = []
+        for content in contents:
+            frame = await loop.run_in_executor(None, collector.parse_csv, content)
+            if frame is not None and not frame.empty:
+                frames.append(frame)
+
+        # Files that were read (or that NEMWEB does not have) are not fetched again
+        self.done[name] |= {interval for interval in intervals if interval.floor(file_step) in settled}
+
+        if not frames:
+            logger.warning(f"Gap repair: no {name} rows found for the missing intervals")
+            return None
+
+        rows = pd.concat(frames)
+        if interpolate:
+            rows = collector._convert_30min_to_5min(rows.drop_duplicates(subset=['settlementdate']))
+
+        time_column = collector.get_key_columns()[0]
+        times = pd.Series(rows.index if time_column not in rows.columns else rows[time_column].to_numpy())
+        wanted = times.isin(pd.DatetimeIndex(sorted(intervals))).to_numpy()
+        rows = rows[wanted]
+        if rows.empty:
+            logger.warning(f"Gap repair: no {name} rows found for the missing intervals")
+            return None
+
+        added = await loop.run_in_executor(None, collector.upsert_data, rows)
+        if not added:
+            return None
+
+        earliest = times[wanted].min()
+        logger.info(f"Gap repair: inserted {added} {name} records from {earliest}")
+        return earliest
+
+    async def _fetch_files(self, name: str, file_times: Set[pd.Timestamp]) -> Tuple[List[str], Set[pd.Timestamp]]:
+        """
+        Fetch the CSV content published for each file time.
+
+        Returns:
+            (CSV contents, file times that were found or that NEMWEB does not have)
+        """
+        source = SOURCES[name]
+        current_url = f"{NEMWEB_REPORTS_URL}/CURRENT/{source['directory']}/"
+        archive_url = f"{NEMWEB_REPORTS_URL}/ARCHIVE/{source['directory']}/"
+        contents, settled = [], set()
+
+        current = await self._list_files(current_url, source)
+        if current is None:
+            return contents, settled
+
+        tasks = [
+            self._fetch_members(name, current_url, current[time], {time})
+            for time in sorted(file_times) if time in current
+        ]
+        for found, readable in await asyncio.gather(*tasks):
+            contents.extend(found.values())
+            settled |= readable
+
+        remaining = {time for time in file_times if time not in current}
+        if not remaining:
+            return contents, settled
+
+        archives = await self._list_files(archive_url, source)
+        if archives is None:
+            return contents, settled
+        archive_dates = sorted(archives)
+
+        # An interval is in the archive for its day, or the one before (archives
+        # start at the market day, 4am) - so try the latest archive starting on
+        # or before its day, then the previous one
+        last_read = {}  # time -> whether the last archive it was looked for in could be read
+        for attempt in range(2):
+            by_archive = defaultdict(set)
+            for time in remaining:
+                earlier = [date for date in archive_dates if date <= time.normalize()]
+                if len(earlier) > attempt:
+                    by_archive[archives[earlier[-1 - attempt]]].add(time)
+
+            items = sorted(by_archive.items())
+            results = await asyncio.gather(*[
+                self._fetch_members(name, archive_url, filename, times) for filename, times in items
+            ])
+            for (filename, times), (found, readable) in zip(items, results):
+                contents.extend(found.values())
+                remaining -= set(found)
+                settled |= set(found)
+                last_read.update({time: time in readable for time in times - set(found)})
+
+        settled |= {time for time in remaining if last_read.get(time)}
+        return contents, settled
+
+    async def _list_files(self, url: str, source: dict) -> Optional[Dict[pd.Timestamp, str]]:
+        """File name for each timestamp in a NEMWEB directory listing (None on error)"""
+        content = await self._download(url)
+        if content is None:
+            return None
+
+        files = {}
+        preferred = source.get('preferred')
+        for href in re.findall(r'href="([^"]+)"', content.decode('utf-8', errors='replace'), re.IGNORECASE):
+            filename = href.rsplit('/', 1)[-1]
+            time = file_time(filename, source['prefix'])
+            if time is not None and (time not in files or (preferred and preferred in filename)):
+                files[time] = filename
+
+        logger.info(f"Gap repair: {len(files)} files listed in {url}")
+        return files
+
+    async def _fetch_members(self, name: str, url: str, filename: str,
+                             times: Set[pd.Timestamp]) -> Tuple[Dict[pd.Timestamp, str], Set[pd.Timestamp]]:
+        """
+        Read the CSVs for the given times from a CURRENT file or ARCHIVE zip.
+
+        Returns:
+            (CSV content by time, the times looked for if the zip could be read)
+        """
+        content = await self._fetch_file(name, url, filename)
+        if content is None:
+            return {}, set()
+
+        loop = asyncio.get_running_loop()
+        try:
+            found = await loop.run_in_executor(None, self._extract, content, SOURCES[name], times)
+        except zipfile.BadZipFile as e:
+            logger.error(f"Gap repair: {filename} is not a valid zip: {e}")
+            (self.cache_dir / name / filename).unlink(missing_ok=True)
+            return {}, set()
+
+        return found, set(times)
+
+    def _extract(self, content: bytes, source: dict, times: Set[pd.Timestamp]) -> Dict[pd.Timestamp, str]:
+        """CSV content for each wanted time in a zip (members may be nested zips or CSVs)"""
+        preferred = source.get('preferred')
+        members = {}
+        found = {}
+
+        with zipfile.ZipFile(BytesIO(content)) as zip_file:
+            for member in zip_file.namelist():
+                time = file_time(member.rsplit('/', 1)[-1], source['prefix'])
+                if time in times and (time not in members or (preferred and preferred in member)):
+                    members[time] = member
+
+            for time, member in members.items():
+                data = zip_file.read(member)
+                if member.lower().endswith('.zip'):
+                    with zipfile.ZipFile(BytesIO(data)) as inner:
+                        csv_files = [n for n in inner.namelist() if n.lower().endswith('.csv')]
+                        if not csv_files:
+                            continue
+                        data = inner.read(csv_files[0])
+                found[time] = data.decode('utf-8')
+
+        return found
+
+    async def _fetch_file(self, name: str, url: str, filename: str) -> Optional[bytes]:
+        """Download a file, or read it from the raw file cache"""
+        path = self.cache_dir / name / filename
+        loop = asyncio.get_running_loop()
+        if path.exists():
+            return await loop.run_in_executor(None, path.read_bytes)
+
+        content = await self._download(url + filename)
+        if content is not None:
+            await loop.run_in_executor(None, self._write_cache, path, content)
+        return content
+
+    def _write_cache(self, path: Path, content: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so an interrupted download is never cached
+            tmp_path = path.with_name(path.name + '.tmp')
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not cache {path.name}: {e}")
+
+    async def _download(self, url: str) -> Optional[bytes]:
+        """Download a URL with retry logic, at most gap_repair_concurrency at a time"""
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            for attempt in range(3):
+                try:
+                    # Add small delay to avoid rate limiting
+                    if attempt > 0:
+                        await asyncio.sleep(2 * attempt)
+                        logger.info(f"Retry attempt {attempt + 1} for {url}")
+
+                    response = await loop.run_in_executor(
+                        None,
+                        lambda: requests.get(url, headers=HEADERS, timeout=120)
+                    )
+                    response.raise_for_status()
+                    return response.content
+
+                except requests.exceptions.HTTPError as e:
+                    if e.response.status_code == 403 and attempt < 2:
+                        logger.warning(f"403 error downloading {url}, will retry...")
+                        continue
+                    logger.error(f"Failed to download {url}: {e}")
+                    return None
+                except Exception as e:
+                    logger.error(f"Failed to download {url}: {e}")
+                    return None
+
+        return None
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Price Alert Stage for AEMO Data Service
+Evaluates spot price alerts as soon as the price collector commits new intervals.
+
+Alerts use hysteresis per region: a HIGH (or EXTREME) alert fires when the
+price reaches the high threshold, and the region is only re-armed once the
+price falls back to the low threshold, which sends a recovery alert. All
+regions and intervals of a batch are evaluated together with NumPy against
+state held in memory. The state is written to disk only when a region's
+alert state changes.
+
+Messages go onto an asyncio queue and are sent by dispatch_forever(), a
+task on the service's event loop. Messages queued together are sent as one
+SMS, and the (blocking) Twilio call runs in a worker thread, so a slow or
+failing SMS send never holds up the collection cycle.
+"""
+
+import asyncio
+import os
+import pickle
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .shared.config import config
+from .shared.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+REGIONS = ['NSW1', 'QLD1', 'SA1', 'TAS1', 'VIC1']
+
+# Twilio's limit for one message body
+MAX_SMS_LENGTH = 1600
+
+
+class PriceAlertStage:
+    """
+    Hysteresis price alerts for all regions, fed by the price collector.
+
+    The state file keeps the format of the standalone alert script:
+    region -> {'high_alert': bool, 'high_time': Timestamp, 'last_price': float}.
+    """
+
+    def __init__(self, state_file=None):
+        self.state_file = state_file or config.price_alert_state_file
+        self.high_threshold = config.high_price_threshold
+        self.low_threshold = config.low_price_threshold
+        self.extreme_threshold = config.extreme_price_threshold
+        self.queue = asyncio.Queue()
+        self._sms_client = None
+
+        state = self._load_state()
+        self.regions = list(dict.fromkeys(REGIONS + list(state)))
+        self.high_alert = np.array([state.get(r, {}).get('high_alert', False) for r in self.regions], dtype=bool)
+        self.high_time = [state.get(r, {}).get('high_time') for r in self.regions]
+        self.last_price = np.array([state.get(r, {}).get('last_price', 0.0) for r in self.regions], dtype=float)
+
+    def process(self, new_prices: pd.DataFrame) -> List[str]:
+        """
+        Evaluate newly committed prices and queue any alerts.
+
+        Args:
+            new_prices: DataFrame with SETTLEMENTDATE as index and columns REGIONID, RRP
+
+        Returns:
+            The alert messages queued, oldest first
+        """
+        if new_prices is None or new_prices.empty:
+            return []
+
+        try:
+            region_ids = new_prices['REGIONID'].to_numpy()
+            for region in pd.unique(region_ids):
+                if region not in self.regions:
+                    self._add_region(region)
+
+            # Intervals x regions price matrix (NaN where a region has no price)
+            times, rows = np.unique(new_prices.index.to_numpy(), return_inverse=True)
+            times = pd.DatetimeIndex(times)
+            columns = pd.Index(self.regions).get_indexer(region_ids)
+            values = np.full((len(times), len(self.regions)), np.nan)
+            values[rows, columns] = new_prices['RRP'].to_numpy(dtype=float)
+
+            # Alert state after each interval: set at or above the high threshold,
+            # cleared at or below the low threshold, otherwise carried forward
+            signal = np.full(values.shape, np.nan)
+            signal[values >= self.high_threshold] = 1.0
+            signal[values <= self.low_threshold] = 0.0
+            signal = np.vstack([self.high_alert.astype(float), signal])
+            filled = np.where(np.isnan(signal), 0, np.arange(len(signal))[:, None])
+            np.maximum.accumulate(filled, axis=0, out=filled)
+            states = signal[filled, np.arange(signal.shape[1])].astype(bool)
+            fired = states[1:] & ~states[:-1]
+            recovered = ~states[1:] & states[:-1]
+
+            messages = []
+            for t, r in zip(*np.nonzero(fired | recovered)):
+                price = values[t, r]
+                if fired[t, r]:
+                    self.high_time[r] = times[t]
+                    messages.append(self._high_message(self.regions[r], price, times[t]))
+                else:
+                    messages.append(self._recovery_message(self.regions[r], price, times[t], self.high_time[r]))
+
+            latest = ~np.isnan(values)
+            if latest.any():
+                last_rows = np.where(latest, np.arange(len(values))[:, None], -1).max(axis=0)
+                seen = last_rows >= 0
+                self.last_price[seen] = values[last_rows[seen], np.nonzero(seen)[0]]
+
+            changed = (states[-1] != self.high_alert).any()
+            self.high_alert = states[-1]
+            if changed:
+                self._save_state()
+
+            for message in messages:
+                logger.info(f"Price alert: {message}")
+                self.queue.put_nowait(message)
+            return messages
+
+        except Exception as e:
+            logger.error(f"Error evaluating price alerts: {e}")
+            return []
+
+    async def dispatch_forever(self) -> None:
+        """Send queued alerts until cancelled, batching messages queued together."""
+        while True:
+            batch = [await self.queue.get()]
+            await self._send_batch(batch)
+
+    async def drain(self) -> None:
+        """Send every alert already queued (for single-cycle runs)."""
+        if not self.queue.empty():
+            await self._send_batch([])
+
+    async def _send_batch(self, batch: List[str]) -> None:
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+
+        for body in self._sms_bodies(batch):
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._send_sms, body)
+            except Exception as e:
+                logger.error(f"Error sending price alert SMS: {e}")
+
+    def _sms_bodies(self, messages: List[str]) -> List[str]:
+        """Join messages into as few SMS bodies as fit within MAX_SMS_LENGTH"""
+        bodies = []
+        for message in messages:
+            if bodies and len(bodies[-1]) + 1 + len(message) <= MAX_SMS_LENGTH:
+                bodies[-1] += "\n" + message
+            else:
+                bodies.append(message)
+        return bodies
+
+    def _send_sms(self, body: str) -> bool:
+        client = self._get_sms_client()
+        if client is None:
+            return False
+        message = client.messages.create(
+            body=body,
+            from_=config.twilio_phone_number,
+            to=config.my_phone_number
+        )
+        logger.info(f"Price alert SMS sent: {message.sid}")
+        return True
+
+    def _get_sms_client(self):
+        if self._sms_client is None:
+            if not all([config.twilio_account_sid, config.twilio_auth_token,
+                        config.twilio_phone_number, config.my_phone_number]):
+                logger.warning("Twilio not configured - price alert logged but not sent")
+                return None
+            try:
+                from twilio.rest import Client
+            except ImportError:
+                logger.warning("twilio package not installed - price alert logged but not sent")
+                return None
+            self._sms_client = Client(config.twilio_account_sid, config.twilio_auth_token)
+        return self._sms_client
+
+    def _high_message(self, region: str, price: float, time: pd.Timestamp) -> str:
+        if price >= self.extreme_threshold:
+            emoji, urgency = "🚨🚨🚨", "EXTREME"
+        else:
+            emoji, urgency = "⚠️", "HIGH"
+        return (f"ITK price alert {emoji} {region} {urgency} PRICE: ${price:.2f}/MWh at "
+                f"{time.strftime('%H:%M on %d/%m/%Y')}. Threshold: ${self.high_threshold}")
+
+    def _recovery_message(self, region: str, price: float, time: pd.Timestamp,
+                          high_time: Optional[pd.Timestamp]) -> str:
+        duration_str = ""
+        if high_time is not None:
+            total_minutes = int((time - high_time).total_seconds() / 60)
+            hours, minutes = divmod(total_minutes, 60)
+            duration_str = f"Duration: {hours}h {minutes}m" if hours > 0 else f"Duration: {minutes}m"
+        return (f"ITK price alert ✅ {region} PRICE RECOVERED: ${price:.2f}/MWh at "
+                f"{time.strftime('%H:%M on %d/%m/%Y')}. Below ${self.low_threshold}. {duration_str}")
+
+    def _add_region(self, region: str) -> None:
+        self.regions.append(region)
+        self.high_alert = np.append(self.high_alert, False)
+        self.high_time.append(None)
+        self.last_price = np.append(self.last_price, 0.0)
+
+    def _load_state(self) -> dict:
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'rb') as f:
+                    return pickle.load(f)
+        except Exception as e:
+            logger.error(f"Error loading price alert state: {e}")
+        return {}
+
+    def _save_state(self) -> None:
+        state = {
+            region: {
+                'high_alert': bool(self.high_alert[i]),
+                'high_time': self.high_time[i],
+                'last_price': float(self.last_price[i])
+            }
+            for i, region in enumerate(self.regions)
+        }
+        try:
+            # Write then rename so a crash never leaves a partial state file
+            tmp_path = f"{self.state_file}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f)
+            os.replace(tmp_path, self.state_file)
+        except Exception as e:
+            logger.error(f"Error saving price alert state: {e}")
@@ -8,7 +8,7 @@ import asyncio
 import signal
 import sys
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 from pathlib import Path
 
@@ -18,11 +18,27 @@ from .collectors.generation_collector import GenerationCollector
 from .collectors.price_collector import PriceCollector
 from .collectors.rooftop_collector import RooftopCollector
 from .collectors.transmission_collector import TransmissionCollector
+from .gap_repair import GapRepairer
+from .price_alerts import PriceAlertStage
+from aemo_dashboard.analysis.duid_daily import update_duid_daily
+from aemo_dashboard.shared.data_events import publish_data_event
+from aemo_dashboard.shared.duid_history import parquet_time_range, update_duid_history
+from aemo_dashboard.shared.latest_snapshot import update_latest_snapshot
+from aemo_dashboard.shared.unknown_duids import UnknownDuidRegistry
+from aemo_dashboard.station.duid_hourly import update_duid_hourly
 
 # Set up logging
 configure_service_logging()
 logger = get_logger(__name__)
 
+# Interval column of each collector's output file
+INTERVAL_COLUMNS = {
+    'generation': 'settlementdate',
+    'prices': 'SETTLEMENTDATE',
+    'rooftop': 'settlementdate',
+    'transmission': 'settlementdate',
+}
+
 
 class AEMODataService:
     """
@@ -44,6 +60,7 @@ class AEMODataService:
         self.is_running = False
         self.start_time = None
         self.collection_task = None
+        self.alert_task = None
         self.cycle_count = 0
         self.last_cycle_time = None
         self.update_interval = config.update_interval_minutes * 60  # Convert to seconds
@@ -61,10 +78,12 @@ class AEMODataService:
         """Initialize all data collectors."""
         try:
             # All collectors implemented
-            self.collectors['generation'] = GenerationCollector()
-            self.collectors['prices'] = PriceCollector()
+            self.price_alerts = PriceAlertStage()
+            self.collectors['generation'] = GenerationCollector(duid_registry=UnknownDuidRegistry())
+            self.collectors['prices'] = PriceCollector(alert_stage=self.price_alerts)
             self.collectors['rooftop'] = RooftopCollector()
             self.collectors['transmission'] = TransmissionCollector()
+            self.gap_repairer = GapRepairer(self.collectors)
             
             logger.info(f"Initialized {len(self.collectors)} collectors")
             
@@ -94,6 +113,12 @@ class AEMODataService:
         self.start_time = datetime.now()
         self.cycle_count = 0
         
+        # Alerts are sent from their own task so SMS sends never hold up collection
+        self.alert_task = asyncio.create_task(
+            self.price_alerts.dispatch_forever(),
+            name="price_alerts"
+        )
+        
         # Start the unified collection loop
         self.collection_task = asyncio.create_task(
             self._unified_collection_loop(),
@@ -110,6 +135,7 @@ class AEMODataService:
         except Exception as e:
             logger.error(f"Error in unified collection: {e}")
         finally:
+            self.alert_task.cancel()
             self.is_running = False
             logger.info("AEMO Data Service stopped")
     
@@ -164,6 +190,10 @@ class AEMODataService:
                 
                 self.last_cycle_time = cycle_start
                 
+                # Gap repair writes through the collectors, so it runs between cycles
+                if self._gap_repair_due():
+                    await self.repair_gaps()
+                
                 # Wait for next cycle (unless stopping)
                 if self.is_running:
                     logger.info(f"Next collection cycle in {self.update_interval/60:.1f} minutes...")
@@ -202,8 +232,86 @@ class AEMODataService:
                 logger.error(f"Error in {name} collector: {e}")
                 results[name] = False
         
+        # Refresh the latest-state snapshot and tell the dashboards straight away,
+        # before the slower rollups below
+        advanced = [name for name, success in results.items() if success]
+        if advanced:
+            loop = asyncio.get_running_loop()
+            results['latest_snapshot'] = await loop.run_in_executor(None, update_latest_snapshot)
+            self._publish_new_intervals(advanced)
+        
+        # Roll the new generation/price intervals into the DUID daily and hourly tables
+        if results.get('generation') or results.get('prices'):
+            loop = asyncio.get_running_loop()
+            results['duid_daily'] = await loop.run_in_executor(None, update_duid_daily)
+            results['duid_hourly'] = await loop.run_in_executor(None, update_duid_hourly)
+        
+        # Copy newly closed months to the DUID-sorted generation history
+        if results.get('generation'):
+            loop = asyncio.get_running_loop()
+            results['duid_history'] = await loop.run_in_executor(None, update_duid_history)
+        
         return results
     
+    def _gap_repair_due(self) -> bool:
+        """True if gap repair is enabled and has not run for gap_repair_interval_hours."""
+        if config.gap_repair_interval_hours <= 0:
+            return False
+        last_run = self.gap_repairer.last_run
+        return last_run is None or datetime.now() - last_run >= timedelta(hours=config.gap_repair_interval_hours)
+    
+    async def repair_gaps(self, datasets: Optional[List[str]] = None, days: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Fill gaps in the data files from NEMWEB and recompute the derived tables.
+        
+        Args:
+            datasets: Datasets to repair (default: all)
+            days: How many days back to check (default from config)
+            
+        Returns:
+            Dict mapping each repaired dataset and recomputed table to success status
+        """
+        logger.info("Checking data files for gaps...")
+        try:
+            repaired = await self.gap_repairer.run(datasets, days)
+        except Exception as e:
+            logger.error(f"Error repairing gaps: {e}")
+            return {}
+        
+        results = {name: True for name in repaired}
+        if not repaired:
+            return results
+        
+        loop = asyncio.get_running_loop()
+        results['latest_snapshot'] = await loop.run_in_executor(None, update_latest_snapshot)
+        self._publish_new_intervals(list(repaired))
+        
+        # Recompute the rollups from the earliest repaired interval
+        if 'generation' in repaired or 'prices' in repaired:
+            since = min(repaired[name] for name in ('generation', 'prices') if name in repaired)
+            results['duid_daily'] = await loop.run_in_executor(None, update_duid_daily, since)
+            results['duid_hourly'] = await loop.run_in_executor(None, update_duid_hourly, since)
+        
+        if 'generation' in repaired:
+            results['duid_history'] = await loop.run_in_executor(None, update_duid_history, repaired['generation'])
+        
+        return results
+    
+    def _publish_new_intervals(self, names: List[str]) -> None:
+        """Publish a data event with the latest interval of each collector that added data."""
+        intervals = {}
+        for name in names:
+            try:
+                _, latest = parquet_time_range(self.collectors[name].output_file, INTERVAL_COLUMNS[name])
+            except Exception as e:
+                logger.error(f"Error reading latest {name} interval: {e}")
+                continue
+            if latest is not None:
+                intervals[name] = latest
+        
+        if intervals:
+            publish_data_event(intervals)
+    
     async def run_once_all(self) -> Dict[str, bool]:
         """
         Run all collectors once (for testing/manual execution).
@@ -215,6 +323,7 @@ class AEMODataService:
         
         # Use the same collection cycle method for consistency
         results = await self._run_collection_cycle()
+        await self.price_alerts.drain()
         
         # Log results
         success_count = sum(1 for success in results.values() if success)
@@ -235,6 +344,7 @@ class AEMODataService:
                 'uptime_seconds': (datetime.now() - self.start_time).total_seconds() if self.start_time else 0,
                 'cycle_count': self.cycle_count,
                 'last_cycle': self.last_cycle_time.isoformat() if self.last_cycle_time else None,
+                'last_gap_repair': self.gap_repairer.last_run.isoformat() if self.gap_repairer.last_run else None,
                 'update_interval_minutes': self.update_interval / 60,
                 'collection_task_running': self.collection_task and not self.collection_task.done() if self.collection_task else False
             },
@@ -263,6 +373,9 @@ class AEMODataService:
         if status['service']['last_cycle']:
             summary += f"  Last cycle: {status['service']['last_cycle']}\n"
         
+        if status['service']['last_gap_repair']:
+            summary += f"  Last gap repair: {status['service']['last_gap_repair']}\n"
+        
         summary += f"  Collection task: {'Running' if status['service']['collection_task_running'] else 'Stopped'}\n"
         summary += "\nCollectors:\n"
         
@@ -312,6 +425,17 @@ async def main():
             print(f"\nService Status:")
             print(service.get_summary())
             
+        elif len(sys.argv) > 1 and sys.argv[1] == '--repair-gaps':
+            print("Repairing gaps in the data files...")
+            results = await service.repair_gaps()
+            
+            print("\nResults:")
+            if not results:
+                print("  No gaps repaired")
+            for name, success in results.items():
+                status = "✅ Success" if success else "❌ Failed"
+                print(f"  {name}: {status}")
+            
         else:
             # Run continuously
             print("Starting AEMO Data Service (Ctrl+C to stop)...")
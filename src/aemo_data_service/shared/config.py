@@ -38,6 +38,78 @@ class DataServiceConfig:
     def transmission_file(self):
         return self._dashboard_config.transmission_output_file
     
+    @property
+    def duid_daily_file(self):
+        return self._dashboard_config.duid_daily_file
+    
+    @property
+    def gen_by_duid_dir(self):
+        return self._dashboard_config.gen_by_duid_dir
+    
+    @property
+    def duid_hourly_dir(self):
+        return self._dashboard_config.duid_hourly_dir
+    
+    @property
+    def latest_dir(self):
+        return self._dashboard_config.latest_dir
+    
+    @property
+    def data_events_file(self):
+        return self._dashboard_config.data_events_file
+    
+    @property
+    def price_alert_state_file(self):
+        return self._dashboard_config.price_alert_state_file
+    
+    @property
+    def unknown_duids_file(self):
+        return self._dashboard_config.unknown_duids_file
+    
+    @property
+    def raw_cache_dir(self):
+        return self._dashboard_config.raw_cache_dir
+    
+    @property
+    def gap_repair_interval_hours(self):
+        return self._dashboard_config.gap_repair_interval_hours
+    
+    @property
+    def gap_repair_days(self):
+        return self._dashboard_config.gap_repair_days
+    
+    @property
+    def gap_repair_concurrency(self):
+        return self._dashboard_config.gap_repair_concurrency
+    
+    @property
+    def high_price_threshold(self):
+        return self._dashboard_config.high_price_threshold
+    
+    @property
+    def low_price_threshold(self):
+        return self._dashboard_config.low_price_threshold
+    
+    @property
+    def extreme_price_threshold(self):
+        return self._dashboard_config.extreme_price_threshold
+    
+    @property
+    def twilio_account_sid(self):
+        return self._dashboard_config.twilio_account_sid
+    
+    @property
+    def twilio_auth_token(self):
+        return self._dashboard_config.twilio_auth_token
+    
+    @property
+    def twilio_phone_number(self):
+        return self._dashboard_config.twilio_phone_number
+    
+    @property
+    def my_phone_number(self):
+        return self._dashboard_config.my_phone_number
+    
     @property
     def update_interval_minutes(self):
         return self._dashboard_config.update_interval_minutes
@@ -68,6 +140,14 @@ class DataServiceConfig:
         summary += f"    Prices: {self.spot_hist_file}\n"
         summary += f"    Rooftop: {self.rooftop_file}\n"
         summary += f"    Transmission: {self.transmission_file}\n"
+        summary += f"    DUID daily: {self.duid_daily_file}\n"
+        summary += f"    Generation by DUID: {self.gen_by_duid_dir}\n"
+        summary += f"    DUID hourly: {self.duid_hourly_dir}\n"
+        summary += f"    Latest snapshot: {self.latest_dir}\n"
+        summary += f"    Data events: {self.data_events_file}\n"
+        summary += f"    Unknown DUIDs: {self.unknown_duids_file}\n"
+        summary += f"    Raw file cache: {self.raw_cache_dir}\n"
+        summary += f"  Gap repair: every {self.gap_repair_interval_hours} hours, last {self.gap_repair_days} days\n"
         
         return summary
     
@@ -0,0 +1,42 @@
+"""
+Shared fixtures.
+
+The tests run offline against a small synthetic dataset (see
+aemo_dashboard.diagnostics.synthetic_data). DATA_DIR and LOGS_DIR point at a
+temporary directory before any aemo_dashboard module is imported, so the
+config picks them up and nothing is read from or written to the real data.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+TEST_DIR = Path(tempfile.mkdtemp(prefix='aemo-tests-'))
+os.environ['DATA_DIR'] = str(TEST_DIR / 'data')
+os.environ['LOGS_DIR'] = str(TEST_DIR / 'logs')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+# Empty, so every file is under DATA_DIR even if .env names one
+for name in ['SPOT_HIST_FILE', 'GEN_OUTPUT_FILE', 'GEN_INFO_FILE', 'TRANSMISSION_OUTPUT_FILE',
+             'ROOFTOP_SOLAR_FILE', 'DUID_DAILY_FILE', 'GEN_BY_DUID_DIR', 'DUID_HOURLY_DIR',
+             'LATEST_DIR', 'PRICE_ALERT_STATE_FILE']:
+    os.environ[name] = ''
+
+# Three days ending part way through a day, so the last day and hour are partial
+DATASET_DAYS = 3
+DATASET_END = '2025-07-01 12:00'
+DATASET_DUIDS = 60
+
+
+@pytest.fixture(scope='session')
+def synthetic_data():
+    """Directory of the synthetic dataset (DATA_DIR), generated once per session"""
+    from aemo_dashboard.diagnostics.synthetic_data import generate_dataset
+    from aemo_dashboard.shared.config import config
+
+    generate_dataset(config.data_dir, days=DATASET_DAYS, end=DATASET_END, n_duids=DATASET_DUIDS, seed=0)
+    yield config.data_dir
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
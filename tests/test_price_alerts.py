@@ -0,0 +1,83 @@
+"""
+PriceAlertStage: alerts from batches of prices against the row-by-row
+hysteresis of twilio_price_alerts.check_price_alerts.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aemo_data_service.price_alerts import REGIONS, PriceAlertStage
+from aemo_data_service.shared.config import config
+
+INTERVALS = 2000
+
+
+def _synthetic_prices(seed: int = 0) -> pd.DataFrame:
+    """Prices that wander between normal, middling, high and extreme levels, for every region"""
+    rng = np.random.default_rng(seed)
+    levels = np.array([80.0, 450.0, 2500.0, 12000.0])
+    level = np.zeros(len(REGIONS), dtype=int)
+    rows = []
+    for time in pd.date_range('2025-06-01 00:05', periods=INTERVALS, freq='5min'):
+        move = rng.random(len(REGIONS)) < 0.15
+        level = np.clip(level + move * rng.choice([-1, 1], len(REGIONS)), 0, len(levels) - 1)
+        prices = levels[level] * rng.uniform(0.5, 1.5, len(REGIONS))
+        rows.extend((time, region, price) for region, price in zip(REGIONS, prices))
+    return pd.DataFrame(rows, columns=['SETTLEMENTDATE', 'REGIONID', 'RRP']).set_index('SETTLEMENTDATE')
+
+
+def _iterrows_alerts(prices: pd.DataFrame) -> list:
+    """Alert messages of check_price_alerts, which walks the rows one at a time"""
+    high, low, extreme = config.high_price_threshold, config.low_price_threshold, config.extreme_price_threshold
+    alert_state = {}
+    messages = []
+    for settlement_time, row in prices.iterrows():
+        region, price = row['REGIONID'], row['RRP']
+        state = alert_state.setdefault(region, {'high_alert': False, 'high_time': None, 'last_price': 0})
+        if price >= high and not state['high_alert']:
+            state['high_alert'] = True
+            state['high_time'] = settlement_time
+            emoji, urgency = ("🚨🚨🚨", "EXTREME") if price >= extreme else ("⚠️", "HIGH")
+            messages.append(f"ITK price alert {emoji} {region} {urgency} PRICE: ${price:.2f}/MWh at "
+                            f"{settlement_time.strftime('%H:%M on %d/%m/%Y')}. Threshold: ${high}")
+        elif price <= low and state['high_alert']:
+            state['high_alert'] = False
+            total_minutes = int((settlement_time - state['high_time']).total_seconds() / 60)
+            hours, minutes = divmod(total_minutes, 60)
+            duration_str = f"Duration: {hours}h {minutes}m" if hours > 0 else f"Duration: {minutes}m"
+            messages.append(f"ITK price alert ✅ {region} PRICE RECOVERED: ${price:.2f}/MWh at "
+                            f"{settlement_time.strftime('%H:%M on %d/%m/%Y')}. Below ${low}. {duration_str}")
+        state['last_price'] = price
+    return messages
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_batches_match_iterrows(tmp_path, seed):
+    prices = _synthetic_prices(seed)
+    expected = _iterrows_alerts(prices)
+    assert len(expected) > 100
+
+    stage = PriceAlertStage(state_file=tmp_path / 'price_alert_state.pkl')
+    rng = np.random.default_rng(seed)
+    messages = []
+    start = 0
+    while start < INTERVALS:
+        # A random number of whole intervals per batch, as the collector commits them
+        size = int(rng.integers(1, 50))
+        messages.extend(stage.process(prices.iloc[start * len(REGIONS):(start + size) * len(REGIONS)]))
+        start += size
+
+    assert messages == expected
+
+
+def test_state_survives_a_restart(tmp_path):
+    prices = _synthetic_prices()
+    state_file = tmp_path / 'price_alert_state.pkl'
+    half = INTERVALS // 2 * len(REGIONS)
+
+    stage = PriceAlertStage(state_file=state_file)
+    messages = stage.process(prices.iloc[:half])
+    messages += PriceAlertStage(state_file=state_file).process(prices.iloc[half:])
+
+    assert messages == _iterrows_alerts(prices)
@@ -0,0 +1,101 @@
+"""
+PriceAnalysisMotor: the gathered integration against a merge of the same data,
+and the daily table path against the 5-minute rows.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from aemo_dashboard.analysis.duid_daily import update_duid_daily
+from aemo_dashboard.analysis.price_analysis import PriceAnalysisMotor
+from aemo_dashboard.shared.config import config
+
+HIERARCHIES = [['Fuel', 'Region'], ['Region', 'Fuel', 'duid'], ['Owner']]
+
+
+def _loaded_motor(start_date=None, end_date=None) -> PriceAnalysisMotor:
+    motor = PriceAnalysisMotor()
+    assert motor.load_data(start_date, end_date) and motor.standardize_columns()
+    return motor
+
+
+def _merged(motor: PriceAnalysisMotor) -> pd.DataFrame:
+    """The integration as a merge: DUID mapping, then prices on interval and region"""
+    mapping = motor.duid_mapping.drop_duplicates('DUID')
+    gen = motor.gen_data.assign(duid=motor.gen_data['duid'].astype(str))
+    merged = gen.merge(mapping, left_on='duid', right_on='DUID').merge(
+        motor.price_data, left_on=['settlementdate', 'Region'], right_on=['SETTLEMENTDATE', 'REGIONID']
+    )
+    merged['revenue_5min'] = merged['scadavalue'] * merged['RRP'] * (5.0 / 60.0)
+    return merged.sort_values(['settlementdate', 'duid'], ignore_index=True)
+
+
+def _sorted_results(results: pd.DataFrame, hierarchy) -> pd.DataFrame:
+    return results.sort_values(hierarchy, ignore_index=True)
+
+
+@pytest.mark.parametrize('window', [(None, None), ('2025-06-29', '2025-06-30')])
+def test_integrate_data_matches_merge(synthetic_data, window):
+    motor = _loaded_motor()
+    assert motor.integrate_data(*window, use_daily=False)
+    integrated = motor.integrated_data.assign(duid=motor.integrated_data['duid'].astype(str))
+    integrated = integrated.sort_values(['settlementdate', 'duid'], ignore_index=True)
+
+    start, end = window
+    reference = _merged(motor)
+    if start:
+        times = reference['settlementdate']
+        reference = reference[(times >= start) & (times < pd.Timestamp(end) + pd.Timedelta(days=1))]
+        reference = reference.reset_index(drop=True)
+
+    assert len(integrated) == len(reference) > 0
+    for column in ['settlementdate', 'duid', 'scadavalue', 'revenue_5min']:
+        pd.testing.assert_series_equal(integrated[column], reference[column], check_names=False)
+    for column in ['Region', 'Fuel', 'Owner', 'Site Name']:
+        assert (integrated[column].astype(str) == reference[column].astype(str)).all()
+    np.testing.assert_allclose(integrated['Capacity(MW)'], reference['Capacity(MW)'].astype(float))
+
+
+def test_integrate_data_cleans_range_capacities(synthetic_data):
+    motor = _loaded_motor()
+    duid = motor.duid_mapping['DUID'].iloc[0]
+    motor.duid_mapping = motor.duid_mapping.astype({'Capacity(MW)': object})
+    motor.duid_mapping.loc[motor.duid_mapping['DUID'] == duid, 'Capacity(MW)'] = '23.44 - 27.60'
+
+    assert motor.integrate_data(use_daily=False)
+    capacity = motor.integrated_data.loc[motor.integrated_data['duid'] == duid, 'Capacity(MW)']
+    assert len(capacity) > 0
+    np.testing.assert_allclose(capacity, 25.52)
+
+
+@pytest.fixture
+def duid_daily_table(synthetic_data):
+    """The DUID daily table, built for the test and removed afterwards"""
+    assert update_duid_daily()
+    yield config.duid_daily_file
+    config.duid_daily_file.unlink()
+
+
+@pytest.mark.parametrize('window', [
+    (None, None),                       # the table's days and the partial last day
+    ('2025-06-29', '2025-06-29'),       # inside the table
+    ('2025-06-30', '2025-07-01'),       # reaching the partial day
+    ('2025-07-01', '2025-07-01'),       # only the partial day
+])
+def test_load_days_matches_5_minute_rows(duid_daily_table, window):
+    motor = PriceAnalysisMotor()
+    assert motor.load_days(*window)
+    assert motor.daily_data is not None
+
+    reference = _loaded_motor(*window)
+    assert reference.integrate_data(*window, use_daily=False)
+
+    assert motor.get_loaded_period() == reference.get_loaded_period()
+    assert motor.get_available_date_range() == reference.get_available_date_range()
+    for hierarchy in HIERARCHIES:
+        pd.testing.assert_frame_equal(
+            _sorted_results(motor.calculate_aggregated_prices(hierarchy), hierarchy),
+            _sorted_results(reference.calculate_aggregated_prices(hierarchy), hierarchy),
+            check_exact=False, rtol=1e-9
+        )
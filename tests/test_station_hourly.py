@@ -0,0 +1,56 @@
+"""
+StationAnalysisMotor.calculate_hourly_series: the stored hourly rollup plus the
+not-yet-stored hours against resampling the station's 5-minute rows.
+"""
+
+import pandas as pd
+import pytest
+
+from aemo_dashboard.station.duid_hourly import update_duid_hourly
+from aemo_dashboard.station.station_analysis import StationAnalysisMotor
+from aemo_dashboard.station.station_search import StationSearchEngine
+
+COLUMNS = ['scadavalue', 'revenue_5min', 'price']
+
+
+@pytest.fixture(scope='module')
+def motor(synthetic_data):
+    assert update_duid_hourly()
+    motor = StationAnalysisMotor()
+    assert motor.load_data() and motor.standardize_columns() and motor.integrate_data()
+    return motor
+
+
+@pytest.fixture(scope='module')
+def selections(motor):
+    """A single unit and the largest multi-unit station"""
+    station = StationSearchEngine(motor.duid_mapping).station_index[0]
+    return [station['duids'][0], station['duids']]
+
+
+def _resampled(motor, duids) -> pd.DataFrame:
+    """Hourly means of the selection's 5-minute rows, as the charts resample them"""
+    assert motor.filter_station_data(duids)
+    return motor.station_data.set_index('settlementdate')[COLUMNS].resample('1h').mean().dropna(how='all')
+
+
+@pytest.mark.parametrize('selection', [0, 1], ids=['unit', 'station'])
+def test_hourly_series_matches_resample(motor, selections, selection):
+    duids = selections[selection]
+    series = motor.calculate_hourly_series(duids).set_index('settlementdate')
+    reference = _resampled(motor, duids)
+
+    pd.testing.assert_index_equal(series.index, reference.index, check_names=False)
+    pd.testing.assert_frame_equal(series[COLUMNS], reference, check_exact=False, rtol=1e-9,
+                                  check_names=False, check_freq=False)
+
+
+@pytest.mark.parametrize('selection', [0, 1], ids=['unit', 'station'])
+def test_time_of_day_averages_match_5_minute_rows(motor, selections, selection):
+    duids = selections[selection]
+    from_series = motor.calculate_time_of_day_averages(motor.calculate_hourly_series(duids))
+    assert motor.filter_station_data(duids)
+    from_rows = motor.calculate_time_of_day_averages()
+
+    pd.testing.assert_frame_equal(from_series[['hour'] + COLUMNS], from_rows[['hour'] + COLUMNS],
+                                  check_exact=False, rtol=1e-9, check_dtype=False)
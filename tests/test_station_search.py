@@ -0,0 +1,55 @@
+"""
+StationSearchEngine: the indexed search against scoring every entry.
+"""
+
+import pytest
+from rapidfuzz import fuzz
+
+from aemo_dashboard.diagnostics.synthetic_data import build_fleet
+from aemo_dashboard.station.station_search import StationSearchEngine
+
+# Exact DUIDs and site names, partial and misspelt
+QUERIES = ['SALTLA1', 'ROCKWO2', 'saltlands solar farm', 'rockwood', 'bay', 'moun', 'silverwod',
+           'lake vale', 'port', 'wnd', 'glen ridge', 'gulf energy']
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return StationSearchEngine(build_fleet(600, seed=0))
+
+
+def _exhaustive_search(engine, query, limit=10, min_score=60, mode='duid'):
+    """(name, score) of the top results when every entry is scored (the scan the index replaced)"""
+    query = query.lower().strip()
+    entries = engine.station_index if mode == 'station' else engine.search_index
+    results = []
+    for entry in entries:
+        name_score = round(fuzz.partial_ratio(query, entry['station_name'].lower()))
+        text_score = round(fuzz.partial_ratio(query, entry['searchable_text']))
+        if mode == 'station':
+            score = max(name_score, text_score)
+            if query in entry['station_name'].lower():
+                score = min(100, score + 20)
+        else:
+            score = max(round(fuzz.partial_ratio(query, entry['duid'].lower())), name_score, text_score)
+            if query == entry['duid'].lower():
+                score = 100
+        if score >= min_score:
+            results.append((entry['display_name'], score))
+    results.sort(key=lambda result: result[1], reverse=True)
+    return results[:limit]
+
+
+@pytest.mark.parametrize('mode', ['duid', 'station'])
+@pytest.mark.parametrize('query', QUERIES)
+def test_fuzzy_search_matches_exhaustive_scan(engine, query, mode):
+    found = [(result['display_name'], result['score']) for result in engine.fuzzy_search(query, mode=mode)]
+    expected = _exhaustive_search(engine, query, mode=mode)
+    assert found
+
+    # Above the weakest score the results are exact. At it, the index may pick other
+    # ties or miss a weak match sharing no text with the query (see station_search).
+    weakest = expected[-1][1]
+    assert [result for result in found if result[1] > weakest] == [result for result in expected if result[1] > weakest]
+    assert set(found) <= set(_exhaustive_search(engine, query, limit=None, mode=mode))
+